@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+# Benchmark for per-tick cost of the collectors (performance data, processes, sensors, file system usage) without GUI.
+# Collectors read files of the current system or files of a fixture folder (see "benchmarks/procfs_fixture.py").
+# Results (seconds per tick) can be saved into a JSON file and compared with saved results. Exit status is "1"
+# if a collector is slower than the saved result more than the allowed percentage (for guarding performance changes).
+#
+# Usage: python3 benchmarks/collectors.py [--root folder] [--ticks 20] [--save file] [--compare file] [--max-regression 20]
+
+import os
+import sys
+import json
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+
+def collector_function_dict_get():
+    """
+    Get functions of the collectors. A function is run once per tick. Modules are imported after root folders are set.
+    """
+
+    from src.Config import Config
+    from src.Performance import Performance
+    from src import Procfs
+    from src.HwmonSensors import HwmonSensors
+    from src.FileSystemUsage import FileSystemUsage
+
+    Config.environment_type = "native"
+    Config.record_performance_history = 0
+    Performance.performance_background_initial_func()
+    Performance.performance_background_loop_func()
+
+    global_process_cpu_times_prev = [{}]
+
+    def performance_func():
+        Performance.performance_background_loop_func()
+
+    def processes_func():
+        # Process information is get in the same way as it is get for the Processes tab (with command lines, "io" files and executable paths).
+        Procfs.snapshot_generation_increase()
+        processes_information_dict, global_cpu_time_all = Procfs.processes_snapshot(read_io=True, read_exe=True)
+        process_cpu_usage_dict, global_process_cpu_times_prev[0] = Procfs.processes_cpu_usage(processes_information_dict, global_cpu_time_all,
+                                                                                             global_process_cpu_times_prev[0], Performance.number_of_logical_cores)
+
+    def sensors_func():
+        Procfs.snapshot_generation_increase()
+        hwmon_sensor_list, raw_value_list = HwmonSensors.sensor_snapshot_func()
+        for (attribute, sensor_group_name, sensor_name, max_value, critical_value), raw_value in zip(hwmon_sensor_list, raw_value_list):
+            HwmonSensors.sensor_value_func(attribute, raw_value)
+
+    def sensor_list_func():
+        # Sensor list is get again (as it is done when sensors are added/removed).
+        HwmonSensors.sensor_groups_prev = None
+        HwmonSensors.sensor_list_update_func()
+
+    def disk_file_system_func():
+        # Mount list is parsed and file system usage is get in every tick (as it is done when mounts are changed).
+        FileSystemUsage.mountinfo_changed_func()
+        FileSystemUsage.mounted_disk_list_update_func()
+        FileSystemUsage.disk_usage_time = None
+        FileSystemUsage.disk_usage_dict_get_func(Performance.disk_list)
+
+    return {"performance": performance_func, "processes": processes_func, "sensors": sensors_func,
+            "sensor_list": sensor_list_func, "disk_file_system": disk_file_system_func}
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Measure per-tick cost of the collectors.")
+    parser.add_argument("--root", help="fixture folder which has \"proc\" and \"sys\" folders (default: current system)")
+    parser.add_argument("--ticks", type=int, default=20, help="number of ticks per collector (default: 20)")
+    parser.add_argument("--save", help="save results into a JSON file")
+    parser.add_argument("--compare", help="compare results with a JSON file which is saved by using \"--save\"")
+    parser.add_argument("--max-regression", type=float, default=20, help="allowed slowdown in percentage (default: 20)")
+    arguments = parser.parse_args()
+
+    # Root folders are get by the modules when they are imported.
+    if arguments.root is not None:
+        os.environ["SMC_PROC_ROOT"] = os.path.abspath(arguments.root) + "/proc"
+        os.environ["SMC_SYS_ROOT"] = os.path.abspath(arguments.root) + "/sys"
+
+    result_dict = {}
+    for collector, function in collector_function_dict_get().items():
+        # First tick is not measured (files are opened and caches are filled).
+        function()
+        tick_time_list = []
+        for _ in range(arguments.ticks):
+            start_time = time.perf_counter()
+            function()
+            tick_time_list.append(time.perf_counter() - start_time)
+        tick_time_list.sort()
+        result_dict[collector] = {"min": tick_time_list[0], "median": tick_time_list[len(tick_time_list) // 2],
+                                  "mean": sum(tick_time_list) / len(tick_time_list), "max": tick_time_list[-1]}
+
+    compare_dict = {}
+    if arguments.compare is not None:
+        with open(arguments.compare) as reader:
+            compare_dict = json.load(reader)
+
+    print(f'{"collector":<18} {"min (ms)":>10} {"median (ms)":>12} {"mean (ms)":>10} {"max (ms)":>10} {"change":>9}')
+    regression_list = []
+    for collector, result in result_dict.items():
+        change_text = ""
+        if collector in compare_dict:
+            # Medians are compared because they are less affected by the other processes on the system.
+            change = (result["median"] / compare_dict[collector]["median"] - 1) * 100
+            change_text = f'{change:+.1f}%'
+            if change > arguments.max_regression:
+                regression_list.append(collector)
+        print(f'{collector:<18} {result["min"] * 1000:>10.3f} {result["median"] * 1000:>12.3f} {result["mean"] * 1000:>10.3f} '
+              f'{result["max"] * 1000:>10.3f} {change_text:>9}')
+
+    if arguments.save is not None:
+        with open(arguments.save, "w") as writer:
+            json.dump(result_dict, writer, indent=1)
+
+    if regression_list != []:
+        print(f'slower than the saved results (more than {arguments.max_regression}%): {", ".join(regression_list)}')
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+# Benchmark for startup time of the GUI. The application is run in a new process for every run and these times are measured
+# (from the start of the process): time to first frame (first frame of the main window is drawn) and time to first data
+# (data of the first collection of the main loop is shown on the GUI). Tab modules which are imported until the first data
+# is shown are also listed. Only the default tab (and modules which are used by it) should be imported.
+# A temporary config folder is used (default settings, default tab) unless "--user-config" is used.
+# A display is required (for example, "xvfb-run" or "GDK_BACKEND=broadway" can be used on systems without a display).
+#
+# Usage: python3 benchmarks/gui_startup.py [--runs number] [--user-config]
+
+import os
+import sys
+import time
+import json
+import shutil
+import tempfile
+import subprocess
+
+source_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+# Times are get by using "time.monotonic()" which uses the same clock in the benchmark process and the application process.
+gui_code = """
+import sys, time, json
+sys.path.insert(0, sys.argv[1])
+import gi
+gi.require_version('Gtk', '4.0')
+from gi.repository import Gtk, GLib, Gio
+from src.Main import SMCApplication
+from src.Collector import Collector
+
+result = {}
+app = SMCApplication()
+# Run a new instance even if the application is already running.
+app.set_flags(Gio.ApplicationFlags.NON_UNIQUE)
+
+def on_after_paint(frame_clock):
+    if "first_frame" not in result:
+        result["first_frame"] = time.monotonic()
+
+def on_activate(app):
+    # This handler is run after the main window is presented by the handler of the application.
+    app.main_window.get_surface().get_frame_clock().connect("after-paint", on_after_paint)
+
+def apply_func(apply_function, collected_data):
+    return_value = apply_func_original(apply_function, collected_data)
+    if "first_data" not in result:
+        result["first_data"] = time.monotonic()
+        result["modules"] = sorted(name[4:] for name in sys.modules if name.startswith("src."))
+        # Quit after the frame which shows the data is drawn.
+        GLib.timeout_add(100, app.quit)
+    return return_value
+
+apply_func_original = Collector.apply_func
+Collector.apply_func = apply_func
+app.connect("activate", on_activate)
+app.run(None)
+sys.stderr.write("\\n" + json.dumps(result) + "\\n")
+"""
+
+
+def gui_run_time(config_folder):
+    """
+    Run the application and get time to first frame and time to first data (in seconds) and imported modules.
+    """
+
+    environment = dict(os.environ)
+    if config_folder is not None:
+        environment["XDG_CONFIG_HOME"] = config_folder
+    start_time = time.monotonic()
+    process = subprocess.run([sys.executable, "-c", gui_code, source_path], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=environment)
+    result = json.loads(process.stderr.decode().strip().split("\n")[-1])
+
+    return result["first_frame"] - start_time, result["first_data"] - start_time, result["modules"]
+
+
+def main():
+
+    runs = 5
+    if "--runs" in sys.argv:
+        runs = int(sys.argv[sys.argv.index("--runs") + 1])
+    config_folder = None
+    if "--user-config" not in sys.argv:
+        config_folder = tempfile.mkdtemp()
+
+    first_frame_time_list = []
+    first_data_time_list = []
+    for _ in range(runs):
+        first_frame_time, first_data_time, module_list = gui_run_time(config_folder)
+        first_frame_time_list.append(first_frame_time)
+        first_data_time_list.append(first_data_time)
+
+    if config_folder is not None:
+        shutil.rmtree(config_folder)
+
+    print(f'time to first frame: {sorted(first_frame_time_list)[runs // 2] * 1000:.1f} ms (median)')
+    print(f'time to first data: {sorted(first_data_time_list)[runs // 2] * 1000:.1f} ms (median)')
+    print(f'imported modules ({len(module_list)}): {", ".join(module_list)}')
+
+
+if __name__ == "__main__":
+    main()
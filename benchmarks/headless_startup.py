@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+# Benchmark for startup time of the headless mode ("smc-cli" / "system-monitoring-center --headless").
+# Headless mode is run in a new process for every run and time until the first sample is written is measured.
+# Time of an empty Python process is also measured for comparison. GTK and cairo should not be imported in headless mode.
+#
+# Usage: python3 benchmarks/headless_startup.py [--runs number]
+
+import os
+import sys
+import time
+import subprocess
+
+source_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+headless_code = """
+import sys
+sys.path.insert(0, sys.argv[1])
+from src import Headless
+Headless.main(["--count", "1", "--interval", "0.001"])
+sys.stderr.write(str(int("gi" in sys.modules or "cairo" in sys.modules)))
+"""
+
+
+def process_run_time(argument_list):
+    """
+    Run a Python process and get its duration (in seconds) and stderr output.
+    """
+
+    start_time = time.perf_counter()
+    process = subprocess.run([sys.executable] + argument_list, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    return time.perf_counter() - start_time, process.stderr.decode()
+
+
+def main():
+
+    runs = 10
+    if "--runs" in sys.argv:
+        runs = int(sys.argv[sys.argv.index("--runs") + 1])
+
+    python_time_list = []
+    headless_time_list = []
+    gui_modules_imported = False
+    for _ in range(runs):
+        python_time_list.append(process_run_time(["-c", "pass"])[0])
+        headless_time, stderr_output = process_run_time(["-c", headless_code, source_path])
+        headless_time_list.append(headless_time)
+        if stderr_output.strip().endswith("1") == True:
+            gui_modules_imported = True
+
+    python_time = sorted(python_time_list)[runs // 2]
+    headless_time = sorted(headless_time_list)[runs // 2]
+    print(f'empty Python process: {python_time * 1000:.1f} ms (median)')
+    print(f'headless mode (until first sample): {headless_time * 1000:.1f} ms (median), '
+          f'{(headless_time - python_time) * 1000:.1f} ms more than empty Python process')
+    print(f'GTK or cairo imported: {gui_modules_imported}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+# Benchmark for main loop (GUI) stalls during data collection.
+# A GLib main loop is run with a heartbeat timeout (every 1 ms) and gaps between heartbeats are measured.
+# Process information is get (all "/proc/[PID]/" files are read) and rows are generated in every loop
+# (every 100 ms) on the main thread (previous code) and in the collector thread (current code).
+# Only the collected data is used on the main thread if the collector thread is used.
+# Max gap should be shorter than one frame (16.7 ms for 60 frames per second) if the collector thread is used.
+# Exit status is "1" if it is longer.
+#
+# Usage: python3 benchmarks/main_loop_stall.py [--duration seconds]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import gi
+gi.require_version('GLib', '2.0')
+from gi.repository import GLib
+
+from src import Procfs
+from src.Config import Config
+from src.Collector import Collector
+
+Config.environment_type = "native"
+
+
+heartbeat_interval = 1
+loop_interval = 100
+
+
+def collect_func():
+    """
+    Get process information and generate rows which are similar to rows of Processes tab (without GTK calls).
+    """
+
+    processes_information_dict, global_cpu_time_all = Procfs.processes_information(read_cmdline=True, read_io=True, read_exe=True)
+    rows = []
+    for pid, process_information in processes_information_dict.items():
+        rows.append([True, "application-x-executable", process_information["name"], process_information["cmdline"], int(pid),
+                     process_information["username"], process_information["status"], process_information["cpu_time"],
+                     process_information["rss"], process_information["vms"], process_information["shared"],
+                     process_information["read_bytes"], process_information["write_bytes"]])
+
+    return rows
+
+
+def apply_func(rows):
+    """
+    Use collected data on the main thread (a treestore would be updated in Processes tab).
+    """
+
+    dict(enumerate(rows))
+
+
+def main_loop_run(use_collector, duration):
+    """
+    Run the main loop and get gaps between heartbeats (in seconds).
+    """
+
+    main_loop = GLib.MainLoop()
+    heartbeat_gaps = []
+    heartbeat_time_prev = [time.perf_counter()]
+
+    def heartbeat_func():
+        heartbeat_time = time.perf_counter()
+        heartbeat_gaps.append(heartbeat_time - heartbeat_time_prev[0])
+        heartbeat_time_prev[0] = heartbeat_time
+        return True
+
+    def loop_func():
+        if use_collector == True:
+            Collector.collection_request_func(collect_func, apply_func)
+        else:
+            apply_func(collect_func())
+        return True
+
+    GLib.timeout_add(heartbeat_interval, heartbeat_func)
+    GLib.timeout_add(loop_interval, loop_func)
+    GLib.timeout_add(int(duration * 1000), main_loop.quit)
+    main_loop.run()
+
+    return heartbeat_gaps
+
+
+def main():
+
+    duration = 5.0
+    if "--duration" in sys.argv:
+        duration = float(sys.argv[sys.argv.index("--duration") + 1])
+
+    print(f'{"collection":>12} {"max gap (ms)":>13} {"p99 gap (ms)":>13} {"gaps > frame":>13}')
+    for use_collector in [False, True]:
+        heartbeat_gaps = sorted(main_loop_run(use_collector, duration))
+        if use_collector == True:
+            collector_max_gap = heartbeat_gaps[-1]
+        over_frame_count = len([gap for gap in heartbeat_gaps if gap > Collector.frame_duration])
+        print(f'{"thread" if use_collector else "main loop":>12} {heartbeat_gaps[-1] * 1000:>13.2f} '
+              f'{heartbeat_gaps[int(len(heartbeat_gaps) * 0.99)] * 1000:>13.2f} {over_frame_count:>13}')
+
+    print(f'collector: {Collector.apply_count} loops, max collection {Collector.collect_duration_max * 1000:.2f} ms, '
+          f'max main thread duration {Collector.apply_duration_max * 1000:.2f} ms, {Collector.apply_over_frame_duration_count} over frame duration, '
+          f'{Collector.skipped_collection_count} skipped')
+
+    if collector_max_gap > Collector.frame_duration:
+        print(f'FAIL: max gap ({collector_max_gap * 1000:.2f} ms) is longer than one frame ({Collector.frame_duration * 1000:.2f} ms) if the collector thread is used.')
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
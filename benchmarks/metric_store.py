@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+# Benchmark for recording performance data into the ring files (see "src/MetricStore.py") and reading it.
+# A record per metric family is written in every loop. Write duration per record and per value (series) is measured.
+# Reading a series (views of the mapped file) should not depend on the number of the records.
+# Files are written into a temporary folder.
+#
+# Usage: python3 benchmarks/metric_store.py
+
+import os
+import sys
+import time
+import random
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from src.MetricStore import MetricStore
+
+
+# Number of the series of the metric families (32 logical cores + average, RAM/swap, 8 disks, 8 network cards).
+family_series_count_dict = {"cpu": 33, "memory": 2, "disk": 16, "network": 16}
+number_of_loops = 20000
+
+
+def main():
+
+    random.seed(0)
+    MetricStore.store_folder_path = tempfile.mkdtemp() + "/"
+
+    family_value_dict = {}
+    for family, series_count in family_series_count_dict.items():
+        family_value_dict[family] = {f'{family}{i}': random.random() * 100 for i in range(series_count)}
+    number_of_values = sum(family_series_count_dict.values())
+
+    record_time = time.time() - number_of_loops
+    start_time = time.perf_counter()
+    for i in range(number_of_loops):
+        for family, value_dict in family_value_dict.items():
+            MetricStore.record_func(family, value_dict, record_time + i)
+    write_time = (time.perf_counter() - start_time) / number_of_loops
+    print(f'write: {write_time * 1000000:.2f} us per loop ({len(family_value_dict)} records), '
+          f'{write_time / number_of_values * 1000000:.3f} us per value')
+
+    for start_offset in [60, 3600, number_of_loops]:
+        start_time = time.perf_counter()
+        series_values_list = MetricStore.series_values_func("cpu", "cpu0", record_time + number_of_loops - start_offset)
+        read_time = time.perf_counter() - start_time
+        value_count = sum(len(values) for times, values in series_values_list)
+        print(f'read: last {start_offset} seconds ({value_count} values) in {read_time * 1000000:.2f} us')
+
+    MetricStore.flush_func()
+    shutil.rmtree(MetricStore.store_folder_path)
+
+
+if __name__ == "__main__":
+    main()
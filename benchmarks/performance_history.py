@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+# Benchmark for performance data histories which are used for drawing charts.
+# Every history is updated once per tick and max value of every history is get once per tick (as it is get for
+# every chart draw). Previous code (list, "append()" + "del list[0]" + "max()") is compared with ring buffers.
+# Per-tick cost of ring buffers should not depend on history length.
+#
+# Usage: python3 benchmarks/performance_history.py
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from src.RingBuffer import RingBuffer
+
+
+# Number of histories: CPU cores + 2 per disk (read/write speed) + 2 per network card (receive/send speed).
+history_counts = [32 + 2 * 8 + 2 * 4, 256 + 2 * 64 + 2 * 200]
+history_lengths = [150, 600, 1200]
+number_of_ticks = 200
+
+
+def main():
+
+    random.seed(0)
+
+    print(f'{"histories":>10} {"length":>7} {"list (ms/tick)":>15} {"ring buffer (ms/tick)":>22}')
+    for history_count in history_counts:
+        for history_length in history_lengths:
+            tick_values = [[random.random() * 100 for _ in range(history_count)] for _ in range(number_of_ticks)]
+
+            history_list = [[0] * history_length for _ in range(history_count)]
+            start_time = time.perf_counter()
+            for values in tick_values:
+                for history, value in zip(history_list, values):
+                    history.append(value)
+                    del history[0]
+                    max(history)
+            list_time = (time.perf_counter() - start_time) / number_of_ticks
+
+            history_list = [RingBuffer(history_length) for _ in range(history_count)]
+            start_time = time.perf_counter()
+            for values in tick_values:
+                for history, value in zip(history_list, values):
+                    history.append(value)
+                    history.max()
+            ring_buffer_time = (time.perf_counter() - start_time) / number_of_ticks
+
+            print(f'{history_count:>10} {history_length:>7} {list_time * 1000:>15.3f} {ring_buffer_time * 1000:>22.3f}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+# Benchmark for the row diff functions which are used for updating Processes tab list models.
+# Synthetic process rows are generated and a loop (tick) is simulated for every process count.
+# Some processes are ended, some processes are started and some cells are changed in every tick.
+# Per-tick cost should scale linearly with process count.
+#
+# Usage: python3 benchmarks/processes_rows_diff.py [--compare]
+# "--compare" also runs the previous "list.index()" based code (it is slow for high process counts).
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from src import RowDiff
+
+
+process_counts = [1000, 5000, 10000, 25000, 50000]
+compare_process_count_limit = 10000
+number_of_ticks = 5
+
+
+def process_rows_generate(pid_list, ppid_list):
+    """
+    Generate process rows which are similar to rows of Processes tab.
+    """
+
+    rows = []
+    for pid, ppid in zip(pid_list, ppid_list):
+        rows.append([True, "application-x-executable", "process-" + pid, "/usr/bin/process-" + pid, int(pid), "user", "Sleeping",
+                     random.random() * 5, random.randint(1, 1000) * 4096, random.randint(1, 10000) * 4096, 0, 0, 0, 0, 0, 1, int(ppid), 1000, 1000])
+    return rows
+
+
+def tick_generate(pid_list, ppid_list, rows, next_pid):
+    """
+    Simulate the next loop: 0.5% of the processes are ended, same number of processes are started and
+    CPU usage/memory values of 10% of the processes are changed.
+    """
+
+    process_count = len(pid_list)
+    ended_indexes = set(random.sample(range(1, process_count), max(1, process_count // 200)))
+    pid_list_new = []
+    ppid_list_new = []
+    rows_new = []
+    for i, (pid, ppid, row) in enumerate(zip(pid_list, ppid_list, rows)):
+        if i in ended_indexes:
+            continue
+        row = list(row)
+        if random.random() < 0.1:
+            row[7] = random.random() * 5
+            row[8] = random.randint(1, 1000) * 4096
+        pid_list_new.append(pid)
+        ppid_list_new.append(ppid)
+        rows_new.append(row)
+    new_pid_list = [str(pid) for pid in range(next_pid, next_pid + len(ended_indexes))]
+    new_ppid_list = [random.choice(pid_list_new) for pid in new_pid_list]
+    pid_list_new = pid_list_new + new_pid_list
+    ppid_list_new = ppid_list_new + new_ppid_list
+    rows_new = rows_new + process_rows_generate(new_pid_list, new_ppid_list)
+
+    return pid_list_new, ppid_list_new, rows_new, next_pid + len(ended_indexes)
+
+
+def rows_update_dict(pid_list, ppid_list, rows, rows_dict_prev):
+    """
+    Code which is used in Processes tab (without GTK calls).
+    """
+
+    rows_dict = dict(zip(pid_list, rows))
+    ppid_dict = dict(zip(pid_list, ppid_list))
+    removed_row_ids, added_row_ids, changed_cells = RowDiff.rows_diff(rows_dict_prev, rows_dict)
+    added_row_ids = RowDiff.tree_insertion_order(added_row_ids, ppid_dict)
+    # Positions of the removed rows are grouped into ranges for "items-changed" signals of the process list model.
+    removed_row_id_set = set(removed_row_ids)
+    RowDiff.position_ranges([position for position, row_id in enumerate(rows_dict_prev) if row_id in removed_row_id_set])
+
+    return rows_dict
+
+
+def rows_update_list(pid_list, ppid_list, rows, pid_list_prev, rows_prev):
+    """
+    Previous "list.index()" based code (without GTK calls).
+    """
+
+    pid_list_prev_set = set(pid_list_prev)
+    pid_list_set = set(pid_list)
+    deleted_processes = sorted(list(pid_list_prev_set - pid_list_set), key=int)
+    new_processes = sorted(list(pid_list_set - pid_list_prev_set), key=int)
+    existing_processes = sorted(list(pid_list_set.intersection(pid_list_prev)), key=int)
+    updated_existing_proc_index = [[pid_list.index(i), pid_list_prev.index(i)] for i in existing_processes]
+    for i, j in updated_existing_proc_index:
+        if rows[i] != rows_prev[j]:
+            for k in range(1, len(rows[i])):
+                if rows_prev[j][k] != rows[i][k]:
+                    pass
+    for process in deleted_processes:
+        pid_list_prev.index(process)
+    for process in new_processes:
+        pid_list.index(ppid_list[pid_list.index(process)])
+
+
+def main():
+
+    compare = "--compare" in sys.argv
+    random.seed(0)
+
+    print(f'{"processes":>10} {"dict (ms/tick)":>15} {"us/process":>11}' + (f' {"list (ms/tick)":>15}' if compare else ""))
+    for process_count in process_counts:
+        pid_list = [str(pid) for pid in range(1, process_count + 1)]
+        ppid_list = ["0"] + [str(random.randint(1, max(1, pid - 1))) for pid in range(2, process_count + 1)]
+        rows = process_rows_generate(pid_list, ppid_list)
+        ticks = [(pid_list, ppid_list, rows)]
+        next_pid = process_count + 1
+        for _ in range(number_of_ticks):
+            pid_list, ppid_list, rows, next_pid = tick_generate(pid_list, ppid_list, rows, next_pid)
+            ticks.append((pid_list, ppid_list, rows))
+
+        rows_dict_prev = rows_update_dict(*ticks[0], {})
+        start_time = time.perf_counter()
+        for tick in ticks[1:]:
+            rows_dict_prev = rows_update_dict(*tick, rows_dict_prev)
+        dict_time = (time.perf_counter() - start_time) / number_of_ticks
+
+        line = f'{process_count:>10} {dict_time * 1000:>15.2f} {dict_time / process_count * 1000000:>11.3f}'
+
+        if compare:
+            if process_count <= compare_process_count_limit:
+                start_time = time.perf_counter()
+                for tick_prev, tick in zip(ticks[:-1], ticks[1:]):
+                    rows_update_list(tick[0], tick[1], tick[2], tick_prev[0], tick_prev[2])
+                list_time = (time.perf_counter() - start_time) / number_of_ticks
+                line = line + f' {list_time * 1000:>15.2f}'
+            else:
+                line = line + f' {"-":>15}'
+
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
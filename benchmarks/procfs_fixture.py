@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+
+# Record "/proc" and "/sys" files which are read by the collectors (performance data, processes, sensors, file system usage)
+# into a fixture folder or generate a synthetic fixture folder (for example, 50000 processes, 512 logical cores,
+# 2000 block devices, 1000 network cards and 300 sensors). Fixture folder has "proc" and "sys" folders and it is used by
+# setting "SMC_PROC_ROOT=[folder]/proc" and "SMC_SYS_ROOT=[folder]/sys" environment variables
+# (see "benchmarks/collectors.py" which sets them by using "--root [folder]").
+# Symlinks are recorded with their original targets. Targets of the hwmon and block device symlinks are relative
+# paths ("../../devices/...") and files of the hwmon devices are recorded into the same relative paths.
+# Fixture files are regular files and they are read at once. Files in "/proc" are seq_files and a read of them returns
+# about one page. "check" command reads seq_files of the current system which are bigger than a page by using the reader
+# of the collectors and compares them with full reads.
+#
+# Usage: python3 benchmarks/procfs_fixture.py capture [folder]
+#        python3 benchmarks/procfs_fixture.py generate [folder] [--processes 50000] [--cores 512] [--disks 2000] [--network-cards 1000] [--sensors 300]
+#        python3 benchmarks/procfs_fixture.py check
+
+import os
+import sys
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+
+proc_file_list = ["stat", "meminfo", "partitions", "diskstats", "net/dev", "mounts", "cmdline", "self/mountinfo"]
+process_file_list = ["stat", "statm", "status", "io", "cmdline"]
+hwmon_file_suffix_list = ["_label", "_input", "_max", "_crit"]
+# Files which are bigger than a page on most systems. Contents of them do not change between two reads.
+check_file_list = ["kallsyms", "self/mountinfo", "diskstats", "partitions", "net/dev"]
+
+
+def file_write(path, content):
+    """
+    Write a file (bytes or string). Parent folders are generated if they do not exist.
+    """
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if isinstance(content, str):
+        content = content.encode()
+    with open(path, "wb") as writer:
+        writer.write(content)
+
+
+def symlink_write(path, target):
+    """
+    Generate a symlink. Parent folders are generated if they do not exist.
+    """
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if os.path.lexists(path) == True:
+        os.remove(path)
+    os.symlink(target, path)
+
+
+def file_copy(source_path, path):
+    """
+    Copy a file. Files in "/proc" and "/sys" report their sizes as "0" or "4096" and they are read until the end.
+    "False" is returned if file could not be read (for example, "io" files of processes of other users).
+    """
+
+    try:
+        with open(source_path, "rb") as reader:
+            content = reader.read()
+    except OSError:
+        return False
+    file_write(path, content)
+
+    return True
+
+
+def listdir(path):
+    """
+    List a folder. An empty list is returned if folder does not exist (for example, there is no "/sys/class/hwmon" in some virtual machines).
+    """
+
+    try:
+        return os.listdir(path)
+    except OSError:
+        return []
+
+
+def capture_func(folder):
+    """
+    Record files of the current system into the fixture folder.
+    """
+
+    proc_folder = folder + "/proc/"
+    sys_folder = folder + "/sys/"
+
+    for file_name in proc_file_list:
+        file_copy("/proc/" + file_name, proc_folder + file_name)
+
+    process_count = 0
+    for pid in os.listdir("/proc"):
+        if pid.isdigit() == False:
+            continue
+        # Process may be ended while its files are copied. Other files of the process are not copied if "stat" file could not be read.
+        if file_copy("/proc/" + pid + "/stat", proc_folder + pid + "/stat") == False:
+            continue
+        for file_name in process_file_list[1:]:
+            file_copy("/proc/" + pid + "/" + file_name, proc_folder + pid + "/" + file_name)
+        try:
+            symlink_write(proc_folder + pid + "/exe", os.readlink("/proc/" + pid + "/exe"))
+        except OSError:
+            pass
+        process_count = process_count + 1
+
+    for network_card in listdir("/sys/class/net"):
+        file_copy("/sys/class/net/" + network_card + "/operstate", sys_folder + "class/net/" + network_card + "/operstate")
+
+    sensor_count = 0
+    for sensor_group in listdir("/sys/class/hwmon"):
+        symlink_write(sys_folder + "class/hwmon/" + sensor_group, os.readlink("/sys/class/hwmon/" + sensor_group))
+        device_path = os.path.realpath("/sys/class/hwmon/" + sensor_group)
+        device_folder = sys_folder + os.path.relpath(device_path, "/sys") + "/"
+        for file_name in os.listdir(device_path):
+            if file_name == "name" or file_name.endswith(tuple(hwmon_file_suffix_list)) == True:
+                file_copy(device_path + "/" + file_name, device_folder + file_name)
+                if file_name.endswith("_input") == True:
+                    sensor_count = sensor_count + 1
+
+    for device_number in listdir("/sys/dev/block"):
+        symlink_write(sys_folder + "dev/block/" + device_number, os.readlink("/sys/dev/block/" + device_number))
+
+    print(f'{process_count} processes, {sensor_count} sensors are recorded into "{folder}"')
+
+
+def generate_func(folder, process_count, core_count, disk_count, network_card_count, sensor_count):
+    """
+    Generate a synthetic fixture folder. Values are random but they are in the same format with the files of a real system.
+    """
+
+    random.seed(0)
+    proc_folder = folder + "/proc/"
+    sys_folder = folder + "/sys/"
+
+    # CPU times (user, nice, system, idle, iowait, irq, softirq, steal, guest, guest_nice) of all cores and every core.
+    stat_line_list = ["cpu  " + " ".join(["0"] * 10)]
+    for core in range(core_count):
+        stat_line_list.append(f'cpu{core} ' + " ".join([str(random.randint(0, 10000000)) for _ in range(10)]))
+    stat_line_list.append("intr 0\nctxt 0\nbtime 0\nprocesses 0\nprocs_running 1\nprocs_blocked 0\n")
+    file_write(proc_folder + "stat", "\n".join(stat_line_list))
+
+    file_write(proc_folder + "meminfo", "MemTotal:       65536000 kB\nMemFree:        32768000 kB\nMemAvailable:   40000000 kB\n"
+                                        "Buffers:          100000 kB\nCached:          5000000 kB\nSwapCached:            0 kB\n"
+                                        "SwapTotal:       8000000 kB\nSwapFree:        7000000 kB\n")
+
+    # Block devices: a disk and a partition per two devices. Device numbers are used by "/sys/dev/block/" symlinks.
+    partition_line_list = ["major minor  #blocks  name", ""]
+    diskstats_line_list = []
+    disk_name_list = []
+    for i in range(disk_count):
+        disk_name = f'sd{i // 2}' if i % 2 == 0 else f'sd{i // 2}p1'
+        major, minor = 8 + i // 256, i % 256
+        disk_name_list.append([disk_name, f'{major}:{minor}'])
+        partition_line_list.append(f'{major:>4} {minor:>7} {random.randint(1000000, 1000000000):>10} {disk_name}')
+        diskstats_line_list.append(f'{major:>4} {minor:>7} {disk_name} ' + " ".join([str(random.randint(0, 100000000)) for _ in range(17)]))
+        device_path = f'devices/virtual/block/{disk_name_list[i - i % 2][0]}' + ("" if i % 2 == 0 else "/" + disk_name)
+        symlink_write(sys_folder + "dev/block/" + f'{major}:{minor}', "../../" + device_path)
+    file_write(proc_folder + "partitions", "\n".join(partition_line_list) + "\n")
+    file_write(proc_folder + "diskstats", "\n".join(diskstats_line_list) + "\n")
+
+    # Mounts: a mount per partition. First partition is mounted as "/".
+    mountinfo_line_list = []
+    mounts_line_list = []
+    for i, (disk_name, device_number) in enumerate(disk_name_list[1::2]):
+        mount_point = "/" if i == 0 else f'/mnt/{disk_name}'
+        mountinfo_line_list.append(f'{i + 30} 1 {device_number} / {mount_point} rw,relatime shared:{i + 1} - ext4 /dev/{disk_name} rw')
+        mounts_line_list.append(f'/dev/{disk_name} {mount_point} ext4 rw,relatime 0 0')
+    file_write(proc_folder + "self/mountinfo", "\n".join(mountinfo_line_list) + "\n")
+    file_write(proc_folder + "mounts", "\n".join(mounts_line_list) + "\n")
+    file_write(proc_folder + "cmdline", "BOOT_IMAGE=/boot/vmlinuz root=/dev/sd0p1 ro quiet\n")
+
+    net_dev_line_list = ["Inter-|   Receive                                                |  Transmit",
+                         " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed"]
+    for i in range(network_card_count):
+        network_card = "lo" if i == 0 else f'eth{i}'
+        net_dev_line_list.append(f'{network_card:>6}: ' + " ".join([str(random.randint(0, 100000000000)) for _ in range(16)]))
+        file_write(sys_folder + f'class/net/{network_card}/operstate', "unknown\n" if i == 0 else "up\n")
+    file_write(proc_folder + "net/dev", "\n".join(net_dev_line_list) + "\n")
+
+    # Sensors: 10 sensors per sensor group (temperature, fan, voltage, current and power sensors).
+    attribute_list = ["temp", "fan", "in", "curr", "power"]
+    for i in range(sensor_count):
+        sensor_group_number, sensor_number = i // 10, i % 10
+        attribute = attribute_list[sensor_number % len(attribute_list)]
+        device_folder = sys_folder + f'devices/platform/sensor.{sensor_group_number}/hwmon/hwmon{sensor_group_number}/'
+        if sensor_number == 0:
+            symlink_write(sys_folder + f'class/hwmon/hwmon{sensor_group_number}', f'../../devices/platform/sensor.{sensor_group_number}/hwmon/hwmon{sensor_group_number}')
+            file_write(device_folder + "name", f'sensor{sensor_group_number}\n')
+        sensor_file_prefix = f'{attribute}{sensor_number // len(attribute_list) + 1}'
+        file_write(device_folder + sensor_file_prefix + "_label", f'Sensor {i}\n')
+        file_write(device_folder + sensor_file_prefix + "_input", f'{random.randint(20000, 90000)}\n')
+        file_write(device_folder + sensor_file_prefix + "_max", "95000\n")
+        file_write(device_folder + sensor_file_prefix + "_crit", "100000\n")
+
+    # Processes: first process is the parent of the other processes. A third of the processes are kernel threads (empty command line).
+    for pid in range(1, process_count + 1):
+        process_folder = proc_folder + str(pid) + "/"
+        name = f'process-{pid}'
+        ppid = 0 if pid == 1 else 1
+        cpu_times = [random.randint(0, 1000000) for _ in range(2)]
+        stat_fields = ["S", str(ppid)] + ["0"] * 9 + [str(cpu_times[0]), str(cpu_times[1])] + ["0"] * 3 + \
+                      ["0", str(random.randint(1, 64)), "0", str(random.randint(0, 10000000)), str(random.randint(1000000, 10000000000))] + ["0"] * 27
+        file_write(process_folder + "stat", f'{pid} ({name}) ' + " ".join(stat_fields) + "\n")
+        file_write(process_folder + "statm", f'{random.randint(1000, 1000000)} {random.randint(100, 100000)} {random.randint(10, 10000)} 1 0 100 0\n')
+        file_write(process_folder + "status", f'Name:\t{name}\nUmask:\t0022\nState:\tS (sleeping)\nTgid:\t{pid}\nPid:\t{pid}\nPPid:\t{ppid}\n'
+                                              f'Uid:\t1000\t1000\t1000\t1000\nGid:\t1000\t1000\t1000\t1000\nThreads:\t1\n')
+        file_write(process_folder + "io", f'rchar: 0\nwchar: 0\nsyscr: 0\nsyscw: 0\nread_bytes: {random.randint(0, 10000000)}\n'
+                                          f'write_bytes: {random.randint(0, 10000000)}\ncancelled_write_bytes: 0\n')
+        file_write(process_folder + "cmdline", b"" if pid % 3 == 0 else f'/usr/bin/{name}\x00--option\x00value\x00'.encode())
+        symlink_write(process_folder + "exe", f'/usr/bin/{name}')
+
+    print(f'{process_count} processes, {core_count} logical cores, {disk_count} block devices, {network_card_count} network cards, '
+          f'{sensor_count} sensors are generated in "{folder}"')
+
+
+def check_func():
+    """
+    Read live seq_files which are bigger than a page by using the reader of the collectors and compare them with full reads.
+    "False" is returned if content of a file is truncated or it is different.
+    """
+
+    from src.Procfs import ProcFileReader
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    checked_file_count = 0
+    success = True
+    for file_name in proc_file_list + check_file_list:
+        path = "/proc/" + file_name
+        try:
+            with open(path, "rb") as reader:
+                content = reader.read()
+        except OSError:
+            continue
+        if len(content) <= page_size:
+            continue
+        file_reader = ProcFileReader(path)
+        reader_content = file_reader.read()
+        file_reader.close()
+        checked_file_count = checked_file_count + 1
+        reader_content_size = 0 if reader_content is None else len(reader_content)
+        if reader_content != content:
+            success = False
+        print(f'{path}: {len(content)} bytes, {reader_content_size} bytes are read ({"OK" if reader_content == content else "FAILED"})')
+
+    if checked_file_count == 0:
+        print(f'There is no readable seq_file which is bigger than a page ({page_size} bytes)')
+
+    return success
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Record or generate /proc and /sys files for the collectors.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    capture_parser = subparsers.add_parser("capture", help="record files of the current system")
+    capture_parser.add_argument("folder")
+    generate_parser = subparsers.add_parser("generate", help="generate synthetic files")
+    generate_parser.add_argument("folder")
+    generate_parser.add_argument("--processes", type=int, default=50000)
+    generate_parser.add_argument("--cores", type=int, default=512)
+    generate_parser.add_argument("--disks", type=int, default=2000)
+    generate_parser.add_argument("--network-cards", type=int, default=1000)
+    generate_parser.add_argument("--sensors", type=int, default=300)
+    subparsers.add_parser("check", help="read live seq_files which are bigger than a page and compare them with full reads")
+    arguments = parser.parse_args()
+
+    if arguments.command == "capture":
+        capture_func(arguments.folder)
+    elif arguments.command == "check":
+        if check_func() == False:
+            sys.exit(1)
+    else:
+        generate_func(arguments.folder, arguments.processes, arguments.cores, arguments.disks, arguments.network_cards, arguments.sensors)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+# Benchmark for getting service information by running "systemctl show" commands at the same time.
+# Refresh latency of the worker pool (threads which are created once) is compared with the previous
+# code which creates new processes (by using multiprocessing) on every refresh.
+# A stand-in command which prints output in "systemctl show" format is used if "--fake" is used or
+# systemd is not running. Synthetic service lists are used with the stand-in command.
+#
+# Usage: python3 benchmarks/services_systemctl_show.py [--fake]
+
+import os
+import sys
+import time
+import subprocess
+import multiprocessing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from src import ServicesGetMultProc
+
+
+fake_service_counts = [50, 200, 600, 1200]
+number_of_refreshes = 5
+number_of_logical_cores = max(os.cpu_count(), 8)
+
+# Stand-in for "systemctl show --property=... [services]" (arguments are same with "systemctl" arguments).
+fake_systemctl_script = r'''
+import sys
+properties = sys.argv[3].split("=", 1)[1].split(",")
+values = {"LoadState": "loaded", "UnitFileState": "enabled", "MainPID": "1234", "ActiveState": "active",
+          "SubState": "running", "MemoryCurrent": "1048576", "Description": "Service"}
+sys.stdout.write("\n\n".join("\n".join(p + "=" + values.get(p, "") for p in properties) for service in sys.argv[4:]))
+'''
+
+
+def get_service_data_process_func(queue1, i, unit_files_command_split):
+    """
+    Previous code (run in a child process).
+    """
+
+    try:
+        systemctl_show_command_lines_split = (subprocess.check_output(unit_files_command_split, shell=False)).decode().strip().split("\n\n")
+    except Exception:
+        systemctl_show_command_lines_split = []
+    queue1.put([[i, systemctl_show_command_lines_split]])
+
+
+def start_processes_multiprocessing_func(number_of_logical_cores, unit_files_command):
+    """
+    Previous code which creates new processes on every refresh.
+    """
+
+    number_of_cpu_cores_used = ServicesGetMultProc.services_number_of_cpu_cores_used_func(number_of_logical_cores)
+    unit_files_command_split = ServicesGetMultProc.services_unit_files_command_split_func(number_of_cpu_cores_used, unit_files_command)
+    queue1 = multiprocessing.Queue()
+    process_list = [multiprocessing.Process(target=get_service_data_process_func, args=(queue1, i, unit_files_command_split[i]), daemon=True) for i in range(number_of_cpu_cores_used)]
+    for process in process_list:
+        process.start()
+    queue_data_list = [queue1.get() for process in process_list]
+    for process in process_list:
+        process.join()
+    systemctl_show_command_lines = []
+    for data1 in sorted(sum(queue_data_list, [])):
+        systemctl_show_command_lines.extend(data1[1])
+
+    return systemctl_show_command_lines
+
+
+def real_service_list_get():
+    """
+    Get service list from systemd. Returns "None" if systemd is not running.
+    """
+
+    try:
+        output = subprocess.check_output(["systemctl", "list-unit-files", "--type=service", "--no-legend", "--no-pager"], stderr=subprocess.DEVNULL).decode()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    service_list = [line.split()[0] for line in output.strip().split("\n") if line.strip() != "" and "@" not in line.split()[0]]
+    if service_list == []:
+        return None
+    # "list-unit-files" works without a running systemd but "show" does not.
+    try:
+        subprocess.check_output(["systemctl", "show", "--property=LoadState", service_list[0]], stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return service_list
+
+
+def refresh_time_get(function, unit_files_command):
+    """
+    Get average time of a refresh in milliseconds.
+    """
+
+    function(number_of_logical_cores, unit_files_command)
+    start_time = time.perf_counter()
+    for _ in range(number_of_refreshes):
+        output = function(number_of_logical_cores, unit_files_command)
+    assert len(output) == len(unit_files_command) - (unit_files_command.index("systemctl") + 3)
+
+    return (time.perf_counter() - start_time) / number_of_refreshes * 1000
+
+
+def main():
+
+    properties = "--property=LoadState,UnitFileState,MainPID,ActiveState,SubState,MemoryCurrent,Description"
+    service_list = None
+    if "--fake" not in sys.argv:
+        service_list = real_service_list_get()
+    if service_list is None:
+        command_list = [([sys.executable, "-c", fake_systemctl_script, "systemctl", "show", properties] + ["fake-" + str(i) + ".service" for i in range(count)], count)
+                        for count in fake_service_counts]
+    else:
+        command_list = [(["systemctl", "show", properties] + service_list, len(service_list))]
+
+    print(f'{"services":>9} {"worker pool (ms)":>17} {"multiprocessing (ms)":>21}')
+    for unit_files_command, count in command_list:
+        pool_time = refresh_time_get(ServicesGetMultProc.start_processes_func, unit_files_command)
+        multiprocessing_time = refresh_time_get(start_processes_multiprocessing_func, unit_files_command)
+        print(f'{count:>9} {pool_time:>17.1f} {multiprocessing_time:>21.1f}')
+
+    ServicesGetMultProc.worker_pool_shutdown_func()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+
+# Stress test of the GUI under load. Dummy processes (long-lived processes and short-lived processes which are started
+# continuously), optionally dummy services (user services which are started by using "systemd-run --user") and dummy
+# network interfaces (veth pairs, root privileges are required) are generated. Then the application is run in a new process
+# and Processes, Users and Services tabs are switched on in order (main loop of the application is run as it is run normally).
+# These values are recorded per tab and they are shown as histograms:
+#   - tick time: duration of the collection (collector thread) + duration of using the collected data (main thread) per tick
+#   - main loop stalls: gaps between the heartbeats of a 1 ms timeout on the main loop (GUI does not respond during a stall)
+#   - CPU usage and RSS of the application (sampled every second)
+# A temporary config folder is used (default settings). A display is required (for example, "xvfb-run" can be used).
+# Releases can be compared by running the same command (for example, with 1000, 10000 and 50000 processes) on the same system.
+# Number of processes may be limited by "ulimit -u" and "/proc/sys/kernel/pid_max".
+#
+# Usage: python3 benchmarks/stress.py [--processes 1000] [--churn 100] [--services 0] [--veth 0]
+#                                     [--tabs processes,users,services] [--tab-duration 30] [--interval 1.0] [--json file]
+
+import os
+import sys
+import json
+import time
+import shutil
+import signal
+import argparse
+import tempfile
+import threading
+import subprocess
+
+source_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+# Upper limits of the histogram buckets (in milliseconds for durations). 16.7 ms is duration of a frame (60 frames per second).
+duration_bucket_list = [1, 2, 5, 10, 16.7, 33, 50, 100, 200, 500, 1000, float("inf")]
+cpu_usage_bucket_list = [1, 2, 5, 10, 20, 50, 100, float("inf")]
+rss_bucket_list = [50, 100, 200, 400, 800, 1600, float("inf")]
+
+
+# Code of the application process. Results are written to stderr as a JSON line after the application is closed.
+gui_code = """
+import os, sys, time, json, resource
+sys.path.insert(0, sys.argv[1])
+tab_list = sys.argv[2].split(",")
+tab_duration = float(sys.argv[3])
+update_interval = float(sys.argv[4])
+import gi
+gi.require_version('Gtk', '4.0')
+from gi.repository import Gtk, GLib, Gio
+from src.Main import SMCApplication
+from src.Config import Config
+from src.Collector import Collector
+
+Config.update_interval = update_interval
+app = SMCApplication()
+app.set_flags(Gio.ApplicationFlags.NON_UNIQUE)
+result = {tab: {"tick": [], "apply": [], "stall": [], "cpu": [], "rss": []} for tab in tab_list}
+state = {"tab": None, "heartbeat": None, "cpu_time": None, "sample_time": None}
+page_size = os.sysconf("SC_PAGE_SIZE")
+
+def apply_func(apply_function, collected_data):
+    apply_start_time = time.perf_counter()
+    return_value = apply_func_original(apply_function, collected_data)
+    if state["tab"] is not None:
+        apply_duration = time.perf_counter() - apply_start_time
+        result[state["tab"]]["tick"].append((Collector.collect_duration_last + apply_duration) * 1000)
+        result[state["tab"]]["apply"].append(apply_duration * 1000)
+    return return_value
+
+def heartbeat_func():
+    heartbeat_time = time.perf_counter()
+    if state["tab"] is not None and state["heartbeat"] is not None:
+        result[state["tab"]]["stall"].append((heartbeat_time - state["heartbeat"]) * 1000)
+    state["heartbeat"] = heartbeat_time
+    return True
+
+def sample_func():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    cpu_time = usage.ru_utime + usage.ru_stime
+    sample_time = time.monotonic()
+    if state["tab"] is not None and state["cpu_time"] is not None:
+        result[state["tab"]]["cpu"].append((cpu_time - state["cpu_time"]) / (sample_time - state["sample_time"]) * 100)
+        with open("/proc/self/statm") as reader:
+            result[state["tab"]]["rss"].append(int(reader.read().split()[1]) * page_size / 1024 / 1024)
+    state["cpu_time"] = cpu_time
+    state["sample_time"] = sample_time
+    return True
+
+def tab_switch_func(tab_index):
+    if tab_index == len(tab_list):
+        state["tab"] = None
+        app.quit()
+        return False
+    state["tab"] = tab_list[tab_index]
+    getattr(app.main_window_object, tab_list[tab_index] + "_tb").set_active(True)
+    GLib.timeout_add(int(tab_duration * 1000), tab_switch_func, tab_index + 1)
+    return False
+
+def on_activate(app):
+    from src.MainWindow import MainWindow
+    app.main_window_object = MainWindow
+    # First tab is switched on after the startup.
+    GLib.timeout_add(1000, tab_switch_func, 0)
+    GLib.timeout_add(1, heartbeat_func)
+    GLib.timeout_add(1000, sample_func)
+
+apply_func_original = Collector.apply_func
+Collector.apply_func = apply_func
+app.connect("activate", on_activate)
+app.run(None)
+sys.stderr.write("\\n" + json.dumps(result) + "\\n")
+"""
+
+
+class LoadGenerator:
+    """
+    Generate and remove dummy processes, services and network interfaces.
+    """
+
+    def __init__(self):
+
+        self.process_group = None
+        self.churn_thread = None
+        self.churn_stop_event = threading.Event()
+        self.service_list = []
+        self.veth_list = []
+
+
+    def processes_start_func(self, process_count):
+        """
+        Start long-lived processes. Processes are started in the same process group in order to stop them at once.
+        """
+
+        for _ in range(process_count):
+            if self.process_group is None:
+                self.process_group = os.posix_spawnp("sleep", ["sleep", "86400"], os.environ, setpgroup=0)
+            else:
+                os.posix_spawnp("sleep", ["sleep", "86400"], os.environ, setpgroup=self.process_group)
+
+
+    def churn_thread_func(self, churn_rate):
+        """
+        Start short-lived processes ("churn_rate" processes per second) until the thread is stopped.
+        """
+
+        pid_list = []
+        while self.churn_stop_event.wait(1 / churn_rate) == False:
+            pid_list.append(os.posix_spawnp("true", ["true"], os.environ))
+            for pid in list(pid_list):
+                if os.waitpid(pid, os.WNOHANG)[0] != 0:
+                    pid_list.remove(pid)
+        for pid in pid_list:
+            os.waitpid(pid, 0)
+
+
+    def churn_start_func(self, churn_rate):
+        """
+        Start the thread which starts short-lived processes.
+        """
+
+        if churn_rate > 0:
+            self.churn_thread = threading.Thread(target=self.churn_thread_func, args=(churn_rate,), daemon=True)
+            self.churn_thread.start()
+
+
+    def services_start_func(self, service_count):
+        """
+        Start dummy user services.
+        """
+
+        for i in range(service_count):
+            service = f'smc-stress-{os.getpid()}-{i}'
+            if subprocess.run(["systemd-run", "--user", "--quiet", "--unit", service, "sleep", "86400"]).returncode == 0:
+                self.service_list.append(service)
+
+
+    def veth_start_func(self, veth_count):
+        """
+        Add dummy network interfaces (veth pairs).
+        """
+
+        for i in range(veth_count):
+            veth = f'smcst{i}'
+            if subprocess.run(["ip", "link", "add", veth, "type", "veth", "peer", "name", veth + "p"]).returncode == 0:
+                self.veth_list.append(veth)
+
+
+    def stop_func(self):
+        """
+        Stop the dummy processes and services and remove the dummy network interfaces.
+        """
+
+        self.churn_stop_event.set()
+        if self.churn_thread is not None:
+            self.churn_thread.join()
+        if self.process_group is not None:
+            os.killpg(self.process_group, signal.SIGTERM)
+            # Wait for the processes in order to avoid zombie processes.
+            try:
+                while True:
+                    os.waitpid(-self.process_group, 0)
+            except ChildProcessError:
+                pass
+        if self.service_list != []:
+            subprocess.run(["systemctl", "--user", "stop"] + [service + ".service" for service in self.service_list])
+        for veth in self.veth_list:
+            subprocess.run(["ip", "link", "delete", veth])
+
+
+def percentile(value_list, percentage):
+    """
+    Get a percentile of a sorted list.
+    """
+
+    return value_list[min(len(value_list) - 1, int(len(value_list) * percentage / 100))]
+
+
+def histogram_lines_func(name, unit, value_list, bucket_list):
+    """
+    Get lines of a histogram (count of the values per bucket) and summary (median, 99th percentile, max).
+    """
+
+    if value_list == []:
+        return [f'  {name}: no values']
+    value_list = sorted(value_list)
+    line_list = [f'  {name}: {len(value_list)} values, median {percentile(value_list, 50):.2f} {unit}, '
+                 f'p99 {percentile(value_list, 99):.2f} {unit}, max {value_list[-1]:.2f} {unit}']
+    bucket_count_list = [0] * len(bucket_list)
+    for value in value_list:
+        for i, bucket in enumerate(bucket_list):
+            if value <= bucket:
+                bucket_count_list[i] = bucket_count_list[i] + 1
+                break
+    max_count = max(bucket_count_list)
+    for bucket, count in zip(bucket_list, bucket_count_list):
+        if count == 0:
+            continue
+        bucket_text = "inf" if bucket == float("inf") else f'{bucket:g}'
+        line_list.append(f'    <= {bucket_text:>5} {unit:<3} {count:>7} {"#" * max(1, round(count / max_count * 40))}')
+
+    return line_list
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Run the application under load and record tick times, main loop stalls, CPU usage and RSS.")
+    parser.add_argument("--processes", type=int, default=1000, help="number of long-lived dummy processes (default: 1000)")
+    parser.add_argument("--churn", type=float, default=100, help="short-lived processes per second (default: 100)")
+    parser.add_argument("--services", type=int, default=0, help="number of dummy user services (default: 0)")
+    parser.add_argument("--veth", type=int, default=0, help="number of dummy veth pairs, root privileges are required (default: 0)")
+    parser.add_argument("--tabs", default="processes,users,services", help="tabs which are switched on in order (default: processes,users,services)")
+    parser.add_argument("--tab-duration", type=float, default=30, help="duration per tab in seconds (default: 30)")
+    parser.add_argument("--interval", type=float, default=1.0, help="update interval of the application in seconds (default: 1.0)")
+    parser.add_argument("--json", help="save the recorded values into a JSON file")
+    arguments = parser.parse_args()
+
+    config_folder = tempfile.mkdtemp()
+    environment = dict(os.environ)
+    environment["XDG_CONFIG_HOME"] = config_folder
+
+    load_generator = LoadGenerator()
+    try:
+        start_time = time.monotonic()
+        load_generator.processes_start_func(arguments.processes)
+        load_generator.services_start_func(arguments.services)
+        load_generator.veth_start_func(arguments.veth)
+        load_generator.churn_start_func(arguments.churn)
+        print(f'load: {arguments.processes} processes, {arguments.churn:g} short-lived processes per second, '
+              f'{len(load_generator.service_list)} services, {len(load_generator.veth_list)} veth pairs '
+              f'(started in {time.monotonic() - start_time:.1f} s)')
+
+        process = subprocess.run([sys.executable, "-c", gui_code, source_path, arguments.tabs, str(arguments.tab_duration), str(arguments.interval)],
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=environment)
+        result = json.loads(process.stderr.decode().strip().split("\n")[-1])
+    finally:
+        load_generator.stop_func()
+        shutil.rmtree(config_folder)
+
+    for tab, tab_result in result.items():
+        print(f'{tab} tab:')
+        for line in histogram_lines_func("tick time", "ms", tab_result["tick"], duration_bucket_list) + \
+                    histogram_lines_func("main thread time per tick", "ms", tab_result["apply"], duration_bucket_list) + \
+                    histogram_lines_func("main loop stalls", "ms", tab_result["stall"], duration_bucket_list) + \
+                    histogram_lines_func("CPU usage", "%", tab_result["cpu"], cpu_usage_bucket_list) + \
+                    histogram_lines_func("RSS", "MiB", tab_result["rss"], rss_bucket_list):
+            print(line)
+
+    if arguments.json is not None:
+        with open(arguments.json, "w") as writer:
+            json.dump({"arguments": vars(arguments), "result": result}, writer)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import gi
+gi.require_version('GLib', '2.0')
+from gi.repository import GLib
+
+import time
+import threading
+import traceback
+
+from .Profiler import Profiler
+
+
+class Collector:
+
+    def __init__(self):
+
+        # Data of the loop (process information, performance data, etc.) is get in a worker thread and it is sent to
+        # the main thread by using "GLib.idle_add()". GUI is updated on the main thread by using the collected data.
+        # Thus reading files and running commands do not block the GUI. Only one collection is run at the same time.
+        # A new collection is not started until the collected data of the previous collection is used on the main thread.
+        self.worker_thread = None
+        self.collection_condition = threading.Condition()
+        self.collection_request = None
+        self.collection_running = False
+        # Number of the loops of which collection is skipped because previous collection is not finished.
+        self.skipped_collection_count = 0
+
+        # Durations (in seconds) of the collection (worker thread) and the functions which use collected data (main thread).
+        # Main loop is blocked while collected data is used. Duration of this is compared with the frame duration
+        # (60 frames per second) for measuring GUI stalls.
+        self.frame_duration = 1 / 60
+        self.collect_duration_last = 0
+        self.collect_duration_max = 0
+        self.apply_count = 0
+        self.apply_duration_last = 0
+        self.apply_duration_max = 0
+        self.apply_over_frame_duration_count = 0
+
+
+    def worker_thread_func(self):
+        """
+        Wait for collection requests and run collection functions. Collected data is sent to the main thread.
+        """
+
+        while True:
+            with self.collection_condition:
+                while self.collection_request is None:
+                    self.collection_condition.wait()
+                collect_function, apply_function = self.collection_request
+                self.collection_request = None
+
+            collect_start_time = time.perf_counter()
+            try:
+                collected_data = Profiler.profiled_call_func(collect_function)
+            # Worker thread is kept running if there is an error. Collection is tried again in the next loop.
+            except Exception:
+                traceback.print_exc()
+                self.collection_running = False
+                continue
+            self.collect_duration_last = time.perf_counter() - collect_start_time
+            self.collect_duration_max = max(self.collect_duration_max, self.collect_duration_last)
+
+            GLib.idle_add(self.apply_func, apply_function, collected_data)
+
+
+    def collection_request_func(self, collect_function, apply_function):
+        """
+        Run "collect_function" in the worker thread and run "apply_function" with its return value on the main thread.
+        "False" is returned and request is not used if previous collection is not finished.
+        """
+
+        with self.collection_condition:
+            if self.collection_running == True:
+                self.skipped_collection_count = self.skipped_collection_count + 1
+                return False
+            self.collection_running = True
+            self.collection_request = (collect_function, apply_function)
+            if self.worker_thread is None:
+                self.worker_thread = threading.Thread(target=self.worker_thread_func, daemon=True)
+                self.worker_thread.start()
+            self.collection_condition.notify()
+
+        return True
+
+
+    def apply_func(self, apply_function, collected_data):
+        """
+        Run the function which uses the collected data on the main thread and measure its duration.
+        """
+
+        apply_start_time = time.perf_counter()
+        try:
+            Profiler.profiled_call_func(apply_function, collected_data)
+        finally:
+            self.collection_running = False
+            self.apply_duration_last = time.perf_counter() - apply_start_time
+            self.apply_duration_max = max(self.apply_duration_max, self.apply_duration_last)
+            self.apply_count = self.apply_count + 1
+            if self.apply_duration_last > self.frame_duration:
+                self.apply_over_frame_duration_count = self.apply_over_frame_duration_count + 1
+            # A tick is ended when the collected data is used. Profiles which are captured on demand are saved after their last tick.
+            Profiler.tick_end_func()
+
+        # Return "False" for running the function once ("GLib.idle_add()" runs the function repeatedly if "True" is returned).
+        return False
+
+
+Collector = Collector()
@@ -12,6 +12,7 @@ from locale import gettext as _tr
 
 from .Config import Config
 from .Performance import Performance
+from .HardwareDatabase import HardwareDatabase
 
 
 class ListStoreItem(GObject.Object):
@@ -872,6 +873,7 @@ def device_vendor_model(modalias_output):
     """
     Get device vendor and model information.
     Hardware database of "udev" is used if "hwdata" database is not found. "hwdata" database is updated frequently.
+    Database files are indexed once and the indexes are cached (see "HardwareDatabase" module).
     If hardware database of "hwdata" is found:
       - It is used for PCI, virtio and USB devices.
       - Hardware database of "udev" is used for SDIO devices. This database is copied into "database" folder of the application.
@@ -926,34 +928,19 @@ def device_vendor_model(modalias_output):
         device_model_id = device_alias[first_index:last_index]
 
         if udev_database == "no":
-            # Get search texts
-            search_text1 = "\n" + device_vendor_id[5:].lower() + "  "
-            search_text2 = "\n\t" + device_model_id[5:].lower() + "  "
-
-            # Read database file
-            with open(pci_usb_hardware_database_dir + "pci.ids", encoding="utf-8") as reader:
-                ids_file_output = reader.read()
+            # Get vendor/model keys
+            database_file = pci_usb_hardware_database_dir + "pci.ids"
+            vendor_key = device_vendor_id[5:].lower()
+            model_key = vendor_key + " " + device_model_id[5:].lower()
 
         if udev_database == "yes":
-            # Get search texts
-            search_text1 = "pci:" + device_vendor_id + "*" + "\n ID_VENDOR_FROM_DATABASE="
-            search_text2 = "pci:" + device_vendor_id + device_model_id + "*" + "\n ID_MODEL_FROM_DATABASE="
-
-            # Read database file
-            with open(udev_hardware_database_dir + "20-pci-vendor-model.hwdb", encoding="utf-8") as reader:
-                ids_file_output = reader.read()
+            # Get vendor/model keys
+            database_file = udev_hardware_database_dir + "20-pci-vendor-model.hwdb"
+            vendor_key = "pci:" + device_vendor_id + "*"
+            model_key = "pci:" + device_vendor_id + device_model_id + "*"
 
         # Get device vendor, model names
-        if search_text1 in ids_file_output:
-            rest_of_the_ids_file_output = ids_file_output.split(search_text1, 1)[1]
-            device_vendor_name = rest_of_the_ids_file_output.split("\n", 1)[0]
-            if search_text2 in rest_of_the_ids_file_output:
-                device_model_name = rest_of_the_ids_file_output.split(search_text2, 1)[1].split("\n", 1)[0]
-            else:
-                device_model_name = "Unknown"
-        else:
-            device_vendor_name = "Unknown"
-            device_model_name = "Unknown"
+        device_vendor_name, device_model_name = HardwareDatabase.vendor_model_names(database_file, vendor_key, model_key)
 
     # Get device vendor, model if device subtype is virtio.
     elif device_subtype == "virtio":
@@ -970,34 +957,19 @@ def device_vendor_model(modalias_output):
         device_model_id = "d0000" + str(int(device_model_id.strip("d")) + 1040)
 
         if udev_database == "no":
-            # Get search texts
-            search_text1 = "\n" + device_vendor_id[5:].lower() + "  "
-            search_text2 = "\n\t" + device_model_id[5:].lower() + "  "
-
-            # Read database file
-            with open(pci_usb_hardware_database_dir + "pci.ids", encoding="utf-8") as reader:
-                ids_file_output = reader.read()
+            # Get vendor/model keys
+            database_file = pci_usb_hardware_database_dir + "pci.ids"
+            vendor_key = device_vendor_id[5:].lower()
+            model_key = vendor_key + " " + device_model_id[5:].lower()
 
         if udev_database == "yes":
-            # Get search texts
-            search_text1 = "pci:" + device_vendor_id + "*" + "\n ID_VENDOR_FROM_DATABASE="
-            search_text2 = "pci:" + device_vendor_id + device_model_id + "*" + "\n ID_MODEL_FROM_DATABASE="
-
-            # Read database file
-            with open(udev_hardware_database_dir + "20-pci-vendor-model.hwdb", encoding="utf-8") as reader:
-                ids_file_output = reader.read()
+            # Get vendor/model keys
+            database_file = udev_hardware_database_dir + "20-pci-vendor-model.hwdb"
+            vendor_key = "pci:" + device_vendor_id + "*"
+            model_key = "pci:" + device_vendor_id + device_model_id + "*"
 
         # Get device vendor, model names
-        if search_text1 in ids_file_output:
-            rest_of_the_ids_file_output = ids_file_output.split(search_text1, 1)[1]
-            device_vendor_name = rest_of_the_ids_file_output.split("\n", 1)[0]
-            if search_text2 in rest_of_the_ids_file_output:
-                device_model_name = rest_of_the_ids_file_output.split(search_text2, 1)[1].split("\n", 1)[0]
-            else:
-                device_model_name = "Unknown"
-        else:
-            device_vendor_name = "Unknown"
-            device_model_name = "Unknown"
+        device_vendor_name, device_model_name = HardwareDatabase.vendor_model_names(database_file, vendor_key, model_key)
 
     # Get device vendor, model if device subtype is USB.
     elif device_subtype == "usb":
@@ -1011,34 +983,19 @@ def device_vendor_model(modalias_output):
         device_model_id = device_alias[first_index:last_index]
 
         if udev_database == "no":
-            # Get search texts
-            search_text1 = "\n" + device_vendor_id[1:].lower() + "  "
-            search_text2 = "\n\t" + device_model_id[1:].lower() + "  "
-
-            # Read database file
-            with open(pci_usb_hardware_database_dir + "usb.ids", encoding="utf-8", errors="ignore") as reader:
-                ids_file_output = reader.read()
+            # Get vendor/model keys
+            database_file = pci_usb_hardware_database_dir + "usb.ids"
+            vendor_key = device_vendor_id[1:].lower()
+            model_key = vendor_key + " " + device_model_id[1:].lower()
 
         if udev_database == "yes":
-            # Get search texts
-            search_text1 = "usb:" + device_vendor_id + "*" + "\n ID_VENDOR_FROM_DATABASE="
-            search_text2 = "usb:" + device_vendor_id + device_model_id + "*" + "\n ID_MODEL_FROM_DATABASE="
-
-            # Read database file
-            with open(udev_hardware_database_dir + "20-usb-vendor-model.hwdb", encoding="utf-8") as reader:
-                ids_file_output = reader.read()
+            # Get vendor/model keys
+            database_file = udev_hardware_database_dir + "20-usb-vendor-model.hwdb"
+            vendor_key = "usb:" + device_vendor_id + "*"
+            model_key = "usb:" + device_vendor_id + device_model_id + "*"
 
         # Get device vendor, model names
-        if search_text1 in ids_file_output:
-            rest_of_the_ids_file_output = ids_file_output.split(search_text1, 1)[1]
-            device_vendor_name = rest_of_the_ids_file_output.split("\n", 1)[0]
-            if search_text2 in rest_of_the_ids_file_output:
-                device_model_name = rest_of_the_ids_file_output.split(search_text2, 1)[1].split("\n", 1)[0]
-            else:
-                device_model_name = "Unknown"
-        else:
-            device_vendor_name = "Unknown"
-            device_model_name = "Unknown"
+        device_vendor_name, device_model_name = HardwareDatabase.vendor_model_names(database_file, vendor_key, model_key)
 
     # Get device vendor, model if device subtype is SDIO.
     elif device_subtype == "sdio":
@@ -1051,31 +1008,18 @@ def device_vendor_model(modalias_output):
         last_index = first_index + 4 + 1
         device_model_id = device_alias[first_index:last_index]
 
-        # Get search texts
-        search_text1 = "sdio:" + "c*" + device_vendor_id + "*" + "\n ID_VENDOR_FROM_DATABASE="
-        search_text2 = "sdio:" + "c*" + device_vendor_id + device_model_id + "*" + "\n ID_MODEL_FROM_DATABASE="
+        # Get vendor/model keys
+        vendor_key = "sdio:" + "c*" + device_vendor_id + "*"
+        model_key = "sdio:" + "c*" + device_vendor_id + device_model_id + "*"
 
         if udev_database == "no":
-            # Read database file
-            with open(sdio_hardware_database_dir + "/20-sdio-vendor-model.hwdb", encoding="utf-8") as reader:
-                ids_file_output = reader.read()
+            database_file = sdio_hardware_database_dir + "20-sdio-vendor-model.hwdb"
 
         if udev_database == "yes":
-            # Read database file
-            with open(udev_hardware_database_dir + "20-sdio-vendor-model.hwdb", encoding="utf-8") as reader:
-                ids_file_output = reader.read()
+            database_file = udev_hardware_database_dir + "20-sdio-vendor-model.hwdb"
 
         # Get device vendor, model names
-        if search_text1 in ids_file_output:
-            rest_of_the_ids_file_output = ids_file_output.split(search_text1, 1)[1]
-            device_vendor_name = rest_of_the_ids_file_output.split("\n", 1)[0]
-            if search_text2 in rest_of_the_ids_file_output:
-                device_model_name = rest_of_the_ids_file_output.split(search_text2, 1)[1].split("\n", 1)[0]
-            else:
-                device_model_name = "Unknown"
-        else:
-            device_vendor_name = "Unknown"
-            device_model_name = "Unknown"
+        device_vendor_name, device_model_name = HardwareDatabase.vendor_model_names(database_file, vendor_key, model_key)
 
     # Get device vendor, model if device subtype is of.
     elif device_subtype == "of":
@@ -103,6 +103,15 @@ class Config:
         self.remember_last_opened_tabs_on_application_start = 0
         self.remember_last_selected_hardware = 0
         self.remember_window_size = [0, 0, 0, 0]
+        # Update intervals of the collectors in "Scheduler.collector_list" order ("-1" means default update interval of the collector).
+        self.collector_update_intervals = [-1, -1, -1, -1, -1, -1, -1]
+        # Performance data (CPU, memory, disk, network) is recorded to files (see "MetricStore") if this setting is enabled.
+        self.record_performance_history = 0
+        self.metrics_exporter = 0
+        self.metrics_exporter_port = 9860
+        self.metrics_exporter_process_count = 10
+        # Main loop stalls are detected and written into a log file (see "Watchdog") if this setting is enabled.
+        self.main_loop_watchdog = 1
 
 
     def config_default_performance_cpu_func(self):
@@ -254,6 +263,30 @@ class Config:
         self.remember_last_opened_tabs_on_application_start = int(config_values[config_variables.index("remember_last_opened_tabs_on_application_start")])
         self.remember_last_selected_hardware = int(config_values[config_variables.index("remember_last_selected_hardware")])
         self.remember_window_size = [int(value) for value in config_values[config_variables.index("remember_window_size")].strip("[]").split(", ")]
+        if "collector_update_intervals" in config_variables:
+            self.collector_update_intervals = [float(value) for value in config_values[config_variables.index("collector_update_intervals")].strip("[]").split(", ")]
+        else:
+            pass
+        if "record_performance_history" in config_variables:
+            self.record_performance_history = int(config_values[config_variables.index("record_performance_history")])
+        else:
+            pass
+        if "metrics_exporter" in config_variables:
+            self.metrics_exporter = int(config_values[config_variables.index("metrics_exporter")])
+        else:
+            pass
+        if "metrics_exporter_port" in config_variables:
+            self.metrics_exporter_port = int(config_values[config_variables.index("metrics_exporter_port")])
+        else:
+            pass
+        if "metrics_exporter_process_count" in config_variables:
+            self.metrics_exporter_process_count = int(config_values[config_variables.index("metrics_exporter_process_count")])
+        else:
+            pass
+        if "main_loop_watchdog" in config_variables:
+            self.main_loop_watchdog = int(config_values[config_variables.index("main_loop_watchdog")])
+        else:
+            pass
 
         self.chart_line_color_cpu_percent = [float(value) for value in config_values[config_variables.index("chart_line_color_cpu_percent")].strip("[]").split(", ")]
         self.show_cpu_usage_per_core = int(config_values[config_variables.index("show_cpu_usage_per_core")])
@@ -341,6 +374,12 @@ class Config:
         config_write_text = config_write_text + "remember_last_opened_tabs_on_application_start = " + str(self.remember_last_opened_tabs_on_application_start) + "\n"
         config_write_text = config_write_text + "remember_last_selected_hardware = " + str(self.remember_last_selected_hardware) + "\n"
         config_write_text = config_write_text + "remember_window_size = " + str(self.remember_window_size) + "\n"
+        config_write_text = config_write_text + "collector_update_intervals = " + str(self.collector_update_intervals) + "\n"
+        config_write_text = config_write_text + "record_performance_history = " + str(self.record_performance_history) + "\n"
+        config_write_text = config_write_text + "metrics_exporter = " + str(self.metrics_exporter) + "\n"
+        config_write_text = config_write_text + "metrics_exporter_port = " + str(self.metrics_exporter_port) + "\n"
+        config_write_text = config_write_text + "metrics_exporter_process_count = " + str(self.metrics_exporter_process_count) + "\n"
+        config_write_text = config_write_text + "main_loop_watchdog = " + str(self.main_loop_watchdog) + "\n"
         config_write_text = config_write_text + "\n"
 
         config_write_text = config_write_text + "[Performance Tab - CPU]" + "\n"
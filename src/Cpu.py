@@ -11,6 +11,7 @@ from .Config import Config
 from .Performance import Performance
 from .MainWindow import MainWindow
 from . import Common
+from . import Procfs
 
 
 class Cpu:
@@ -448,31 +449,13 @@ class Cpu:
         Get number of threads and number of processes.
         """
 
-        if Config.environment_type == "flatpak":
-            import subprocess
-            ps_output_lines = (subprocess.check_output(["flatpak-spawn", "--host", "ps", "--no-headers", "-eo", "thcount"], shell=False)).decode().strip().split("\n")
-            number_of_total_processes = len(ps_output_lines)
-            number_of_total_threads = 0
-            for line in ps_output_lines:
-                number_of_total_threads = number_of_total_threads + int(line.strip())
+        # Get number of threads of the processes from the process snapshot which is shared with other tabs and windows.
+        processes_information_dict, global_cpu_time_all = Procfs.processes_snapshot()
 
-        else:
-            pid_list = [filename for filename in os.listdir("/proc/") if filename.isdigit()]
-
-            thread_count_list = []
-            for pid in pid_list:
-                try:
-                    with open("/proc/" + pid + "/status") as reader:
-                        proc_status_output = reader.read()
-                # Skip to the next loop without application error if a "FileNotFoundError" error is encountered
-                # when process is ended after process list is get.
-                except (FileNotFoundError, ProcessLookupError) as me:
-                    continue
-                # Append number of threads of the process
-                thread_count_list.append(int(proc_status_output.split("\nThreads:", 1)[1].split("\n", 1)[0].strip()))
-
-            number_of_total_processes = len(thread_count_list)
-            number_of_total_threads = sum(thread_count_list)
+        number_of_total_processes = len(processes_information_dict)
+        number_of_total_threads = 0
+        for process_information in processes_information_dict.values():
+            number_of_total_threads = number_of_total_threads + process_information["threads"]
 
         return number_of_total_processes, number_of_total_threads
 
@@ -0,0 +1,169 @@
+import os
+import json
+
+from .Config import Config
+
+
+class DesktopApplications:
+
+    def __init__(self):
+
+        # Application icon names and types (desktop_application or application) (application exec name is the key).
+        self.exec_icon_dict = {}
+        self.exec_type_dict = {}
+        # Application folders and their modification times when the index is generated. ".desktop" files are read
+        # again only if modification time of a folder is changed (a file is added/removed/renamed in the folder).
+        self.application_dir_mtimes = None
+
+        # "XDG_CACHE_HOME" may not be defined on several distributions.
+        self.cache_file_path = os.environ.get("XDG_CACHE_HOME", os.environ.get("HOME", "") + "/.cache") + "/system-monitoring-center/desktop-applications.json"
+
+
+    def application_dir_list_func(self):
+        """
+        Get application folders in precedence order. Folders of the user and Flatpak applications are also used.
+        ".desktop" files of the host OS are used in Flatpak environment.
+        """
+
+        home_dir = os.environ.get("HOME", "")
+        # "XDG_DATA_HOME" and "XDG_DATA_DIRS" may not be defined on several distributions.
+        data_dir_list = [os.environ.get("XDG_DATA_HOME", home_dir + "/.local/share")]
+        if Config.environment_type == "flatpak":
+            data_dir_list = data_dir_list + ["/var/run/host/usr/local/share", "/var/run/host/usr/share"]
+        else:
+            data_dir_list = data_dir_list + [data_dir for data_dir in os.environ.get("XDG_DATA_DIRS", "/usr/local/share:/usr/share").split(":") if data_dir != ""]
+        # Exported ".desktop" files of Flatpak applications (for user and system installations).
+        data_dir_list = data_dir_list + [home_dir + "/.local/share/flatpak/exports/share", "/var/lib/flatpak/exports/share"]
+
+        application_dir_list = []
+        for data_dir in data_dir_list:
+            application_dir = data_dir.rstrip("/") + "/applications/"
+            if application_dir not in application_dir_list:
+                application_dir_list.append(application_dir)
+
+        return application_dir_list
+
+
+    def desktop_file_read_func(self, desktop_file):
+        """
+        Get exec name, icon name and application type from a ".desktop" file.
+        "None" is returned if file could not be read or it has no exec or icon information.
+        """
+
+        # "encoding="utf-8"" is used for preventing "UnicodeDecodeError" errors during reading the file content if "C" locale is used.
+        try:
+            with open(desktop_file, encoding="utf-8", errors="ignore") as reader:
+                desktop_file_lines = reader.read().split("\n")
+        except OSError:
+            return None
+
+        # Only keys in "[Desktop Entry]" group are used. There may be other groups (such as "[Desktop Action new-window]")
+        # which have their own "Exec=" keys.
+        desktop_entry_dict = {}
+        in_desktop_entry_group = False
+        for line in desktop_file_lines:
+            if line.startswith("[") == True:
+                in_desktop_entry_group = (line.strip() == "[Desktop Entry]")
+                continue
+            if in_desktop_entry_group == True:
+                key, separator, value = line.partition("=")
+                key = key.strip()
+                if separator != "" and key not in desktop_entry_dict:
+                    desktop_entry_dict[key] = value.strip()
+
+        # Do not include application name or icon name if any of them is not found in the .desktop file.
+        application_exec = desktop_entry_dict.get("Exec", "")
+        application_icon = desktop_entry_dict.get("Icon", "")
+        if application_exec == "" or application_icon == "":
+            return None
+
+        # Get application exec data
+        application_exec_full = application_exec
+        application_exec = application_exec_full.split("/")[-1].split(" ")[0]
+        # Splitting operation above may give "sh" as application name and this may cause confusion between "sh" process
+        # and splitted application exec (for example: sh -c "gdebi-gtk %f"sh -c "gdebi-gtk %f").
+        # This statement is used to avoid from this confusion.
+        if application_exec == "sh":
+            application_exec = application_exec_full
+
+        # Get "desktop_application/application" information
+        if desktop_entry_dict.get("NoDisplay") == "true":
+            application_type = "application"
+        else:
+            application_type = "desktop_application"
+
+        return application_exec, application_icon, application_type
+
+
+    def application_index_update_func(self, application_dir_mtimes):
+        """
+        Read ".desktop" files in the application folders and generate exec name - icon name/application type dictionaries.
+        """
+
+        self.exec_icon_dict = {}
+        self.exec_type_dict = {}
+        desktop_file_id_set = set()
+        for application_dir, _ in application_dir_mtimes:
+            try:
+                application_file_list = sorted(file for file in os.listdir(application_dir) if file.endswith(".desktop"))
+            except OSError:
+                continue
+            for application in application_file_list:
+                # Same named ".desktop" file in a folder which has higher precedence (for example, in the folder of the user) overrides the others.
+                if application in desktop_file_id_set:
+                    continue
+                desktop_file_id_set.add(application)
+                application_information = self.desktop_file_read_func(application_dir + application)
+                if application_information is None:
+                    continue
+                application_exec, application_icon, application_type = application_information
+                if application_exec not in self.exec_icon_dict:
+                    self.exec_icon_dict[application_exec] = application_icon
+                    self.exec_type_dict[application_exec] = application_type
+
+
+    def exec_icon_dict_get_func(self):
+        """
+        Get application exec name - icon name dictionary. Index is get from the cache file or it is generated
+        by reading ".desktop" files if application folders are changed since the index is generated.
+        """
+
+        application_dir_mtimes = []
+        for application_dir in self.application_dir_list_func():
+            try:
+                application_dir_mtimes.append([application_dir, os.stat(application_dir).st_mtime_ns])
+            except OSError:
+                continue
+
+        if application_dir_mtimes == self.application_dir_mtimes:
+            return self.exec_icon_dict
+
+        # Get index from the cache file if it is generated for the same folders (and modification times).
+        if self.application_dir_mtimes is None:
+            try:
+                with open(self.cache_file_path, encoding="utf-8") as reader:
+                    cache_data = json.load(reader)
+                if cache_data["application_dirs"] == application_dir_mtimes:
+                    self.exec_icon_dict = cache_data["exec_icon"]
+                    self.exec_type_dict = cache_data["exec_type"]
+                    self.application_dir_mtimes = application_dir_mtimes
+                    return self.exec_icon_dict
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+
+        self.application_index_update_func(application_dir_mtimes)
+        self.application_dir_mtimes = application_dir_mtimes
+
+        # Cache file is written into a temporary file and renamed in order to prevent reading incomplete files.
+        try:
+            os.makedirs(os.path.dirname(self.cache_file_path), exist_ok=True)
+            with open(self.cache_file_path + ".tmp", "w", encoding="utf-8") as writer:
+                json.dump({"application_dirs": application_dir_mtimes, "exec_icon": self.exec_icon_dict, "exec_type": self.exec_type_dict}, writer)
+            os.replace(self.cache_file_path + ".tmp", self.cache_file_path)
+        except OSError:
+            pass
+
+        return self.exec_icon_dict
+
+
+DesktopApplications = DesktopApplications()
@@ -0,0 +1,138 @@
+import os
+import sys
+import time
+import threading
+
+
+class Diagnostics:
+
+    def __init__(self):
+
+        # Registry of the counters and durations of the collectors and loop functions. Values are added by the collectors
+        # and the loop functions of the tabs during a tick (a loop of the main window) and they are moved to the values of
+        # the last tick when the tick is ended. Values are always recorded because adding a value costs less than a microsecond
+        # and values are added a few times per tick (not per process or per file). They are shown on the diagnostics panel
+        # if it is enabled from the main menu or by using "SMC_DIAGNOSTICS=1" environment variable.
+        self.lock = threading.Lock()
+        self.tick_duration_dict = {}
+        self.tick_counter_dict = {}
+        self.last_tick_duration_dict = {}
+        self.last_tick_counter_dict = {}
+        self.tick_count = 0
+        # Name of the collector or loop function which is being run by a thread (thread ID is the key). It is used for
+        # attributing main loop stalls (see "Watchdog").
+        self.running_name_dict = {}
+
+        # Wall time and CPU time (all threads of the application) at the start of the tick. They are used for getting
+        # CPU usage of the application and for comparing it with the durations of the collectors.
+        self.tick_start_time = time.perf_counter()
+        self.tick_start_cpu_time = time.process_time()
+        self.last_tick_duration = 0
+        self.last_tick_cpu_time = 0
+
+        self.panel_enabled = os.environ.get("SMC_DIAGNOSTICS") == "1"
+
+        # Subprocesses are counted by using an audit hook ("subprocess.Popen" event is raised for every command which is run
+        # by using "subprocess" module). Audit hooks can not be removed. Therefore hook is added when the panel is enabled for the first time.
+        self.audit_hook_added = False
+
+
+    def counter_add_func(self, counter, value=1):
+        """
+        Add a value to a counter of the current tick.
+        """
+
+        with self.lock:
+            self.tick_counter_dict[counter] = self.tick_counter_dict.get(counter, 0) + value
+
+
+    def duration_add_func(self, name, duration):
+        """
+        Add a duration (in seconds) to the duration of a collector or a loop function in the current tick.
+        """
+
+        with self.lock:
+            self.tick_duration_dict[name] = self.tick_duration_dict.get(name, 0) + duration
+
+
+    def timed_call_func(self, name, function, *args):
+        """
+        Run a function, add its duration to the current tick and return its return value.
+        """
+
+        thread_id = threading.get_ident()
+        running_name_prev = self.running_name_dict.get(thread_id)
+        self.running_name_dict[thread_id] = name
+        start_time = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.duration_add_func(name, time.perf_counter() - start_time)
+            self.running_name_dict[thread_id] = running_name_prev
+
+
+    def tick_end_func(self):
+        """
+        End the current tick. Values of the tick are kept as the values of the last tick and new tick is started.
+        """
+
+        current_time = time.perf_counter()
+        current_cpu_time = time.process_time()
+
+        with self.lock:
+            self.last_tick_duration_dict = self.tick_duration_dict
+            self.last_tick_counter_dict = self.tick_counter_dict
+            self.tick_duration_dict = {}
+            self.tick_counter_dict = {}
+
+        self.last_tick_duration = current_time - self.tick_start_time
+        self.last_tick_cpu_time = current_cpu_time - self.tick_start_cpu_time
+        self.tick_start_time = current_time
+        self.tick_start_cpu_time = current_cpu_time
+        self.tick_count = self.tick_count + 1
+
+
+    def audit_hook_func(self, event, args):
+        """
+        Count subprocesses which are run by the application.
+        """
+
+        if event == "subprocess.Popen":
+            self.counter_add_func("Subprocesses")
+
+
+    def subprocess_counting_start_func(self):
+        """
+        Start counting subprocesses. This is run when the panel is enabled.
+        """
+
+        if self.audit_hook_added == False:
+            sys.addaudithook(self.audit_hook_func)
+            self.audit_hook_added = True
+
+
+    def report_text_func(self, collect_duration=None):
+        """
+        Get text of the values of the last tick. Durations of the collectors and loop functions are listed in descending order.
+        "collect_duration" is total duration of the collection (collector thread) of the last tick.
+        Durations may overlap (for example, sensor files are read during the loop of the Sensors tab).
+        """
+
+        if self.last_tick_duration > 0:
+            cpu_usage = self.last_tick_cpu_time / self.last_tick_duration * 100
+        else:
+            cpu_usage = 0
+        line_list = [f'Tick {self.tick_count}: {self.last_tick_duration * 1000:.0f} ms, application CPU time {self.last_tick_cpu_time * 1000:.1f} ms ({cpu_usage:.1f}%)']
+        if collect_duration is not None:
+            line_list.append(f'{"Collection (total)":<32} {collect_duration * 1000:>9.2f} ms')
+        for name, duration in sorted(self.last_tick_duration_dict.items(), key=lambda item: item[1], reverse=True):
+            line_list.append(f'{name:<32} {duration * 1000:>9.2f} ms')
+        for counter, value in sorted(self.last_tick_counter_dict.items()):
+            line_list.append(f'{counter:<32} {value:>9}')
+        if self.audit_hook_added == False:
+            line_list.append(f'{"Subprocesses":<32} {"-":>9}')
+
+        return "\n".join(line_list)
+
+
+Diagnostics = Diagnostics()
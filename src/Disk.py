@@ -12,6 +12,7 @@ from .Config import Config
 from .Performance import Performance
 from .MainWindow import MainWindow
 from . import Common
+from .FileSystemUsage import FileSystemUsage
 
 
 class Disk:
@@ -429,9 +430,19 @@ class Disk:
         self.initial_already_run = 1
 
 
-    def disk_loop_func(self):
+    def disk_collect_func(self):
+        """
+        Get file system usage information of the disks. GTK is not used in this function and it is run in the collector
+        thread (see "Collector.py") because "os.statvfs()" may wait for a slow or unreachable (network) file system.
+        """
+
+        return FileSystemUsage.disk_usage_dict_get_func(Performance.disk_list)
+
+
+    def disk_loop_func(self, disk_usage_dict=None):
         """
         Get and show information on the GUI on every loop.
+        File system usage information is get on the main thread if it is not collected by the collector thread.
         """
 
         disk_list = Performance.disk_list
@@ -477,8 +488,11 @@ class Disk:
             pass
         self.hide_loop_ramdisk_zram_disks_prev = hide_loop_ramdisk_zram_disks
 
+        if disk_usage_dict is None:
+            disk_usage_dict = FileSystemUsage.disk_usage_dict_get_func(disk_list)
+
         # Update disk usage percentages on disk list between Performance tab sub-tabs.
-        self.disk_update_disk_usage_percentages_on_disk_list_func()
+        self.disk_update_disk_usage_percentages_on_disk_list_func(disk_usage_dict)
 
         # Check if disk exists in the disk list and if disk directory exists in order to prevent errors when disk is removed suddenly when the same disk is selected on the GUI. This error occurs because foreground thread and background thread are different for performance monitoring. Tracking of disk list changes is performed by background thread and there may be a time difference between these two threads. This situtation may cause errors when viewed list is removed suddenly. There may be a better way for preventing these errors/fixing this problem.
         try:
@@ -490,7 +504,7 @@ class Disk:
 
         # Get information.
         disk_read_data, disk_write_data = self.disk_read_write_data_func(selected_disk)
-        disk_file_system_information = self.disk_file_system_information_func(disk_list)
+        disk_file_system_information = self.disk_file_system_information_func(disk_list, disk_usage_dict)
         disk_file_system, disk_capacity, disk_used, disk_free, self.disk_usage_percentage, disk_mount_point, encrypted_disk_name  = self.disk_file_system_capacity_used_free_used_percent_mount_point_func(disk_file_system_information, disk_list, selected_disk)
 
 
@@ -666,54 +680,21 @@ class Disk:
         return disk_device_model_name
 
 
-    def disk_file_system_information_func(self, disk_list):
+    def disk_file_system_information_func(self, disk_list, disk_usage_dict=None):
         """
         Get file system information (file systems, capacities, used, free, used percentages and mount points) of all disks.
         """
 
-        # Get file system information of the mounted disks by using "df" command.
-        # Online drives are excluded from "df" command output for avoiding long command runs and GUI blockings.
-        # Currently, "fuse.onedriver" filesystems (generated by Onedriver application) are excluded.
-        # More filesystems can be excluded by using the parameter multiple times (comma-separated filesystems
-        # for excluding are not supported by "df").
-        command_list = ["df", "--exclude-type=fuse.onedriver", "--output=source,fstype,size,used,avail,pcent,target"]
-        if Config.environment_type == "flatpak":
-            command_list = ["flatpak-spawn", "--host"] + command_list
-
-        df_output_lines = (subprocess.run(command_list, shell=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)).stdout.decode().strip().split("\n")
-
-        # Remove command output title line. Only disk information will be left.
-        del df_output_lines[0]
-
-        # Get mounted disk list.
-        mounted_disk_list = []
-        for line in df_output_lines:
-            disk_name = line.split()[0]
-            mounted_disk_list.append(disk_name.split("/dev/")[-1])
-
-        encrypted_disk_filesystem_information_dict = self.get_encrypted_disk_information(df_output_lines)
-        encrypted_disk_list = list(encrypted_disk_filesystem_information_dict.keys())
+        # Get file system information of the mounted disks if it is not collected. Information is cached for a short time
+        # because this function is called multiple times in a loop and capacity/usage values change slowly.
+        if disk_usage_dict is None:
+            disk_usage_dict = FileSystemUsage.disk_usage_dict_get_func(disk_list)
 
         # Get file system information of the mounted and unmounted disks.
         disk_filesystem_information_list = []
         for disk in disk_list:
-            if disk in mounted_disk_list:
-                index = mounted_disk_list.index(disk)
-                disk_file_system = df_output_lines[index].split()[1]
-                disk_capacity = int(df_output_lines[index].split()[2]) * 1024
-                disk_used = int(df_output_lines[index].split()[3]) * 1024
-                disk_free = int(df_output_lines[index].split()[4]) * 1024
-                disk_used_percentage = int(df_output_lines[index].split()[5].strip("%"))
-                disk_mount_point = df_output_lines[index].split("% ", 1)[-1]
-                encrypted_disk_name = ""
-            elif disk in encrypted_disk_list:
-                disk_file_system = encrypted_disk_filesystem_information_dict[disk]["disk_file_system"]
-                disk_capacity = encrypted_disk_filesystem_information_dict[disk]["disk_capacity"]
-                disk_used = encrypted_disk_filesystem_information_dict[disk]["disk_used"]
-                disk_free = encrypted_disk_filesystem_information_dict[disk]["disk_free"]
-                disk_used_percentage = encrypted_disk_filesystem_information_dict[disk]["disk_used_percentage"]
-                disk_mount_point = encrypted_disk_filesystem_information_dict[disk]["disk_mount_point"]
-                encrypted_disk_name = encrypted_disk_filesystem_information_dict[disk]["encrypted_disk_name"]
+            if disk in disk_usage_dict:
+                disk_file_system, disk_capacity, disk_used, disk_free, disk_used_percentage, disk_mount_point, encrypted_disk_name = disk_usage_dict[disk]
             else:
                 disk_file_system = "[" + _tr("Not mounted") + "]"
                 disk_capacity = "[" + _tr("Not mounted") + "]"
@@ -727,44 +708,6 @@ class Disk:
         return disk_filesystem_information_list
 
 
-    def get_encrypted_disk_information(self, df_output_lines):
-        """
-        Check if the selected disk is encrypted and get its file system information.
-        """
-
-        encrypted_disk_filesystem_information_dict = {}
-
-        for line in df_output_lines:
-            encrypted_disk_information = {}
-            disk_name = line.split()[0]
-            if disk_name.startswith("/dev/mapper/") == False:
-                continue
-            else:
-                encrypted_disk_name = disk_name.split("/dev/mapper/")[-1]
-                disk_file_system = line.split()[1]
-                disk_capacity = int(line.split()[2]) * 1024
-                disk_used = int(line.split()[3]) * 1024
-                disk_free = int(line.split()[4]) * 1024
-                disk_used_percentage = int(line.split()[5].strip("%"))
-                disk_mount_point = line.split("% ", 1)[-1]
-                encrypted_disk_information["encrypted_disk_name"] = encrypted_disk_name
-                encrypted_disk_information["disk_file_system"] = disk_file_system
-                encrypted_disk_information["disk_capacity"] = disk_capacity
-                encrypted_disk_information["disk_used"] = disk_used
-                encrypted_disk_information["disk_free"] = disk_free
-                encrypted_disk_information["disk_used_percentage"] = disk_used_percentage
-                encrypted_disk_information["disk_mount_point"] = disk_mount_point
-                # Get disk file in "/dev/mapper"
-                dev_mapper_disks = os.listdir("/dev/mapper/")
-                if encrypted_disk_name in dev_mapper_disks:
-                    if os.path.isdir("/dev/mapper/" + encrypted_disk_name) != True:
-                        disk_real_path = os.path.realpath("/dev/mapper/" + encrypted_disk_name)
-                        disk_proc_name = disk_real_path.split("/")[-1]
-                        encrypted_disk_filesystem_information_dict[disk_proc_name] = encrypted_disk_information
-
-        return encrypted_disk_filesystem_information_dict
-
-
     def disk_file_system_capacity_used_free_used_percent_mount_point_func(self, disk_filesystem_information_list, disk_list, selected_disk):
         """
         Get file file systems, capacities, used, free, used percentages and mount points of all disks.
@@ -859,7 +802,7 @@ class Disk:
         return disk_label
 
 
-    def disk_update_disk_usage_percentages_on_disk_list_func(self):
+    def disk_update_disk_usage_percentages_on_disk_list_func(self, disk_usage_dict=None):
         """
         Update disk usage percentages on the disk list between Performance tab sub-tabs.
         """
@@ -867,7 +810,7 @@ class Disk:
         # Get disk usage percentages.
         device_list = Performance.disk_list
         disk_usage_percentage_list = []
-        disk_filesystem_information_list = self.disk_file_system_information_func(device_list)
+        disk_filesystem_information_list = self.disk_file_system_information_func(device_list, disk_usage_dict)
         for device in device_list:
             _, _, _, _, disk_usage_percentage, disk_mount_point, _ = self.disk_file_system_capacity_used_free_used_percent_mount_point_func(disk_filesystem_information_list, device_list, device)
             # Append percentage number with no fractions in order to avoid updating the list very frequently.
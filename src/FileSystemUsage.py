@@ -0,0 +1,271 @@
+import os
+import time
+import select
+import threading
+import subprocess
+
+from .Config import Config
+from . import Procfs
+from .Procfs import ProcFileReader
+from .Scheduler import Scheduler
+from .Diagnostics import Diagnostics
+
+
+class FileSystemUsage:
+
+    def __init__(self):
+
+        # Mount list is get from "/proc/self/mountinfo" only if mounts are changed. Kernel notifies
+        # changes by setting "POLLPRI" event on the file descriptor of the file.
+        self.mountinfo_reader = None
+        self.mountinfo_poll = None
+        # Mounted disks (disk name is the key, value: [file system, mount point, encrypted disk name, mount root]).
+        self.mounted_disk_dict = {}
+        # Disk names of "major:minor" device numbers. They are not get again for every mount.
+        self.device_number_disk_name_dict = {}
+
+        # File system usage information (disk name is the key, value: [file system, capacity, used, free,
+        # used percentage, mount point, encrypted disk name]) and the time when it is get.
+        self.disk_usage_dict = {}
+        self.disk_usage_dict_disk_set = set()
+        self.disk_usage_time = None
+        self.mounted_disk_dict_changed = 1
+
+        # "os.statvfs()" may not return for a long time if a network file system is not reachable. It is run in a thread
+        # and mount point is marked as stale if it does not return in this time. Thread of a stale mount point is kept
+        # (mount point is not checked again) until it returns.
+        self.statvfs_timeout = 0.5
+        self.stale_mount_point_thread_dict = {}
+
+        # Information is get in the collector thread of the main window and also on the main thread (for example,
+        # when disk list is updated). Lock prevents getting it at the same time.
+        self.lock = threading.Lock()
+
+
+    def mountinfo_changed_func(self):
+        """
+        Check if mounts are changed since the last check.
+        """
+
+        if self.mountinfo_reader is None:
+            # "mountinfo" is a seq_file and it may be bigger than a page if there are many mounts (for example, containers).
+            # Reader reads it until end of the file and buffer size is only the initial size.
+            self.mountinfo_reader = ProcFileReader(Procfs.proc_dir + "self/mountinfo", 65536)
+            try:
+                self.mountinfo_poll = select.poll()
+                self.mountinfo_poll.register(os.open(Procfs.proc_dir + "self/mountinfo", os.O_RDONLY), select.POLLPRI | select.POLLERR)
+            except OSError:
+                self.mountinfo_poll = None
+            return True
+
+        # Mount list is get in every check if changes could not be tracked.
+        if self.mountinfo_poll is None:
+            return True
+
+        return self.mountinfo_poll.poll(0) != []
+
+
+    def device_disk_name_func(self, device_number, mount_source):
+        """
+        Get disk name of a mounted device by using its device number or mount source.
+        """
+
+        # Device number of some file systems (such as Btrfs) is an anonymous device number (major number is "0").
+        # Mount source (such as "/dev/sda2") is used for them.
+        if device_number.startswith("0:") == False:
+            disk_name = self.device_number_disk_name_dict.get(device_number)
+            if disk_name is None:
+                disk_name = os.path.realpath(Procfs.sys_dir + "dev/block/" + device_number).split("/")[-1]
+                self.device_number_disk_name_dict[device_number] = disk_name
+            return disk_name
+
+        if mount_source.startswith("/dev/") == True:
+            return os.path.realpath(mount_source).split("/")[-1]
+
+        return None
+
+
+    def mounted_disk_list_update_func(self):
+        """
+        Get mounted disks, their file systems and mount points from "/proc/self/mountinfo" file.
+        Line format: "[mount ID] [parent ID] [major:minor] [root] [mount point] [options] [optional fields] - [file system] [source] [super options]"
+        """
+
+        mountinfo_output = self.mountinfo_reader.read()
+        Procfs.readers_diagnostics_counter_add_func([self.mountinfo_reader])
+        if mountinfo_output is None:
+            return
+
+        self.mounted_disk_dict = {}
+        for line in mountinfo_output.decode(errors="ignore").split("\n"):
+            line_split = line.split(" - ", 1)
+            if len(line_split) != 2:
+                continue
+            mount_fields = line_split[0].split()
+            file_system_fields = line_split[1].split()
+            if len(mount_fields) < 5 or len(file_system_fields) < 2:
+                continue
+            device_number, mount_root, mount_point = mount_fields[2], mount_fields[3], mount_fields[4]
+            file_system, mount_source = file_system_fields[0], file_system_fields[1]
+            # Online drives are not used for avoiding long waits. Currently, "fuse.onedriver" file systems (generated by Onedriver application) are excluded.
+            if file_system == "fuse.onedriver":
+                continue
+            disk_name = self.device_disk_name_func(device_number, mount_source)
+            if disk_name is None:
+                continue
+            # A disk may be mounted multiple times (bind mounts, Btrfs subvolumes, etc.). Mount of the root folder
+            # of the file system is used if there is one. Otherwise, the first mount is used.
+            if disk_name in self.mounted_disk_dict and (self.mounted_disk_dict[disk_name][3] == "/" or mount_root != "/"):
+                continue
+            # Spaces and some other characters are escaped in the mount points (for example, " " is "\040").
+            mount_point = mount_point.replace("\\040", " ").replace("\\011", "\t").replace("\\012", "\n").replace("\\134", "\\")
+            encrypted_disk_name = ""
+            if mount_source.startswith("/dev/mapper/") == True:
+                encrypted_disk_name = mount_source.split("/dev/mapper/")[-1]
+            self.mounted_disk_dict[disk_name] = [file_system, mount_point, encrypted_disk_name, mount_root]
+
+
+    def statvfs_func(self, mount_point):
+        """
+        Get file system statistics of a mount point. "None" is returned if it could not be get or mount point is stale.
+        """
+
+        thread = self.stale_mount_point_thread_dict.get(mount_point)
+        if thread is not None:
+            if thread.is_alive() == True:
+                return None
+            del self.stale_mount_point_thread_dict[mount_point]
+
+        statvfs_result = []
+        def statvfs_thread_func():
+            try:
+                statvfs_result.append(os.statvfs(mount_point))
+            except OSError:
+                pass
+
+        thread = threading.Thread(target=statvfs_thread_func, daemon=True)
+        thread.start()
+        thread.join(self.statvfs_timeout)
+        if thread.is_alive() == True:
+            self.stale_mount_point_thread_dict[mount_point] = thread
+            return None
+        if statvfs_result == []:
+            return None
+
+        return statvfs_result[0]
+
+
+    def disk_usage_statvfs_func(self, disk_list):
+        """
+        Get file system usage information of the mounted disks by using "os.statvfs()".
+        Values are calculated as they are calculated by "df" command.
+        """
+
+        disk_usage_dict = {}
+        for disk in disk_list:
+            mounted_disk = self.mounted_disk_dict.get(disk)
+            if mounted_disk is None:
+                continue
+            disk_file_system, disk_mount_point, encrypted_disk_name, _ = mounted_disk
+            statvfs_result = self.statvfs_func(disk_mount_point)
+            # Previous values are used for stale mount points.
+            if statvfs_result is None:
+                if disk in self.disk_usage_dict:
+                    disk_usage_dict[disk] = self.disk_usage_dict[disk]
+                continue
+            disk_capacity = statvfs_result.f_blocks * statvfs_result.f_frsize
+            disk_used = (statvfs_result.f_blocks - statvfs_result.f_bfree) * statvfs_result.f_frsize
+            disk_free = statvfs_result.f_bavail * statvfs_result.f_frsize
+            # Used percentage is rounded up.
+            if disk_used + disk_free > 0:
+                disk_used_percentage = -(-disk_used * 100 // (disk_used + disk_free))
+            else:
+                disk_used_percentage = 0
+            disk_usage_dict[disk] = [disk_file_system, disk_capacity, disk_used, disk_free, disk_used_percentage, disk_mount_point, encrypted_disk_name]
+
+        return disk_usage_dict
+
+
+    def disk_usage_df_func(self):
+        """
+        Get file system usage information of the mounted disks by using "df" command.
+        It is used in Flatpak environment because mounts of the host OS are not visible in the sandbox.
+        """
+
+        # Online drives are excluded from "df" command output for avoiding long command runs and GUI blockings.
+        # Currently, "fuse.onedriver" filesystems (generated by Onedriver application) are excluded.
+        # More filesystems can be excluded by using the parameter multiple times (comma-separated filesystems
+        # for excluding are not supported by "df").
+        command_list = ["flatpak-spawn", "--host", "df", "--exclude-type=fuse.onedriver", "--output=source,fstype,size,used,avail,pcent,target"]
+        try:
+            df_output_lines = (subprocess.run(command_list, shell=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=5)).stdout.decode().strip().split("\n")
+        # Previous values are used if "df" does not return (for example, if a network file system is not reachable).
+        except subprocess.TimeoutExpired:
+            return self.disk_usage_dict
+
+        # Remove command output title line. Only disk information will be left.
+        del df_output_lines[0]
+
+        disk_usage_dict = {}
+        for line in df_output_lines:
+            line_split = line.split()
+            disk_name = line_split[0]
+            disk_file_system = line_split[1]
+            disk_capacity = int(line_split[2]) * 1024
+            disk_used = int(line_split[3]) * 1024
+            disk_free = int(line_split[4]) * 1024
+            disk_used_percentage = int(line_split[5].strip("%"))
+            disk_mount_point = line.split("% ", 1)[-1]
+            encrypted_disk_name = ""
+            # Get disk name of the encrypted disk from "/dev/mapper" ("dm-0", etc.).
+            if disk_name.startswith("/dev/mapper/") == True:
+                encrypted_disk_name = disk_name.split("/dev/mapper/")[-1]
+                if os.path.isdir(disk_name) == True:
+                    continue
+                disk_name = os.path.realpath(disk_name)
+            disk_name = disk_name.split("/dev/")[-1]
+            if disk_name not in disk_usage_dict:
+                disk_usage_dict[disk_name] = [disk_file_system, disk_capacity, disk_used, disk_free, disk_used_percentage, disk_mount_point, encrypted_disk_name]
+
+        return disk_usage_dict
+
+
+    def disk_usage_dict_get_func(self, disk_list):
+        """
+        Get file system usage information of the mounted disks. Information is get again if it is older than update
+        interval of the file system information collector or mounts are changed. Otherwise, previous information is used.
+        """
+
+        with self.lock:
+            disk_usage_dict = self.disk_usage_dict_update_func(disk_list)
+
+        return disk_usage_dict
+
+
+    def disk_usage_dict_update_func(self, disk_list):
+        """
+        Get file system usage information of the mounted disks again if it is outdated.
+        """
+
+        if Config.environment_type != "flatpak" and self.mountinfo_changed_func() == True:
+            self.mounted_disk_list_update_func()
+            self.mounted_disk_dict_changed = 1
+
+        current_time = time.monotonic()
+        if self.disk_usage_time is not None and self.mounted_disk_dict_changed == 0 and \
+           current_time - self.disk_usage_time < Scheduler.collector_update_interval_func("disk_file_system") and \
+           set(disk_list).issubset(self.disk_usage_dict_disk_set) == True:
+            return self.disk_usage_dict
+
+        if Config.environment_type == "flatpak":
+            self.disk_usage_dict = Diagnostics.timed_call_func("Disk file system usage", self.disk_usage_df_func)
+        else:
+            self.disk_usage_dict = Diagnostics.timed_call_func("Disk file system usage", self.disk_usage_statvfs_func, disk_list)
+        self.disk_usage_dict_disk_set = set(disk_list)
+        self.disk_usage_time = current_time
+        self.mounted_disk_dict_changed = 0
+
+        return self.disk_usage_dict
+
+
+FileSystemUsage = FileSystemUsage()
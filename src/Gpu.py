@@ -13,6 +13,8 @@ from locale import gettext as _tr
 from .Config import Config
 from .Performance import Performance
 from .MainWindow import MainWindow
+from .RingBuffer import RingBuffer
+from .MultiResolutionHistory import MultiResolutionHistory
 from . import Common
 
 
@@ -164,9 +166,9 @@ class Gpu:
 
         # Define initial values
         self.chart_data_history = Config.chart_data_history
-        self.gpu_load_list = [0] * self.chart_data_history
+        self.gpu_load_list = MultiResolutionHistory(self.chart_data_history)
         # Currently highest monitor refresh rate is 360. 365 is used in order to get GPU load for AMD GPUs precisely.
-        self.amd_gpu_load_list = [0] * 365
+        self.amd_gpu_load_list = RingBuffer(365)
 
 
         # Get information.
@@ -186,9 +188,27 @@ class Gpu:
         self.initial_already_run = 1
 
 
-    def gpu_loop_func(self):
+    def gpu_collect_func(self):
+        """
+        Get GPU load, memory, frequencies, temperature and power of the selected GPU. GTK is not used in this function and
+        it is run in the collector thread (see "Collector.py") because tools are run for getting information of some GPUs.
+        "None" is returned if initial function is not run yet.
+        """
+
+        if self.initial_already_run == 0:
+            return None
+
+        selected_gpu_number = self.selected_gpu_number
+        gpu_pci_address = self.gpu_pci_address_func()
+        gpu_information = self.gpu_load_memory_frequency_power_func(gpu_pci_address)
+
+        return {"selected_gpu_number": selected_gpu_number, "gpu_information": gpu_information}
+
+
+    def gpu_loop_func(self, collected_data=None):
         """
         Get and show information on the GUI on every loop.
+        GPU information is get on the main thread if it is not collected by the collector thread.
         """
 
         # Run "gpu_initial_func" if "initial_already_run variable is "0" which means all settings
@@ -197,10 +217,20 @@ class Gpu:
         if self.initial_already_run == 0:
             self.gpu_initial_func()
 
+        # Start getting GPU load of AMD GPUs in short intervals (it is stopped when GPU tab is switched off).
+        if self.device_vendor_id in ["v00001022", "v00001002"]:
+            try:
+                self.gpu_load_amd_func()
+            except Exception:
+                pass
+
+        # Data which is collected before selected GPU is changed is not used.
+        if collected_data is None or collected_data["selected_gpu_number"] != self.selected_gpu_number:
+            collected_data = self.gpu_collect_func()
+
         # Get information.
         current_resolution, current_refresh_rate = self.resolution_refresh_rate_func()
-        gpu_pci_address = self.gpu_pci_address_func()
-        gpu_load, gpu_memory, gpu_current_frequency, gpu_min_max_frequency, gpu_temperature, gpu_power = self.gpu_load_memory_frequency_power_func(gpu_pci_address)
+        gpu_load, gpu_memory, gpu_current_frequency, gpu_min_max_frequency, gpu_temperature, gpu_power = collected_data["gpu_information"]
 
         gpu_load = gpu_load.split()[0]
         if gpu_load == "-":
@@ -209,7 +239,6 @@ class Gpu:
         else:
             self.gpu_load_list.append(float(gpu_load))
             gpu_load = f'{gpu_load} %'
-        del self.gpu_load_list[0]
 
         try:
             gpu_temperature = float(gpu_temperature)
@@ -486,10 +515,10 @@ class Gpu:
                     gpu_max_frequency = gpu_max_frequency.split("Mhz")[0] + " MHz"
 
             # Get GPU load average. There is no "%" character in "gpu_busy_percent" file. This file contains GPU load for a very small time.
-            try:
-                self.gpu_load_amd_func()
-                gpu_load = f'{(sum(self.amd_gpu_load_list) / len(self.amd_gpu_load_list)):.0f} %'
-            except Exception:
+            # GPU load is get in short intervals on the main thread (see "gpu_load_amd_func").
+            if os.path.isfile(gpu_device_path + "device/gpu_busy_percent") == True:
+                gpu_load = f'{(self.amd_gpu_load_list.sum() / len(self.amd_gpu_load_list)):.0f} %'
+            else:
                 gpu_load = "-"
 
             # Get GPU used memory (data in this file is in Bytes). There is also "mem_info_vis_vram_used" file for visible memory (can be shown on the "lspci" command) and "mem_info_gtt_used" file for reserved memory from system memory. gtt+vram=total video memory. Probably "mem_busy_percent" is for memory controller load.
@@ -721,7 +750,6 @@ class Gpu:
 
         # Add GPU load data into a list in order to calculate average of the list.
         self.amd_gpu_load_list.append(float(gpu_load))
-        del self.amd_gpu_load_list[0]
 
         # Prevent running the function again if tab is GPU switched off.
         if Config.current_main_tab != 0 or Config.performance_tab_current_sub_tab != 5:
@@ -0,0 +1,145 @@
+import os
+import json
+
+
+class HardwareDatabase:
+
+    def __init__(self):
+
+        # Vendor and model names in the hardware database files are indexed once (database file path is the key) and
+        # they are get by using dictionary lookups. Database files (several MB) are not read for every device.
+        self.database_index_dict = {}
+
+        # Indexes are saved into the cache folder and they are used until database files are changed.
+        # "XDG_CACHE_HOME" may not be defined on several distributions.
+        self.cache_folder_path = os.environ.get("XDG_CACHE_HOME", os.environ.get("HOME", "") + "/.cache") + "/system-monitoring-center/hardware-database/"
+
+
+    def ids_file_index_func(self, database_file):
+        """
+        Get vendor and model names from a "hwdata" database file ("pci.ids", "usb.ids").
+        Vendor lines are in "[vendor ID]  [vendor name]" format and model lines (under vendor lines)
+        are in "\t[model ID]  [model name]" format. IDs are lowercase hexadecimal numbers.
+        Vendor key is vendor ID and model key is "[vendor ID] [model ID]".
+        """
+
+        vendor_dict = {}
+        model_dict = {}
+        vendor_id = None
+        with open(database_file, encoding="utf-8", errors="ignore") as reader:
+            for line in reader:
+                if line.startswith("#") == True or line.strip() == "":
+                    continue
+                # Subsystem lines ("\t\t[subvendor ID] [subdevice ID]  [subsystem name]") are not used.
+                if line.startswith("\t\t") == True:
+                    continue
+                if line.startswith("\t") == True:
+                    if vendor_id is not None:
+                        model_id, _, model_name = line[1:].rstrip("\n").partition("  ")
+                        model_dict[vendor_id + " " + model_id] = model_name
+                    continue
+                # There are other lists (device classes, etc.) after vendor list in the same file. Their lines
+                # (such as "C 00  [class name]") are not in vendor line format and their sublines are not used.
+                vendor_id, separator, vendor_name = line.rstrip("\n").partition("  ")
+                if separator == "" or len(vendor_id) != 4 or " " in vendor_id:
+                    vendor_id = None
+                    continue
+                vendor_dict[vendor_id] = vendor_name
+
+        return vendor_dict, model_dict
+
+
+    def hwdb_file_index_func(self, database_file):
+        """
+        Get vendor and model names from a "udev" hardware database file ("20-pci-vendor-model.hwdb", etc.).
+        Records are in "[match text]\n ID_VENDOR_FROM_DATABASE=[vendor name]" or
+        "[match text]\n ID_MODEL_FROM_DATABASE=[model name]" format (for example, match text is "pci:v000010DE*").
+        Match texts are used as vendor/model keys.
+        """
+
+        vendor_dict = {}
+        model_dict = {}
+        match_list = []
+        with open(database_file, encoding="utf-8", errors="ignore") as reader:
+            for line in reader:
+                line = line.rstrip("\n")
+                if line.startswith("#") == True:
+                    continue
+                if line.strip() == "":
+                    match_list = []
+                    continue
+                if line.startswith(" ") == False:
+                    match_list.append(line)
+                    continue
+                property_name, _, value = line.strip().partition("=")
+                if property_name == "ID_VENDOR_FROM_DATABASE":
+                    for match in match_list:
+                        vendor_dict[match] = value
+                elif property_name == "ID_MODEL_FROM_DATABASE":
+                    for match in match_list:
+                        model_dict[match] = value
+
+        return vendor_dict, model_dict
+
+
+    def database_index_get_func(self, database_file):
+        """
+        Get index of a database file. Index is get from the memory, cache file or it is generated by reading the database file.
+        """
+
+        database_index = self.database_index_dict.get(database_file)
+        if database_index is not None:
+            return database_index
+
+        try:
+            database_file_stat = os.stat(database_file)
+        except OSError:
+            database_index = ({}, {})
+            self.database_index_dict[database_file] = database_index
+            return database_index
+        database_file_information = [database_file, database_file_stat.st_mtime_ns, database_file_stat.st_size]
+
+        # Get index from the cache file if database file is not changed after the index is saved.
+        cache_file = self.cache_folder_path + os.path.normpath(database_file).strip("/").replace("/", "_") + ".json"
+        try:
+            with open(cache_file, encoding="utf-8") as reader:
+                cache_data = json.load(reader)
+            if cache_data["database_file"] == database_file_information:
+                database_index = (cache_data["vendors"], cache_data["models"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        if database_index is None:
+            if database_file.endswith(".hwdb") == True:
+                database_index = self.hwdb_file_index_func(database_file)
+            else:
+                database_index = self.ids_file_index_func(database_file)
+            # Cache file is written into a temporary file and renamed in order to prevent reading incomplete files.
+            try:
+                os.makedirs(self.cache_folder_path, exist_ok=True)
+                with open(cache_file + ".tmp", "w", encoding="utf-8") as writer:
+                    json.dump({"database_file": database_file_information, "vendors": database_index[0], "models": database_index[1]}, writer)
+                os.replace(cache_file + ".tmp", cache_file)
+            except OSError:
+                pass
+
+        self.database_index_dict[database_file] = database_index
+
+        return database_index
+
+
+    def vendor_model_names(self, database_file, vendor_key, model_key):
+        """
+        Get vendor and model names of a device. "Unknown" is returned for the names which are not found.
+        """
+
+        vendor_dict, model_dict = self.database_index_get_func(database_file)
+        device_vendor_name = vendor_dict.get(vendor_key)
+        if device_vendor_name is None:
+            return "Unknown", "Unknown"
+        device_model_name = model_dict.get(model_key, "Unknown")
+
+        return device_vendor_name, device_model_name
+
+
+HardwareDatabase = HardwareDatabase()
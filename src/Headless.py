@@ -0,0 +1,270 @@
+import os
+import sys
+import time
+import json
+import argparse
+
+from .Config import Config
+from .Performance import Performance
+from . import Procfs
+from .HwmonSensors import HwmonSensors
+from .FileSystemUsage import FileSystemUsage
+
+
+class Headless:
+
+    def __init__(self):
+
+        # Performance, processes, sensors and disk data is get by using the same modules which are used by the GUI
+        # and samples are written to stdout (JSON lines or CSV). GTK (and cairo) are not imported in this mode.
+        self.collector_list = ["performance", "processes", "sensors", "disk"]
+        self.output_format_list = ["jsonl", "csv", "none"]
+        self.csv_header = "time,collector,device,metric,value"
+
+        self.global_process_cpu_times_prev = {}
+
+
+    def argument_parser_func(self):
+        """
+        Generate parser of the command line arguments.
+        """
+
+        parser = argparse.ArgumentParser(prog="smc-cli", description="Write performance, processes, sensors and disk data to stdout without GUI.")
+        parser.add_argument("--headless", action="store_true", help=argparse.SUPPRESS)
+        parser.add_argument("--interval", type=float, default=1.0, help="time between samples in seconds (default: 1.0)")
+        parser.add_argument("--count", type=int, default=0, help="number of samples (default: 0, unlimited)")
+        parser.add_argument("--format", choices=self.output_format_list, default="jsonl", help="output format (default: jsonl, none: write nothing, for example, if only metrics exporter is used)")
+        parser.add_argument("--collectors", default=",".join(self.collector_list),
+                            help="comma separated collectors (default: " + ",".join(self.collector_list) + ")")
+        parser.add_argument("--processes", type=int, default=10, help="number of processes (highest CPU usage) per sample (default: 10, 0 for all processes)")
+        parser.add_argument("--record", action="store_true", help="record performance data to the performance history files")
+        parser.add_argument("--exporter-port", type=int, default=0, help="serve metrics for Prometheus on http://127.0.0.1:[port]/metrics (default: 0, disabled)")
+
+        return parser
+
+
+    def headless_initial_func(self, collector_list):
+        """
+        Initial code which which is not wanted to be run in every loop.
+        """
+
+        # Detect environment type (Flatpak or native). It is detected in the same way as it is detected by the main window.
+        if os.getenv('FLATPAK_ID') != None:
+            Config.environment_type = "flatpak"
+        else:
+            Config.environment_type = "native"
+
+        # Performance data is get in every loop because disk and network speeds of the disk collector and
+        # number of logical cores of the processes collector are get from it.
+        Performance.performance_background_initial_func()
+        Performance.performance_background_loop_func()
+        if "processes" in collector_list:
+            self.processes_data_func(0)
+
+
+    def headless_loop_func(self, collector_list, process_count):
+        """
+        Get data of the collectors. Returns a dictionary (collector names are keys).
+        """
+
+        # Processes are scanned once per loop (process snapshot is shared with the metrics exporter).
+        Procfs.snapshot_generation_increase()
+        Performance.performance_background_loop_func()
+
+        sample = {"time": round(time.time(), 3)}
+        if "performance" in collector_list:
+            sample["performance"] = self.performance_data_func()
+        if "processes" in collector_list:
+            sample["processes"] = self.processes_data_func(process_count)
+        if "sensors" in collector_list:
+            sample["sensors"] = self.sensors_data_func()
+        if "disk" in collector_list:
+            sample["disk"] = self.disk_data_func()
+
+        return sample
+
+
+    def performance_data_func(self):
+        """
+        Get CPU, memory, disk and network usage data (last values of the performance data histories).
+        """
+
+        return {"cpu_percent": Performance.cpu_usage_percent_ave[-1],
+                "cpu_percent_per_core": {core: Performance.cpu_usage_percent_per_core[core][-1] for core in Performance.logical_core_list},
+                "ram_percent": Performance.ram_usage_percent[-1],
+                "swap_percent": Performance.swap_usage_percent[-1],
+                "disk_read_speed": {disk: Performance.disk_read_speed[disk][-1] for disk in Performance.disk_list},
+                "disk_write_speed": {disk: Performance.disk_write_speed[disk][-1] for disk in Performance.disk_list},
+                "network_receive_speed": {network_card: Performance.network_receive_speed[network_card][-1] for network_card in Performance.network_card_list},
+                "network_send_speed": {network_card: Performance.network_send_speed[network_card][-1] for network_card in Performance.network_card_list}}
+
+
+    def processes_data_func(self, process_count):
+        """
+        Get information of the processes. Processes are sorted by CPU usage and first "process_count" processes are returned.
+        CPU usage is calculated in the same way as it is calculated in Processes tab.
+        """
+
+        processes_information_dict, global_cpu_time_all = Procfs.processes_snapshot()
+
+        if Config.processes_cpu_divide_by_core == 1:
+            core_count_division_number = Performance.number_of_logical_cores
+        else:
+            core_count_division_number = 1
+
+        process_cpu_usage_dict, self.global_process_cpu_times_prev = Procfs.processes_cpu_usage(processes_information_dict, global_cpu_time_all,
+                                                                                              self.global_process_cpu_times_prev, core_count_division_number)
+        process_list = []
+        for pid, process_information in processes_information_dict.items():
+            process_list.append({"pid": int(pid), "ppid": process_information["ppid"], "name": process_information["name"],
+                                 "username": process_information["username"], "status": process_information["status"],
+                                 "cpu_percent": process_cpu_usage_dict[pid], "rss": process_information["rss"], "vms": process_information["vms"],
+                                 "threads": process_information["threads"]})
+
+        process_list.sort(key=lambda process: process["cpu_percent"], reverse=True)
+        if process_count > 0:
+            process_list = process_list[:process_count]
+
+        return process_list
+
+
+    def sensors_data_func(self):
+        """
+        Get current, high and critical values of the sensors (in degree Celcius, RPM, Volt, Amper or Watt).
+        """
+
+        hwmon_sensor_list, raw_value_list = HwmonSensors.sensor_snapshot_func()
+        sensor_list = []
+        for (attribute, sensor_group_name, sensor_name, max_value, critical_value), raw_value in zip(hwmon_sensor_list, raw_value_list):
+            sensor_list.append({"group": sensor_group_name, "name": sensor_name, "type": attribute,
+                                "value": HwmonSensors.sensor_value_func(attribute, raw_value),
+                                "high": HwmonSensors.sensor_value_func(attribute, max_value),
+                                "critical": HwmonSensors.sensor_value_func(attribute, critical_value)})
+
+        return sensor_list
+
+
+    def disk_data_func(self):
+        """
+        Get file system usage information of the mounted disks.
+        """
+
+        disk_usage_dict = FileSystemUsage.disk_usage_dict_get_func(Performance.disk_list)
+        disk_dict = {}
+        for disk, (disk_file_system, disk_capacity, disk_used, disk_free, disk_used_percentage, disk_mount_point, encrypted_disk_name) in disk_usage_dict.items():
+            disk_dict[disk] = {"file_system": disk_file_system, "mount_point": disk_mount_point, "capacity": disk_capacity,
+                               "used": disk_used, "free": disk_free, "used_percent": disk_used_percentage}
+
+        return disk_dict
+
+
+    def csv_lines_func(self, sample):
+        """
+        Convert a sample to CSV lines (one line per value).
+        """
+
+        sample_time = sample["time"]
+        line_list = []
+        performance_data = sample.get("performance")
+        if performance_data is not None:
+            for metric, value in performance_data.items():
+                if isinstance(value, dict):
+                    for device, device_value in value.items():
+                        line_list.append(f'{sample_time},performance,{device},{metric},{device_value}')
+                else:
+                    line_list.append(f'{sample_time},performance,,{metric},{value}')
+        for process in sample.get("processes", []):
+            for metric in ["cpu_percent", "rss", "vms", "threads"]:
+                line_list.append(f'{sample_time},processes,{process["pid"]},{metric},{process[metric]}')
+        for sensor in sample.get("sensors", []):
+            device = self.csv_field_func(sensor["group"] + "/" + sensor["name"])
+            line_list.append(f'{sample_time},sensors,{device},{sensor["type"]},{"" if sensor["value"] is None else sensor["value"]}')
+        for disk, disk_data in sample.get("disk", {}).items():
+            for metric in ["capacity", "used", "free", "used_percent"]:
+                line_list.append(f'{sample_time},disk,{disk},{metric},{disk_data[metric]}')
+
+        return line_list
+
+
+    def csv_field_func(self, value):
+        """
+        Quote a CSV field if it has special characters.
+        """
+
+        if "," in value or '"' in value or "\n" in value:
+            return '"' + value.replace('"', '""') + '"'
+        return value
+
+
+    def headless_run_func(self, argv):
+        """
+        Parse the arguments, get samples in the preferred interval and write them to stdout.
+        """
+
+        arguments = self.argument_parser_func().parse_args(argv)
+        collector_list = [collector.strip() for collector in arguments.collectors.split(",") if collector.strip() != ""]
+        for collector in collector_list:
+            if collector not in self.collector_list:
+                sys.stderr.write(f'smc-cli: unknown collector: {collector}\n')
+                return 2
+        if arguments.interval <= 0:
+            sys.stderr.write("smc-cli: interval must be bigger than 0\n")
+            return 2
+
+        # Update interval is used by the collectors (for example, for speed calculations and update intervals of the collectors).
+        Config.update_interval = arguments.interval
+        # Performance data is not recorded unless it is preferred in order to avoid writing the same files with the GUI.
+        Config.record_performance_history = 1 if arguments.record == True else 0
+
+        self.headless_initial_func(collector_list)
+
+        # Metrics exporter uses values of the collectors of this loop. Processes are served only if processes collector is used.
+        if arguments.exporter_port > 0:
+            from .MetricsExporter import MetricsExporter
+            Config.metrics_exporter = 1
+            Config.metrics_exporter_process_count = arguments.processes if "processes" in collector_list else 0
+            error_message = MetricsExporter.exporter_start_func(arguments.exporter_port)
+            if error_message is not None:
+                sys.stderr.write(f'smc-cli: metrics exporter could not be started: {error_message}\n')
+                return 1
+        else:
+            Config.metrics_exporter = 0
+
+        output = sys.stdout
+        if arguments.format == "csv":
+            output.write(self.csv_header + "\n")
+            output.flush()
+
+        sample_count = 0
+        next_sample_time = time.monotonic() + arguments.interval
+        try:
+            while arguments.count == 0 or sample_count < arguments.count:
+                time.sleep(max(0, next_sample_time - time.monotonic()))
+                next_sample_time = next_sample_time + arguments.interval
+                sample = self.headless_loop_func(collector_list, arguments.processes)
+                if Config.metrics_exporter == 1:
+                    MetricsExporter.exporter_tick_func()
+                if arguments.format == "jsonl":
+                    output.write(json.dumps(sample, separators=(",", ":")) + "\n")
+                    output.flush()
+                elif arguments.format == "csv":
+                    output.write("\n".join(self.csv_lines_func(sample)) + "\n")
+                    output.flush()
+                sample_count = sample_count + 1
+        # Stop without error messages if output is closed (for example, output is piped to "head") or user stops it.
+        except BrokenPipeError:
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+        except KeyboardInterrupt:
+            pass
+
+        return 0
+
+
+Headless = Headless()
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    return Headless.headless_run_func(argv)
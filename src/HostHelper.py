@@ -0,0 +1,229 @@
+import os
+import json
+import struct
+import select
+import subprocess
+import threading
+
+
+# This script is run on the host OS (by using "flatpak-spawn --host") once and it is kept running.
+# It reads requests (one JSON line per request) from stdin and writes responses to stdout.
+# Response format: number of items (4 bytes), then for every item, data length (4 bytes, "-1" if
+# the item could not be get) and data. Only Python standard library is used in order to run it on
+# every host OS which has Python.
+host_helper_script = r'''
+import os, sys, json, struct
+stdin = sys.stdin.buffer
+stdout = sys.stdout.buffer
+
+def read(path, read_size):
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        chunks = []
+        remaining_size = read_size
+        while remaining_size > 0:
+            chunk = os.read(fd, min(remaining_size, 1048576))
+            if chunk == b"":
+                break
+            chunks.append(chunk)
+            remaining_size = remaining_size - len(chunk)
+        return b"".join(chunks)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+def listdir(path):
+    try:
+        return b"\x00".join(os.listdir(path))
+    except OSError:
+        return None
+
+def readlink(path):
+    try:
+        return os.readlink(path)
+    except OSError:
+        return None
+
+def realpath(path):
+    return os.path.realpath(path)
+
+operations = {"read": read, "listdir": listdir, "readlink": readlink, "realpath": realpath}
+
+for line in stdin:
+    request = json.loads(line)
+    operation = operations.get(request["op"])
+    items = []
+    if operation is read:
+        items = [read(os.fsencode(path), request["size"]) for path in request["paths"]]
+    elif operation is not None:
+        items = [operation(os.fsencode(path)) for path in request["paths"]]
+    output = [struct.pack("!i", len(items))]
+    for item in items:
+        if item is None:
+            output.append(struct.pack("!i", -1))
+        else:
+            output.append(struct.pack("!i", len(item)))
+            output.append(item)
+    stdout.write(b"".join(output))
+    stdout.flush()
+'''
+
+
+class HostHelper:
+
+    def __init__(self):
+
+        self.helper_process = None
+        # "1" means that helper could not be started (for example, if there is no Python on the host OS).
+        # Functions return "None" in this situation and callers use "flatpak-spawn --host [command]" for every operation.
+        self.helper_unavailable = 0
+        # Helper may be used by functions which are run in different threads.
+        self.helper_lock = threading.Lock()
+
+
+    def helper_start_func(self):
+        """
+        Start the helper on the host OS and check if it responds.
+        """
+
+        try:
+            self.helper_process = subprocess.Popen(["flatpak-spawn", "--host", "python3", "-u", "-c", host_helper_script],
+                                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, shell=False)
+        except OSError:
+            self.helper_process = None
+            self.helper_unavailable = 1
+            return
+
+        # Wait for the response of a request without items. "flatpak-spawn" starts running
+        # even if there is no Python on the host OS. It is stopped by checking the response.
+        try:
+            self.helper_process.stdin.write(b'{"op": "ping", "paths": []}\n')
+            self.helper_process.stdin.flush()
+            if select.select([self.helper_process.stdout], [], [], 5)[0] == [] or \
+               self.helper_response_func() != []:
+                raise OSError
+        except (OSError, ValueError, struct.error):
+            self.helper_stop_func()
+            self.helper_unavailable = 1
+
+
+    def helper_stop_func(self):
+        """
+        Stop the helper.
+        """
+
+        if self.helper_process is not None:
+            try:
+                self.helper_process.kill()
+                self.helper_process.wait()
+            except OSError:
+                pass
+            self.helper_process = None
+
+
+    def helper_response_func(self):
+        """
+        Read a response from the helper.
+        """
+
+        reader = self.helper_process.stdout
+        number_of_items = struct.unpack("!i", reader.read(4))[0]
+        items = []
+        for _ in range(number_of_items):
+            item_length = struct.unpack("!i", reader.read(4))[0]
+            if item_length == -1:
+                items.append(None)
+                continue
+            item = reader.read(item_length)
+            if len(item) != item_length:
+                raise OSError
+            items.append(item)
+
+        return items
+
+
+    def helper_request_func(self, operation, paths, read_size=0):
+        """
+        Send a request to the helper and get the response. Helper is started if it is not started before.
+        Helper is restarted on the next request if it is stopped unexpectedly.
+        """
+
+        with self.helper_lock:
+            if self.helper_unavailable == 1:
+                return None
+            if self.helper_process is None:
+                self.helper_start_func()
+                if self.helper_unavailable == 1:
+                    return None
+
+            request = json.dumps({"op": operation, "paths": paths, "size": read_size}).encode() + b"\n"
+            try:
+                self.helper_process.stdin.write(request)
+                self.helper_process.stdin.flush()
+                return self.helper_response_func()
+            except (OSError, ValueError, struct.error):
+                self.helper_stop_func()
+                return None
+
+
+    def read_files(self, paths, read_size=131072):
+        """
+        Read files on the host OS. Returns a list of bytes ("None" for files which could not be read).
+        Returns "None" if helper could not be used.
+        """
+
+        return self.helper_request_func("read", paths, read_size)
+
+
+    def list_dirs(self, paths):
+        """
+        List directories on the host OS. Returns a list of name lists ("None" for directories which could not be listed).
+        Returns "None" if helper could not be used.
+        """
+
+        outputs = self.helper_request_func("listdir", paths)
+        if outputs is None:
+            return None
+
+        dir_lists = []
+        for output in outputs:
+            if output is None:
+                dir_lists.append(None)
+            elif output == b"":
+                dir_lists.append([])
+            else:
+                dir_lists.append(os.fsdecode(output).split("\x00"))
+
+        return dir_lists
+
+
+    def readlinks(self, paths):
+        """
+        Get targets of links on the host OS. Returns a list of targets ("None" for paths which are not links or could not be read).
+        Returns "None" if helper could not be used.
+        """
+
+        outputs = self.helper_request_func("readlink", paths)
+        if outputs is None:
+            return None
+
+        return [None if output is None else os.fsdecode(output) for output in outputs]
+
+
+    def realpaths(self, paths):
+        """
+        Get real paths on the host OS. Returns "None" if helper could not be used.
+        """
+
+        outputs = self.helper_request_func("realpath", paths)
+        if outputs is None:
+            return None
+
+        return [os.fsdecode(output) for output in outputs]
+
+
+HostHelper = HostHelper()
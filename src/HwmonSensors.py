@@ -0,0 +1,157 @@
+import os
+import threading
+
+from . import Procfs
+from .Procfs import ProcFileReader
+from .Diagnostics import Diagnostics
+
+
+class HwmonSensors:
+
+    def __init__(self):
+
+        # Sensor list (sensor groups, names, high/critical values, etc.) and file readers of the sensor current values.
+        # They are updated if sensor groups are changed. This module has no GUI code and it is used by Sensors tab and headless mode.
+        self.hwmon_dir = Procfs.sys_dir + "class/hwmon/"
+        self.supported_sensor_attributes = ["temp", "fan", "in", "curr", "power"]
+        self.sensor_groups_prev = None
+        self.sensor_list = []
+        self.sensor_input_reader_list = []
+        # Sensors are read once per main loop ("Procfs.snapshot_generation") and the values are shared by the Sensors tab (main thread)
+        # and the metrics exporter (collector thread).
+        self.lock = threading.Lock()
+        self.snapshot_generation = -1
+        self.snapshot = ([], [])
+
+
+    def sensor_file_read_func(self, path):
+        """
+        Read a sensor file. "None" is returned if file could not be read.
+        """
+
+        try:
+            with open(path, "rb") as reader:
+                return reader.read()
+        except OSError:
+            return None
+
+
+    def sensor_raw_value_func(self, value):
+        """
+        Convert sensor value (bytes which are read from the sensor file) to integer. "None" is returned if file could not be read.
+        """
+
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+
+    def sensor_value_func(self, attribute, value):
+        """
+        Convert raw sensor value to degree Celcius, RPM, Volt, Amper or Watt. "None" is returned if there is no value.
+        """
+
+        if value is None:
+            return None
+
+        # Units of data in the sensor files are millidegree Celcius for temperature sensors, RPM for fan sensors,
+        # millivolt for voltage sensors, milliamper for current sensors and microwatt for power sensors.
+        if attribute == "fan":
+            return value
+        if attribute == "power":
+            return value / 1000000
+        return value / 1000
+
+
+    def sensor_list_update_func(self):
+        """
+        Get sensor list if sensor groups (and their devices) are changed since the previous loop.
+        Returns "True" if sensor list is updated.
+        """
+
+        hwmon_dir = self.hwmon_dir
+        # Sensor groups are checked with their device paths because "hwmon[number]" names may be used for different devices after hotplug.
+        try:
+            sensor_groups = [(sensor_group, os.readlink(hwmon_dir + sensor_group)) for sensor_group in sorted(os.listdir(hwmon_dir))]    # Get sensor group names. In some sensor directories there are a name file and multiple label files. For example, name: "coretemp", label: "Core 0", "Core 1", ... For easier grouping and understanding name is used as "Sensor Group" name and labels are used as "Sensor" names.
+        except OSError:
+            sensor_groups = []
+        if sensor_groups == self.sensor_groups_prev:
+            return False
+        self.sensor_groups_prev = sensor_groups
+
+        for reader in self.sensor_input_reader_list:
+            reader.close()
+        self.sensor_list = []
+        self.sensor_input_reader_list = []
+
+        for sensor_group, device_path in sensor_groups:
+            sensor_group_dir = hwmon_dir + sensor_group + "/"
+            try:
+                files_in_sensor_group = set(os.listdir(sensor_group_dir))
+            except OSError:
+                continue
+            # Get device name
+            sensor_group_name = self.sensor_file_read_func(sensor_group_dir + "name")
+            sensor_group_name = "" if sensor_group_name is None else sensor_group_name.decode().strip()
+            # Get device detailed name
+            device_detailed_name = device_path.split("/")[-2]
+            if device_detailed_name.startswith("hwmon") == True:
+                device_detailed_name = device_path.split("/")[-3]
+                if device_detailed_name.startswith("hwmon") == True:
+                    device_detailed_name = "-"
+            if device_detailed_name != "-" and device_detailed_name.startswith("0000:") == False:
+                sensor_group_name = device_detailed_name + " ( " + sensor_group_name + " )"
+
+            for attribute in self.supported_sensor_attributes:
+                sensor_number = 0
+                while True:                                                                       # Continue loop until code breaks it when next sensor data is not available in the folder.
+                    sensor_file_prefix = attribute + str(sensor_number)
+                    if (sensor_file_prefix + "_label" not in files_in_sensor_group) and (sensor_file_prefix + "_input" not in files_in_sensor_group):    # Some sensor groups have both label and input files. Some sensor groups have only label or only input files. Some sensor groups do not have label or input files, but they have name files. Data of sensor groups with only name files are not get because they do not have sensor values.
+                        if sensor_number == 0:                                                    # Number in sensor names may start from 0 or 1. Skipped to next loop if number is 0.
+                            sensor_number = sensor_number + 1
+                            continue
+                        if sensor_number > 0:                                                     # Number in sensor names may start from 0 or 1. Loop is broken if number is bigger than 1.
+                            break
+                    # Get sensor name
+                    sensor_name = self.sensor_file_read_func(sensor_group_dir + sensor_file_prefix + "_label")
+                    sensor_name = "-" if sensor_name is None else sensor_name.decode().strip()
+                    # Get sensor high and critical values (raw values). They are not changed and they are get once.
+                    max_value = self.sensor_raw_value_func(self.sensor_file_read_func(sensor_group_dir + sensor_file_prefix + "_max"))
+                    critical_value = self.sensor_raw_value_func(self.sensor_file_read_func(sensor_group_dir + sensor_file_prefix + "_crit"))
+
+                    self.sensor_list.append((attribute, sensor_group_name, sensor_name, max_value, critical_value))
+                    self.sensor_input_reader_list.append(ProcFileReader(sensor_group_dir + sensor_file_prefix + "_input", 64))
+
+                    sensor_number = sensor_number + 1                                             # Increase sensor number by "1" in order to use this value for getting next file names of the sensor.
+
+        return True
+
+
+    def sensor_raw_values_func(self):
+        """
+        Get current values (raw values) of the sensors in "sensor_list" order.
+        """
+
+        sensor_raw_value_list = [self.sensor_raw_value_func(reader.read()) for reader in self.sensor_input_reader_list]
+        Procfs.readers_diagnostics_counter_add_func(self.sensor_input_reader_list)
+
+        return sensor_raw_value_list
+
+
+    def sensor_snapshot_func(self):
+        """
+        Get sensor list and current values (raw values) of the sensors of the current loop.
+        Sensor files are read once per loop even if values are used by multiple functions.
+        """
+
+        with self.lock:
+            if self.snapshot_generation != Procfs.snapshot_generation:
+                Diagnostics.timed_call_func("Sensors (list)", self.sensor_list_update_func)
+                self.snapshot = (self.sensor_list, Diagnostics.timed_call_func("Sensors (read)", self.sensor_raw_values_func))
+                self.snapshot_generation = Procfs.snapshot_generation
+
+            return self.snapshot
+
+
+HwmonSensors = HwmonSensors()
@@ -2,7 +2,9 @@
 
 import gi
 gi.require_version('Gtk', '4.0')
-from gi.repository import Gtk
+gi.require_version('GLib', '2.0')
+gi.require_version('Gio', '2.0')
+from gi.repository import Gtk, GLib, Gio
 
 
 class SMCApplication(Gtk.Application):
@@ -12,14 +14,34 @@ class SMCApplication(Gtk.Application):
         self.connect('activate', self.on_activate)
         self.main_window = None
 
+        # Actions for capturing profiles of the running application for the next ticks. Parameter is number of the ticks.
+        # They are run by using keyboard shortcuts or by using "gapplication action [application ID] profile 20" command.
+        action = Gio.SimpleAction.new("profile", GLib.VariantType.new("i"))
+        action.connect("activate", self.on_profile_action_activate)
+        self.add_action(action)
+        action = Gio.SimpleAction.new("memory-profile", GLib.VariantType.new("i"))
+        action.connect("activate", self.on_profile_action_activate)
+        self.add_action(action)
+
     def on_activate(self, app):
         # Allow opening single instance of the application.
         if not self.main_window:
             from .MainWindow import MainWindow
             self.main_window = MainWindow.main_window
             self.main_window.set_application(self)
+            self.set_accels_for_action("app.profile(10)", ["<Control><Shift>p"])
+            self.set_accels_for_action("app.memory-profile(10)", ["<Control><Shift>m"])
             self.main_window.present()
 
+    def on_profile_action_activate(self, action, parameter):
+        # Results are saved into "[XDG_CACHE_HOME]/system-monitoring-center/profiles/" folder.
+        from .Profiler import Profiler
+        tick_count = max(1, parameter.get_int32())
+        if action.get_name() == "profile":
+            Profiler.profile_start_func(tick_count)
+        else:
+            Profiler.tracemalloc_start_func(tick_count)
+
 
 localedir = None
 def main(_localedir):
@@ -14,6 +14,11 @@ from locale import gettext as _tr
 from .Config import Config
 from .Performance import Performance
 from . import Common
+from . import Procfs
+from .HwmonSensors import HwmonSensors
+from .Collector import Collector
+from .Scheduler import Scheduler
+from .Diagnostics import Diagnostics
 
 
 class MainWindow():
@@ -47,8 +52,18 @@ class MainWindow():
 
         # Run "Performance" module in order to provide performance data
         # to Performance tab and performance summary on the headerbar.
+        # Loops (including the first loop which gets device lists) are run in the collector thread.
         Performance.performance_background_initial_func()
 
+        # Default tab is built when data of the first collection is applied because device lists (CPU cores, disks,
+        # network cards) are used when it is built. Main loop is not blocked for getting them before the first frame.
+        self.default_tab_built = False
+
+        # Start serving metrics on the local HTTP endpoint if it is preferred.
+        if Config.metrics_exporter == 1:
+            from .MetricsExporter import MetricsExporter
+            MetricsExporter.exporter_start_func()
+
         # Define these settings in order to avoid error on the first call 
         # of "main_gui_tab_loop" function. This value is used in order to detect
         # the current tab without checking GUI obejects for lower CPU usage.
@@ -233,6 +248,18 @@ class MainWindow():
         self.main_tab_stack.set_transition_type(Gtk.StackTransitionType.NONE)
         self.main_grid.attach(self.main_tab_stack, 0, 2, 1, 1)
 
+        # Label (diagnostics panel). Durations of the collectors and loop functions and counters of the last tick are shown
+        # on this panel if it is enabled from the main menu or by using "SMC_DIAGNOSTICS=1" environment variable.
+        self.diagnostics_label = Gtk.Label()
+        self.diagnostics_label.set_halign(Gtk.Align.START)
+        self.diagnostics_label.set_selectable(True)
+        self.diagnostics_label.add_css_class("monospace")
+        self.diagnostics_label.add_css_class("dim-label")
+        self.diagnostics_label.set_visible(Diagnostics.panel_enabled)
+        self.main_grid.attach(self.diagnostics_label, 0, 3, 1, 1)
+        if Diagnostics.panel_enabled == True:
+            Diagnostics.subprocess_counting_start_func()
+
         # Main Grid (Performance tab)
         self.performance_tab_main_grid = Gtk.Grid.new()
         self.performance_tab_main_grid.set_column_spacing(2)
@@ -402,19 +429,53 @@ class MainWindow():
             Config.remember_window_size = [remember_window_size_value, main_window_state, main_window_width, main_window_height]
             Config.config_save_func()
 
+        # Stop worker threads which are used for getting service information.
+        from . import ServicesGetMultProc
+        ServicesGetMultProc.worker_pool_shutdown_func()
+
+        # Write recorded performance data to the disk.
+        if Config.record_performance_history == 1:
+            from .MetricStore import MetricStore
+            MetricStore.flush_func()
+
+        # Stop serving metrics.
+        if Config.metrics_exporter == 1:
+            from .MetricsExporter import MetricsExporter
+            MetricsExporter.exporter_stop_func()
+
+        # Stop detecting main loop stalls.
+        if Config.main_loop_watchdog == 1:
+            from .Watchdog import Watchdog
+            Watchdog.watchdog_stop_func()
+
 
     def on_main_window_show(self, widget):
         """
         Run code after window is shown.
         """
 
-        # Start the main loop function
+        # Only the default tab is imported and built when data of the first collection is applied.
+        # Other tabs are imported and built when they are switched on. Initial functions of the tabs
+        # (getting device/service/package lists, etc.) are run after the first frame is drawn ("GLib.idle_add()").
+        # Start the main loop function.
         self.main_gui_tab_loop()
 
-        self.unified_tab_device_list_width()
+        # Start detecting main loop stalls if it is preferred. It is started after the first frame is drawn ("GLib.idle_add()")
+        # because building the GUI blocks the main loop on cold start and this is not a stall of the shown window.
+        if Config.main_loop_watchdog == 1:
+            GLib.idle_add(self.main_loop_watchdog_start_func)
 
-        # Run main tab function (It is also called when main tab togglebuttons are toggled).
-        self.main_gui_tab_switch()
+
+    def main_loop_watchdog_start_func(self):
+        """
+        Start detecting main loop stalls. This function is run once after the first frame is drawn.
+        """
+
+        if Config.main_loop_watchdog == 1:
+            from .Watchdog import Watchdog
+            Watchdog.watchdog_start_func()
+
+        return False
 
 
     def main_menu_gui(self, val=None):
@@ -435,10 +496,15 @@ class MainWindow():
         action = Gio.SimpleAction.new("about", None)
         action.connect("activate", self.on_main_menu_about_button_clicked)
         self.main_window.add_action(action)
+        # "Diagnostics" action (check menu item)
+        action = Gio.SimpleAction.new_stateful("diagnostics", None, GLib.Variant.new_boolean(Diagnostics.panel_enabled))
+        action.connect("activate", self.on_main_menu_diagnostics_button_clicked)
+        self.main_window.add_action(action)
 
         # Menu model
         main_menu_model = Gio.Menu.new()
         main_menu_model.append(_tr("General Settings"), "win.settings")
+        main_menu_model.append(_tr("Diagnostics"), "win.diagnostics")
         main_menu_model.append(_tr("About"), "win.about")
 
         # Popover menu
@@ -458,6 +524,18 @@ class MainWindow():
         SettingsWindow.settings_window.present()
 
 
+    def on_main_menu_diagnostics_button_clicked(self, action, parameter):
+        """
+        Show/Hide diagnostics panel.
+        """
+
+        Diagnostics.panel_enabled = not action.get_state().get_boolean()
+        action.set_state(GLib.Variant.new_boolean(Diagnostics.panel_enabled))
+        if Diagnostics.panel_enabled == True:
+            Diagnostics.subprocess_counting_start_func()
+        self.diagnostics_label.set_visible(Diagnostics.panel_enabled)
+
+
     def on_main_menu_about_button_clicked(self, action, parameter):
         """
         Generate and show about dialog.
@@ -644,7 +722,8 @@ class MainWindow():
         Runs tab functions (Performance, Processes, CPU, Memory, etc.) when their togglebutton is toggled).
         """
 
-        if widget.get_active() == True:
+        # Tab is switched when the default tab is built if a togglebutton is toggled before the first collection.
+        if widget.get_active() == True and self.default_tab_built == True:
             self.main_gui_tab_switch()
 
 
@@ -1175,36 +1254,117 @@ class MainWindow():
             pass
         self.main_glib_source = GLib.timeout_source_new(Config.update_interval * 1000)
 
-        Performance.performance_background_loop_func()
+        # Data of the loop is get in the collector thread and GUI is updated on the main thread when data is collected.
+        # Collection of this loop is skipped if collection of the previous loop is not finished (for example, if it takes
+        # longer than update interval because of a slow disk or a high number of processes).
+        # Collectors which are due on this tick are determined by the scheduler. Tick is not started if collection of
+        # the previous tick is not finished. Thus collectors which are not run are run on the next tick.
+        if Collector.collection_running == False:
+            Scheduler.tick_func()
+        Collector.collection_request_func(self.main_gui_tab_collect_func, self.main_gui_tab_apply_func)
 
-        if Config.performance_summary_on_the_headerbar == 1:
-            GLib.idle_add(self.performance_summary_headerbar_loop)
+        self.main_glib_source.set_callback(self.main_gui_tab_loop)
+        # Attach GLib.Source to MainContext.
+        # Therefore it will be part of the main loop until it is destroyed.
+        # A function may be attached to the MainContext multiple times.
+        self.main_glib_source.attach(GLib.MainContext.default())
+
+
+    def main_gui_tab_collect_func(self):
+        """
+        Get data of the loop in the collector thread. GTK functions must not be used in this function.
+        Collected data of the Processes, Disk, GPU and Services tabs is returned with the collector name because
+        tab may be switched before the data is used on the main thread.
+        Process snapshot (Users tab) and sensor values (Sensors tab) are also get in this thread and they are used
+        by the loop functions of the tabs without reading files again.
+        """
+
+        # Mark the process snapshot which is shared by tabs and windows as outdated. Processes are scanned once in this loop by the first function which needs them.
+        Procfs.snapshot_generation_increase()
 
+        Diagnostics.timed_call_func("Performance (background)", Performance.performance_background_loop_func)
+
+        collected_data = [None, None]
         if Config.current_main_tab == 0:
+            if Config.performance_tab_current_sub_tab == 3:
+                collected_data = ["disk", Diagnostics.timed_call_func("Disk (collect)", Disk.disk_collect_func)]
+            elif Config.performance_tab_current_sub_tab == 5 and Scheduler.collector_due_func("gpu") == True:
+                collected_data = ["gpu", Diagnostics.timed_call_func("GPU (collect)", Gpu.gpu_collect_func)]
+            elif Config.performance_tab_current_sub_tab == 6 and Scheduler.collector_due_func("sensors") == True:
+                HwmonSensors.sensor_snapshot_func()
+        elif Config.current_main_tab == 1 and Processes.initial_already_run == 1 and Scheduler.collector_due_func("processes") == True:
+            collected_data = ["processes", Diagnostics.timed_call_func("Processes (collect)", Processes.processes_collect_func)]
+        elif Config.current_main_tab == 2 and Scheduler.collector_due_func("users") == True:
+            Diagnostics.timed_call_func("Users (collect)", Procfs.processes_snapshot)
+        elif Config.current_main_tab == 3 and Config.init_system == "systemd" and Services.initial_already_run == 1 and Scheduler.collector_due_func("services") == True:
+            collected_data = ["services", Diagnostics.timed_call_func("Services (collect)", Services.services_collect_func)]
+
+        # Values of the metrics exporter are get after the tab data in order to use the same process snapshot.
+        if Config.metrics_exporter == 1:
+            from .MetricsExporter import MetricsExporter
+            Diagnostics.timed_call_func("Metrics exporter", MetricsExporter.exporter_tick_func)
+
+        return collected_data
+
+
+    def main_gui_tab_apply_func(self, collected_data):
+        """
+        Update GUI of the opened tab on the main thread by using the data which is get in the collector thread.
+        Tabs which have no collection function get their data in their loop functions. Loop functions of the tabs
+        which have collection functions get their data on the main thread if data is collected for another tab.
+        """
+
+        collector, tab_collected_data = collected_data
+
+        if Config.performance_summary_on_the_headerbar == 1:
+            Diagnostics.timed_call_func("Headerbar performance summary", self.performance_summary_headerbar_loop)
+
+        # Build the default tab by using the device lists which are get by the first collection. Run main tab function
+        # (It is also called when main tab togglebuttons are toggled). It runs the loop function of the tab.
+        if self.default_tab_built == False:
+            self.default_tab_built = True
+            self.main_gui_tab_switch()
+            self.unified_tab_device_list_width()
+        elif Config.current_main_tab == 0:
             if Config.performance_tab_current_sub_tab == 0:
-                GLib.idle_add(Summary.summary_loop_func)
+                Diagnostics.timed_call_func("Summary (loop)", Summary.summary_loop_func)
             elif Config.performance_tab_current_sub_tab == 1:
-                GLib.idle_add(Cpu.cpu_loop_func)
+                Diagnostics.timed_call_func("CPU (loop)", Cpu.cpu_loop_func)
             elif Config.performance_tab_current_sub_tab == 2:
-                GLib.idle_add(Memory.memory_loop_func)
+                Diagnostics.timed_call_func("Memory (loop)", Memory.memory_loop_func)
             elif Config.performance_tab_current_sub_tab == 3:
-                GLib.idle_add(Disk.disk_loop_func)
+                if collector != "disk":
+                    tab_collected_data = None
+                Diagnostics.timed_call_func("Disk (apply)", Disk.disk_loop_func, tab_collected_data)
             elif Config.performance_tab_current_sub_tab == 4:
-                GLib.idle_add(Network.network_loop_func)
+                Diagnostics.timed_call_func("Network (loop)", Network.network_loop_func)
             elif Config.performance_tab_current_sub_tab == 5:
-                GLib.idle_add(Gpu.gpu_loop_func)
+                if Scheduler.collector_due_func("gpu") == True:
+                    if collector != "gpu":
+                        tab_collected_data = None
+                    Diagnostics.timed_call_func("GPU (apply)", Gpu.gpu_loop_func, tab_collected_data)
             elif Config.performance_tab_current_sub_tab == 6:
-                GLib.idle_add(Sensors.sensors_loop_func)
+                if Scheduler.collector_due_func("sensors") == True:
+                    Diagnostics.timed_call_func("Sensors (loop)", Sensors.sensors_loop_func)
         elif Config.current_main_tab == 1:
-            GLib.idle_add(Processes.processes_loop_func)
+            if Processes.initial_already_run == 1 and Scheduler.collector_due_func("processes") == True:
+                if collector != "processes":
+                    tab_collected_data = None
+                Diagnostics.timed_call_func("Processes (apply)", Processes.processes_loop_func, tab_collected_data)
         elif Config.current_main_tab == 2:
-            GLib.idle_add(Users.users_loop_func)
-
-        self.main_glib_source.set_callback(self.main_gui_tab_loop)
-        # Attach GLib.Source to MainContext.
-        # Therefore it will be part of the main loop until it is destroyed.
-        # A function may be attached to the MainContext multiple times.
-        self.main_glib_source.attach(GLib.MainContext.default())
+            if Scheduler.collector_due_func("users") == True:
+                Diagnostics.timed_call_func("Users (loop)", Users.users_loop_func)
+        # Service list is updated by using the refresh button or in the update interval of the services collector.
+        elif Config.current_main_tab == 3:
+            if Services.initial_already_run == 1 and Scheduler.collector_due_func("services") == True:
+                if collector != "services":
+                    tab_collected_data = None
+                Diagnostics.timed_call_func("Services (apply)", Services.services_loop_func, tab_collected_data)
+
+        # End the tick of the diagnostics registry and show the values of the tick if diagnostics panel is enabled.
+        Diagnostics.tick_end_func()
+        if Diagnostics.panel_enabled == True:
+            self.diagnostics_label.set_text(Diagnostics.report_text_func(Collector.collect_duration_last))
 
 
     def performance_summary_headerbar_loop(self):
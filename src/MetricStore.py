@@ -0,0 +1,287 @@
+import os
+import mmap
+import errno
+import array
+import time
+import struct
+import threading
+from bisect import bisect_left
+
+
+class MetricStore:
+
+    def __init__(self):
+
+        # Performance data is recorded into fixed size ring files (one file per metric family) if it is enabled by the user.
+        # Files are memory mapped. A record (time and values of all series of the family) is written into the file by copying
+        # it into the mapped memory (there is no write call per value). Oldest record is overwritten when the file is full.
+        # "XDG_STATE_HOME" may not be defined on several distributions.
+        self.store_folder_path = os.environ.get("XDG_STATE_HOME", os.environ.get("HOME", "") + "/.local/state") + "/system-monitoring-center/metrics/"
+
+        # File format:
+        # Header: magic, version, number of the series slots, number of the records (capacity), number of the written records.
+        # Series names are written after the header (fixed length per name). Records are written after the series names (header size is multiple of page size).
+        # A record has float64 values: time (Unix time) and value of every series slot (values of the unused slots are "0").
+        # Thus all records are an array of float64 values and values of a series can be get by using a strided view without parsing them.
+        self.header_struct = struct.Struct("<8sIIQQ")
+        self.magic = b"SMCRING1"
+        self.version = 1
+        self.series_name_offset = 64
+        self.series_name_length = 32
+        # Write count is updated after writing values of a record in order to prevent reading the record before it is written completely.
+        self.write_count_offset = 24
+        self.capacity = 43200
+        # Minimum number of the series slots of the metric families. Number of the slots is also get from the number of the
+        # series (devices) when the file is generated and half of this number is added as free slots for new devices (hotplug).
+        # If there is no free slot, slot of the series which is not recorded for the longest time (removed device) is reused.
+        # File is generated again with more slots (records are copied) if all slots are used by the current series.
+        self.family_slot_count_dict = {"cpu": 0, "memory": 2, "disk": 32, "network": 32}
+        # Recorded data is used for seeding the chart histories when the application is started. There is no GUI for browsing
+        # older recorded data. "series_values_func" can be used for reading it.
+
+        self.family_dict = {}
+        self.lock = threading.Lock()
+
+
+    def family_open_func(self, family, series_count):
+        """
+        Open (or generate) the ring file of a metric family and map it into memory.
+        "None" is returned if the file is opened for reading ("series_count" is "0") and it is not valid.
+        """
+
+        slot_count = max(self.family_slot_count_dict[family], series_count + series_count // 2)
+        header_size = -(-(self.series_name_offset + self.series_name_length * slot_count) // mmap.PAGESIZE) * mmap.PAGESIZE
+
+        os.makedirs(self.store_folder_path, exist_ok=True)
+        file_path = self.store_folder_path + family + ".ring"
+        fd = os.open(file_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            # Use the existing file if its header is valid. Otherwise file is generated again.
+            header = os.pread(fd, self.header_struct.size, 0)
+            if len(header) == self.header_struct.size:
+                magic, version, file_slot_count, capacity, write_count = self.header_struct.unpack(header)
+                # Existing file is used even if it has less slots than the number of the series. File is generated again with more slots when a slot is needed.
+                if magic == self.magic and version == self.version and capacity == self.capacity and file_slot_count > 0:
+                    slot_count = file_slot_count
+                    header_size = -(-(self.series_name_offset + self.series_name_length * slot_count) // mmap.PAGESIZE) * mmap.PAGESIZE
+                # File is not generated if it is opened for reading recorded data ("series_count" is "0").
+                elif series_count == 0:
+                    return None
+                else:
+                    os.ftruncate(fd, 0)
+                    header = b""
+            file_size = header_size + self.capacity * (slot_count + 1) * 8
+            if len(header) != self.header_struct.size:
+                # Disk space is allocated when the file is generated. Writing into the mapped memory of a file which has
+                # no disk space (sparse file on a full disk) stops the application with SIGBUS error.
+                try:
+                    os.posix_fallocate(fd, 0, file_size)
+                except OSError as e:
+                    if e.errno not in (errno.EOPNOTSUPP, errno.EINVAL):
+                        raise
+                    os.ftruncate(fd, file_size)
+                os.pwrite(fd, self.header_struct.pack(self.magic, self.version, slot_count, self.capacity, 0), 0)
+            file_mmap = mmap.mmap(fd, file_size)
+        finally:
+            os.close(fd)
+
+        series_name_list = []
+        for i in range(slot_count):
+            start = self.series_name_offset + i * self.series_name_length
+            series_name_list.append(file_mmap[start:start + self.series_name_length].rstrip(b"\x00").decode("utf-8", "replace"))
+
+        # Time of the last record of the series is tracked for finding the series which is not recorded for the longest time.
+        # Series which are not recorded since the file is opened have "0" value.
+        self.family_dict[family] = {"mmap": file_mmap, "records": memoryview(file_mmap)[header_size:].cast("d"),
+                                    "slot_count": slot_count, "record_length": slot_count + 1,
+                                    "series_name_list": series_name_list,
+                                    "series_slot_dict": {name: i for i, name in enumerate(series_name_list) if name != ""},
+                                    "series_record_time_dict": {}}
+
+        return self.family_dict[family]
+
+
+    def series_slot_func(self, family_data, series_name, value_dict):
+        """
+        Get slot index of a series. A free slot is used for a new series. If there is no free slot, slot of the series which
+        is not in "value_dict" (values of the current record) and which is not recorded for the longest time is reused.
+        "None" is returned if all slots are used by the series of the current record.
+        """
+
+        slot = family_data["series_slot_dict"].get(series_name)
+        if slot is not None:
+            return slot
+
+        series_name_list = family_data["series_name_list"]
+        try:
+            slot = series_name_list.index("")
+        except ValueError:
+            series_record_time_dict = family_data["series_record_time_dict"]
+            unused_series_list = [name for name in series_name_list if name not in value_dict]
+            if unused_series_list == []:
+                return None
+            unused_series_name = min(unused_series_list, key=lambda name: series_record_time_dict.get(name, 0))
+            slot = family_data["series_slot_dict"].pop(unused_series_name)
+            series_record_time_dict.pop(unused_series_name, None)
+            # Values of the previous series are cleared in order to prevent showing them as values of the new series.
+            family_data["records"][slot + 1::family_data["record_length"]] = array.array("d", bytes(8 * self.capacity))
+
+        self.series_name_write_func(family_data, slot, series_name)
+
+        return slot
+
+
+    def series_name_write_func(self, family_data, slot, series_name):
+        """
+        Write name of the series of a slot into the file.
+        """
+
+        series_name_bytes = series_name.encode("utf-8")[:self.series_name_length].ljust(self.series_name_length, b"\x00")
+        start = self.series_name_offset + slot * self.series_name_length
+        family_data["mmap"][start:start + self.series_name_length] = series_name_bytes
+        family_data["series_name_list"][slot] = series_name
+        family_data["series_slot_dict"][series_name] = slot
+
+
+    def family_grow_func(self, family, series_count):
+        """
+        Generate the ring file of a metric family again with more series slots. Series names and records are copied into the new file.
+        """
+
+        family_data = self.family_dict.pop(family)
+        file_mmap = family_data["mmap"]
+        write_count = struct.unpack_from("<Q", file_mmap, self.write_count_offset)[0]
+        record_length = family_data["record_length"]
+        record_count = min(write_count, self.capacity)
+        records = array.array("d", family_data["records"][:record_count * record_length])
+        family_data["records"].release()
+        file_mmap.close()
+        os.remove(self.store_folder_path + family + ".ring")
+
+        family_data_new = self.family_open_func(family, series_count)
+        for slot, series_name in enumerate(family_data["series_name_list"]):
+            if series_name != "":
+                self.series_name_write_func(family_data_new, slot, series_name)
+        family_data_new["series_record_time_dict"] = family_data["series_record_time_dict"]
+        records_new = family_data_new["records"]
+        record_length_new = family_data_new["record_length"]
+        for i in range(record_count):
+            records_new[i * record_length_new:i * record_length_new + record_length] = records[i * record_length:(i + 1) * record_length]
+        struct.pack_into("<Q", family_data_new["mmap"], self.write_count_offset, write_count)
+
+        return family_data_new
+
+
+    def record_func(self, family, value_dict, record_time=None):
+        """
+        Write a record (values of the series of a metric family) into the ring file of the family.
+        Values of the series which are not in "value_dict" are written as "0".
+        """
+
+        if record_time is None:
+            record_time = time.time()
+
+        with self.lock:
+            family_data = self.family_dict.get(family)
+            if family_data is None:
+                family_data = self.family_open_func(family, len(value_dict))
+
+            # Slots are get before generating the record because the file may be generated again with more slots.
+            slot_list = []
+            for series_name in value_dict:
+                slot = family_data["series_slot_dict"].get(series_name)
+                if slot is None:
+                    slot = self.series_slot_func(family_data, series_name, value_dict)
+                    if slot is None:
+                        family_data = self.family_grow_func(family, len(value_dict))
+                        slot = self.series_slot_func(family_data, series_name, value_dict)
+                slot_list.append(slot)
+
+            record = array.array("d", bytes(8 * family_data["record_length"]))
+            record[0] = record_time
+            series_record_time_dict = family_data["series_record_time_dict"]
+            for (series_name, value), slot in zip(value_dict.items(), slot_list):
+                record[slot + 1] = value
+                series_record_time_dict[series_name] = record_time
+
+            file_mmap = family_data["mmap"]
+            write_count = struct.unpack_from("<Q", file_mmap, self.write_count_offset)[0]
+            record_length = family_data["record_length"]
+            start = (write_count % self.capacity) * record_length
+            family_data["records"][start:start + record_length] = record
+            struct.pack_into("<Q", file_mmap, self.write_count_offset, write_count + 1)
+
+
+    def series_values_func(self, family, series_name, start_time=0):
+        """
+        Get times and values of a series which are recorded after "start_time". Views of the mapped file are returned
+        (there is no copying or parsing). Records are split into two parts ([times, values] pairs in oldest-to-newest order)
+        if the ring file is wrapped. An empty list is returned if there is no recorded data for the series.
+        """
+
+        with self.lock:
+            family_data = self.family_dict.get(family)
+            if family_data is None:
+                if os.path.isfile(self.store_folder_path + family + ".ring") == False:
+                    return []
+                family_data = self.family_open_func(family, 0)
+                if family_data is None:
+                    return []
+
+            slot = family_data["series_slot_dict"].get(series_name)
+            if slot is None:
+                return []
+            write_count = struct.unpack_from("<Q", family_data["mmap"], self.write_count_offset)[0]
+
+        records = family_data["records"]
+        record_length = family_data["record_length"]
+        record_count = min(write_count, self.capacity)
+        oldest_record_index = write_count % self.capacity if write_count > self.capacity else 0
+
+        # Oldest records are at the end of the file if the file is wrapped.
+        index_range_list = [[oldest_record_index, record_count], [0, oldest_record_index]]
+        if oldest_record_index == 0:
+            index_range_list = [[0, record_count]]
+
+        series_values_list = []
+        for start, end in index_range_list:
+            times = records[start * record_length:end * record_length:record_length]
+            start_index = bisect_left(times, start_time)
+            if start_index == len(times):
+                continue
+            values = records[start * record_length + slot + 1:end * record_length:record_length]
+            series_values_list.append([times[start_index:], values[start_index:]])
+
+        return series_values_list
+
+
+    def series_recent_values_func(self, family, series_name, count, sample_interval):
+        """
+        Get values of a series which are recorded in the last "count x sample_interval" seconds. Values are placed by
+        their record times ("count" values, one value per "sample_interval", newest value is the last one).
+        "0" is used for the periods which have no recorded values (for example, if the application was not running).
+        """
+
+        end_time = time.time()
+        start_time = end_time - count * sample_interval
+        value_list = [0] * count
+        for times, values in self.series_values_func(family, series_name, start_time):
+            for record_time, value in zip(times, values):
+                index = min(int((record_time - start_time) / sample_interval), count - 1)
+                if index >= 0:
+                    value_list[index] = value
+
+        return value_list
+
+
+    def flush_func(self):
+        """
+        Write changes of the mapped files to the disk (when the application is closed).
+        """
+
+        with self.lock:
+            for family_data in self.family_dict.values():
+                family_data["mmap"].flush()
+
+
+MetricStore = MetricStore()
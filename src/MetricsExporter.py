@@ -0,0 +1,265 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .Config import Config
+from .Performance import Performance
+from . import Procfs
+from .HwmonSensors import HwmonSensors
+from .Scheduler import Scheduler
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serve metrics text of the exporter. Text is rendered once per tick and the same text is served to all requests of the tick.
+    """
+
+    server_version = "system-monitoring-center"
+
+    def do_GET(self):
+
+        if self.path.split("?")[0] not in ["/metrics", "/"]:
+            self.send_error(404)
+            return
+
+        # OpenMetrics format is used if it is accepted by the client (Prometheus sends it in the "Accept" header).
+        # Otherwise Prometheus text format is used. Metrics are same in both formats except the "# EOF" line.
+        openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+        body = MetricsExporter.metrics_text_func(openmetrics)
+        if openmetrics == True:
+            content_type = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+        else:
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+    def log_message(self, format, *args):
+        """
+        Do not write a line to stderr for every request.
+        """
+
+        pass
+
+
+class MetricsExporter:
+
+    def __init__(self):
+
+        # Metrics are served on a local HTTP endpoint ("http://127.0.0.1:[port]/metrics") in Prometheus/OpenMetrics text format
+        # if it is enabled by the user. Values are get from the data of the same collectors which are used by the tabs
+        # (performance data histories, process snapshot, sensors). There is no additional collection per request.
+        self.server = None
+        self.server_thread = None
+
+        # Values of the last tick. They are updated by "exporter_tick_func" (collector thread) and read by the request threads.
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.performance_value_dict = {}
+        self.sensor_value_list = []
+        self.process_value_list = []
+        self.global_process_cpu_times_prev = {}
+        # Memory of the services is set by Services tab because service information is get only when the tab is opened.
+        self.services_memory_dict = {}
+
+        # Rendered text and generation of the values it is rendered for.
+        self.metrics_text_cache = {"generation": -1, False: b"", True: b""}
+
+        # Metric names, types, help texts and units of the sensor types.
+        self.sensor_metric_dict = {"temp": ["smc_sensor_temperature_celsius", "Temperature of the sensor in degree Celsius."],
+                                   "fan": ["smc_sensor_fan_rpm", "Fan speed in revolutions per minute."],
+                                   "in": ["smc_sensor_voltage_volts", "Voltage of the sensor in volts."],
+                                   "curr": ["smc_sensor_current_amperes", "Current of the sensor in amperes."],
+                                   "power": ["smc_sensor_power_watts", "Power of the sensor in watts."]}
+
+
+    def exporter_start_func(self, port=None):
+        """
+        Start the HTTP server of the exporter. Server is bound to the loopback address.
+        Returns error message if server could not be started ("None" if it is started).
+        """
+
+        if self.server is not None:
+            return None
+        if port is None:
+            port = Config.metrics_exporter_port
+
+        try:
+            self.server = ThreadingHTTPServer(("127.0.0.1", port), MetricsRequestHandler)
+        except OSError as e:
+            self.server = None
+            return str(e)
+        self.server.daemon_threads = True
+        self.server_thread = threading.Thread(target=self.server.serve_forever, name="metrics-exporter", daemon=True)
+        self.server_thread.start()
+
+        return None
+
+
+    def exporter_stop_func(self):
+        """
+        Stop the HTTP server of the exporter.
+        """
+
+        if self.server is None:
+            return
+        self.server.shutdown()
+        self.server.server_close()
+        self.server = None
+        self.server_thread = None
+
+
+    def exporter_tick_func(self):
+        """
+        Get values of the current tick from the collectors. This function is called after the collectors are run
+        (in the collector thread of the GUI or in the loop of the headless mode). Metrics text is not rendered here.
+        It is rendered when it is requested (once per tick).
+        """
+
+        if self.server is None:
+            return
+
+        performance_value_dict = {"cpu": {"all": Performance.cpu_usage_percent_ave[-1]},
+                                  "memory": {"ram": Performance.ram_usage_percent[-1], "swap": Performance.swap_usage_percent[-1]},
+                                  "disk_read": {}, "disk_write": {}, "network_receive": {}, "network_send": {}}
+        for core in Performance.logical_core_list:
+            performance_value_dict["cpu"][core] = Performance.cpu_usage_percent_per_core[core][-1]
+        for disk in Performance.disk_list:
+            performance_value_dict["disk_read"][disk] = Performance.disk_read_speed[disk][-1]
+            performance_value_dict["disk_write"][disk] = Performance.disk_write_speed[disk][-1]
+        for network_card in Performance.network_card_list:
+            performance_value_dict["network_receive"][network_card] = Performance.network_receive_speed[network_card][-1]
+            performance_value_dict["network_send"][network_card] = Performance.network_send_speed[network_card][-1]
+
+        # Sensors and processes are get in the update intervals of their collectors. Values of the previous ticks are used between them.
+        sensor_value_list = self.sensor_value_list
+        if Scheduler.collector_due_func("sensors") == True:
+            sensor_value_list = self.sensor_values_func()
+
+        process_value_list = self.process_value_list
+        if Scheduler.collector_due_func("processes") == True and Config.metrics_exporter_process_count > 0:
+            process_value_list = self.process_values_func(Config.metrics_exporter_process_count)
+
+        with self.lock:
+            self.performance_value_dict = performance_value_dict
+            self.sensor_value_list = sensor_value_list
+            self.process_value_list = process_value_list
+            self.generation = self.generation + 1
+
+
+    def sensor_values_func(self):
+        """
+        Get current values of the sensors ([attribute, sensor group, sensor name, value] lists).
+        """
+
+        sensor_list, raw_value_list = HwmonSensors.sensor_snapshot_func()
+        sensor_value_list = []
+        for (attribute, sensor_group_name, sensor_name, max_value, critical_value), raw_value in zip(sensor_list, raw_value_list):
+            if raw_value is None:
+                continue
+            sensor_value_list.append([attribute, sensor_group_name, sensor_name, HwmonSensors.sensor_value_func(attribute, raw_value)])
+
+        return sensor_value_list
+
+
+    def process_values_func(self, process_count):
+        """
+        Get PID, name, CPU usage and RSS of the processes which have the highest CPU usage.
+        Process snapshot of the current tick is used (processes are not scanned again if they are scanned by Processes tab in this tick).
+        """
+
+        processes_information_dict, global_cpu_time_all = Procfs.processes_snapshot()
+
+        if Config.processes_cpu_divide_by_core == 1:
+            core_count_division_number = Performance.number_of_logical_cores
+        else:
+            core_count_division_number = 1
+
+        process_cpu_usage_dict, self.global_process_cpu_times_prev = Procfs.processes_cpu_usage(processes_information_dict, global_cpu_time_all,
+                                                                                              self.global_process_cpu_times_prev, core_count_division_number)
+        pid_list = sorted(process_cpu_usage_dict, key=process_cpu_usage_dict.get, reverse=True)[:process_count]
+
+        return [[pid, processes_information_dict[pid]["name"], process_cpu_usage_dict[pid], processes_information_dict[pid]["rss"]] for pid in pid_list]
+
+
+    def label_value_func(self, value):
+        """
+        Escape a label value (backslash, double quote and line feed characters).
+        """
+
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+    def metric_lines_func(self, line_list, metric, metric_type, help_text, label_name_list, value_list):
+        """
+        Add lines of a metric ("# HELP", "# TYPE" and a line per value) to "line_list".
+        "value_list" has label values and the value of the metric ([label value 1, label value 2, ..., value] lists).
+        """
+
+        if len(value_list) == 0:
+            return
+        line_list.append(f'# HELP {metric} {help_text}')
+        line_list.append(f'# TYPE {metric} {metric_type}')
+        for values in value_list:
+            labels = ",".join([f'{label_name}="{self.label_value_func(label_value)}"' for label_name, label_value in zip(label_name_list, values)])
+            line_list.append(f'{metric}{{{labels}}} {values[-1]}')
+
+
+    def metrics_text_func(self, openmetrics=False):
+        """
+        Get metrics text. Text is rendered once per tick (per format) and cached text is returned for the other requests of the tick.
+        """
+
+        with self.lock:
+            if self.metrics_text_cache["generation"] != self.generation:
+                self.metrics_text_cache = {"generation": self.generation, False: None, True: None}
+            if self.metrics_text_cache[openmetrics] is None:
+                self.metrics_text_cache[openmetrics] = self.metrics_text_render_func(openmetrics)
+
+            return self.metrics_text_cache[openmetrics]
+
+
+    def metrics_text_render_func(self, openmetrics):
+        """
+        Render metrics text by using the values of the last tick.
+        """
+
+        performance_value_dict = self.performance_value_dict
+        line_list = []
+
+        if performance_value_dict != {}:
+            self.metric_lines_func(line_list, "smc_cpu_usage_percent", "gauge", "CPU usage (average of all logical cores or a logical core).",
+                                   ["cpu"], list(performance_value_dict["cpu"].items()))
+            self.metric_lines_func(line_list, "smc_memory_usage_percent", "gauge", "RAM and swap memory usage.",
+                                   ["memory"], list(performance_value_dict["memory"].items()))
+            self.metric_lines_func(line_list, "smc_disk_read_bytes_per_second", "gauge", "Disk read speed.",
+                                   ["disk"], list(performance_value_dict["disk_read"].items()))
+            self.metric_lines_func(line_list, "smc_disk_write_bytes_per_second", "gauge", "Disk write speed.",
+                                   ["disk"], list(performance_value_dict["disk_write"].items()))
+            self.metric_lines_func(line_list, "smc_network_receive_bytes_per_second", "gauge", "Network download speed.",
+                                   ["device"], list(performance_value_dict["network_receive"].items()))
+            self.metric_lines_func(line_list, "smc_network_send_bytes_per_second", "gauge", "Network upload speed.",
+                                   ["device"], list(performance_value_dict["network_send"].items()))
+
+        for attribute, (metric, help_text) in self.sensor_metric_dict.items():
+            self.metric_lines_func(line_list, metric, "gauge", help_text, ["group", "name"],
+                                   [sensor_values[1:] for sensor_values in self.sensor_value_list if sensor_values[0] == attribute])
+
+        self.metric_lines_func(line_list, "smc_service_memory_bytes", "gauge", "Memory usage of the service.",
+                               ["service"], list(self.services_memory_dict.items()))
+
+        self.metric_lines_func(line_list, "smc_process_cpu_usage_percent", "gauge", "CPU usage of the process (processes with the highest CPU usage).",
+                               ["pid", "name"], [[pid, name, cpu_usage] for pid, name, cpu_usage, rss in self.process_value_list])
+        self.metric_lines_func(line_list, "smc_process_memory_rss_bytes", "gauge", "Resident memory of the process (processes with the highest CPU usage).",
+                               ["pid", "name"], [[pid, name, rss] for pid, name, cpu_usage, rss in self.process_value_list])
+
+        if openmetrics == True:
+            line_list.append("# EOF")
+
+        return ("\n".join(line_list) + "\n").encode("utf-8")
+
+
+MetricsExporter = MetricsExporter()
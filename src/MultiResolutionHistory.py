@@ -0,0 +1,195 @@
+import time
+import array
+from math import ceil
+
+from .RingBuffer import RingBuffer
+
+
+class MultiResolutionHistory(RingBuffer):
+    """
+    History of a chart in multiple resolutions (similar to round robin databases). Recent values are kept as they are
+    get (raw values in a ring buffer). Min/average/max values of the raw values are also kept for 10 second and 1 minute
+    periods ("rollups") for longer (hours) chart data histories. Lengths of all resolutions are fixed. Thus memory usage
+    does not increase if chart data history is lengthened and it is same for every history.
+    Raw values are used in the same way as a "RingBuffer" ("append()", "view()", "max()", "[-1]", etc.).
+    """
+
+    # Max length of the raw values. Rollups are used for longer chart data histories.
+    raw_length_max = 1200
+    # Rollup periods (in seconds) and lengths. 10 second rollups are kept for 1 hour and 1 minute rollups are kept for 12 hours.
+    rollup_period_length_list = [[10, 360], [60, 720]]
+
+    def __init__(self, length, value_list=None):
+
+        RingBuffer.__init__(self, min(length, self.raw_length_max), value_list)
+
+        # Rollups are stored in fixed length arrays ("f" is used because values are used only for drawing charts).
+        # Index of the oldest value is tracked (oldest value is overwritten as it is done for the raw values).
+        # Values of the period which is not finished yet are collected in "period_..." keys.
+        self.rollup_list = []
+        for period, length in self.rollup_period_length_list:
+            self.rollup_list.append({"period": period, "length": length,
+                                     "min": array.array("f", [0] * length), "avg": array.array("f", [0] * length),
+                                     "max": array.array("f", [0] * length), "index": 0,
+                                     "period_number": None, "period_min": 0, "period_sum": 0, "period_max": 0, "period_count": 0})
+
+
+    def append(self, value, sample_time=None):
+        """
+        Append a value to the raw values and to the rollup of the current period.
+        """
+
+        RingBuffer.append(self, value)
+
+        if sample_time is None:
+            sample_time = time.monotonic()
+        self.rollup_append_func(0, value, value, value, 1, sample_time)
+
+
+    def rollup_append_func(self, rollup_index, value_min, value_sum, value_max, value_count, sample_time):
+        """
+        Add values to the current period of a rollup. If a new period is started, min/average/max values of
+        the previous period are written to the rollup and they are added to the next (lower resolution) rollup.
+        """
+
+        rollup = self.rollup_list[rollup_index]
+        period_number = int(sample_time // rollup["period"])
+
+        if period_number != rollup["period_number"]:
+            if rollup["period_count"] > 0:
+                self.rollup_write_func(rollup, rollup["period_min"], rollup["period_sum"] / rollup["period_count"], rollup["period_max"])
+                if rollup_index + 1 < len(self.rollup_list):
+                    self.rollup_append_func(rollup_index + 1, rollup["period_min"], rollup["period_sum"], rollup["period_max"],
+                                            rollup["period_count"], rollup["period_number"] * rollup["period"])
+                # Write "0" for the periods which have no values (for example, if the application is suspended)
+                # in order to keep times of the rollup values correct.
+                for _ in range(min(period_number - rollup["period_number"] - 1, rollup["length"])):
+                    self.rollup_write_func(rollup, 0, 0, 0)
+            rollup["period_number"] = period_number
+            rollup["period_min"] = value_min
+            rollup["period_sum"] = value_sum
+            rollup["period_max"] = value_max
+            rollup["period_count"] = value_count
+            return
+
+        if value_min < rollup["period_min"]:
+            rollup["period_min"] = value_min
+        if value_max > rollup["period_max"]:
+            rollup["period_max"] = value_max
+        rollup["period_sum"] = rollup["period_sum"] + value_sum
+        rollup["period_count"] = rollup["period_count"] + value_count
+
+
+    def rollup_write_func(self, rollup, value_min, value_avg, value_max):
+        """
+        Write values of a period to a rollup by overwriting the oldest values.
+        """
+
+        index = rollup["index"]
+        rollup["min"][index] = value_min
+        rollup["avg"][index] = value_avg
+        rollup["max"][index] = value_max
+        rollup["index"] = (index + 1) % rollup["length"]
+
+
+    def rollup_values_func(self, rollup_index, value_type, count):
+        """
+        Get newest "count" values of a rollup ("min", "avg" or "max") in oldest-to-newest order.
+        """
+
+        rollup = self.rollup_list[rollup_index]
+        index = rollup["index"]
+        values = rollup[value_type]
+        value_list = (values[index:] + values[:index]).tolist()
+
+        return value_list[len(value_list) - count:]
+
+
+    def rollup_recent_values_func(self, rollup_index, count):
+        """
+        Get newest "count" average values of a rollup in oldest-to-newest order including the periods which are not finished yet.
+        Values of these periods are in this rollup and in the higher resolution rollups (they are added to this rollup when
+        their periods are finished). Average of the values which are get until now is used for these periods.
+        Thus newest values are also shown on the charts which use rollups.
+        """
+
+        rollup = self.rollup_list[rollup_index]
+
+        # Get sum and number of the values of the periods which are not finished yet ({period number: [sum, count]}).
+        period_sum_count_dict = {}
+        for rollup_higher_resolution in self.rollup_list[:rollup_index + 1]:
+            if rollup_higher_resolution["period_count"] > 0:
+                period_number = rollup_higher_resolution["period_number"] * rollup_higher_resolution["period"] // rollup["period"]
+                period_sum_count = period_sum_count_dict.setdefault(period_number, [0, 0])
+                period_sum_count[0] = period_sum_count[0] + rollup_higher_resolution["period_sum"]
+                period_sum_count[1] = period_sum_count[1] + rollup_higher_resolution["period_count"]
+
+        # "0" is used for the periods which have no values (as it is done when periods are written to the rollup).
+        value_list = []
+        if period_sum_count_dict != {}:
+            period_number_last = max(period_sum_count_dict)
+            for period_number in range(max(min(period_sum_count_dict), period_number_last - count + 1), period_number_last + 1):
+                period_sum, period_count = period_sum_count_dict.get(period_number, [0, 0])
+                if period_count > 0:
+                    value_list.append(period_sum / period_count)
+                else:
+                    value_list.append(0)
+
+        return self.rollup_values_func(rollup_index, "avg", count - len(value_list)) + value_list
+
+
+    def resize(self, length):
+        """
+        Change length of the raw values. Rollups are not changed because their lengths are fixed.
+        """
+
+        RingBuffer.resize(self, min(length, self.raw_length_max))
+
+
+    def chart_max_func(self, time_span, sample_interval, value_list):
+        """
+        Get max value of a chart which shows "time_span" seconds of the history. Tracked max value of the raw values is
+        used if all raw values are shown on the chart. Otherwise max value of the chart values ("value_list") is used.
+        """
+
+        if max(2, round(time_span / sample_interval)) == self.length:
+            return self.max()
+
+        return max(value_list)
+
+
+    def chart_values_func(self, time_span, sample_interval, point_count_max):
+        """
+        Get values of a chart which shows "time_span" seconds of the history. Raw values are used if there are
+        enough raw values for this time span. Otherwise the highest resolution rollup which covers this time span
+        is used (average of the values of the period which is not finished yet is the newest value). Number of the values
+        is not more than "point_count_max" (width of the chart in pixels). Values are averaged if there are more values.
+        """
+
+        point_count = max(2, round(time_span / sample_interval))
+        if point_count <= self.length:
+            value_list = self.view()[self.length - point_count:].tolist()
+        else:
+            for rollup_index, rollup in enumerate(self.rollup_list):
+                if rollup["period"] * rollup["length"] >= time_span:
+                    break
+            point_count = max(2, ceil(time_span / rollup["period"]))
+            if point_count <= rollup["length"]:
+                value_list = self.rollup_recent_values_func(rollup_index, point_count)
+            # Add "0" before the oldest value if the time span is longer than the lowest resolution rollup.
+            else:
+                value_list = [0] * (point_count - rollup["length"]) + self.rollup_recent_values_func(rollup_index, rollup["length"])
+
+        # Average values which are drawn on the same pixel.
+        point_count_max = max(2, point_count_max)
+        point_count = len(value_list)
+        if point_count > point_count_max:
+            value_list_averaged = []
+            start = 0
+            for i in range(1, point_count_max + 1):
+                end = i * point_count // point_count_max
+                value_list_averaged.append(sum(value_list[start:end]) / (end - start))
+                start = end
+            value_list = value_list_averaged
+
+        return value_list
@@ -10,6 +10,7 @@ from locale import gettext as _tr
 from .Config import Config
 from .Performance import Performance
 from .MainWindow import MainWindow
+from .Scheduler import Scheduler
 from . import Common
 
 
@@ -179,6 +180,9 @@ class Network:
         self.ipv6_address_label.set_text(network_address_ipv6)
         self.mac_address_label.set_text(network_card_mac_address)
 
+        # Connection information is get in the next loop.
+        self.connection_information_network_card = None
+
         self.initial_already_run = 1
 
 
@@ -221,9 +225,18 @@ class Network:
 
         # Get information.
         network_send_bytes, network_receive_bytes = self.network_download_upload_data_func(selected_network_card)
-        network_card_connected = self.network_card_connected_func(selected_network_card)
-        network_ssid = self.network_ssid_func(selected_network_card)
-        network_link_quality = self.network_link_quality_func(selected_network_card, network_card_connected)
+        # Connection information (connection state, SSID, link quality, IP addresses) changes slowly and it is get in
+        # update interval of the network connection collector. It is also get if selected network card is changed.
+        if Scheduler.collector_due_func("network_connection") == True or self.connection_information_network_card != selected_network_card:
+            network_card_connected = self.network_card_connected_func(selected_network_card)
+            network_ssid = self.network_ssid_func(selected_network_card)
+            network_link_quality = self.network_link_quality_func(selected_network_card, network_card_connected)
+            network_address_ipv4, network_address_ipv6 = self.ipv4_ipv6_address_func(selected_network_card)
+            self.ipv4_address_label.set_text(network_address_ipv4)
+            self.ipv6_address_label.set_text(network_address_ipv6)
+            self.connected_ssid_label.set_text(f'{network_card_connected} - {network_ssid}')
+            self.link_quality_label.set_text(network_link_quality)
+            self.connection_information_network_card = selected_network_card
 
 
         # Set and update Network tab label texts by using information get
@@ -231,8 +244,6 @@ class Network:
         self.upload_speed_label.set_text(f'{Performance.performance_data_unit_converter_func("speed", performance_network_speed_bit, network_send_speed[selected_network_card][-1], performance_network_data_unit, performance_network_data_precision)}/s')
         self.download_data_label.set_text(Performance.performance_data_unit_converter_func("data", "none", network_receive_bytes, performance_network_data_unit, performance_network_data_precision))
         self.upload_data_label.set_text(Performance.performance_data_unit_converter_func("data", "none", network_send_bytes, performance_network_data_unit, performance_network_data_precision))
-        self.connected_ssid_label.set_text(f'{network_card_connected} - {network_ssid}')
-        self.link_quality_label.set_text(network_link_quality)
 
 
     def device_model_name_func(self, selected_network_card):
@@ -1,11 +1,15 @@
 import os
-import cairo
 import time
+import threading
 from math import sqrt, ceil
 
 from locale import gettext as _tr
 
 from .Config import Config
+from . import Procfs
+from .Procfs import ProcFileReader
+from .MultiResolutionHistory import MultiResolutionHistory
+from .MetricStore import MetricStore
 
 
 class Performance:
@@ -21,6 +25,18 @@ class Performance:
         # source: https://git.kernel.org/pub/scm/linux/kernel/git/torvalds/linux.git/tree/include/linux/types.h?id=v4.4-rc6#n121https://git.kernel.org/pub/scm/linux/kernel/git/torvalds/linux.git/tree/include/linux/types.h?id=v4.4-rc6#n121)
         self.disk_sector_size = 512
 
+        # Files which are read in every loop of the background function are kept open.
+        # They are read by using "os.preadv()" instead of opening/decoding them in every loop.
+        self.proc_stat_reader = ProcFileReader(Procfs.proc_dir + "stat", 16384)
+        self.proc_meminfo_reader = ProcFileReader(Procfs.proc_dir + "meminfo")
+        self.proc_partitions_reader = ProcFileReader(Procfs.proc_dir + "partitions")
+        self.proc_diskstats_reader = ProcFileReader(Procfs.proc_dir + "diskstats", 16384)
+        self.proc_net_dev_reader = ProcFileReader(Procfs.proc_dir + "net/dev")
+
+        # Histories and device lists are updated in the collector thread and charts are drawn on the main thread.
+        # Lock is held while they are updated and while charts are drawn. Thus a chart is not drawn by using half-updated data.
+        self.history_lock = threading.Lock()
+
         # Set chart performance data line and point highligting off.
         # "chart_line_highlight" takes chart name or "" for highlighting or not.
         # "chart_point_highlight" takes data point index or "-1" for not highlighting.
@@ -49,7 +65,7 @@ class Performance:
         """
 
         # Set selected disk
-        with open("/proc/mounts") as reader:
+        with open(Procfs.proc_dir + "mounts") as reader:
             proc_mounts_output_lines = reader.read().strip().split("\n")
         system_disk_list = []
         for line in proc_mounts_output_lines:
@@ -63,7 +79,7 @@ class Performance:
         # Detect system disk by checking if mount point is "/" on some systems such as some ARM devices.
         # "/dev/root" is the system disk name (symlink) in the "/proc/mounts" file on these systems.
         if system_disk_list == []:
-            with open("/proc/cmdline") as reader:
+            with open(Procfs.proc_dir + "cmdline") as reader:
                 proc_cmdline = reader.read()
             if "root=UUID=" in proc_cmdline:
                 disk_uuid_partuuid = proc_cmdline.split("root=UUID=", 1)[1].split(" ", 1)[0].strip()
@@ -99,7 +115,7 @@ class Performance:
         # Set selected network card
         connected_network_card_list = []
         for network_card in self.network_card_list:
-            with open(f'/sys/class/net/{network_card}/operstate') as reader:
+            with open(Procfs.sys_dir + f'class/net/{network_card}/operstate') as reader:
                 sys_class_net_output = reader.read().strip()
             if sys_class_net_output == "up":
                 connected_network_card_list.append(network_card)
@@ -125,28 +141,18 @@ class Performance:
         '/proc/stat' file contains online logical CPU core names (without regarding CPU sockets) and CPU times (unit is jiffies).
         """
 
-        # Read CPU times and remove first line (summation for all cores)
-        with open("/proc/stat") as reader:
-            proc_stat_lines = reader.read().split("intr", 1)[0].strip().split("\n")[1:]
+        # Read CPU times and remove first line (summation for all cores) and lines after CPU lines.
+        proc_stat_lines = self.proc_stat_reader.read().split(b"\nintr", 1)[0].split(b"\n")[1:]
 
         # Get CPU times
         _cpu_times = {}
         for line in proc_stat_lines:
             line_split = line.split()
-            cpu_core = line_split[0]
-            user = int(line_split[1])
-            nice = int(line_split[2])
-            system = int(line_split[3])
-            idle = int(line_split[4])
-            iowait = int(line_split[5])
-            irq = int(line_split[6])
-            softirq = int(line_split[7])
-            steal = int(line_split[8])
-            guest = int(line_split[9])
-            guest_nice = int(line_split[10])
-            cpu_time_all = user + nice + system + idle + iowait + irq + softirq + steal + guest
-            cpu_time_load = cpu_time_all - idle - iowait
-            _cpu_times[cpu_core] = {"load": cpu_time_load, "all": cpu_time_all}
+            # user, nice, system, idle, iowait, irq, softirq, steal, guest values. guest_nice value is not used.
+            times = [int(value) for value in line_split[1:10]]
+            cpu_time_all = sum(times)
+            cpu_time_load = cpu_time_all - times[3] - times[4]
+            _cpu_times[line_split[0].decode()] = {"load": cpu_time_load, "all": cpu_time_all}
 
         return _cpu_times
 
@@ -157,20 +163,26 @@ class Performance:
         Values in '/proc/meminfo' file are in KiB unit.
         """
 
-        # Read memory information
-        with open("/proc/meminfo") as reader:
-            proc_meminfo_output = reader.read()
+        # Read memory information. File is parsed in a single pass and
+        # the loop is stopped when all of the required values are get.
+        meminfo_values = {}
+        for line in self.proc_meminfo_reader.read().split(b"\n"):
+            key, _, value = line.partition(b":")
+            if key in (b"MemTotal", b"MemFree", b"MemAvailable", b"SwapTotal", b"SwapFree"):
+                meminfo_values[key] = int(value.split()[0]) * 1024
+                if len(meminfo_values) == 5:
+                    break
 
         # Get memory (RAM) information
-        ram_total = int(proc_meminfo_output.split("MemTotal:", 1)[1].split("\n", 1)[0].split(" ")[-2].strip()) *1024
-        ram_free = int(proc_meminfo_output.split("\nMemFree:", 1)[1].split("\n", 1)[0].split(" ")[-2].strip()) *1024
-        ram_available = int(proc_meminfo_output.split("\nMemAvailable:", 1)[1].split("\n", 1)[0].split(" ")[-2].strip()) *1024
+        ram_total = meminfo_values[b"MemTotal"]
+        ram_free = meminfo_values[b"MemFree"]
+        ram_available = meminfo_values[b"MemAvailable"]
         ram_used = ram_total - ram_available
         ram_used_percent = ram_used / ram_total * 100
 
         # Get memory (swap) information
-        swap_total = int(proc_meminfo_output.split("\nSwapTotal:", 1)[1].split("\n", 1)[0].split(" ")[-2].strip()) *1024
-        swap_free = int(proc_meminfo_output.split("\nSwapFree:", 1)[1].split("\n", 1)[0].split(" ")[-2].strip()) *1024
+        swap_total = meminfo_values[b"SwapTotal"]
+        swap_free = meminfo_values[b"SwapFree"]
         # Calculate values if swap memory exists.
         if swap_free != 0:
             swap_used = swap_total - swap_free
@@ -196,28 +208,20 @@ class Performance:
 
         # Get disk list
         # Read disk information and remove first 2 lines (header information and spaces)
-        with open("/proc/partitions") as reader:
-            proc_partitions_lines = reader.read().strip().split("\n")[2:]
-
-        # Get disk list
-        _disk_list = []
-        for line in proc_partitions_lines:
-            _disk_list.append(line.split()[3].strip())
-
-        # Read disk IO information
-        with open("/proc/diskstats") as reader:
-            proc_diskstats_lines = reader.read().strip().split("\n")
+        _disk_list = set()
+        for line in self.proc_partitions_reader.read().strip().split(b"\n")[2:]:
+            _disk_list.add(line.split()[3])
 
         # Get disk IO information
         _disk_io = {}
-        for line in proc_diskstats_lines:
+        for line in self.proc_diskstats_reader.read().strip().split(b"\n"):
             line_split = line.split()
             disk_name = line_split[2]
             if disk_name not in _disk_list:
                 continue
             read_bytes = int(line_split[5]) * self.disk_sector_size
             write_bytes = int(line_split[9]) * self.disk_sector_size
-            _disk_io[disk_name] = {"read_bytes": read_bytes, "write_bytes": write_bytes}
+            _disk_io[disk_name.decode()] = {"read_bytes": read_bytes, "write_bytes": write_bytes}
 
         return _disk_io
 
@@ -227,19 +231,17 @@ class Performance:
         Get network card download bytes, upload bytes.
         """
 
-        # Read network card IO information
-        network_card_list = []
-        with open("/proc/net/dev") as reader:
-            proc_net_dev_lines = reader.read().strip().split("\n")[2:]
+        # Read network card IO information and remove first 2 lines (header information)
+        proc_net_dev_lines = self.proc_net_dev_reader.read().strip().split(b"\n")[2:]
 
-        # Get network card IO information
+        # Get network card IO information. There may not be a space between network card name and the first value.
         _network_io = {}
         for line in proc_net_dev_lines:
-            line_split = line.split()
-            network_card = line_split[0].split(":")[0]
-            download_bytes = int(line_split[1])
-            upload_bytes = int(line_split[9])
-            _network_io[network_card] = {"download_bytes": download_bytes, "upload_bytes": upload_bytes}
+            network_card, _, line_values = line.partition(b":")
+            line_split = line_values.split()
+            download_bytes = int(line_split[0])
+            upload_bytes = int(line_split[8])
+            _network_io[network_card.strip().decode()] = {"download_bytes": download_bytes, "upload_bytes": upload_bytes}
 
         return _network_io
 
@@ -256,11 +258,11 @@ class Performance:
         self.cpu_times_prev = {}
         self.cpu_usage_percent_per_core = {}
         self.cpu_usage_percent_ave = {}
-        self.cpu_usage_percent_ave = [0] * self.chart_data_history
+        self.cpu_usage_percent_ave = self.performance_history_func("cpu", "average")
 
         # Define initial values for RAM usage percent and swap usage percent
-        self.ram_usage_percent = [0] * self.chart_data_history
-        self.swap_usage_percent = [0] * self.chart_data_history
+        self.ram_usage_percent = self.performance_history_func("memory", "ram")
+        self.swap_usage_percent = self.performance_history_func("memory", "swap")
 
         # Define initial values for disk read speed and write speed
         self.disk_list_prev = []
@@ -287,6 +289,16 @@ class Performance:
     def performance_background_loop_func(self):
         """
         Get basic CPU, memory, disk and network usage data in the background in order to assure uninterrupted data for charts.
+        Histories are not changed while a chart is drawn on the main thread.
+        """
+
+        with self.history_lock:
+            self.performance_background_update_func()
+
+
+    def performance_background_update_func(self):
+        """
+        Get basic CPU, memory, disk and network usage data and append them to the histories.
         """
 
         # Get CPU usage percentage per-core
@@ -294,7 +306,7 @@ class Performance:
         self.logical_core_list = list(cpu_times.keys())
         for core in self.logical_core_list:
             if core not in self.logical_core_list_prev:
-                self.cpu_usage_percent_per_core[core] = [0] * self.chart_data_history
+                self.cpu_usage_percent_per_core[core] = self.performance_history_func("cpu", core)
             else:
                 cpu_time_load_difference = cpu_times[core]["load"] - self.cpu_times_prev[core]["load"]
                 cpu_time_all_difference = cpu_times[core]["all"] - self.cpu_times_prev[core]["all"]
@@ -304,17 +316,15 @@ class Performance:
                 else:
                     _cpu_usage_percent_core = cpu_time_load_difference / cpu_time_all_difference * 100
                 self.cpu_usage_percent_per_core[core].append(_cpu_usage_percent_core)
-                del self.cpu_usage_percent_per_core[core][0]
         for core in self.logical_core_list_prev:
             if core not in self.logical_core_list:
-                self.cpu_usage_percent_per_core[core] = [0] * self.chart_data_history
+                self.cpu_usage_percent_per_core[core] = MultiResolutionHistory(self.chart_data_history)
         # Get average CPU usage percentage
         _cpu_usage_percent_ave = 0
         for core in self.logical_core_list:
             _cpu_usage_percent_ave = _cpu_usage_percent_ave + self.cpu_usage_percent_per_core[core][-1]
         self.number_of_logical_cores = len(self.logical_core_list)
         self.cpu_usage_percent_ave.append(_cpu_usage_percent_ave / self.number_of_logical_cores)
-        del self.cpu_usage_percent_ave[0]
         # Set selected CPU core
         if self.logical_core_list_prev != self.logical_core_list:
             self.performance_set_selected_cpu_core_func()
@@ -326,11 +336,9 @@ class Performance:
         memory_info = self.memory_info()
         ram_used_percent = memory_info["ram_used_percent"]
         self.ram_usage_percent.append(ram_used_percent)
-        del self.ram_usage_percent[0]
         # Get swap usage percentage
         swap_used_percent = memory_info["swap_used_percent"]
         self.swap_usage_percent.append(swap_used_percent)
-        del self.swap_usage_percent[0]
 
         # Get time for calculating disk and network speeds
         get_time = time.time()
@@ -340,21 +348,19 @@ class Performance:
         self.disk_list = list(disk_io.keys())
         for disk in self.disk_list:
             if disk not in self.disk_list_prev:
-                self.disk_read_speed[disk] = [0] * self.chart_data_history
-                self.disk_write_speed[disk] = [0] * self.chart_data_history
+                self.disk_read_speed[disk] = self.performance_history_func("disk", disk + "/read")
+                self.disk_write_speed[disk] = self.performance_history_func("disk", disk + "/write")
             else:
                 disk_read_speed_difference = disk_io[disk]["read_bytes"] - self.disk_io_prev[disk]["read_bytes"]
                 disk_write_speed_difference = disk_io[disk]["write_bytes"] - self.disk_io_prev[disk]["write_bytes"]
                 _disk_read_speed = disk_read_speed_difference / (get_time - self.get_time_prev)
                 _disk_write_speed = disk_write_speed_difference / (get_time - self.get_time_prev)
                 self.disk_read_speed[disk].append(_disk_read_speed)
-                del self.disk_read_speed[disk][0]
                 self.disk_write_speed[disk].append(_disk_write_speed)
-                del self.disk_write_speed[disk][0]
         for disk in self.disk_list_prev:
             if disk not in self.disk_list:
-                self.disk_read_speed[disk] = [0] * self.chart_data_history
-                self.disk_write_speed[disk] = [0] * self.chart_data_history
+                self.disk_read_speed[disk] = MultiResolutionHistory(self.chart_data_history)
+                self.disk_write_speed[disk] = MultiResolutionHistory(self.chart_data_history)
         # Set selected disk
         if self.disk_list_prev != self.disk_list:
             self.performance_set_selected_disk_func()
@@ -367,21 +373,19 @@ class Performance:
         self.network_card_list = list(network_io.keys())
         for network_card in self.network_card_list:
             if network_card not in self.network_card_list_prev:
-                self.network_receive_speed[network_card] = [0] * self.chart_data_history
-                self.network_send_speed[network_card] = [0] * self.chart_data_history
+                self.network_receive_speed[network_card] = self.performance_history_func("network", network_card + "/receive")
+                self.network_send_speed[network_card] = self.performance_history_func("network", network_card + "/send")
             else:
                 network_receive_speed_difference = network_io[network_card]["download_bytes"] - self.network_io_prev[network_card]["download_bytes"]
                 network_send_speed_difference = network_io[network_card]["upload_bytes"] - self.network_io_prev[network_card]["upload_bytes"]
                 _network_receive_speed = network_receive_speed_difference / (get_time - self.get_time_prev)
                 _network_send_speed = network_send_speed_difference / (get_time - self.get_time_prev)
                 self.network_receive_speed[network_card].append(_network_receive_speed)
-                del self.network_receive_speed[network_card][0]
                 self.network_send_speed[network_card].append(_network_send_speed)
-                del self.network_send_speed[network_card][0]
         for network_card in self.network_card_list_prev:
             if network_card not in self.network_card_list:
-                self.network_receive_speed[network_card] = [0] * self.chart_data_history
-                self.network_send_speed[network_card] = [0] * self.chart_data_history
+                self.network_receive_speed[network_card] = MultiResolutionHistory(self.chart_data_history)
+                self.network_send_speed[network_card] = MultiResolutionHistory(self.chart_data_history)
         # Set selected network card
         if self.network_card_list_prev != self.network_card_list:
             self.performance_set_selected_network_card_func()
@@ -391,12 +395,127 @@ class Performance:
 
         self.get_time_prev = get_time
 
+        Procfs.readers_diagnostics_counter_add_func([self.proc_stat_reader, self.proc_meminfo_reader, self.proc_partitions_reader,
+                                                     self.proc_diskstats_reader, self.proc_net_dev_reader])
+
+        # Record performance data if preferred.
+        if Config.record_performance_history == 1:
+            self.performance_record_func(get_time)
+
+
+    def performance_history_func(self, family, series_name):
+        """
+        Generate history of a chart. Recorded values of the last chart data history period
+        are added to the history if recording performance data is enabled.
+        """
+
+        value_list = []
+        if Config.record_performance_history == 1:
+            history_length = min(self.chart_data_history, MultiResolutionHistory.raw_length_max)
+            try:
+                value_list = MetricStore.series_recent_values_func(family, series_name, history_length, Config.update_interval)
+            # Prevent errors if recorded data could not be read (for example, if there is no write permission for the folder).
+            except (OSError, ValueError):
+                pass
+
+        return MultiResolutionHistory(self.chart_data_history, value_list)
+
+
+    def performance_record_func(self, record_time):
+        """
+        Record last values of CPU, memory, disk and network performance data (one record per metric family).
+        """
+
+        cpu_value_dict = {"average": self.cpu_usage_percent_ave[-1]}
+        for core in self.logical_core_list:
+            cpu_value_dict[core] = self.cpu_usage_percent_per_core[core][-1]
+        memory_value_dict = {"ram": self.ram_usage_percent[-1], "swap": self.swap_usage_percent[-1]}
+        disk_value_dict = {}
+        for disk in self.disk_list:
+            disk_value_dict[disk + "/read"] = self.disk_read_speed[disk][-1]
+            disk_value_dict[disk + "/write"] = self.disk_write_speed[disk][-1]
+        network_value_dict = {}
+        for network_card in self.network_card_list:
+            network_value_dict[network_card + "/receive"] = self.network_receive_speed[network_card][-1]
+            network_value_dict[network_card + "/send"] = self.network_send_speed[network_card][-1]
+
+        try:
+            MetricStore.record_func("cpu", cpu_value_dict, record_time)
+            MetricStore.record_func("memory", memory_value_dict, record_time)
+            MetricStore.record_func("disk", disk_value_dict, record_time)
+            MetricStore.record_func("network", network_value_dict, record_time)
+        # Stop recording if performance data could not be written (for example, if there is no free disk space).
+        except OSError:
+            Config.record_performance_history = 0
+
+
+    def performance_chart_number_of_horizontal_charts_func(self, number_of_charts):
+        """
+        Get number of horizontal charts if multiple charts (devices) are drawn.
+        """
+
+        for i in range(1, 1000):
+            if number_of_charts % i == 0:
+                number_of_horizontal_charts = i
+                number_of_vertical_charts = number_of_charts // i
+                if number_of_horizontal_charts >= number_of_vertical_charts:
+                    if number_of_horizontal_charts > 2 * number_of_vertical_charts:
+                        number_of_horizontal_charts = number_of_vertical_charts = ceil(sqrt(number_of_charts))
+                    break
+
+        return number_of_horizontal_charts
+
+
+    def performance_chart_values_func(self, performance_data, device_name_list, width):
+        """
+        Get values of the charts of the devices. Histories have raw values and lower resolution values (rollups) for
+        long chart data histories. Resolution is selected by using time span of the chart and number of the values
+        is limited by width of the chart in pixels. Thus more values than pixels are not drawn.
+        """
+
+        number_of_horizontal_charts = self.performance_chart_number_of_horizontal_charts_func(len(device_name_list))
+        point_count_max = int(width / number_of_horizontal_charts)
+        time_span = Config.chart_data_history * Config.update_interval
+
+        chart_values_dict = {}
+        for device_name in device_name_list:
+            chart_values_dict[device_name] = performance_data[device_name].chart_values_func(time_span, Config.update_interval, point_count_max)
+
+        return chart_values_dict
+
+
+    def performance_chart_max_values_func(self, performance_data, chart_values_dict):
+        """
+        Get max values of the charts of the devices. Tracked max values of the histories are used if all raw values
+        are shown on the charts. Thus values of the charts are not searched for the max value in every draw.
+        """
+
+        time_span = Config.chart_data_history * Config.update_interval
+
+        chart_max_dict = {}
+        for device_name, value_list in chart_values_dict.items():
+            chart_max_dict[device_name] = performance_data[device_name].chart_max_func(time_span, Config.update_interval, value_list)
+
+        return chart_max_dict
+
 
     def performance_line_charts_draw(self, widget, ctx, width, height, widget_name):
+        """
+        Draw performance data as line chart. Histories are not changed by the collector thread while they are drawn.
+        """
+
+        with self.history_lock:
+            self.performance_line_charts_draw_func(widget, ctx, width, height, widget_name)
+
+
+    def performance_line_charts_draw_func(self, widget, ctx, width, height, widget_name):
         """
         Draw performance data as line chart.
         """
 
+        # "cairo" is imported here because this module is also used without GUI (headless mode).
+        import cairo
+
         # Check if drawing will be for CPU tab.
         if widget_name == "da_cpu_usage":
 
@@ -413,6 +532,9 @@ class Performance:
                 device_name_list = list(self.logical_core_list)
                 selected_device = self.selected_cpu_core
 
+            # Get chart values of the devices (values of the history in the resolution which is suitable for width of the charts).
+            performance_data1 = self.performance_chart_values_func(performance_data1, device_name_list, width)
+
             # Get which performance data will be drawn.
             draw_performance_data1 = 1
             draw_performance_data2 = 0
@@ -438,6 +560,9 @@ class Performance:
                 device_name_list = list(performance_data1.keys())
                 selected_device = ""
 
+            # Get chart values of the devices (values of the history in the resolution which is suitable for width of the charts).
+            performance_data1 = self.performance_chart_values_func(performance_data1, device_name_list, width)
+
             # Get which performance data will be drawn.
             draw_performance_data1 = 1
             draw_performance_data2 = 0
@@ -471,6 +596,15 @@ class Performance:
                     if device.startswith("loop") == True or device.startswith("ram") == True or device.startswith("zram") == True:
                         device_name_list.remove(device)
 
+            # Get chart values of the devices (values of the history in the resolution which is suitable for width of the charts)
+            # and max values of the charts.
+            chart_values_dict1 = self.performance_chart_values_func(performance_data1, device_name_list, width)
+            chart_values_dict2 = self.performance_chart_values_func(performance_data2, device_name_list, width)
+            chart_max_dict1 = self.performance_chart_max_values_func(performance_data1, chart_values_dict1)
+            chart_max_dict2 = self.performance_chart_max_values_func(performance_data2, chart_values_dict2)
+            performance_data1 = chart_values_dict1
+            performance_data2 = chart_values_dict2
+
             # Get which performance data will be drawn.
             if Config.plot_disk_read_speed == 1:
                 draw_performance_data1 = 1
@@ -486,11 +620,11 @@ class Performance:
             # performance data is increased or decreased for preventing the line being out of the chart border.
             chart_y_limit_dict = {}
             for device_name in device_name_list:
-                chart_y_limit = 1.1 * ((max(max(performance_data1[device_name]), max(performance_data2[device_name]))) + 0.0000001)
+                chart_y_limit = 1.1 * ((max(chart_max_dict1[device_name], chart_max_dict2[device_name])) + 0.0000001)
                 if draw_performance_data1 == 1 and draw_performance_data2 == 0:
-                    chart_y_limit = 1.1 * (max(performance_data1[device_name]) + 0.0000001)
+                    chart_y_limit = 1.1 * (chart_max_dict1[device_name] + 0.0000001)
                 if draw_performance_data1 == 0 and draw_performance_data2 == 1:
-                    chart_y_limit = 1.1 * (max(performance_data2[device_name]) + 0.0000001)
+                    chart_y_limit = 1.1 * (chart_max_dict2[device_name] + 0.0000001)
                 chart_y_limit_dict[device_name] = chart_y_limit
 
             # Get chart y limit value in order to show maximum value of the chart as multiples of 1, 10, 100.
@@ -541,6 +675,15 @@ class Performance:
                 device_name_list = list(self.network_card_list)
                 selected_device = self.selected_network_card
 
+            # Get chart values of the devices (values of the history in the resolution which is suitable for width of the charts)
+            # and max values of the charts.
+            chart_values_dict1 = self.performance_chart_values_func(performance_data1, device_name_list, width)
+            chart_values_dict2 = self.performance_chart_values_func(performance_data2, device_name_list, width)
+            chart_max_dict1 = self.performance_chart_max_values_func(performance_data1, chart_values_dict1)
+            chart_max_dict2 = self.performance_chart_max_values_func(performance_data2, chart_values_dict2)
+            performance_data1 = chart_values_dict1
+            performance_data2 = chart_values_dict2
+
             # Get which performance data will be drawn.
             if Config.plot_network_download_speed == 1:
                 draw_performance_data1 = 1
@@ -556,11 +699,11 @@ class Performance:
             # performance data is increased or decreased for preventing the line being out of the chart border.
             chart_y_limit_dict = {}
             for device_name in device_name_list:
-                chart_y_limit = 1.1 * ((max(max(performance_data1[device_name]), max(performance_data2[device_name]))) + 0.0000001)
+                chart_y_limit = 1.1 * ((max(chart_max_dict1[device_name], chart_max_dict2[device_name])) + 0.0000001)
                 if draw_performance_data1 == 1 and draw_performance_data2 == 0:
-                    chart_y_limit = 1.1 * (max(performance_data1[device_name]) + 0.0000001)
+                    chart_y_limit = 1.1 * (chart_max_dict1[device_name] + 0.0000001)
                 if draw_performance_data1 == 0 and draw_performance_data2 == 1:
-                    chart_y_limit = 1.1 * (max(performance_data2[device_name]) + 0.0000001)
+                    chart_y_limit = 1.1 * (chart_max_dict2[device_name] + 0.0000001)
                 chart_y_limit_dict[device_name] = chart_y_limit
 
             # Get chart y limit value in order to show maximum value of the chart as multiples of 1, 10, 100.
@@ -610,6 +753,9 @@ class Performance:
             device_name_list = list(performance_data1.keys())
             selected_device = ""
 
+            # Get chart values of the devices (values of the history in the resolution which is suitable for width of the charts).
+            performance_data1 = self.performance_chart_values_func(performance_data1, device_name_list, width)
+
             # Get which performance data will be drawn.
             draw_performance_data1 = 1
             draw_performance_data2 = 0
@@ -635,6 +781,9 @@ class Performance:
             device_name_list = list(performance_data1.keys())
             selected_device = ""
 
+            # Get chart values of the devices (values of the history in the resolution which is suitable for width of the charts).
+            performance_data1 = self.performance_chart_values_func(performance_data1, device_name_list, width)
+
             # Get which performance data will be drawn.
             draw_performance_data1 = 1
             draw_performance_data2 = 0
@@ -674,6 +823,12 @@ class Performance:
             device_name_list = list(performance_data1.keys())
             selected_device = ""
 
+            # Get chart values of the devices (values of the history in the resolution which is suitable for width of the charts)
+            # and max values of the charts.
+            chart_values_dict1 = self.performance_chart_values_func(performance_data1, device_name_list, width)
+            chart_max_dict1 = self.performance_chart_max_values_func(performance_data1, chart_values_dict1)
+            performance_data1 = chart_values_dict1
+
             # Get which performance data will be drawn.
             draw_performance_data1 = 1
             draw_performance_data2 = 0
@@ -681,7 +836,7 @@ class Performance:
             # Maximum performance data value is multiplied by 1.1 in order to scale chart when performance data is increased or decreased for preventing the line being out of the chart border.
             chart_y_limit_dict = {}
             for device_name in device_name_list:
-                chart_y_limit = 1.1 * (max(performance_data1[device_name]) + 0.0000001)
+                chart_y_limit = 1.1 * (chart_max_dict1[device_name] + 0.0000001)
                 chart_y_limit_dict[device_name] = chart_y_limit
 
             # Get chart y limit value in order to show maximum value of the chart as multiples of 1, 10, 100.
@@ -729,6 +884,15 @@ class Performance:
             device_name_list = list(performance_data1.keys())
             selected_device = ""
 
+            # Get chart values of the devices (values of the history in the resolution which is suitable for width of the charts)
+            # and max values of the charts.
+            chart_values_dict1 = self.performance_chart_values_func(performance_data1, device_name_list, width)
+            chart_values_dict2 = self.performance_chart_values_func(performance_data2, device_name_list, width)
+            chart_max_dict1 = self.performance_chart_max_values_func(performance_data1, chart_values_dict1)
+            chart_max_dict2 = self.performance_chart_max_values_func(performance_data2, chart_values_dict2)
+            performance_data1 = chart_values_dict1
+            performance_data2 = chart_values_dict2
+
             # Get which performance data will be drawn.
             draw_performance_data1 = 1
             draw_performance_data2 = 1
@@ -737,11 +901,11 @@ class Performance:
             # performance data is increased or decreased for preventing the line being out of the chart border.
             chart_y_limit_dict = {}
             for device_name in device_name_list:
-                chart_y_limit = 1.1 * ((max(max(performance_data1[device_name]), max(performance_data2[device_name]))) + 0.0000001)
+                chart_y_limit = 1.1 * ((max(chart_max_dict1[device_name], chart_max_dict2[device_name])) + 0.0000001)
                 if draw_performance_data1 == 1 and draw_performance_data2 == 0:
-                    chart_y_limit = 1.1 * (max(performance_data1[device_name]) + 0.0000001)
+                    chart_y_limit = 1.1 * (chart_max_dict1[device_name] + 0.0000001)
                 if draw_performance_data1 == 0 and draw_performance_data2 == 1:
-                    chart_y_limit = 1.1 * (max(performance_data2[device_name]) + 0.0000001)
+                    chart_y_limit = 1.1 * (chart_max_dict2[device_name] + 0.0000001)
                 chart_y_limit_dict[device_name] = chart_y_limit
 
             # Get chart y limit value in order to show maximum value of the chart as multiples of 1, 10, 100.
@@ -774,8 +938,8 @@ class Performance:
 
 
         # Start drawing the performance data.
-        # Get chart data history.
-        chart_data_history = Config.chart_data_history
+        # Get number of the chart values (same for all devices).
+        chart_data_history = len(performance_data1[device_name_list[0]])
         chart_x_axis = list(range(0, chart_data_history))
 
         # Get chart background color.
@@ -788,15 +952,8 @@ class Performance:
         # Get number of charts.
         number_of_charts = len(device_name_list)
 
-        # Get number of horizontal and vertical charts (per-device).
-        for i in range(1, 1000):
-            if number_of_charts % i == 0:
-                number_of_horizontal_charts = i
-                number_of_vertical_charts = number_of_charts // i
-                if number_of_horizontal_charts >= number_of_vertical_charts:
-                    if number_of_horizontal_charts > 2 * number_of_vertical_charts:
-                        number_of_horizontal_charts = number_of_vertical_charts = ceil(sqrt(number_of_charts))
-                    break
+        # Get number of horizontal charts (per-device).
+        number_of_horizontal_charts = self.performance_chart_number_of_horizontal_charts_func(number_of_charts)
 
         # Get chart index list for horizontal and vertical charts. This data will be used for tiling charts.
         chart_index_dict = {}
@@ -1142,6 +1299,15 @@ class Performance:
 
 
     def performance_bar_charts_draw(self, widget, ctx, width, height, widget_name):
+        """
+        Draw performance data as bar chart. Histories are not changed by the collector thread while they are drawn.
+        """
+
+        with self.history_lock:
+            self.performance_bar_charts_draw_func(widget, ctx, width, height, widget_name)
+
+
+    def performance_bar_charts_draw_func(self, widget, ctx, width, height, widget_name):
         """
         Draw performance data as bar chart.
         """
@@ -8,7 +8,7 @@ gi.require_version('Pango', '1.0')
 from gi.repository import Gtk, Gdk, GLib, Gio, GObject, Pango
 
 import os
-import time
+import threading
 import subprocess
 
 from locale import gettext as _tr
@@ -17,6 +17,91 @@ from .Config import Config
 from .Performance import Performance
 from .MainWindow import MainWindow
 from . import Common
+from . import Procfs
+from . import RowDiff
+from .Diagnostics import Diagnostics
+from .DesktopApplications import DesktopApplications
+
+
+class ProcessItem(GObject.Object):
+    """
+    Item of a process in the process list models. Row of the process (which is generated by the collector) is kept
+    as it is instead of a GObject property per cell. Child processes are kept in a list model of the item if
+    processes are shown as tree.
+    """
+
+    __gtype_name__ = 'ProcessItem'
+
+    def __init__(self, pid, row):
+        super().__init__()
+
+        self.pid = pid
+        self.row = row
+        self.parent = None
+        self.children = None
+        self.children_sort_filter_model = None
+
+
+class ProcessListModel(GObject.Object, Gio.ListModel):
+    """
+    List model of processes (root processes or child processes of a process). Items are added, removed and changed
+    in groups and "items-changed" signal is emitted only for the changed ranges of the list.
+    """
+
+    __gtype_name__ = 'ProcessListModel'
+
+    def __init__(self):
+        super().__init__()
+
+        self.item_list = []
+
+    def do_get_item_type(self):
+        return ProcessItem.__gtype__
+
+    def do_get_n_items(self):
+        return len(self.item_list)
+
+    def do_get_item(self, position):
+        if position < len(self.item_list):
+            return self.item_list[position]
+        return None
+
+    def items_set_func(self, item_list):
+        """
+        Replace all items.
+        """
+
+        removed_item_count = len(self.item_list)
+        self.item_list = item_list
+        self.items_changed(0, removed_item_count, len(item_list))
+
+    def items_append_func(self, item_list):
+        """
+        Append items at the end of the list.
+        """
+
+        position = len(self.item_list)
+        self.item_list.extend(item_list)
+        self.items_changed(position, 0, len(item_list))
+
+    def items_remove_func(self, pid_set):
+        """
+        Remove items of the processes. Ranges are removed from the end of the list in order to keep positions of the other ranges valid.
+        """
+
+        positions = [position for position, item in enumerate(self.item_list) if item.pid in pid_set]
+        for position, item_count in reversed(RowDiff.position_ranges(positions)):
+            del self.item_list[position:position + item_count]
+            self.items_changed(position, item_count, 0)
+
+    def items_update_func(self, pid_set):
+        """
+        Notify the models which use this model (sorting, filtering, tree list models) about the changed items.
+        """
+
+        positions = [position for position, item in enumerate(self.item_list) if item.pid in pid_set]
+        for position, item_count in RowDiff.position_ranges(positions):
+            self.items_changed(position, item_count, item_count)
 
 
 class Processes:
@@ -29,6 +114,9 @@ class Processes:
         # tab settings are reset from general settings and initial function have to be run.
         self.initial_already_run = 0
 
+        # Process information is get in the collector thread and also on the main thread in some situations.
+        self.collect_lock = threading.Lock()
+
 
     def tab_gui(self):
         """
@@ -109,15 +197,49 @@ class Processes:
         scrolledwindow.set_vexpand(True)
         self.tab_grid.attach(scrolledwindow, 0, 1, 1, 1)
 
-        # TreeView
-        self.treeview = Gtk.TreeView()
-        self.treeview.set_activate_on_single_click(True)
-        self.treeview.set_fixed_height_mode(True)
-        self.treeview.set_headers_clickable(True)
-        self.treeview.set_enable_search(True)
-        self.treeview.set_search_column(2)
-        self.treeview.set_tooltip_column(3)                                                       # "3" is used for process command line
-        scrolledwindow.set_child(self.treeview)
+        # ColumnView. Rows are generated only for the visible part of the list and widgets of the rows are reused while scrolling.
+        self.columnview = Gtk.ColumnView()
+        self.columnview.set_reorderable(True)
+        self.columnview.add_css_class("data-table")
+        scrolledwindow.set_child(self.columnview)
+
+        # Models: process list models (root processes and child processes of every process if processes are shown as tree)
+        # -> filter list models (for search) -> sort list models (for row sorting when column titles are clicked. Child processes
+        # are sorted under their parent processes) -> tree list model -> selection model. Filter and sort list models of the child
+        # processes are generated when a row is expanded for the first time.
+        self.search_filter = Gtk.CustomFilter()
+        self.search_visible_pid_set = None
+        self.root_model = ProcessListModel()
+        self.tree_list_model = Gtk.TreeListModel.new(self.sort_filter_model_func(self.root_model), False, True, self.tree_list_model_create_func)
+        self.selection_model = Gtk.SingleSelection.new(self.tree_list_model)
+        self.selection_model.set_autoselect(False)
+        self.selection_model.set_can_unselect(True)
+        self.columnview.set_model(self.selection_model)
+
+        # Style provider for cell background colors (they are set depending on relative performance data).
+        style_provider_cell_background = Gtk.CssProvider()
+        css = ""
+        for css_class, alpha in cell_background_css_class_alpha_dict.items():
+            css = css + "." + css_class + " {background-color: rgba(70%,35%,5%," + str(alpha) + ");}\n"
+        # Tree lines are drawn on the indentation of the expanders.
+        css = css + ".processes-tree-lines treeexpander indent {box-shadow: inset 1px 0 rgba(50%,50%,50%,0.5);}\n"
+        try:
+            style_provider_cell_background.load_from_data(css.encode())
+        except Exception:
+            style_provider_cell_background.load_from_data(css, len(css))
+        Gtk.StyleContext.add_provider_for_display(Gdk.Display.get_default(), style_provider_cell_background, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+
+        # Widgets of the visible cells are kept in order to update them in every loop ({list item: (process item, image, label, column information)}).
+        self.bound_cell_dict = {}
+        # Processes of which rows are collapsed by the user. Rows are generated again (as expanded) if they are moved while sorting.
+        self.collapsed_pid_set = set()
+        # Prevent saving column order/widths, row sorting while they are changed by the code.
+        self.columns_updating = False
+        self.item_dict = {}
+        self.column_dict = {}
+        self.column_data_index_dict = {}
+        self.sort_data_index = None
+        self.show_processes_as_tree = Config.show_processes_as_tree
 
 
     def gui_signals(self):
@@ -125,19 +247,10 @@ class Processes:
         Connect GUI signals.
         """
 
-        # Treeview signals
-        self.treeview.connect("columns-changed", self.on_columns_changed)
-
-        # Treeview mouse events
-        treeview_mouse_event = Gtk.GestureClick()
-        treeview_mouse_event.connect("pressed", self.on_treeview_pressed)
-        treeview_mouse_event.connect("released", self.on_treeview_released)
-        self.treeview.add_controller(treeview_mouse_event)
-
-        treeview_mouse_event_right_click = Gtk.GestureClick()
-        treeview_mouse_event_right_click.set_button(3)
-        treeview_mouse_event_right_click.connect("pressed", self.on_treeview_pressed)
-        self.treeview.add_controller(treeview_mouse_event_right_click)
+        # ColumnView signals (mouse events are connected for the cells, see "on_cell_setup")
+        self.columnview.get_columns().connect("items-changed", self.on_columns_changed)
+        self.columnview.get_sorter().connect("changed", self.on_column_sorter_changed)
+        self.selection_model.connect("selection-changed", self.on_selection_changed)
 
         # SeachEntry focus action and accelerator
         Common.searchentry_focus_action_and_accelerator(MainWindow)
@@ -257,7 +370,6 @@ class Processes:
         # Popover menu
         self.right_click_menu_po = Gtk.PopoverMenu()
         self.right_click_menu_po.set_menu_model(right_click_menu_model)
-        #self.right_click_menu_po.set_parent(self.treeview)
         self.right_click_menu_po.set_parent(MainWindow.main_window)
         self.right_click_menu_po.set_position(Gtk.PositionType.BOTTOM)
         self.right_click_menu_po.set_has_arrow(False)
@@ -445,7 +557,7 @@ class Processes:
 
         # Get right clicked process pid and name.
         selected_process_pid = self.selected_process_pid
-        selected_process_name = self.processes_data_rows[self.pid_list.index(selected_process_pid)][2]
+        selected_process_name = self.processes_data_rows_dict[selected_process_pid][2]
 
         # Pause Process
         if action.get_name() == "processes_pause_process":
@@ -623,7 +735,7 @@ class Processes:
         if action.get_name() == "processes_priority_custom_value":
 
             # Get right clicked process name.
-            selected_process_name = self.processes_data_rows[Processes.pid_list.index(selected_process_pid)][2]
+            selected_process_name = self.processes_data_rows_dict[selected_process_pid][2]
 
             # Get process stat file path.
             selected_process_stat_file = "/proc/" + selected_process_pid + "/stat"
@@ -677,137 +789,297 @@ class Processes:
 
         process_search_text = self.searchentry.get_text().lower()
 
-        treeview = self.treeview
-        sort_model = treeview.get_model()
-        filter_model = sort_model.get_model()
-        treestore = filter_model.get_model()
-
-        global pid_list, cmdline_list
-
-        # Get PID, iter, shown, expanded information from sort model before changing search text.
-        pid_piter_sort_model_before_dict = self.get_sort_model_piter_information(treeview, sort_model)
+        # Filter function is removed if there is no search text. All rows are shown without running the filter function for every row in this situation.
+        if process_search_text == "":
+            if self.search_visible_pid_set is not None:
+                self.search_visible_pid_set = None
+                self.search_filter.set_filter_func(None)
+            return
 
-        # Show/hide iters (rows) by using search text.
-        for piter in self.piter_list:
+        # Get processes which match the search text. Parent processes of them are also shown if processes are shown as tree.
+        search_visible_pid_set = set()
+        for pid, process_item in self.item_dict.items():
             if self.process_search_type == "name":
-                process_data_text_in_model = treestore.get_value(piter, self.filter_column)
+                process_data_text_in_model = process_item.row[self.filter_column]
             elif self.process_search_type == "command_line":
-                process_pid_in_model = str(treestore.get_value(piter, 4))
-                process_data_text_in_model = cmdline_list[pid_list.index(process_pid_in_model)]
+                process_data_text_in_model = process_item.row[3]
             if process_search_text in str(process_data_text_in_model).lower():
-                while piter != None:
-                    pid = treestore.get_value(piter, 4)
-                    treestore.set_value(piter, 0, True)
-                    piter = treestore.iter_parent(piter)
-            else:
-                treestore.set_value(piter, 0, False)
+                while process_item is not None and process_item.pid not in search_visible_pid_set:
+                    search_visible_pid_set.add(process_item.pid)
+                    process_item = process_item.parent
 
-        # Get PID, iter, shown, expanded information from sort model after changing search text.
-        pid_piter_sort_model_after_dict = self.get_sort_model_piter_information(treeview, sort_model)
+        # Filter list models are updated when filter function is set.
+        self.search_visible_pid_set = search_visible_pid_set
+        self.search_filter.set_filter_func(self.search_filter_func)
 
-        # Expand rows after search text change if if is expanded before or it is made shown again.
-        for pid in pid_piter_sort_model_after_dict:
-            piter = pid_piter_sort_model_after_dict[pid]["piter"]
-            if pid not in pid_piter_sort_model_before_dict:
-                treeview.expand_row(sort_model.get_path(piter), False)
-                continue
-            if pid_piter_sort_model_before_dict[pid]["expanded"] == True:
-                treeview.expand_row(sort_model.get_path(piter), False)
-
-
-    def get_sort_model_piter_information(self, treeview, sort_model):
-        """
-        Get PID, iter, shown, expanded information from treeview sort model.
-        """
-
-        pid_piter_sort_model_dict = {}
-        # Get PID, iter, shown, expanded information for for root rows.
-        list_current = []
-        for i, row in enumerate(sort_model):
-            piter = sort_model.get_iter(i)
-            pid = sort_model.get_value(piter, 4)
-            sub_dict = {}
-            sub_dict["piter"] = piter
-            sub_dict["shown"] = sort_model.get_value(piter, 0)
-            sub_dict["expanded"] = treeview.row_expanded(sort_model.get_path(piter))
-            pid_piter_sort_model_dict[pid] = sub_dict
-            list_current.append(piter)
-        list_current = list(list_current)
-        list_next = []
-        # Get PID, iter, shown, expanded information for for children rows.
-        while list_current != []:
-            for piter in list_current:
-                children_count = sort_model.iter_n_children(piter)
-                for i in range(children_count):
-                    piter_child = sort_model.iter_nth_child(piter, i)
-                    if piter_child == None:
-                        continue
-                    pid = sort_model.get_value(piter_child, 4)
-                    sub_dict = {}
-                    sub_dict["piter"] = piter_child
-                    sub_dict["shown"] = sort_model.get_value(piter_child, 0)
-                    sub_dict["expanded"] = treeview.row_expanded(sort_model.get_path(piter_child))
-                    pid_piter_sort_model_dict[pid] = sub_dict
-                    list_next.append(piter_child)
-            list_current = list(list_next)
-            list_next = []
-
-        return pid_piter_sort_model_dict
-
-
-    def on_columns_changed(self, widget):
-        """
-        Called if number of columns changed.
-        """
-
-        processes_treeview_columns = self.treeview.get_columns()
-        if len(Config.processes_treeview_columns_shown) != len(processes_treeview_columns):
+
+    def search_filter_func(self, process_item):
+        """
+        Filter function of the filter list models (process search).
+        """
+
+        return process_item.pid in self.search_visible_pid_set
+
+
+    def sort_filter_model_func(self, process_list_model):
+        """
+        Generate filter list model (for search) and sort list model (for row sorting) for a process list model.
+        """
+
+        filter_list_model = Gtk.FilterListModel.new(process_list_model, self.search_filter)
+
+        return Gtk.SortListModel.new(filter_list_model, self.columnview.get_sorter())
+
+
+    def tree_list_model_create_func(self, process_item):
+        """
+        Get model of the child processes of a process when its row is expanded. Row has no expander if the process has no child processes.
+        Models are kept for reusing them when the row is generated again.
+        """
+
+        if process_item.children is None:
+            return None
+        if process_item.children_sort_filter_model is None:
+            process_item.children_sort_filter_model = self.sort_filter_model_func(process_item.children)
+
+        return process_item.children_sort_filter_model
+
+
+    def items_clear_func(self):
+        """
+        Remove references between the items and the models of the child processes. Models are also referenced by GTK and
+        the items could not be freed otherwise.
+        """
+
+        for process_item in self.item_dict.values():
+            process_item.parent = None
+            process_item.children = None
+            process_item.children_sort_filter_model = None
+        self.item_dict = {}
+
+
+    def process_list_model_func(self, parent_item):
+        """
+        Get process list model which contains the process. Process is in the root process list model if it has no parent process item.
+        """
+
+        if parent_item is None:
+            return self.root_model
+
+        return parent_item.children
+
+
+    def columnview_columns_func(self):
+        """
+        Get columns of the columnview as a list.
+        """
+
+        processes_columnview_columns = self.columnview.get_columns()
+
+        return [processes_columnview_columns.get_item(i) for i in range(processes_columnview_columns.get_n_items())]
+
+
+    def on_cell_setup(self, factory, list_item, column_info):
+        """
+        Generate widgets of a cell. Widgets are reused for different processes while scrolling.
+        """
+
+        image_data_index, label_data_index, cell_alignment, cell_function = column_info
+
+        label = Gtk.Label()
+        label.set_xalign(cell_alignment)
+        label.set_ellipsize(Pango.EllipsizeMode.END)
+        label.set_hexpand(True)
+
+        if image_data_index is None:
+            cell_widget = label
+        else:
+            # Name column has expander (for tree structure), process icon and process name.
+            grid = Gtk.Grid()
+            grid.set_column_spacing(5)
+            grid.attach(Gtk.Image(), 0, 0, 1, 1)
+            grid.attach(label, 1, 0, 1, 1)
+            cell_widget = Gtk.TreeExpander()
+            cell_widget.set_child(grid)
+
+        # Cell mouse events (all mouse buttons)
+        cell_mouse_event = Gtk.GestureClick()
+        cell_mouse_event.set_button(0)
+        cell_mouse_event.connect("pressed", self.on_cell_pressed)
+        cell_widget.add_controller(cell_mouse_event)
+
+        list_item.set_child(cell_widget)
+
+
+    def on_cell_bind(self, factory, list_item, column_info):
+        """
+        Show data of a process on a cell when the cell becomes visible.
+        """
+
+        tree_list_row = list_item.get_item()
+        process_item = tree_list_row.get_item()
+        cell_widget = list_item.get_child()
+
+        expanded_handler_id = None
+        if column_info[0] is None:
+            image = None
+            label = cell_widget
+        else:
+            cell_widget.set_list_row(tree_list_row)
+            cell_widget.set_indent_for_icon(self.show_processes_as_tree == 1)
+            grid = cell_widget.get_child()
+            image = grid.get_child_at(0, 0)
+            label = grid.get_child_at(1, 0)
+            expanded_handler_id = tree_list_row.connect("notify::expanded", self.on_row_expanded_changed)
+            # Row is generated as expanded if it is moved while sorting. Collapse it again if it is collapsed by the user.
+            # Expanding/collapsing rows while cells are bound changes the model. Therefore it is run later.
+            if process_item.pid in self.collapsed_pid_set and tree_list_row.get_expanded() == True:
+                GLib.idle_add(tree_list_row.set_expanded, False)
+
+        # Process command line is shown as tooltip.
+        cell_widget.set_tooltip_text(process_item.row[3])
+
+        self.bound_cell_dict[cell_widget] = (process_item, image, label, column_info, tree_list_row, expanded_handler_id)
+        self.cell_update_func(process_item, image, label, column_info)
+
+
+    def on_cell_unbind(self, factory, list_item, column_info):
+        """
+        Forget a cell when it is not visible anymore.
+        """
+
+        cell_widget = list_item.get_child()
+        bound_cell = self.bound_cell_dict.pop(cell_widget, None)
+        if column_info[0] is not None:
+            cell_widget.set_list_row(None)
+            if bound_cell is not None:
+                bound_cell[4].disconnect(bound_cell[5])
+
+
+    def cell_update_func(self, process_item, image, label, column_info):
+        """
+        Show data of a process on a cell. Cell functions set data precisions and/or data units and cell background colors.
+        """
+
+        image_data_index, label_data_index, cell_alignment, cell_function = column_info
+        row = process_item.row
+
+        if image is not None:
+            image.set_from_icon_name(row[image_data_index])
+        if cell_function is None:
+            label.set_label(str(row[label_data_index]))
+        else:
+            cell_function(label, row[label_data_index])
+
+
+    def sort_compare_func(self, process_item1, process_item2, data_index):
+        """
+        Compare two processes for row sorting (numeric data).
+        """
+
+        value1 = process_item1.row[data_index]
+        value2 = process_item2.row[data_index]
+
+        return (value1 > value2) - (value1 < value2)
+
+
+    def sort_compare_text_func(self, process_item1, process_item2, data_index):
+        """
+        Compare two processes for row sorting (text data). Texts are compared by using the collation rules of the current locale.
+        """
+
+        return GLib.utf8_collate(process_item1.row[data_index], process_item2.row[data_index])
+
+
+    def on_row_expanded_changed(self, tree_list_row, parameter):
+        """
+        Keep processes of which rows are collapsed by the user.
+        """
+
+        process_item = tree_list_row.get_item()
+        if process_item is None:
             return
-        if processes_treeview_columns[0].get_width() == 0:
+
+        if tree_list_row.get_expanded() == True:
+            self.collapsed_pid_set.discard(process_item.pid)
+        else:
+            self.collapsed_pid_set.add(process_item.pid)
+
+
+    def rows_expand_all_func(self):
+        """
+        Expand all rows.
+        """
+
+        self.collapsed_pid_set = set()
+        # Number of rows is increased while rows are expanded.
+        position = 0
+        while position < self.tree_list_model.get_n_items():
+            self.tree_list_model.get_row(position).set_expanded(True)
+            position = position + 1
+
+
+    def rows_collapse_all_func(self):
+        """
+        Collapse all rows.
+        """
+
+        # Number of rows is decreased while rows are collapsed.
+        position = 0
+        while position < self.tree_list_model.get_n_items():
+            self.tree_list_model.get_row(position).set_expanded(False)
+            position = position + 1
+        self.collapsed_pid_set = set(pid for pid, process_item in self.item_dict.items() if process_item.children is not None)
+
+
+    def on_columns_changed(self, processes_columnview_columns, position, removed, added):
+        """
+        Called if columns are added, removed or reordered.
+        """
+
+        if self.columns_updating == True:
+            return
+        if processes_columnview_columns.get_n_items() != len(Config.processes_treeview_columns_shown):
             return
         self.treeview_column_order_width_row_sorting()
 
 
-    def on_treeview_pressed(self, event, count, x, y):
+    def on_selection_changed(self, selection_model, position, n_items):
+        """
+        Get PID of the selected process (for keyboard shortcuts of the right click menu actions).
+        """
+
+        tree_list_row = selection_model.get_selected_item()
+        if tree_list_row is None or tree_list_row.get_item() is None:
+            return
+        self.selected_process_pid = tree_list_row.get_item().pid
+
+
+    def on_cell_pressed(self, event, count, x, y):
         """
         Mouse single right click and double left click events (button press).
         Right click menu is opened when right clicked. Details window is shown when double clicked.
         """
 
-        # Convert coordinates for getting path.
-        x_bin, y_bin = self.treeview.convert_widget_to_bin_window_coords(x,y)
-
-        # Get right/double clicked row data
-        try:
-            path, _, _, _ = self.treeview.get_path_at_pos(int(x_bin), int(y_bin))
-        # Prevent errors when right clicked on an empty area on the treeview.
-        except TypeError:
-            return
-        model = self.treeview.get_model()
-        treeiter = model.get_iter(path)
-        self.aaa=model
         # Get right/double clicked process PID
-        if treeiter == None:
-            return
-        try:
-            self.selected_process_pid = self.pid_list[self.processes_data_rows.index(model[treeiter][:])]
-        # It gives error such as "ValueError: [True, 'system-monitoring-center-process-symbolic', 'python3', 2411, 'user', 'Running', 1.6633495783351964, 98824192, 548507648, 45764608, 0, 16384, 0, 5461, 0, 4, 1727, 1000, 1000, '/usr/bin/python3.9'] is not in list" rarely.
-        # It is handled in this situation.
-        except ValueError:
+        cell_widget = event.get_widget()
+        bound_cell = self.bound_cell_dict.get(cell_widget)
+        if bound_cell is None:
             return
+        self.selected_process_pid = bound_cell[0].pid
 
         # Show right click menu if right clicked on a row
-        if int(event.get_button()) == 3:
+        if int(event.get_current_button()) == 3:
 
             rectangle = Gdk.Rectangle()
             rectangle.x = int(x)
             rectangle.y = int(y)
             rectangle.width = 1
             rectangle.height = 1
-            # Convert teeview coordinates to window coordinates. Because popovermenu is set for window instead of treeview.
-            treeview_x_coord, treeview_y_coord = self.treeview.translate_coordinates(MainWindow.main_window,0,0)
-            rectangle.x = rectangle.x + treeview_x_coord
-            rectangle.y = rectangle.y + treeview_y_coord
+            # Convert cell coordinates to window coordinates. Because popovermenu is set for window instead of columnview.
+            cell_x_coord, cell_y_coord = cell_widget.translate_coordinates(MainWindow.main_window,0,0)
+            rectangle.x = rectangle.x + cell_x_coord
+            rectangle.y = rectangle.y + cell_y_coord
 
             # New coordinates have to be set for popovermenu on every popup.
             self.right_click_menu_po.set_pointing_to(rectangle)
@@ -815,23 +1087,11 @@ class Processes:
             self.set_priority_menu_option()
 
         # Show details window if double clicked on a row
-        if int(event.get_button()) == 1 and int(count) == 2:
+        if int(event.get_current_button()) == 1 and int(count) == 2:
             from . import ProcessesDetails
             ProcessesDetails.process_details_show_process_details()
 
 
-    def on_treeview_released(self, event, count, x, y):
-        """
-        Mouse single left click event (button release).
-        Update teeview column/row width/sorting/order.
-        """
-
-        # Check if left mouse button is used
-        if int(event.get_button()) == 1:
-            pass
-            #self.treeview_column_order_width_row_sorting()
-
-
     def processes_initial_func(self):
         """
         Initial code which which is not wanted to be run in every loop.
@@ -839,32 +1099,32 @@ class Processes:
 
         # data list explanation:
         # processes_data_list = [
-        #                       [treeview column number, treeview column title, internal column count, cell renderer count, treeview column sort column id, [data type 1, data type 2, ...], [cell renderer type 1, cell renderer type 2, ...], [cell attribute 1, cell attribute 2, ...], [cell renderer data 1, cell renderer data 2, ...], [cell left/right alignment 1, cell left/right alignment 2, ...], [set expand 1 {if cell will allocate unused space} cell expand 2, ...], [cell function 1, cell function 2, ...]]
+        #                       [column number, column title, internal column count, [data type 1, data type 2, ...], [cell widget type 1, cell widget type 2, ...], [cell left/right alignment 1, cell left/right alignment 2, ...], [cell function 1, cell function 2, ...]]
         #                       .
         #                       .
         #                       ]
         global processes_data_list
         processes_data_list = [
-                              [0, _tr('Name'), 3, 2, 3, [bool, str, str], ['internal_column', 'CellRendererPixbuf', 'CellRendererText'], ['no_cell_attribute', 'icon_name', 'text'], [0, 1, 2], ['no_cell_alignment', 0.0, 0.0], ['no_set_expand', False, False], ['no_cell_function', 'no_cell_function', 'no_cell_function']],
-                              [1, _tr('PID'), 2, 1, 2, [str, int], ['internal_column', 'CellRendererText'], ['no_cell_attribute', 'text'], [0, 1], ['no_cell_alignment', 1.0], [False, False], ['no_cell_function', 'no_cell_function']],
-                              [2, _tr('User'), 1, 1, 1, [str], ['CellRendererText'], ['text'], [0], [0.0], [False], ['no_cell_function']],
-                              [3, _tr('Status'), 1, 1, 1, [str], ['CellRendererText'], ['text'], [0], [0.0], [False], ['no_cell_function']],
-                              [4, _tr('CPU'), 1, 1, 1, [float], ['CellRendererText'], ['text'], [0], [1.0], [False], [cell_data_function_cpu_usage_percent]],
-                              [5, _tr('Memory (RSS)'), 1, 1, 1, [GObject.TYPE_INT64], ['CellRendererText'], ['text'], [0], [1.0], [False], [cell_data_function_memory_rss]],
-                              [6, _tr('Memory (VMS)'), 1, 1, 1, [GObject.TYPE_INT64], ['CellRendererText'], ['text'], [0], [1.0], [False], [cell_data_function_memory_vms]],
-                              [7, _tr('Memory (Shared)'), 1, 1, 1, [GObject.TYPE_INT64], ['CellRendererText'], ['text'], [0], [1.0], [False], [cell_data_function_memory_shared]],
-                              [8, _tr('Read Data'), 1, 1, 1, [GObject.TYPE_INT64], ['CellRendererText'], ['text'], [0], [1.0], [False], [cell_data_function_disk_read_data]],
-                              [9, _tr('Written Data'), 1, 1, 1, [GObject.TYPE_INT64], ['CellRendererText'], ['text'], [0], [1.0], [False], [cell_data_function_disk_write_data]],
-                              [10, _tr('Read Speed'), 1, 1, 1, [float], ['CellRendererText'], ['text'], [0], [1.0], [False], [cell_data_function_disk_read_speed]],
-                              [11, _tr('Write Speed'), 1, 1, 1, [float], ['CellRendererText'], ['text'], [0], [1.0], [False], [cell_data_function_disk_write_speed]],
-                              [12, _tr('Priority'), 1, 1, 1, [int], ['CellRendererText'], ['text'], [0], [1.0], [False], ['no_cell_function']],
-                              [13, _tr('Threads'), 1, 1, 1, [int], ['CellRendererText'], ['text'], [0], [1.0], [False], ['no_cell_function']],
-                              [14, _tr('PPID'), 1, 1, 1, [int], ['CellRendererText'], ['text'], [0], [1.0], [False], ['no_cell_function']],
-                              [15, _tr('UID'), 1, 1, 1, [int], ['CellRendererText'], ['text'], [0], [1.0], [False], ['no_cell_function']],
-                              [16, _tr('GID'), 1, 1, 1, [int], ['CellRendererText'], ['text'], [0], [1.0], [False], ['no_cell_function']],
-                              [17, _tr('Path'), 1, 1, 1, [str], ['CellRendererText'], ['text'], [0], [0.0], [False], ['no_cell_function']],
-                              [18, _tr('Command Line'), 1, 1, 1, [str], ['CellRendererText'], ['text'], [0], [0.0], [False], ['no_cell_function']],
-                              [19, _tr('CPU Time'), 1, 1, 1, [float], ['CellRendererText'], ['text'], [0], [1.0], [False], [cell_data_function_cpu_time]]
+                              [0, _tr('Name'), 3, [bool, str, str], ['internal_column', 'Image', 'Label'], ['no_cell_alignment', 0.0, 0.0], ['no_cell_function', 'no_cell_function', 'no_cell_function']],
+                              [1, _tr('PID'), 2, [str, int], ['internal_column', 'Label'], ['no_cell_alignment', 1.0], ['no_cell_function', 'no_cell_function']],
+                              [2, _tr('User'), 1, [str], ['Label'], [0.0], ['no_cell_function']],
+                              [3, _tr('Status'), 1, [str], ['Label'], [0.0], ['no_cell_function']],
+                              [4, _tr('CPU'), 1, [float], ['Label'], [1.0], [cell_data_function_cpu_usage_percent]],
+                              [5, _tr('Memory (RSS)'), 1, [int], ['Label'], [1.0], [cell_data_function_memory_rss]],
+                              [6, _tr('Memory (VMS)'), 1, [int], ['Label'], [1.0], [cell_data_function_memory_vms]],
+                              [7, _tr('Memory (Shared)'), 1, [int], ['Label'], [1.0], [cell_data_function_memory_shared]],
+                              [8, _tr('Read Data'), 1, [int], ['Label'], [1.0], [cell_data_function_disk_read_data]],
+                              [9, _tr('Written Data'), 1, [int], ['Label'], [1.0], [cell_data_function_disk_write_data]],
+                              [10, _tr('Read Speed'), 1, [float], ['Label'], [1.0], [cell_data_function_disk_read_speed]],
+                              [11, _tr('Write Speed'), 1, [float], ['Label'], [1.0], [cell_data_function_disk_write_speed]],
+                              [12, _tr('Priority'), 1, [int], ['Label'], [1.0], ['no_cell_function']],
+                              [13, _tr('Threads'), 1, [int], ['Label'], [1.0], ['no_cell_function']],
+                              [14, _tr('PPID'), 1, [int], ['Label'], [1.0], ['no_cell_function']],
+                              [15, _tr('UID'), 1, [int], ['Label'], [1.0], ['no_cell_function']],
+                              [16, _tr('GID'), 1, [int], ['Label'], [1.0], ['no_cell_function']],
+                              [17, _tr('Path'), 1, [str], ['Label'], [0.0], ['no_cell_function']],
+                              [18, _tr('Command Line'), 1, [str], ['Label'], [0.0], ['no_cell_function']],
+                              [19, _tr('CPU Time'), 1, [float], ['Label'], [1.0], [cell_data_function_cpu_time]]
                               ]
 
         # Define data unit conversion function objects in for lower CPU usage.
@@ -872,12 +1132,13 @@ class Processes:
         performance_data_unit_converter_func = Performance.performance_data_unit_converter_func
 
 
-        global processes_data_rows_prev, pid_list_prev, global_process_cpu_times_prev, disk_read_write_data_prev, show_processes_as_tree_prev, processes_treeview_columns_shown_prev, processes_data_row_sorting_column_prev, processes_data_row_sorting_order_prev, processes_data_column_order_prev, processes_data_column_widths_prev
-        processes_data_rows_prev = []
+        global processes_data_rows_dict_prev, pid_list_prev, global_process_cpu_times_prev, disk_read_write_data_prev, snapshot_global_cpu_time_all_prev, snapshot_time_prev, show_processes_as_tree_prev, processes_treeview_columns_shown_prev, processes_data_row_sorting_column_prev, processes_data_row_sorting_order_prev, processes_data_column_order_prev, processes_data_column_widths_prev
+        processes_data_rows_dict_prev = {}
         pid_list_prev = []
-        self.piter_list = []
-        global_process_cpu_times_prev = []
-        disk_read_write_data_prev = []
+        global_process_cpu_times_prev = {}
+        disk_read_write_data_prev = {}
+        snapshot_global_cpu_time_all_prev = 0
+        snapshot_time_prev = 0
         show_processes_as_tree_prev = Config.show_processes_as_tree
         processes_treeview_columns_shown_prev = []
         processes_data_row_sorting_column_prev = ""
@@ -885,32 +1146,37 @@ class Processes:
         processes_data_column_order_prev = []
         processes_data_column_widths_prev = []
 
-        global process_status_list, number_of_clock_ticks, memory_page_size, application_exec_list, application_icon_list
+        global process_status_list, number_of_clock_ticks, memory_page_size
         process_status_list = {"R": _tr("Running"), "S": _tr("Sleeping"), "D": _tr("Waiting"), "I": _tr("Idle"), "Z": _tr("Zombie"), "T": _tr("Stopped"), "t": "Tracing Stop", "X": "Dead"}    # This list is used in order to show full status of the process. For more information, see: "https://man7.org/linux/man-pages/man5/proc.5.html".
         number_of_clock_ticks = os.sysconf("SC_CLK_TCK")                                          # For many systems CPU ticks 100 times in a second. Wall clock time could be get if CPU times are multiplied with this value or vice versa.
         memory_page_size = os.sysconf("SC_PAGE_SIZE")                                             # This value is used for converting memory page values into byte values. This value depends on architecture (also sometimes depends on machine model). Default value is 4096 Bytes (4 KiB) for most processors.
 
-        # Get application names, images and types.
-        global application_exec_list, application_icon_list, application_type_list
-        application_exec_list, application_icon_list, application_type_list = self.application_exec_icon_type_list()
-
-        self.filter_column = processes_data_list[0][2] - 1                                        # Search filter is "Process Name". "-1" is used because "processes_data_list" has internal column count and it has to be converted to Python index. For example, if there are 3 internal columns but index is 2 for the last internal column number for the relevant treeview column.
+        self.filter_column = processes_data_list[0][2] - 1                                        # Search filter is "Process Name". "-1" is used because "processes_data_list" has internal column count and it has to be converted to Python index. For example, if there are 3 internal columns but index is 2 for the last internal column number for the relevant column.
 
         self.process_status_list = process_status_list
         self.number_of_clock_ticks = number_of_clock_ticks
         self.memory_page_size = memory_page_size
-        self.application_exec_list = application_exec_list
-        self.application_icon_list = application_icon_list
 
         self.initial_already_run = 1
 
 
-    def processes_loop_func(self):
+    def processes_collect_func(self):
         """
-        Get and show information on the GUI on every loop.
+        Get process information and generate rows of the treeview. GTK is not used in this function and it is run
+        in the collector thread (see "Collector.py") in every loop. It is also run on the main thread if loop function
+        is run without collected data (for example, after a menu setting is changed). Lock prevents running it at the same time.
         """
 
-        update_interval = Config.update_interval
+        with self.collect_lock:
+            collected_data = self.processes_rows_get_func()
+
+        return collected_data
+
+
+    def processes_rows_get_func(self):
+        """
+        Get process information and generate rows of the treeview.
+        """
 
         # Get configrations one time per floop instead of getting them multiple times (hundreds of times for many of them) in every loop which causes high CPU usage.
         global processes_cpu_precision, processes_cpu_divide_by_core
@@ -924,14 +1190,8 @@ class Processes:
         processes_disk_data_unit = Config.processes_disk_data_unit
         processes_disk_speed_bit = Config.processes_disk_speed_bit
 
-        # Define global variables and get treeview columns, sort column/order, column widths, etc.
-        global processes_treeview_columns_shown, show_processes_of_all_users
-        global processes_treeview_columns_shown_prev, processes_data_row_sorting_column_prev, processes_data_row_sorting_order_prev, processes_data_column_order_prev, processes_data_column_widths_prev
+        # Get treeview columns and process filtering preference.
         processes_treeview_columns_shown = Config.processes_treeview_columns_shown
-        processes_data_row_sorting_column = Config.processes_data_row_sorting_column
-        processes_data_row_sorting_order = Config.processes_data_row_sorting_order
-        processes_data_column_order = Config.processes_data_column_order
-        processes_data_column_widths = Config.processes_data_column_widths
         show_processes_of_all_users = Config.show_processes_of_all_users
 
         # Define lists for appending some performance data for calculating max values to determine cell background color.
@@ -955,147 +1215,55 @@ class Processes:
         current_user_name = os.environ.get('USER')
 
         # Get process PIDs and define global variables and empty lists for the current loop
-        global processes_data_rows_prev, global_process_cpu_times_prev, disk_read_write_data_prev, pid_list_prev, pid_list
+        global global_process_cpu_times_prev, disk_read_write_data_prev, snapshot_global_cpu_time_all_prev, snapshot_time_prev
         processes_data_rows = []
         ppid_list = []
         username_list = []
-        global_process_cpu_times = []
-        disk_read_write_data = []
+        global_process_cpu_times = {}
+        disk_read_write_data = {}
         pid_list = []
 
         processes_treeview_columns_shown = set(processes_treeview_columns_shown)                  # For obtaining lower CPU usage (because "if [number] in processes_treeview_columns_shown:" check is repeated thousand of times).
 
-        # Get process information by using "ps" command. "env" and "LANG=C" parameters are used in order to get column headers in English.
-        command_list = ["env", "LANG=C", "ps", "-eo", "comm:96,pid,user:80,s,rss,vsz,sz,nice,thcount,ppid,uid,gid,exe:800,command=CMDLINE"]
-        # "exe" parameter is not recognized by "ps" command in "coreutils" package if version
-        # is lower than 8.32. "group" parameter is used instead of "exe as a placeholder.
-        command_list2 = ["env", "LANG=C", "ps", "-eo", "comm:96,pid,user:80,s,rss,vsz,sz,nice,thcount,ppid,uid,gid,group:800,command=CMDLINE"]
-        if Config.environment_type == "flatpak":
-            command_list = ["flatpak-spawn", "--host"] + command_list
-            command_list2 = ["flatpak-spawn", "--host"] + command_list2
-        exe_column_get = 1
-        try:
-            # "stderr=subprocess.STDOUT" is used for not printing errors.
-            ps_output = (subprocess.check_output(command_list, stderr=subprocess.STDOUT, shell=False)).decode().strip()
-        except subprocess.CalledProcessError:
-            ps_output = (subprocess.check_output(command_list2, stderr=subprocess.STDOUT, shell=False)).decode().strip()
-            exe_column_get = 0
-
-        ps_output_lines = ps_output.split("\n")
-        # Delete the first line if there are errors because of some environment variables, libraries, etc.
-        if ps_output_lines[0].startswith("COMMAND      ") == False:
-            del ps_output_lines[0]
-        # Get first line (command output headers) for using it to determine column data locations. Because some columns (such as cmdline) may contain spaces.
-        ps_output_headers = ps_output_lines[0]
-        # Get column locations. "16" is subtracted because some column names may start after a few character on the right side. There is no need to use subtraction for "EXE" column because previous column "GID" is an integer data which is aligned to right.
-        pid_column_index = ps_output_headers.index("PID") - 16
-        if exe_column_get == 1:
-            exe_column_index = ps_output_headers.index("EXE")
-        else:
-            exe_column_index = ps_output_headers.index("GROUP")
-        cmdline_column_index = ps_output_headers.index("CMDLINE") - 16
+        # Get process information from the process snapshot which is shared with other tabs and windows. Files in "/proc/[PID]/"
+        # folders are read directly instead of running "ps" and "cat" commands in every loop. Commands are used if the application
+        # is run in Flatpak environment because processes of the host OS are not visible in the sandbox.
+        # "io" files and executable paths are read only if relevant columns are shown.
+        read_io = len(processes_treeview_columns_shown.intersection({8, 9, 10, 11})) > 0
+        read_exe = 17 in processes_treeview_columns_shown
+        processes_information_dict, global_cpu_time_all = Procfs.processes_snapshot(read_io=read_io, read_exe=read_exe)
+        # Disk read/write speeds are calculated by using the measured time between the snapshots (monotonic clock) instead of
+        # the update interval because a loop may be run later than the update interval (for example, if the previous collection is not finished).
+        snapshot_time = Procfs.snapshot_time()
+        snapshot_time_interval = snapshot_time - snapshot_time_prev
+        # Time difference is "0" if the loop function is run again by using the same snapshot (differences of the bytes are also "0" in this situation).
+        if snapshot_time_interval <= 0:
+            snapshot_time_interval = 1
 
-        # Deleted first line (command output headers).
-        del ps_output_lines[0]
         # Get PIDs and user names of the processes from the current user (show processes only from this user)
         # if it is preferred by user. PID values are appended as string values because they are used as string
         # values in various places in the code and this ensures lower CPU usage by avoiding hundreds/thousands
         # of times integer to string conversion. Commandlines will be used for determining full names of the
         # processes if their names are longer than 15 characters.
-        global cmdline_list
         cmdline_list = []
-        for line in ps_output_lines[:]:
-            line_split = line[pid_column_index:].split()
-            username = line_split[1]
+        for pid, process_information in processes_information_dict.items():
+            username = process_information["username"]
             if show_processes_of_all_users == 0 and username != current_user_name:
-                # Remove the line from the list. Because "ps_output_lines" list will be used for getting process information.
-                ps_output_lines.remove(line)
                 continue
-            pid_list.append(line_split[0])
+            pid_list.append(pid)
             username_list.append(username)
-            ppid_list.append(line_split[8])
-            cmdline_list.append(line[cmdline_column_index:].strip())
-
-        # Get process data.
-        # Get process names, images and CPU times for calculating usage information.
-        global previous_line_process
-        previous_line_process = 0
-        # Read "" and "" files by using "cat" command for calculating process CPU usages and read/write speeds.
-        command_list = ["cat"]
-        if Config.environment_type == "flatpak":
-            command_list = ["flatpak-spawn", "--host"] + command_list
-        for pid in pid_list:
-            command_list.append(f'/proc/{pid}/stat')
-            command_list.append(f'/proc/{pid}/io')
-        cat_output = (subprocess.run(command_list, shell=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)).stdout.decode().strip()
-        global_cpu_time_all = time.time() * number_of_clock_ticks                                 # global_cpu_time_all value is get just after "/proc/[PID]/stat file is get in order to measure global an process specific CPU times at the same time (nearly) for ensuring accurate process CPU usage percent.
-        cat_output_lines = cat_output.split("\n")
-        process_cpu_time_list = []
-        pid_list_from_stat = []
-        for line in cat_output_lines:
-            line_split = line.split()
-            if line_split[0].isdigit():
-                process_pid = line_split[0]
-                if process_pid not in pid_list:
-                    continue
-                if previous_line_process == 1:                                                    # Add "disk_read_write" data of the previous process if it has no readable "/proc/[PID]/io" file.
-                    disk_read_write_data.append([0, 0])
-                pid_list_from_stat.append(process_pid)                                            # This information will be used for removing "cat" command output data of stopped processes.
-                process_cpu_time_list.append(int(line_split[-38]) + int(line_split[-39]))         # Get process cpu time in user mode (utime + stime)
-                previous_line_process = 1
-            else:
-                if line_split[0] == "read_bytes:":
-                    disk_read_write_data.append([int(line_split[1])])
-                if line_split[0] == "write_bytes:":
-                    disk_read_write_data[-1].append(int(line_split[1]))
-                    previous_line_process = 0
-        if len(disk_read_write_data) < len(pid_list_from_stat):                                   # Append disk read/write data of the last process if it the line starts with digit number. This is skipped in the loop.
-            disk_read_write_data.append([0, 0])
-
-        # Get process shared memory data for all processes. This information is not provided
-        # by "ps" command. "ps" command output is processes line-by-line and next line is
-        # detected as process statm file if current line contains string value in the second element.
-        if 7 in processes_treeview_columns_shown:
-            command_list = ["cat"]
-            if Config.environment_type == "flatpak":
-                command_list = ["flatpak-spawn", "--host"] + command_list
-            for pid in pid_list:
-                command_list.append("/proc/" + pid + "/stat")
-                command_list.append("/proc/" + pid + "/statm")
-            cat_output_lines = (subprocess.run(command_list, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=False)).stdout.decode().strip().split("\n")
-            process_memory_shared_list = []
-            pid_list_from_stat_statm = []
-            for i, line in enumerate(cat_output_lines):
-                line_split = line.split()
-                if line_split[1].isdigit() == False:
-                    process_pid = line_split[0]
-                    if process_pid not in pid_list:
-                        continue
-                    next_line = cat_output_lines[i+1]
-                    next_line_split = next_line.split()
-                    if next_line_split[1].isdigit() == True:
-                        process_memory_shared_list.append(int(next_line_split[2]) * memory_page_size)
-                    else:
-                        process_memory_shared_list.append(0)
-                    pid_list_from_stat_statm.append(process_pid)
-            if len(process_memory_shared_list) < len(pid_list_from_stat_statm):
-                process_memory_shared_list.append(0)
+            ppid_list.append(str(process_information["ppid"]))
+            cmdline_list.append(process_information["cmdline"])
+
+        # Get application exec name - icon name dictionary which is used for getting process icons. ".desktop" files
+        # are read only if application folders are changed.
+        application_exec_icon_dict = DesktopApplications.exec_icon_dict_get_func()
 
         # Get and append process data.
-        for pid in pid_list[:]:                                                                   # "[:]" is used for iterating over copy of the list because elements are removed during iteration. Otherwise incorrect operations (incorrect element removals) are performed on the list.
-            index = pid_list.index(pid)
-            if pid not in pid_list_from_stat:
-                del pid_list[index]
-                del username_list[index]
-                del ppid_list[index]
-                del cmdline_list[index]
-                del ps_output_lines[index]
-                continue
-            index_from_stat = pid_list_from_stat.index(pid)
-            ps_output_line = ps_output_lines[index]
-            ps_output_line_split = ps_output_line[pid_column_index:].split()
+        for index, pid in enumerate(pid_list):
+            process_information = processes_information_dict[pid]
             # Get process full name.
-            process_name_from_stat = ps_output_line[:pid_column_index].strip()
+            process_name_from_stat = process_information["name"]
             process_name = process_name_from_stat
             if len(process_name) == 15:                                                           # Linux kernel trims process names longer than 16 (TASK_COMM_LEN, see: https://man7.org/linux/man-pages/man5/proc.5.html) characters (it is counted as 15). "/proc/[PID]/cmdline/" file is read and it is split by the last "/" character (not all process cmdlines have this) in order to obtain full process name.
                 process_cmdline = cmdline_list[index]
@@ -1109,11 +1277,11 @@ class Processes:
                 process_icon = "system-monitoring-center-process-symbolic"
             else:
                 process_icon = "application-x-executable"                                         # Initial value of "process_icon". This icon will be shown for processes of which icon could not be found in default icon theme.
-                if process_name in application_exec_list:                                         # Use process icon name from application file if process name is found in application exec list.
-                    process_icon = application_icon_list[application_exec_list.index(process_name)]
+                if process_name in application_exec_icon_dict:                                    # Use process icon name from application file if process name is found in application exec names.
+                    process_icon = application_exec_icon_dict[process_name]
             # Get process command line
-            process_commandline = ps_output_line[cmdline_column_index:].strip()
-            processes_data_row = [True, process_icon, process_name, process_commandline]          # Process row visibility data (True/False) which is used for showing/hiding process when processes of specific user is preferred to be shown or process search feature is used from the GUI.
+            process_commandline = cmdline_list[index]
+            processes_data_row = [True, process_icon, process_name, process_commandline]          # First element of the row (row visibility data) is kept for the data indexes of the columns. Rows are shown/hidden by the filter list models when process search feature is used from the GUI.
             # Get process PID. Value is appended as integer for ensuring correct "PID" column sorting such as 1,2,10,101... Otherwise it would sort such as 1,10,101,2...
             if 1 in processes_treeview_columns_shown:
                 processes_data_row.append(int(pid))
@@ -1122,51 +1290,47 @@ class Processes:
                 processes_data_row.append(username_list[index])
             # Get process status.
             if 3 in processes_treeview_columns_shown:
-                processes_data_row.append(process_status_list[ps_output_line_split[2]])
+                process_status = process_information["status"]
+                processes_data_row.append(process_status_list.get(process_status, process_status))
             # Get process CPU usage.
             if 4 in processes_treeview_columns_shown:
-                process_cpu_time = process_cpu_time_list[index_from_stat]
-                global_process_cpu_times.append((global_cpu_time_all, process_cpu_time))
+                process_cpu_time = process_information["cpu_time"]
+                global_process_cpu_times[pid] = (global_cpu_time_all, process_cpu_time)
                 try:
-                    global_cpu_time_all_prev, process_cpu_time_prev = global_process_cpu_times_prev[pid_list_prev.index(pid)]
-                except (ValueError, IndexError, UnboundLocalError) as e:
+                    global_cpu_time_all_prev, process_cpu_time_prev = global_process_cpu_times_prev[pid]
+                except KeyError:
                     process_cpu_time_prev = process_cpu_time                                      # There is no "process_cpu_time_prev" value and get it from "process_cpu_time" if this is first loop of the process.
-                    global_cpu_time_all_prev = global_process_cpu_times[-1][0] - 1                # Subtract "1" CPU time (a negligible value) if this is first loop of the process.
+                    global_cpu_time_all_prev = global_cpu_time_all - 1                            # Subtract "1" CPU time (a negligible value) if this is first loop of the process.
                 process_cpu_time_difference = process_cpu_time - process_cpu_time_prev
                 global_cpu_time_difference = global_cpu_time_all - global_cpu_time_all_prev
                 cpu_usage = process_cpu_time_difference / global_cpu_time_difference * 100 / core_count_division_number
                 processes_data_row.append(cpu_usage)
                 cpu_usage_list.append(cpu_usage)
-            # Get process RSS (resident set size) memory pages and multiply with 1024 in order to convert the value into bytes.
+            # Get process RSS (resident set size) memory (in bytes).
             if 5 in processes_treeview_columns_shown:
-                memory_rss = int(ps_output_line_split[3]) * 1024
+                memory_rss = process_information["rss"]
                 processes_data_row.append(memory_rss)
                 memory_rss_list.append(memory_rss)
-            # Get process VMS (virtual memory size) memory and multiply with 1024 in order to convert the value into bytes.
+            # Get process VMS (virtual memory size) memory (in bytes).
             if 6 in processes_treeview_columns_shown:
-                memory_vms = int(ps_output_line_split[4]) * 1024
+                memory_vms = process_information["vms"]
                 processes_data_row.append(memory_vms)
                 memory_vms_list.append(memory_vms)
-            # Get process shared memory size and multiply with 1024 in order to convert the value into bytes.
+            # Get process shared memory size (in bytes).
             if 7 in processes_treeview_columns_shown:
-                if pid in pid_list_from_stat_statm:
-                    index_from_stat_statm = pid_list_from_stat_statm.index(pid)
-                    process_memory_shared = process_memory_shared_list[index_from_stat_statm]
-                else:
-                    process_memory_shared = 0
+                process_memory_shared = process_information["shared"]
                 processes_data_row.append(process_memory_shared)
                 memory_shared_list.append(process_memory_shared)
             # Get process read data, write data, read speed, write speed.
-            if 8 in processes_treeview_columns_shown or 9 in processes_treeview_columns_shown or 10 in processes_treeview_columns_shown or 11 in processes_treeview_columns_shown:
-                process_read_bytes = disk_read_write_data[index_from_stat][0]
-                process_write_bytes = disk_read_write_data[index_from_stat][1]
+            if read_io == True:
+                process_read_bytes = process_information["read_bytes"]
+                process_write_bytes = process_information["write_bytes"]
+                disk_read_write_data[pid] = (process_read_bytes, process_write_bytes)
                 try:
-                    process_read_bytes_prev, process_write_bytes_prev = disk_read_write_data_prev[pid_list_prev.index(pid)]
-                except (ValueError, IndexError, UnboundLocalError) as e:
+                    process_read_bytes_prev, process_write_bytes_prev = disk_read_write_data_prev[pid]
+                except KeyError:
                     process_read_bytes_prev = process_read_bytes                                  # Make process_read_bytes_prev equal to process_read_bytes for giving "0" disk read speed value if this is first loop of the process
                     process_write_bytes_prev = process_write_bytes                                # Make process_write_bytes_prev equal to process_write_bytes for giving "0" disk write speed value if this is first loop of the process
-                if pid not in pid_list_prev and disk_read_write_data_prev != []:
-                    disk_read_write_data_prev.append((process_read_bytes, process_write_bytes))
                 # Get process read data.
                 if 8 in processes_treeview_columns_shown:
                     processes_data_row.append(process_read_bytes)
@@ -1177,199 +1341,258 @@ class Processes:
                     disk_write_data_list.append(process_write_bytes)
                 # Get process read speed.
                 if 10 in processes_treeview_columns_shown:
-                    disk_read_speed = (process_read_bytes - process_read_bytes_prev) / update_interval
-                    processes_data_row.append(disk_read_speed)    # Append process_read_bytes which will be used as "process_read_bytes_prev" value in the next loop and also append disk read speed. 
+                    disk_read_speed = (process_read_bytes - process_read_bytes_prev) / snapshot_time_interval
+                    processes_data_row.append(disk_read_speed)
                     disk_read_speed_list.append(disk_read_speed)
                 # Get process write speed.
                 if 11 in processes_treeview_columns_shown:
-                    disk_write_speed = (process_write_bytes - process_write_bytes_prev) / update_interval
-                    processes_data_row.append(disk_write_speed)    # Append process_write_bytes which will be used as "process_write_bytes_prev" value in the next loop and also append disk write speed. 
+                    disk_write_speed = (process_write_bytes - process_write_bytes_prev) / snapshot_time_interval
+                    processes_data_row.append(disk_write_speed)
                     disk_write_speed_list.append(disk_write_speed)
             # Get process nice value.
             if 12 in processes_treeview_columns_shown:
-                process_nice = ps_output_line_split[6]
-                if process_nice == "-":
-                    process_nice = "0"
-                processes_data_row.append(int(process_nice))
+                processes_data_row.append(process_information["nice"])
             # Get process number of threads value.
             if 13 in processes_treeview_columns_shown:
-                processes_data_row.append(int(ps_output_line_split[7]))
+                processes_data_row.append(process_information["threads"])
             # Get process PPID.
             if 14 in processes_treeview_columns_shown:
-                processes_data_row.append(int(ps_output_line_split[8]))
+                processes_data_row.append(process_information["ppid"])
             # Append process UID value.
             if 15 in processes_treeview_columns_shown:
-                processes_data_row.append(int(ps_output_line_split[9]))
+                processes_data_row.append(process_information["uid"])
             # Append process GID value.
             if 16 in processes_treeview_columns_shown:
-                processes_data_row.append(int(ps_output_line_split[10]))
+                processes_data_row.append(process_information["gid"])
             # Get process executable path.
             if 17 in processes_treeview_columns_shown:
-                if exe_column_get == 1:
-                    process_exe = ps_output_line[exe_column_index:cmdline_column_index].strip()
-                else:
-                    process_exe = "[Not Supported]"
-                processes_data_row.append(process_exe)
+                processes_data_row.append(process_information["exe"])
             # Get process commandline.
             if 18 in processes_treeview_columns_shown:
                 processes_data_row.append(process_commandline)
             if 19 in processes_treeview_columns_shown:
-                processes_data_row.append(process_cpu_time_list[index_from_stat])
+                processes_data_row.append(process_information["cpu_time"])
 
             # Append process data into a list (processes_data_rows)
             processes_data_rows.append(processes_data_row)
-        global_process_cpu_times_prev = global_process_cpu_times                                  # For using values in the next loop
-        disk_read_write_data_prev = disk_read_write_data
+        # For using values in the next loop. Previous values are not changed if the process snapshot is not refreshed since the previous loop
+        # (for example, if the loop function is run again after a menu setting is changed). Otherwise CPU usage and disk speed values could not be calculated.
+        if global_cpu_time_all != snapshot_global_cpu_time_all_prev:
+            global_process_cpu_times_prev = global_process_cpu_times
+            disk_read_write_data_prev = disk_read_write_data
+            snapshot_global_cpu_time_all_prev = global_cpu_time_all
+            snapshot_time_prev = snapshot_time
 
         processes_treeview_columns_shown = sorted(list(processes_treeview_columns_shown))         # Convert set to list (it was set before getting process information)
 
-        # Add/Remove treeview columns appropriate for user preferences
-        if processes_treeview_columns_shown != processes_treeview_columns_shown_prev:             # Remove all columns, redefine treestore and models, set treestore data types (str, int, etc) if column numbers are changed. Because once treestore data types (str, int, etc) are defined, they can not be changed anymore. Thus column (internal data) order and column treeview column addition/removal can not be performed.
-            cumulative_sort_column_id = -1
-            cumulative_internal_data_id = -1
-            for column in self.treeview.get_columns():                                            # Remove all columns in the treeview.
-                self.treeview.remove_column(column)
-            for i, column in enumerate(processes_treeview_columns_shown):
-                if processes_data_list[column][0] in processes_treeview_columns_shown:
-                    cumulative_sort_column_id = cumulative_sort_column_id + processes_data_list[column][2]
-                processes_treeview_column = Gtk.TreeViewColumn(processes_data_list[column][1])    # Define column (also column title is defined)
-                for i, cell_renderer_type in enumerate(processes_data_list[column][6]):
-                    cumulative_internal_data_id = cumulative_internal_data_id + 1
-                    if cell_renderer_type == "internal_column":                                   # Continue to next loop to avoid generating a cell renderer for internal column (internal columns are not shon on the treeview and they do not have cell renderers).
-                        continue
-                    if cell_renderer_type == "CellRendererPixbuf":                                # Define cell renderer
-                        cell_renderer = Gtk.CellRendererPixbuf()
-                    if cell_renderer_type == "CellRendererText":
-                        cell_renderer = Gtk.CellRendererText()
-                    cell_renderer.set_alignment(processes_data_list[column][9][i], 0.5)           # Vertical alignment is set 0.5 in order to leave it as unchanged.
-                    processes_treeview_column.pack_start(cell_renderer, processes_data_list[column][10][i])    # Set if column will allocate unused space
-                    processes_treeview_column.add_attribute(cell_renderer, processes_data_list[column][7][i], cumulative_internal_data_id)
-                    if processes_data_list[column][11][i] != "no_cell_function":
-                        processes_treeview_column.set_cell_data_func(cell_renderer, processes_data_list[column][11][i], func_data=cumulative_internal_data_id)    # Define cell function which sets cell data precision and/or data unit
-                processes_treeview_column.set_sizing(2)                                           # Set column sizing (2 = auto sizing which is required for "self.treeview.set_fixed_height_mode(True)" command that is used for lower treeview CPU consumption because row heights are not calculated for every row).
-                processes_treeview_column.set_sort_column_id(cumulative_sort_column_id)           # Be careful with lists contain same element more than one.
-                processes_treeview_column.set_resizable(True)                                     # Set columns resizable by the user when column title button edge handles are dragged.
-                processes_treeview_column.set_reorderable(True)                                   # Set columns reorderable by the user when column title buttons are dragged.
-                processes_treeview_column.set_min_width(50)                                       # Set minimum column widths as "50 pixels" which is useful for realizing the minimized column. Otherwise column title will be invisible.
-                processes_treeview_column.connect("clicked", self.on_column_title_clicked)        # Connect signal for column title button clicks. Getting column ordering and row sorting will be performed by using this signal.
-                processes_treeview_column.connect("notify::width", self.treeview_column_order_width_row_sorting)
-                self.treeview.append_column(processes_treeview_column)                            # Append column into treeview
-
-            # Get column data types for appending processes data into treestore
-            processes_data_column_types = []
-            for column in sorted(processes_treeview_columns_shown):
-                internal_column_count = len(processes_data_list[column][5])
-                for internal_column_number in range(internal_column_count):
-                    processes_data_column_types.append(processes_data_list[column][5][internal_column_number])    # Get column types (int, bool, float, str, etc.)
-
-            # Define a treestore (for storing treeview data in it), a treemodelfilter (for search filtering), treemodelsort (for row sorting when column title buttons are clicked)
-            self.treestore = Gtk.TreeStore()
-            self.treestore.set_column_types(processes_data_column_types)                          # Set column types of the columns which will be appended into treestore
-            treemodelfilter2101 = self.treestore.filter_new()
-            treemodelfilter2101.set_visible_column(0)                                             # Column "0" of the treestore will be used for column visibility information (True or False)
-            treemodelsort2101 = Gtk.TreeModelSort().new_with_model(treemodelfilter2101)
-            self.treeview.set_model(treemodelsort2101)
-            pid_list_prev = []                                                                    # Redefine (clear) "pid_list_prev" list. Thus code will recognize this and data will be appended into treestore and piter_list from zero.
-            self.piter_list = []
-
-        # Reorder columns if this is the first loop (columns are appended into treeview as unordered) or user has reset column order from customizations.
+        # Get max values of some performance data for setting cell background colors depending on relative performance data.
+        max_value_list = []
+        for performance_data_list in [cpu_usage_list, memory_rss_list, memory_vms_list, memory_shared_list, disk_read_data_list, disk_write_data_list, disk_read_speed_list, disk_write_speed_list]:
+            try:
+                max_value_list.append(max(performance_data_list))
+            except ValueError:
+                max_value_list.append(0)
+
+        return {"pid_list": pid_list, "ppid_list": ppid_list, "processes_data_rows": processes_data_rows, "processes_treeview_columns_shown": processes_treeview_columns_shown,
+                "show_processes_of_all_users": show_processes_of_all_users, "number_of_logical_cores": number_of_logical_cores, "max_value_list": max_value_list}
+
+
+    def processes_loop_func(self, collected_data=None):
+        """
+        Get and show information on the GUI on every loop.
+        Process information is get on the main thread if it is not collected by the collector thread.
+        """
+
+        # Data which is collected before column or process filtering settings are changed is not used.
+        if collected_data is None or collected_data["processes_treeview_columns_shown"] != sorted(Config.processes_treeview_columns_shown) or \
+           collected_data["show_processes_of_all_users"] != Config.show_processes_of_all_users:
+            collected_data = self.processes_collect_func()
+
+        pid_list = collected_data["pid_list"]
+        ppid_list = collected_data["ppid_list"]
+        processes_data_rows = collected_data["processes_data_rows"]
+        processes_treeview_columns_shown = collected_data["processes_treeview_columns_shown"]
+        number_of_logical_cores = collected_data["number_of_logical_cores"]
+
+        # Define global variables and get sort column/order, column widths, etc.
+        global processes_data_rows_dict_prev, pid_list_prev
+        global processes_treeview_columns_shown_prev, processes_data_row_sorting_column_prev, processes_data_row_sorting_order_prev, processes_data_column_order_prev, processes_data_column_widths_prev
+        processes_data_row_sorting_column = Config.processes_data_row_sorting_column
+        processes_data_row_sorting_order = Config.processes_data_row_sorting_order
+        processes_data_column_order = Config.processes_data_column_order
+        processes_data_column_widths = Config.processes_data_column_widths
+
+        # Add/Remove columns appropriate for user preferences
+        if processes_treeview_columns_shown != processes_treeview_columns_shown_prev:             # Remove all columns and items if column numbers are changed. Because indexes of the data in the rows of the processes are changed.
+            self.columns_updating = True
+            self.root_model.items_set_func([])
+            self.items_clear_func()
+            for processes_columnview_column in self.columnview_columns_func():                    # Remove all columns in the columnview.
+                self.columnview.remove_column(processes_columnview_column)
+            self.bound_cell_dict = {}
+            self.column_dict = {}
+            self.column_data_index_dict = {}
+            data_index = 0
+            for column in processes_treeview_columns_shown:
+                image_data_index = None
+                for i, cell_widget_type in enumerate(processes_data_list[column][4]):
+                    if cell_widget_type == "Image":
+                        image_data_index = data_index + i
+                    if cell_widget_type == "Label":                                               # Data of the label is also used for row sorting (process name is used for "Name" column, PID (integer) is used for "PID" column).
+                        label_data_index = data_index + i
+                        label_data_type = processes_data_list[column][3][i]
+                        cell_alignment = processes_data_list[column][5][i]
+                        cell_function = processes_data_list[column][6][i]
+                        if cell_function == "no_cell_function":
+                            cell_function = None
+                data_index = data_index + processes_data_list[column][2]
+                column_info = (image_data_index, label_data_index, cell_alignment, cell_function)
+                factory = Gtk.SignalListItemFactory()                                             # Cell widgets are generated, bound and unbound by using the factory signals.
+                factory.connect("setup", self.on_cell_setup, column_info)
+                factory.connect("bind", self.on_cell_bind, column_info)
+                factory.connect("unbind", self.on_cell_unbind, column_info)
+                processes_columnview_column = Gtk.ColumnViewColumn.new(processes_data_list[column][1], factory)    # Define column (also column title is defined)
+                if label_data_type == str:
+                    processes_columnview_column.set_sorter(Gtk.CustomSorter.new(self.sort_compare_text_func, label_data_index))
+                else:
+                    processes_columnview_column.set_sorter(Gtk.CustomSorter.new(self.sort_compare_func, label_data_index))
+                processes_columnview_column.set_resizable(True)                                   # Set columns resizable by the user when column title button edge handles are dragged.
+                processes_columnview_column.connect("notify::fixed-width", self.treeview_column_order_width_row_sorting)
+                self.columnview.append_column(processes_columnview_column)                        # Append column into columnview
+                self.column_dict[column] = processes_columnview_column
+                self.column_data_index_dict[column] = label_data_index
+            self.columns_updating = False
+            pid_list_prev = []                                                                    # Redefine (clear) "pid_list_prev" list. Thus code will recognize this and items will be generated from zero.
+            processes_data_rows_dict_prev = {}
+
+        # Reorder columns if this is the first loop (columns are appended into columnview as unordered) or user has reset column order from customizations.
         if processes_treeview_columns_shown_prev != processes_treeview_columns_shown or processes_data_column_order_prev != processes_data_column_order:
-            processes_treeview_columns = self.treeview.get_columns()                               # Get shown columns on the treeview in order to use this data for reordering the columns.
-            treeview_column_titles = []
-            for column in processes_treeview_columns:
-                treeview_column_titles.append(column.get_title())
+            self.columns_updating = True
             processes_data_column_order_scratch = []
             for column_order in processes_data_column_order:
                 if column_order != -1:
                     processes_data_column_order_scratch.append(column_order)
-            for order in reversed(sorted(processes_data_column_order_scratch)):                   # Reorder treeview columns by moving the last unsorted column at the beginning of the treeview.
+            for order in reversed(sorted(processes_data_column_order_scratch)):                   # Reorder columns by moving the last unsorted column at the beginning of the columnview.
                 if processes_data_column_order.index(order) in processes_treeview_columns_shown:
                     column_number_to_move = processes_data_column_order.index(order)
-                    column_title_to_move = processes_data_list[column_number_to_move][1]
-                    column_to_move = processes_treeview_columns[treeview_column_titles.index(column_title_to_move)]
-                    self.treeview.move_column_after(column_to_move, None)                          # Column is moved at the beginning of the treeview if "None" is used.
+                    self.columnview.insert_column(0, self.column_dict[column_number_to_move])      # Column is moved if it is already in the columnview.
+            self.columns_updating = False
 
         # Sort process rows if user has changed row sorting column and sorting order (ascending/descending) by clicking on any column title button on the GUI.
-        if processes_treeview_columns_shown_prev != processes_treeview_columns_shown or processes_data_row_sorting_column_prev != processes_data_row_sorting_column or processes_data_row_sorting_order != processes_data_row_sorting_order_prev:    # Reorder columns/sort rows if column ordering/row sorting has been changed since last loop in order to avoid reordering/sorting in every loop.
-            processes_treeview_columns = self.treeview.get_columns()                               # Get shown columns on the treeview in order to use this data for reordering the columns.
-            treeview_column_titles = []
-            for column in processes_treeview_columns:
-                treeview_column_titles.append(column.get_title())
-            for i in range(10):
-                if processes_data_row_sorting_column in processes_treeview_columns_shown:
-                    for data in processes_data_list:
-                        if data[0] == processes_data_row_sorting_column:
-                            column_title_for_sorting = data[1]
-                if processes_data_row_sorting_column not in processes_treeview_columns_shown:
-                    column_title_for_sorting = processes_data_list[0][1]
-                column_for_sorting = processes_treeview_columns[treeview_column_titles.index(column_title_for_sorting)]
-                column_for_sorting.clicked()                                                      # For row sorting.
-                if processes_data_row_sorting_order == int(column_for_sorting.get_sort_order()):
-                    break
+        if processes_treeview_columns_shown_prev != processes_treeview_columns_shown or processes_data_row_sorting_column_prev != processes_data_row_sorting_column or processes_data_row_sorting_order != processes_data_row_sorting_order_prev:    # Sort rows if row sorting has been changed since last loop in order to avoid sorting in every loop.
+            if processes_data_row_sorting_column in processes_treeview_columns_shown:
+                column_for_sorting = self.column_dict[processes_data_row_sorting_column]
+                self.sort_data_index = self.column_data_index_dict[processes_data_row_sorting_column]
+            else:
+                column_for_sorting = self.column_dict[0]
+                self.sort_data_index = self.column_data_index_dict[0]
+            self.columns_updating = True
+            self.columnview.sort_by_column(column_for_sorting, Gtk.SortType(processes_data_row_sorting_order))
+            self.columns_updating = False
 
         # Set column widths if there are changes since last loop.
         if processes_treeview_columns_shown_prev != processes_treeview_columns_shown or processes_data_column_widths_prev != processes_data_column_widths:
-            processes_treeview_columns = self.treeview.get_columns()
-            treeview_column_titles = []
-            for column in processes_treeview_columns:
-                treeview_column_titles.append(column.get_title())
-            for i, processes_data in enumerate(processes_data_list):
-                for j, column_title in enumerate(treeview_column_titles):
-                    if column_title == processes_data[1]:
-                       column_width = processes_data_column_widths[i]
-                       processes_treeview_columns[j].set_fixed_width(column_width)                # Set column width in pixels. Fixed width is unset if value is "-1".
-
-        # Append treestore items (rows) as tree or list structure depending on user preferences.
+            self.columns_updating = True
+            for column, processes_columnview_column in self.column_dict.items():
+                processes_columnview_column.set_fixed_width(processes_data_column_widths[column])  # Set column width in pixels. Fixed width is unset if value is "-1".
+            self.columns_updating = False
+
+        # Generate items as tree or list structure depending on user preferences.
         global show_processes_as_tree_prev
         show_processes_as_tree = Config.show_processes_as_tree
-        if show_processes_as_tree != show_processes_as_tree_prev:                                 # Check if "show_processes_as_tree" setting has been changed since last loop and redefine "piter_list" in order to prevent resetting it in every loop which will cause high CPU consumption because piter_list and treestore content would have been appended/builded from zero.
-            pid_list_prev = []                                                                    # Redefine (clear) "pid_list_prev" list. Thus code will recognize this and data will be appended into treestore and piter_list from zero.
-            self.treestore.clear()                                                                # Clear treestore because items will be appended from zero (in tree or list structure).
-            self.piter_list = []
-
-        # Get new/deleted(ended) processes for updating treestore/treeview
-        pid_list_prev_set = set(pid_list_prev)
-        pid_list_set = set(pid_list)
-        deleted_processes = sorted(list(pid_list_prev_set - pid_list_set), key=int)               # "sorted(list, key=int)" is used for sorting string list (like "'1', '2', '10', '100'") as integer list without converting the list into integer list. Otherwise it is sorted like "'1', '10', '100', '2'".
-        new_processes = sorted(list(pid_list_set - pid_list_prev_set), key=int)
-        existing_processes = sorted(list(pid_list_set.intersection(pid_list_prev)), key=int)
-        updated_existing_proc_index = [[pid_list.index(i), pid_list_prev.index(i)] for i in existing_processes]    # "c = set(a).intersection(b)" is about 19% faster than "c = set(a).intersection(set(b))"
-        processes_data_rows_row_length = len(processes_data_rows[0])
-        # Append/Remove/Update processes data into treestore
-        global process_search_text
-        if len(self.piter_list) > 0:
-            for i, j in updated_existing_proc_index:
-                if processes_data_rows[i] != processes_data_rows_prev[j]:
-                    for k in range(1, processes_data_rows_row_length):                            # Start from "1" in order to set first element (treeview row visibility data) as "True" in every loop.
-                        if processes_data_rows_prev[j][k] != processes_data_rows[i][k]:
-                            self.treestore.set_value(self.piter_list[j], k, processes_data_rows[i][k])
-        if len(deleted_processes) > 0:
-            for process in reversed(sorted(list(deleted_processes), key=int)):
-                self.treestore.remove(self.piter_list[pid_list_prev.index(process)])
-                self.piter_list.remove(self.piter_list[pid_list_prev.index(process)])
-            self.on_searchentry_changed(self.searchentry)                                         # Update search results.
-        if len(new_processes) > 0:
-            for process in new_processes:
+        self.show_processes_as_tree = show_processes_as_tree
+        if show_processes_as_tree != show_processes_as_tree_prev:                                 # Check if "show_processes_as_tree" setting has been changed since last loop and generate items from zero.
+            pid_list_prev = []
+            processes_data_rows_dict_prev = {}
+
+        # Get new/deleted(ended)/updated processes for updating the items. Rows, parent processes and items
+        # are kept in dictionaries (PID is the key) for avoiding "list.index()" calls which cause high CPU usage if there are many processes.
+        processes_data_rows_dict = dict(zip(pid_list, processes_data_rows))
+        ppid_dict = dict(zip(pid_list, ppid_list))
+        deleted_processes, new_processes, updated_processes = RowDiff.rows_diff(processes_data_rows_dict_prev, processes_data_rows_dict)
+        # Child processes of an ended process are moved under another process by the OS. Items are generated from zero
+        # in this situation (it does not happen frequently).
+        rebuild_items = pid_list_prev == []
+        if show_processes_as_tree == 1:
+            for process in deleted_processes:
+                if self.item_dict[process].children is not None:
+                    rebuild_items = True
+                    break
+
+        if rebuild_items == True:
+            # Process is appended under its parent process if "Show processes as tree" option is preferred. Process is set as tree root (this root has no relationship
+            # between root user) process if it has no parent process (PPID is "0") or its parent process is not in pid_list ("Show processes of all users" is not preferred).
+            # All processes are tree root processes if "Show processes as tree" is not preferred. Thus processes are listed as list structure instead of tree structure.
+            self.items_clear_func()
+            self.item_dict = {process: ProcessItem(process, processes_data_rows_dict[process]) for process in pid_list}
+            root_item_list = []
+            for process, process_item in self.item_dict.items():
+                parent_item = None
                 if show_processes_as_tree == 1:
-                    if ppid_list[pid_list.index(process)] == "0":                                 # Process ppid was set as "0" if it has no parent process. Process is set as tree root (this root has no relationship between root user) process if it has no ppid (parent process). Treeview tree indentation is first level for the tree root proceess.
-                        self.piter_list.append(self.treestore.append(None, processes_data_rows[pid_list.index(process)]))
-                    if ppid_list[pid_list.index(process)] != "0":
-                        if show_processes_of_all_users == 1:                                      # Process appended under tree root process or another process if "Show processes as tree" option is preferred.
-                            self.piter_list.append(self.treestore.append(self.piter_list[pid_list.index(ppid_list[pid_list.index(process)])], processes_data_rows[pid_list.index(process)]))
-                        parent_process = ppid_list[pid_list.index(process)]                       # Define parent process of the process in order to avoid calculating it multiple times for faster processing.
-                        if show_processes_of_all_users == 0 and parent_process not in pid_list:   # Process is appended into treeview as tree root process if "Show processes of all users" is not preferred and process ppid not in pid_list.
-                            self.piter_list.append(self.treestore.append(None, processes_data_rows[pid_list.index(process)]))
-                        if show_processes_of_all_users == 0 and parent_process in pid_list:       # Process is appended into treeview under tree root process or another process if "Show processes of all users" is preferred and process ppid is in pid_list.
-                            self.piter_list.append(self.treestore.append(self.piter_list[pid_list.index(ppid_list[pid_list.index(process)])], processes_data_rows[pid_list.index(process)]))
-                if show_processes_as_tree == 0:                                                   # All processes are appended into treeview as tree root process if "Show processes as tree" is not preferred. Thus processes are listed as list structure instead of tree structure.
-                    self.piter_list.insert(pid_list.index(process), self.treestore.insert(None, pid_list.index(process), processes_data_rows[pid_list.index(process)]))
+                    parent_item = self.item_dict.get(ppid_dict[process])
+                if parent_item is None:
+                    root_item_list.append(process_item)
+                    continue
+                process_item.parent = parent_item
+                if parent_item.children is None:
+                    parent_item.children = ProcessListModel()
+                parent_item.children.item_list.append(process_item)
+            self.root_model.items_set_func(root_item_list)
+            self.collapsed_pid_set.intersection_update(self.item_dict)
             self.on_searchentry_changed(self.searchentry)                                         # Update search results.
+            Diagnostics.counter_add_func("Model rows changed", len(pid_list))
 
-        if pid_list_prev == []:                                                                   # Expand all treeview rows (if treeview items are in tree structured, not list) if this is the first loop of the Processes tab. It expands treeview rows (and children) in all loops if this control is not made. "First loop" control is made by checking if pid_list_prev is empty.
-            self.treeview.expand_all()
+        else:
+            # Processes of which rows will be generated again ({parent process item: PIDs}). Only rows of which positions may be
+            # changed by sorting and rows of which expanders are added/removed are generated again. Visible cells of the other
+            # rows are updated below without changing the models.
+            changed_process_dict = {}
+            for process in updated_processes:
+                process_item = self.item_dict[process]
+                process_item.row = processes_data_rows_dict[process]
+                # Sorting column is not known ("None") if rows are sorted by clicking a column title on GTK versions older than 4.10.
+                # All changed rows are generated again in this situation in order to keep the sorting up to date.
+                if self.sort_data_index is None or self.sort_data_index in updated_processes[process][0]:
+                    changed_process_dict.setdefault(process_item.parent, set()).add(process)
+            # Remove ended processes.
+            deleted_process_dict = {}
+            for process in deleted_processes:
+                process_item = self.item_dict.pop(process)
+                deleted_process_dict.setdefault(process_item.parent, set()).add(process)
+            for parent_item, process_set in deleted_process_dict.items():
+                self.process_list_model_func(parent_item).items_remove_func(process_set)
+                if parent_item is not None and parent_item.children.item_list == []:
+                    parent_item.children = None
+                    parent_item.children_sort_filter_model = None
+                    changed_process_dict.setdefault(parent_item.parent, set()).add(parent_item.pid)
+            # Append new processes. Parent processes are appended before their child processes if they are also new processes.
+            if show_processes_as_tree == 1:
+                new_processes = RowDiff.tree_insertion_order(new_processes, ppid_dict)
+            new_process_set = set(new_processes)
+            new_process_dict = {}
+            for process in new_processes:
+                process_item = ProcessItem(process, processes_data_rows_dict[process])
+                self.item_dict[process] = process_item
+                parent_item = None
+                if show_processes_as_tree == 1:
+                    parent_item = self.item_dict.get(ppid_dict[process])
+                if parent_item is not None:
+                    process_item.parent = parent_item
+                    if parent_item.children is None:
+                        parent_item.children = ProcessListModel()
+                        if parent_item.pid not in new_process_set:
+                            changed_process_dict.setdefault(parent_item.parent, set()).add(parent_item.pid)
+                new_process_dict.setdefault(parent_item, []).append(process_item)
+            for parent_item, process_item_list in new_process_dict.items():
+                self.process_list_model_func(parent_item).items_append_func(process_item_list)
+            for parent_item, process_set in changed_process_dict.items():
+                self.process_list_model_func(parent_item).items_update_func(process_set)
+            if len(deleted_processes) > 0 or len(new_processes) > 0:
+                self.on_searchentry_changed(self.searchentry)                                     # Update search results.
+            Diagnostics.counter_add_func("Model rows changed", len(updated_processes) + len(deleted_processes) + len(new_processes))
 
         pid_list_prev = pid_list
-        processes_data_rows_prev = processes_data_rows
+        processes_data_rows_dict_prev = processes_data_rows_dict
         show_processes_as_tree_prev = show_processes_as_tree
         processes_treeview_columns_shown_prev = processes_treeview_columns_shown
         processes_data_row_sorting_column_prev = processes_data_row_sorting_column
@@ -1378,71 +1601,57 @@ class Processes:
         processes_data_column_widths_prev = processes_data_column_widths
 
         self.processes_data_rows = processes_data_rows
+        self.processes_data_rows_dict = processes_data_rows_dict
         self.pid_list = pid_list
         self.number_of_logical_cores = number_of_logical_cores
 
         # Get max values of some performance data for setting cell background colors depending on relative performance data.
         global max_value_cpu_usage_list, max_value_memory_rss_list, max_value_memory_vms_list, max_value_memory_shared_list
         global max_value_disk_read_data_list, max_value_disk_write_data_list, max_value_disk_read_speed_list, max_value_disk_write_speed_list
-        try:
-            max_value_cpu_usage_list = max(cpu_usage_list)
-        except ValueError:
-            max_value_cpu_usage_list = 0
-        try:
-            max_value_memory_rss_list = max(memory_rss_list)
-        except ValueError:
-            max_value_memory_rss_list = 0
-        try:
-            max_value_memory_vms_list = max(memory_vms_list)
-        except ValueError:
-            max_value_memory_vms_list = 0
-        try:
-            max_value_memory_shared_list = max(memory_shared_list)
-        except ValueError:
-            max_value_memory_shared_list = 0
-        try:
-            max_value_disk_read_data_list = max(disk_read_data_list)
-        except ValueError:
-            max_value_disk_read_data_list = 0
-        try:
-            max_value_disk_write_data_list = max(disk_write_data_list)
-        except ValueError:
-            max_value_disk_write_data_list = 0
-        try:
-            max_value_disk_read_speed_list = max(disk_read_speed_list)
-        except ValueError:
-            max_value_disk_read_speed_list = 0
-        try:
-            max_value_disk_write_speed_list = max(disk_write_speed_list)
-        except ValueError:
-            max_value_disk_write_speed_list = 0
+        max_value_cpu_usage_list, max_value_memory_rss_list, max_value_memory_vms_list, max_value_memory_shared_list, \
+        max_value_disk_read_data_list, max_value_disk_write_data_list, max_value_disk_read_speed_list, max_value_disk_write_speed_list = collected_data["max_value_list"]
 
-        # Show number of processes on the searchentry as placeholder text
-        self.searchentry.props.placeholder_text = _tr("Search...") + "                    " + "(" + _tr("Processes") + ": " + str(len(username_list)) + ")"
+        # Update visible cells. Cells of the rows which are generated again are updated when they are bound.
+        for process_item, image, label, column_info, tree_list_row, expanded_handler_id in self.bound_cell_dict.values():
+            self.cell_update_func(process_item, image, label, column_info)
 
-        # Show/Hide treeview expander arrows. If "child rows" are not used and there is no need for these expanders (they would be shown as empty spaces in this situation).
-        if show_processes_as_tree == 1:
-            self.treeview.set_show_expanders(True)
-        if show_processes_as_tree == 0:
-            self.treeview.set_show_expanders(False)
+        # Show number of processes on the searchentry as placeholder text
+        self.searchentry.props.placeholder_text = _tr("Search...") + "                    " + "(" + _tr("Processes") + ": " + str(len(pid_list)) + ")"
 
-        # Show/Hide treeview tree lines
+        # Show/Hide tree lines (they are drawn on the indentation of the expanders)
         if Config.show_tree_lines == 1:
-            self.treeview.set_enable_tree_lines(True)
+            self.columnview.add_css_class("processes-tree-lines")
         if Config.show_tree_lines == 0:
-            self.treeview.set_enable_tree_lines(False)
+            self.columnview.remove_css_class("processes-tree-lines")
 
 
-    def on_column_title_clicked(self, widget):
+    def on_column_sorter_changed(self, sorter, change):
         """
         Get and save column sorting order.
         """
 
-        processes_data_row_sorting_column_title = widget.get_title()                              # Get column title which will be used for getting column number
-        for data in processes_data_list:
-            if data[1] == processes_data_row_sorting_column_title:
-                Config.processes_data_row_sorting_column = data[0]                                # Get column number
-        Config.processes_data_row_sorting_order = int(widget.get_sort_order())                    # Convert Gtk.SortType (for example: <enum GTK_SORT_ASCENDING of type Gtk.SortType>) to integer (0: ascending, 1: descending)
+        # "Gtk.ColumnViewSorter.get_primary_sort_column()" is available on GTK 4.10 and newer versions. Rows are also sorted
+        # by clicking column titles on older versions but the sorting column and order are not saved.
+        if hasattr(sorter, "get_primary_sort_column") == False:
+            if self.columns_updating == False:
+                self.sort_data_index = None
+            return
+
+        processes_columnview_column = sorter.get_primary_sort_column()
+        self.sort_data_index = None
+        for column, column_in_dict in self.column_dict.items():
+            if column_in_dict == processes_columnview_column:
+                self.sort_data_index = self.column_data_index_dict[column]
+                break
+        if self.sort_data_index is None or self.columns_updating == True:
+            return
+
+        # Rows are already sorted. Previous values are also set in order to prevent sorting them again in the next loop.
+        global processes_data_row_sorting_column_prev, processes_data_row_sorting_order_prev
+        Config.processes_data_row_sorting_column = column                                         # Get column number
+        Config.processes_data_row_sorting_order = int(sorter.get_primary_sort_order())            # Convert Gtk.SortType (for example: <enum GTK_SORT_ASCENDING of type Gtk.SortType>) to integer (0: ascending, 1: descending)
+        processes_data_row_sorting_column_prev = Config.processes_data_row_sorting_column
+        processes_data_row_sorting_order_prev = Config.processes_data_row_sorting_order
         Config.config_save_func()
 
 
@@ -1451,131 +1660,73 @@ class Processes:
         Get and save column order/width, row sorting.
         """
 
-        # Columns in the treeview are get one by one and appended into "processes_data_column_order".
-        # "processes_data_column_widths" list elements are modified for widths of every columns in the treeview.
+        # Column width is changed by the code.
+        if widget is not None and self.columns_updating == True:
+            return
+
+        # Columns in the columnview are get one by one and appended into "processes_data_column_order".
+        # "processes_data_column_widths" list elements are modified for widths of every columns in the columnview.
         # Length of these list are always same even if columns are removed, appended and column widths are changed.
         # Only values of the elements (element indexes are always same with "processes_data") are changed if column order/widths are changed.
-        processes_treeview_columns = self.treeview.get_columns()
-        treeview_column_titles = []
-        for column in processes_treeview_columns:
-            treeview_column_titles.append(column.get_title())
+        processes_columnview_columns = self.columnview_columns_func()
+        columnview_column_titles = []
+        for column in processes_columnview_columns:
+            columnview_column_titles.append(column.get_title())
 
         processes_data_column_order = [-1] * len(processes_data_list)
         processes_data_column_widths = [-1] * len(processes_data_list)
 
-        processes_treeview_columns_last_index = len(processes_treeview_columns)-1
+        processes_columnview_columns_last_index = len(processes_columnview_columns)-1
 
         for i, processes_data in enumerate(processes_data_list):
-            for j, column_title in enumerate(treeview_column_titles):
+            for j, column_title in enumerate(columnview_column_titles):
                 if column_title == processes_data[1]:
-                    column_index = treeview_column_titles.index(processes_data[1])
+                    column_index = columnview_column_titles.index(processes_data[1])
                     processes_data_column_order[i] = column_index
-                    if j != processes_treeview_columns_last_index:
-                        processes_data_column_widths[i] = processes_treeview_columns[column_index].get_width()
+                    if j != processes_columnview_columns_last_index:
+                        processes_data_column_widths[i] = processes_columnview_columns[column_index].get_fixed_width()
 
         Config.processes_data_column_order = list(processes_data_column_order)
         Config.processes_data_column_widths = list(processes_data_column_widths)
         Config.config_save_func()
 
 
-    def application_exec_icon_type_list(self):
-        """
-        Get application names, images and types (desktop_application or application).
-        Process name will be searched in "application_exec_list" list and image/application type will be get.
-        """
-
-        application_exec_list = []
-        application_icon_list = []
-        application_type_list = []
-
-        # Get  ".desktop" file names
-        application_file_list = [file for file in os.listdir("/usr/share/applications/") if file.endswith(".desktop")]
-
-        for application in application_file_list:
-
-            # "encoding="utf-8"" is used for preventing "UnicodeDecodeError" errors during reading the file content if "C" locale is used.
-            try:
-                with open("/usr/share/applications/" + application, encoding="utf-8") as reader:
-                    application_file_content = reader.read()
-            except PermissionError:
-                continue
-
-            # Do not include application name or icon name if any of them is not found in the .desktop file.
-            if "Exec=" not in application_file_content or "Icon=" not in application_file_content:
-                continue
-
-            # Get application exec data
-            application_exec = application_file_content.split("Exec=", 1)[1].split("\n", 1)[0].split("/")[-1].split(" ")[0]
-            # Splitting operation above may give "sh" as application name and this may cause confusion between "sh" process
-            # and splitted application exec (for example: sh -c "gdebi-gtk %f"sh -c "gdebi-gtk %f").
-            # This statement is used to avoid from this confusion.
-            if application_exec == "sh":
-                application_exec = application_file_content.split("Exec=", 1)[1].split("\n", 1)[0]
-
-            # Get application icon name data
-            application_icon = application_file_content.split("Icon=", 1)[1].split("\n", 1)[0]
-
-            # Get "desktop_application/application" information
-            if "NoDisplay=" in application_file_content:
-                desktop_application_value = application_file_content.split("NoDisplay=", 1)[1].split("\n", 1)[0]
-                if desktop_application_value == "true":
-                    application_type = "application"
-                if desktop_application_value == "false":
-                    application_type = "desktop_application"
-            else:
-                application_type = "desktop_application"
-
-            application_exec_list.append(application_exec)
-            application_icon_list.append(application_icon)
-            application_type_list.append(application_type)
-
-        return application_exec_list, application_icon_list, application_type_list
-
-
-# ----------------------------------- Processes - Treeview Cell Functions (defines functions for treeview cell for setting data precisions and/or data units) -----------------------------------
-def cell_data_function_cpu_usage_percent(tree_column, cell, tree_model, iter, data):
-    cell.set_property('text', f'{tree_model.get(iter, data)[0]:.{processes_cpu_precision}f} %')
-    value = tree_model.get(iter, data)[0]
+# ----------------------------------- Processes - Cell Functions (defines functions for columnview cells for setting data precisions and/or data units) -----------------------------------
+def cell_data_function_cpu_usage_percent(cell, value):
+    cell.set_label(f'{value:.{processes_cpu_precision}f} %')
     cell_backround_color(cell, value, max_value_cpu_usage_list)
 
-def cell_data_function_memory_rss(tree_column, cell, tree_model, iter, data):
-    cell.set_property('text', performance_data_unit_converter_func("data", "none", tree_model.get(iter, data)[0], processes_memory_data_unit, processes_memory_data_precision))
-    value = tree_model.get(iter, data)[0]
+def cell_data_function_memory_rss(cell, value):
+    cell.set_label(performance_data_unit_converter_func("data", "none", value, processes_memory_data_unit, processes_memory_data_precision))
     cell_backround_color(cell, value, max_value_memory_rss_list)
 
-def cell_data_function_memory_vms(tree_column, cell, tree_model, iter, data):
-    cell.set_property('text', performance_data_unit_converter_func("data", "none", tree_model.get(iter, data)[0], processes_memory_data_unit, processes_memory_data_precision))
-    value = tree_model.get(iter, data)[0]
+def cell_data_function_memory_vms(cell, value):
+    cell.set_label(performance_data_unit_converter_func("data", "none", value, processes_memory_data_unit, processes_memory_data_precision))
     cell_backround_color(cell, value, max_value_memory_vms_list)
 
-def cell_data_function_memory_shared(tree_column, cell, tree_model, iter, data):
-    cell.set_property('text', performance_data_unit_converter_func("data", "none", tree_model.get(iter, data)[0], processes_memory_data_unit, processes_memory_data_precision))
-    value = tree_model.get(iter, data)[0]
+def cell_data_function_memory_shared(cell, value):
+    cell.set_label(performance_data_unit_converter_func("data", "none", value, processes_memory_data_unit, processes_memory_data_precision))
     cell_backround_color(cell, value, max_value_memory_shared_list)
 
-def cell_data_function_disk_read_data(tree_column, cell, tree_model, iter, data):
-    cell.set_property('text', performance_data_unit_converter_func("data", "none", tree_model.get(iter, data)[0], processes_disk_data_unit, processes_disk_data_precision))
-    value = tree_model.get(iter, data)[0]
+def cell_data_function_disk_read_data(cell, value):
+    cell.set_label(performance_data_unit_converter_func("data", "none", value, processes_disk_data_unit, processes_disk_data_precision))
     cell_backround_color(cell, value, max_value_disk_read_data_list)
 
-def cell_data_function_disk_write_data(tree_column, cell, tree_model, iter, data):
-    cell.set_property('text', performance_data_unit_converter_func("data", "none", tree_model.get(iter, data)[0], processes_disk_data_unit, processes_disk_data_precision))
-    value = tree_model.get(iter, data)[0]
+def cell_data_function_disk_write_data(cell, value):
+    cell.set_label(performance_data_unit_converter_func("data", "none", value, processes_disk_data_unit, processes_disk_data_precision))
     cell_backround_color(cell, value, max_value_disk_write_data_list)
 
-def cell_data_function_disk_read_speed(tree_column, cell, tree_model, iter, data):
-    cell.set_property('text', f'{performance_data_unit_converter_func("speed", processes_disk_speed_bit, tree_model.get(iter, data)[0], processes_disk_data_unit, processes_disk_data_precision)}/s')
-    value = tree_model.get(iter, data)[0]
+def cell_data_function_disk_read_speed(cell, value):
+    cell.set_label(f'{performance_data_unit_converter_func("speed", processes_disk_speed_bit, value, processes_disk_data_unit, processes_disk_data_precision)}/s')
     cell_backround_color(cell, value, max_value_disk_read_speed_list)
 
-def cell_data_function_disk_write_speed(tree_column, cell, tree_model, iter, data):
-    cell.set_property('text', f'{performance_data_unit_converter_func("speed", processes_disk_speed_bit, tree_model.get(iter, data)[0], processes_disk_data_unit, processes_disk_data_precision)}/s')
-    value = tree_model.get(iter, data)[0]
+def cell_data_function_disk_write_speed(cell, value):
+    cell.set_label(f'{performance_data_unit_converter_func("speed", processes_disk_speed_bit, value, processes_disk_data_unit, processes_disk_data_precision)}/s')
     cell_backround_color(cell, value, max_value_disk_write_speed_list)
 
-def cell_data_function_cpu_time(tree_column, cell, tree_model, iter, data):
+def cell_data_function_cpu_time(cell, value):
     global number_of_clock_ticks
-    time_days = tree_model.get(iter, data)[0]/number_of_clock_ticks/60/60/24
+    time_days = value/number_of_clock_ticks/60/60/24
     time_days_int = int(time_days)
     time_hours = (time_days -time_days_int) * 24
     time_hours_int = int(time_hours)
@@ -1588,24 +1739,26 @@ def cell_data_function_cpu_time(tree_column, cell, tree_model, iter, data):
         cpu_time = f'{time_hours_int:02}:{time_minutes_int:02}:{time_seconds:05.2f}'
     else:
         cpu_time = f'{time_days_int:02}:{time_hours_int:02}:{time_minutes_int:02}:{time_seconds:05.2f}'
-    cell.set_property('text', cpu_time)
+    cell.set_label(cpu_time)
+
+# CSS classes of the cell background colors and alpha values of the colors. Colors are defined by using a style provider (see "tab_info_grid").
+cell_background_css_class_alpha_dict = {"processes-cell-background-1": 0.15, "processes-cell-background-2": 0.25,
+                                        "processes-cell-background-3": 0.35, "processes-cell-background-4": 0.45}
 
 def cell_backround_color(cell, value, max_value):
-    color = Gdk.RGBA()
-    color.red = 0.7
-    color.green = 0.35
-    color.blue = 0.05
     if value > 0.7 * max_value:
-        color.alpha = 0.45
+        css_class_list = ["processes-cell-background-4"]
     elif value <= 0.7 * max_value and value > 0.4 * max_value:
-        color.alpha = 0.35
+        css_class_list = ["processes-cell-background-3"]
     elif value <= 0.4 * max_value and value > 0.2 * max_value:
-        color.alpha = 0.25
+        css_class_list = ["processes-cell-background-2"]
     elif value <= 0.2 * max_value and value > 0.1 * max_value:
-        color.alpha = 0.15
-    elif value <= 0.1 * max_value:
-        color.alpha = 0.0
-    cell.set_property('background-rgba', color)
+        css_class_list = ["processes-cell-background-1"]
+    else:
+        css_class_list = []
+    # Style of the cell is updated only if its color is changed.
+    if cell.get_css_classes() != css_class_list:
+        cell.set_css_classes(css_class_list)
 
 
 Processes = Processes()
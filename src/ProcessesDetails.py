@@ -14,7 +14,9 @@ from .Config import Config
 from .Processes import Processes
 from .Performance import Performance
 from .MainWindow import MainWindow
+from .MultiResolutionHistory import MultiResolutionHistory
 from . import Common
+from .HostHelper import HostHelper
 
 
 class ProcessesDetails:
@@ -648,10 +650,10 @@ class ProcessesDetails:
 
         chart_data_history = Config.chart_data_history
 
-        self.process_cpu_usage_list = [0] * chart_data_history
-        self.process_ram_usage_list = [0] * chart_data_history
-        self.process_disk_read_speed_list = [0] * chart_data_history
-        self.process_disk_write_speed_list = [0] * chart_data_history
+        self.process_cpu_usage_list = MultiResolutionHistory(chart_data_history)
+        self.process_ram_usage_list = MultiResolutionHistory(chart_data_history)
+        self.process_disk_read_speed_list = MultiResolutionHistory(chart_data_history)
+        self.process_disk_write_speed_list = MultiResolutionHistory(chart_data_history)
 
         # Get system boot time.
         with open("/proc/stat") as reader:
@@ -727,13 +729,9 @@ class ProcessesDetails:
 
         # Update data lists for graphs.
         self.process_cpu_usage_list.append(selected_process_cpu_percent)
-        del self.process_cpu_usage_list[0]
         self.process_ram_usage_list.append(selected_process_memory_rss)
-        del self.process_ram_usage_list[0]
         self.process_disk_read_speed_list.append(selected_process_read_speed)
-        del self.process_disk_read_speed_list[0]
         self.process_disk_write_speed_list.append(selected_process_write_speed)
-        del self.process_disk_write_speed_list[0]
 
         # Update graphs.
         self.processes_details_da_cpu_usage.queue_draw()
@@ -883,6 +881,15 @@ class ProcessesDetails:
         Get stat, status, statm, io, smaps, cmdline file outputs.
         """
 
+        # Read files by using the helper which is run on the host OS in Flatpak environment. "cat" command is used if the helper could not be used.
+        if Config.environment_type == "flatpak":
+            file_paths = ["/proc/" + selected_process_pid + "/" + file_name for file_name in ["stat", "status", "statm", "io", "smaps", "cmdline"]]
+            file_outputs = HostHelper.read_files(file_paths, 67108864)
+            if file_outputs is not None:
+                file_outputs = [(output or b"").decode(errors="replace").strip() for output in file_outputs]
+                file_outputs[5] = file_outputs[5].replace("\x00", " ")
+                return self.processes_details_file_outputs_check_func(*file_outputs)
+
         # Generate command for getting file outputs.
         if Config.environment_type == "flatpak":
             command_list = ["flatpak-spawn", "--host", "cat"]
@@ -918,6 +925,14 @@ class ProcessesDetails:
         smaps_output = cat_output_split[4].strip()
         cmdline_output = cat_output_split[5].strip().replace("\x00", " ")                     # "\x00" characters in "cmdline" file are replaced with " ".
 
+        return self.processes_details_file_outputs_check_func(stat_output, status_output, statm_output, io_output, smaps_output, cmdline_output)
+
+
+    def processes_details_file_outputs_check_func(self, stat_output, status_output, statm_output, io_output, smaps_output, cmdline_output):
+        """
+        Use "-" for outputs of files which could not be read.
+        """
+
         if stat_output == "":
             stat_output = "-"
         if status_output == "":
@@ -939,6 +954,21 @@ class ProcessesDetails:
         Get fd and stat folder list outputs.
         """
 
+        # List folders by using the helper which is run on the host OS in Flatpak environment.
+        # Outputs are generated in "ls" command output format. "ls" command is used if the helper could not be used.
+        if Config.environment_type == "flatpak":
+            fd_dir = "/proc/" + selected_process_pid + "/fd/"
+            task_dir = "/proc/" + selected_process_pid + "/task/"
+            dir_lists = HostHelper.list_dirs([fd_dir, task_dir])
+            if dir_lists is not None:
+                fd_ls_output = "-"
+                task_ls_output = "-"
+                if dir_lists[0] is not None:
+                    fd_ls_output = fd_dir + ":\n" + "\n".join(sorted(dir_lists[0]))
+                if dir_lists[1] is not None:
+                    task_ls_output = task_dir + ":\n" + "\n".join(sorted(dir_lists[1]))
+                return fd_ls_output, task_ls_output
+
         # Generate command for getting file outputs.
         if Config.environment_type == "flatpak":
             command_list = ["flatpak-spawn", "--host", "ls"]
@@ -1342,6 +1372,21 @@ class ProcessesDetails:
         if selected_process_fd_paths == []:
             selected_process_fd_paths = "-"
 
+        # Read links by using the helper which is run on the host OS in Flatpak environment. "readlink" command is used if the helper could not be used.
+        if Config.environment_type == "flatpak":
+            link_paths = [selected_process_exe_path, selected_process_cwd_path]
+            if selected_process_fd_paths != "-":
+                link_paths = link_paths + selected_process_fd_paths
+            link_targets = HostHelper.readlinks(link_paths)
+            if link_targets is not None:
+                selected_process_exe = link_targets[0] or "-"
+                selected_process_cwd = link_targets[1] or "-"
+                # Prevent adding targets which are not files.
+                selected_process_open_files = [target for target in link_targets[2:] if target is not None and target.count("/") > 1]
+                if selected_process_open_files == []:
+                    selected_process_open_files = "-"
+                return selected_process_exe, selected_process_cwd, selected_process_open_files
+
         # Append command list for process open files.
         if selected_process_fd_paths != "-":
             for path in selected_process_fd_paths:
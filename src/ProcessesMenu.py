@@ -488,14 +488,14 @@ class ProcessesMenu:
 
     def on_expand_collapse_buttons_clicked(self, widget):
         """
-        Expand/Collapse treeview rows.
+        Expand/Collapse rows.
         """
 
         if widget == self.expand_all_button:
-            Processes.treeview.expand_all()
+            Processes.rows_expand_all_func()
 
         if widget == self.collapse_all_button:
-            Processes.treeview.collapse_all()
+            Processes.rows_collapse_all_func()
 
 
     def on_reset_button_clicked(self, widget):
@@ -0,0 +1,619 @@
+import os
+import time
+import subprocess
+import threading
+
+from .Config import Config
+from .HostHelper import HostHelper
+from .Diagnostics import Diagnostics
+
+
+# Files in "/proc/[PID]/" folders are read by using "os.open()" and "os.read()" instead of "open()".
+# Python file objects are not used because a file object is generated and destroyed for every file
+# of every process in every loop and this causes high CPU usage if there are thousands of processes.
+# Files are read as bytes and only the required parts are decoded.
+# Root folders of "proc" and "sys" file systems can be changed by using "SMC_PROC_ROOT" and "SMC_SYS_ROOT" environment
+# variables (for example, for using recorded files of another system, see "benchmarks/procfs_fixture.py").
+proc_dir = os.environ.get("SMC_PROC_ROOT", "/proc").rstrip("/") + "/"
+sys_dir = os.environ.get("SMC_SYS_ROOT", "/sys").rstrip("/") + "/"
+
+# Maximum number of bytes to read from "/proc/[PID]/..." files. Sizes of "stat", "statm" and "io" files are
+# smaller than 1 KiB. "status" file may be bigger than 1 KiB if there are many supplementary groups.
+file_read_size = 4096
+cmdline_read_size = 131072
+
+# Username of an UID is get once and cached in this dictionary in order to avoid getting it for every process in every loop.
+uid_username_dict = {}
+
+
+def read_file_bytes(path, read_size=file_read_size):
+    """
+    Read a file as bytes. "None" is returned if process is ended or file could not be read.
+    """
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    # Process may be ended just after PID list is get or file may not be read by the current user.
+    except OSError:
+        return None
+    try:
+        return os.read(fd, read_size)
+    # "ESRCH" (ProcessLookupError) is raised if the process is ended after the file is opened.
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def pid_list():
+    """
+    Get PIDs of all processes as string values.
+    """
+
+    return [filename for filename in os.listdir(proc_dir) if filename.isdigit()]
+
+
+def username_from_uid(uid):
+    """
+    Get username of an UID by using cached values.
+    UID is returned as username if username could not be found (same behavior with "ps" command).
+    """
+
+    try:
+        return uid_username_dict[uid]
+    except KeyError:
+        pass
+
+    username = str(uid)
+    # User database of the host OS is read if the application is run in Flatpak environment.
+    if Config.environment_type == "flatpak":
+        passwd_file = "/var/run/host/etc/passwd"
+    else:
+        passwd_file = "/etc/passwd"
+    try:
+        with open(passwd_file) as reader:
+            etc_passwd_lines = reader.read().strip().split("\n")
+        for line in etc_passwd_lines:
+            line_split = line.split(":")
+            if len(line_split) > 2 and line_split[2] == str(uid):
+                username = line_split[0]
+                break
+    except OSError:
+        pass
+    # Try to get username by using "pwd" module if user is not a local user (LDAP, NIS users, etc.).
+    if username == str(uid):
+        try:
+            import pwd
+            username = pwd.getpwuid(uid).pw_name
+        except (ImportError, KeyError):
+            pass
+
+    uid_username_dict[uid] = username
+
+    return username
+
+
+def process_stat_func(stat_output):
+    """
+    Parse "/proc/[PID]/stat" file content (bytes).
+    Process name is between the first "(" and the last ")" characters. Process name may contain spaces and ")" characters.
+    Field numbers are given in the "proc" manual (https://man7.org/linux/man-pages/man5/proc.5.html).
+    First field after process name is 3rd field (process state).
+    """
+
+    name_start = stat_output.find(b"(")
+    name_end = stat_output.rfind(b")")
+    process_name = stat_output[name_start+1:name_end].decode(errors="replace")
+    stat_fields = stat_output[name_end+2:].split()
+
+    process_stat = {"name": process_name,
+                    "status": chr(stat_fields[0][0]),
+                    "ppid": int(stat_fields[1]),
+                    # utime + stime (in clock ticks)
+                    "cpu_time": int(stat_fields[11]) + int(stat_fields[12]),
+                    "nice": int(stat_fields[16]),
+                    "threads": int(stat_fields[17]),
+                    "start_time": int(stat_fields[19]),
+                    "vms": int(stat_fields[20])}
+
+    return process_stat
+
+
+def process_statm_func(statm_output, memory_page_size):
+    """
+    Parse "/proc/[PID]/statm" file content (bytes). Values in this file are in pages.
+    Returns RSS and shared memory values in bytes.
+    """
+
+    statm_fields = statm_output.split(None, 3)
+
+    return int(statm_fields[1]) * memory_page_size, int(statm_fields[2]) * memory_page_size
+
+
+def process_status_uid_gid_func(status_output):
+    """
+    Parse effective UID and GID values in "/proc/[PID]/status" file content (bytes).
+    Second values in "Uid:" and "Gid:" lines are effective UID and GID values.
+    """
+
+    uid_index = status_output.find(b"\nUid:")
+    gid_index = status_output.find(b"\nGid:")
+    if uid_index == -1 or gid_index == -1:
+        return 0, 0
+
+    uid = int(status_output[uid_index+5:status_output.find(b"\n", uid_index+5)].split()[1])
+    gid = int(status_output[gid_index+5:status_output.find(b"\n", gid_index+5)].split()[1])
+
+    return uid, gid
+
+
+def process_io_func(io_output):
+    """
+    Parse read bytes and write bytes values in "/proc/[PID]/io" file content (bytes).
+    """
+
+    read_index = io_output.find(b"\nread_bytes:")
+    write_index = io_output.find(b"\nwrite_bytes:")
+    if read_index == -1 or write_index == -1:
+        return 0, 0
+
+    read_bytes = int(io_output[read_index+12:io_output.find(b"\n", read_index+12)])
+    write_bytes = int(io_output[write_index+13:io_output.find(b"\n", write_index+13)])
+
+    return read_bytes, write_bytes
+
+
+def process_information_func(stat_output, statm_output, status_output, cmdline_output, io_output, memory_page_size):
+    """
+    Get information of a process from "/proc/[PID]/" file contents (bytes).
+    "cmdline_output" and "io_output" are not used if they are "False" (not read).
+    "None" values are used for files which could not be read.
+    """
+
+    process_information = process_stat_func(stat_output)
+    # "statm" file is used for RSS value instead of "stat" file. Because shared memory value is also read from this file.
+    process_information["rss"], process_information["shared"] = process_statm_func(statm_output, memory_page_size)
+    process_information["uid"], process_information["gid"] = process_status_uid_gid_func(status_output)
+    process_information["username"] = username_from_uid(process_information["uid"])
+
+    # Get process command line. Arguments are separated by null characters.
+    # Process name is shown in square brackets if command line is empty (for kernel threads, zombie processes, etc.) as "ps" command does.
+    if cmdline_output is not False:
+        if cmdline_output:
+            process_information["cmdline"] = cmdline_output.rstrip(b"\x00").replace(b"\x00", b" ").decode(errors="replace")
+        else:
+            process_information["cmdline"] = "[" + process_information["name"] + "]"
+
+    # "/proc/[PID]/io" file of processes of other users could not be read without root privileges.
+    if io_output is not False:
+        if io_output is None:
+            process_information["read_bytes"], process_information["write_bytes"] = 0, 0
+        else:
+            process_information["read_bytes"], process_information["write_bytes"] = process_io_func(io_output)
+
+    return process_information
+
+
+def processes_information(read_cmdline=True, read_io=True, read_exe=False):
+    """
+    Get information of all processes by reading files in "/proc/[PID]/" folders.
+    This function is used instead of running "ps" and "cat" commands in every loop.
+    "/proc/[PID]/io" and "/proc/[PID]/exe" are read only if they are required.
+    Returns a dictionary (PID (string) is the key) and time (in clock ticks) just after files are read.
+    """
+
+    memory_page_size = os.sysconf("SC_PAGE_SIZE")
+    number_of_clock_ticks = os.sysconf("SC_CLK_TCK")
+
+    processes_information_dict = {}
+    # Number of bytes which are read is added to the diagnostics registry once (not for every file).
+    read_bytes_sum = 0
+    for pid in pid_list():
+
+        process_dir = proc_dir + pid
+
+        # Skip to the next process if the process is ended after PID list is get.
+        stat_output = read_file_bytes(process_dir + "/stat")
+        if stat_output is None:
+            continue
+        statm_output = read_file_bytes(process_dir + "/statm")
+        status_output = read_file_bytes(process_dir + "/status")
+        if statm_output is None or status_output is None:
+            continue
+        cmdline_output = False
+        if read_cmdline == True:
+            cmdline_output = read_file_bytes(process_dir + "/cmdline", cmdline_read_size)
+        io_output = False
+        if read_io == True:
+            io_output = read_file_bytes(process_dir + "/io")
+
+        process_information = process_information_func(stat_output, statm_output, status_output, cmdline_output, io_output, memory_page_size)
+        read_bytes_sum = read_bytes_sum + len(stat_output) + len(statm_output) + len(status_output)
+        if cmdline_output:
+            read_bytes_sum = read_bytes_sum + len(cmdline_output)
+        if io_output:
+            read_bytes_sum = read_bytes_sum + len(io_output)
+
+        # Executable path of processes of other users could not be read without root privileges. "-" is used as "ps" command does.
+        if read_exe == True:
+            try:
+                process_information["exe"] = os.readlink(process_dir + "/exe")
+            except OSError:
+                process_information["exe"] = "-"
+
+        processes_information_dict[pid] = process_information
+
+    # This value is get just after process files are read in order to measure global and process specific CPU times at the same time (nearly) for ensuring accurate process CPU usage percent.
+    global_cpu_time_all = time.time() * number_of_clock_ticks
+
+    Diagnostics.counter_add_func("/proc bytes read", read_bytes_sum)
+
+    return processes_information_dict, global_cpu_time_all
+
+
+def processes_cpu_usage(processes_information_dict, global_cpu_time_all, global_process_cpu_times_prev, core_count_division_number):
+    """
+    Get CPU usage percentages of the processes by using CPU times of the previous call (as it is done in Processes tab).
+    CPU usage is "0" for processes which are not in the previous call. Returns a dictionary (PID is the key)
+    and CPU times which are used in the next call.
+    """
+
+    global_process_cpu_times = {}
+    process_cpu_usage_dict = {}
+    for pid, process_information in processes_information_dict.items():
+        process_cpu_time = process_information["cpu_time"]
+        global_process_cpu_times[pid] = (global_cpu_time_all, process_cpu_time)
+        try:
+            global_cpu_time_all_prev, process_cpu_time_prev = global_process_cpu_times_prev[pid]
+        # Subtract "1" CPU time (a negligible value) if this is first loop of the process.
+        except KeyError:
+            process_cpu_time_prev = process_cpu_time
+            global_cpu_time_all_prev = global_cpu_time_all - 1
+        process_cpu_usage_dict[pid] = (process_cpu_time - process_cpu_time_prev) / (global_cpu_time_all - global_cpu_time_all_prev) * 100 / core_count_division_number
+
+    return process_cpu_usage_dict, global_process_cpu_times
+
+
+def processes_information_host_helper(read_cmdline=True, read_io=True, read_exe=False):
+    """
+    Get information of all processes of the host OS by using the helper which is run on the host OS.
+    This function is used in Flatpak environment. Files of all processes are read by using a single request.
+    "None" is returned if the helper could not be used.
+    """
+
+    memory_page_size = os.sysconf("SC_PAGE_SIZE")
+    number_of_clock_ticks = os.sysconf("SC_CLK_TCK")
+
+    dir_lists = HostHelper.list_dirs([proc_dir])
+    if dir_lists is None or dir_lists[0] is None:
+        return None
+    host_pid_list = [filename for filename in dir_lists[0] if filename.isdigit()]
+
+    file_names = ["/stat", "/statm", "/status"]
+    if read_cmdline == True:
+        file_names.append("/cmdline")
+    if read_io == True:
+        file_names.append("/io")
+    paths = [proc_dir + pid + file_name for pid in host_pid_list for file_name in file_names]
+    outputs = HostHelper.read_files(paths, cmdline_read_size)
+    if outputs is None:
+        return None
+    global_cpu_time_all = time.time() * number_of_clock_ticks
+    exe_list = None
+    if read_exe == True:
+        exe_list = HostHelper.readlinks([proc_dir + pid + "/exe" for pid in host_pid_list])
+        if exe_list is None:
+            return None
+
+    processes_information_dict = {}
+    number_of_files = len(file_names)
+    for i, pid in enumerate(host_pid_list):
+        process_outputs = outputs[i * number_of_files:(i + 1) * number_of_files]
+        stat_output, statm_output, status_output = process_outputs[:3]
+        # Skip to the next process if the process is ended after PID list is get.
+        if not stat_output or not statm_output or not status_output:
+            continue
+        cmdline_output = False
+        io_output = False
+        if read_cmdline == True:
+            cmdline_output = process_outputs[3]
+        if read_io == True:
+            io_output = process_outputs[-1]
+
+        process_information = process_information_func(stat_output, statm_output, status_output, cmdline_output, io_output, memory_page_size)
+        if read_exe == True:
+            process_information["exe"] = exe_list[i] or "-"
+
+        processes_information_dict[pid] = process_information
+
+    return processes_information_dict, global_cpu_time_all
+
+
+def processes_information_ps(read_io=True, read_exe=False):
+    """
+    Get information of all processes by using "ps" and "cat" commands.
+    This function is used if the application is run in Flatpak environment (processes of the host OS
+    are not visible in the sandbox) and the helper could not be run on the host OS. Returned values
+    are in the same format with the values which are returned by "processes_information" function.
+    """
+
+    # Get process information by using "ps" command. "env" and "LANG=C" parameters are used in order to get column headers in English.
+    command_list = ["flatpak-spawn", "--host", "env", "LANG=C", "ps", "-eo", "comm:96,pid,user:80,s,rss,vsz,nice,thcount,ppid,uid,gid,exe:800,command=CMDLINE"]
+    # "exe" parameter is not recognized by "ps" command in "coreutils" package if version
+    # is lower than 8.32. "group" parameter is used instead of "exe as a placeholder.
+    command_list2 = ["flatpak-spawn", "--host", "env", "LANG=C", "ps", "-eo", "comm:96,pid,user:80,s,rss,vsz,nice,thcount,ppid,uid,gid,group:800,command=CMDLINE"]
+    exe_column_get = 1
+    try:
+        # "stderr=subprocess.STDOUT" is used for not printing errors.
+        ps_output = (subprocess.check_output(command_list, stderr=subprocess.STDOUT, shell=False)).decode().strip()
+    except subprocess.CalledProcessError:
+        ps_output = (subprocess.check_output(command_list2, stderr=subprocess.STDOUT, shell=False)).decode().strip()
+        exe_column_get = 0
+
+    ps_output_lines = ps_output.split("\n")
+    # Delete the first line if there are errors because of some environment variables, libraries, etc.
+    if ps_output_lines[0].startswith("COMMAND      ") == False:
+        del ps_output_lines[0]
+    # Get first line (command output headers) for using it to determine column data locations. Because some columns (such as cmdline) may contain spaces.
+    ps_output_headers = ps_output_lines[0]
+    # Get column locations. "16" is subtracted because some column names may start after a few character on the right side. There is no need to use subtraction for "EXE" column because previous column "GID" is an integer data which is aligned to right.
+    pid_column_index = ps_output_headers.index("PID") - 16
+    if exe_column_get == 1:
+        exe_column_index = ps_output_headers.index("EXE")
+    else:
+        exe_column_index = ps_output_headers.index("GROUP")
+    cmdline_column_index = ps_output_headers.index("CMDLINE") - 16
+    # Deleted first line (command output headers).
+    del ps_output_lines[0]
+
+    processes_information_dict = {}
+    for line in ps_output_lines:
+        line_split = line[pid_column_index:exe_column_index].split()
+        process_information = {"name": line[:pid_column_index].strip(),
+                               "username": line_split[1],
+                               "status": line_split[2],
+                               # "rss" and "vsz" values are in KiB.
+                               "rss": int(line_split[3]) * 1024,
+                               "vms": int(line_split[4]) * 1024,
+                               "shared": 0,
+                               # "ps" shows "-" as nice value of real-time processes.
+                               "nice": int(line_split[5]) if line_split[5] != "-" else 0,
+                               "threads": int(line_split[6]),
+                               "ppid": int(line_split[7]),
+                               "uid": int(line_split[8]),
+                               "gid": int(line_split[9]),
+                               "cmdline": line[cmdline_column_index:].strip(),
+                               "read_bytes": 0,
+                               "write_bytes": 0}
+        if read_exe == True:
+            if exe_column_get == 1:
+                process_information["exe"] = line[exe_column_index:cmdline_column_index].strip()
+            else:
+                process_information["exe"] = "-"
+        processes_information_dict[line_split[0]] = process_information
+
+    memory_page_size = os.sysconf("SC_PAGE_SIZE")
+    number_of_clock_ticks = os.sysconf("SC_CLK_TCK")
+
+    # Read "/proc/[PID]/stat", "/proc/[PID]/statm" and "/proc/[PID]/io" files by using "cat" command for getting process CPU times,
+    # shared memory and read/write data. Output of every file is a single line. Lines are separated by checking their contents.
+    command_list = ["flatpak-spawn", "--host", "cat"]
+    for pid in processes_information_dict:
+        command_list.append("/proc/" + pid + "/stat")
+        command_list.append("/proc/" + pid + "/statm")
+        if read_io == True:
+            command_list.append("/proc/" + pid + "/io")
+    cat_output = (subprocess.run(command_list, shell=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)).stdout.decode().strip()
+    global_cpu_time_all = time.time() * number_of_clock_ticks                                 # global_cpu_time_all value is get just after "/proc/[PID]/stat file is get in order to measure global an process specific CPU times at the same time (nearly) for ensuring accurate process CPU usage percent.
+
+    pid_list_from_stat = set()
+    process_information = None
+    for line in cat_output.split("\n"):
+        line_split = line.split()
+        if len(line_split) < 2:
+            continue
+        # "/proc/[PID]/stat" file line.
+        if line_split[0].isdigit() == True and line_split[1].isdigit() == False:
+            process_information = processes_information_dict.get(line_split[0])
+            if process_information is None:
+                continue
+            pid_list_from_stat.add(line_split[0])                                             # This information will be used for removing data of stopped processes.
+            process_information["cpu_time"] = int(line_split[-38]) + int(line_split[-39])     # Get process cpu time in user mode (utime + stime)
+            process_information["start_time"] = int(line_split[-31])
+        elif process_information is None:
+            continue
+        # "/proc/[PID]/statm" file line.
+        elif line_split[1].isdigit() == True:
+            process_information["shared"] = int(line_split[2]) * memory_page_size
+        elif line_split[0] == "read_bytes:":
+            process_information["read_bytes"] = int(line_split[1])
+        elif line_split[0] == "write_bytes:":
+            process_information["write_bytes"] = int(line_split[1])
+
+    # Remove processes which are ended after "ps" command is run.
+    for pid in list(processes_information_dict.keys()):
+        if pid not in pid_list_from_stat:
+            del processes_information_dict[pid]
+
+    return processes_information_dict, global_cpu_time_all
+
+
+# Process snapshot which is shared by all tabs and windows (Processes, Users, User Details, CPU, Summary, System).
+# Processes are scanned at most once per generation. Generation is increased once per main loop (update interval)
+# and the snapshot is refreshed by the first function which requests it in the new generation.
+snapshot_generation = 0
+snapshot_lock = threading.Lock()
+snapshot = {"generation": -1, "read_io": False, "read_exe": False,
+            "processes_information_dict": {}, "global_cpu_time_all": 0, "time": 0}
+snapshot_pid_list_cache = {"generation": -1, "pid_list": []}
+
+
+def snapshot_generation_increase():
+    """
+    Mark the process snapshot as outdated. This function is called once per main loop.
+    """
+
+    global snapshot_generation
+    snapshot_generation = snapshot_generation + 1
+
+
+def processes_snapshot(read_io=False, read_exe=False):
+    """
+    Get information of all processes from the snapshot of the current generation.
+    Processes are scanned again if the snapshot is outdated or if "io" or "exe" information is
+    requested and it is not in the snapshot. Returned dictionary is shared and must not be modified.
+    Returns the same values with "processes_information" function.
+    """
+
+    with snapshot_lock:
+        if snapshot["generation"] != snapshot_generation or \
+           (read_io == True and snapshot["read_io"] == False) or \
+           (read_exe == True and snapshot["read_exe"] == False):
+            # Optional information which is requested by another function in the same generation is also read.
+            if snapshot["generation"] == snapshot_generation:
+                read_io = read_io or snapshot["read_io"]
+                read_exe = read_exe or snapshot["read_exe"]
+            if Config.environment_type == "flatpak":
+                processes_information_output = processes_information_host_helper(read_cmdline=True, read_io=read_io, read_exe=read_exe)
+                if processes_information_output is None:
+                    processes_information_output = processes_information_ps(read_io=read_io, read_exe=read_exe)
+                processes_information_dict, global_cpu_time_all = processes_information_output
+            else:
+                processes_information_dict, global_cpu_time_all = processes_information(read_cmdline=True, read_io=read_io, read_exe=read_exe)
+            snapshot["generation"] = snapshot_generation
+            snapshot["read_io"] = read_io
+            snapshot["read_exe"] = read_exe
+            snapshot["processes_information_dict"] = processes_information_dict
+            snapshot["global_cpu_time_all"] = global_cpu_time_all
+            snapshot["time"] = time.monotonic()
+
+        return snapshot["processes_information_dict"], snapshot["global_cpu_time_all"]
+
+
+def snapshot_time():
+    """
+    Get time (monotonic clock) of the process snapshot of the current generation. It is used for calculating
+    speeds by using the measured time between snapshots instead of the update interval.
+    """
+
+    with snapshot_lock:
+        return snapshot["time"]
+
+
+def snapshot_pid_list():
+    """
+    Get PIDs of all processes for the current generation.
+    PIDs are get from the process snapshot if it is already get in the current generation.
+    Otherwise only "/proc" folder is listed because it is cheaper than getting a full snapshot.
+    """
+
+    with snapshot_lock:
+        if snapshot["generation"] == snapshot_generation:
+            return list(snapshot["processes_information_dict"].keys())
+        if snapshot_pid_list_cache["generation"] != snapshot_generation:
+            if Config.environment_type == "flatpak":
+                dir_lists = HostHelper.list_dirs([proc_dir])
+                if dir_lists is None or dir_lists[0] is None:
+                    ls_proc_list = (subprocess.run(["flatpak-spawn", "--host", "ls", "/proc/"], shell=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)).stdout.decode().strip().split()
+                else:
+                    ls_proc_list = dir_lists[0]
+                snapshot_pid_list_cache["pid_list"] = [filename for filename in ls_proc_list if filename.isdigit()]
+            else:
+                snapshot_pid_list_cache["pid_list"] = pid_list()
+            snapshot_pid_list_cache["generation"] = snapshot_generation
+
+        return list(snapshot_pid_list_cache["pid_list"])
+
+
+class ProcFileReader:
+    """
+    Read a file which is read in every loop (such as "/proc/stat") by using a file descriptor which is kept open.
+    File content is read by using "os.preadv()" into a preallocated buffer. File is not opened/closed and a file
+    object is not generated in every loop. Content of the files in "/proc/" is regenerated when they are read from offset 0.
+    Most of the files in "/proc/" (seq_file) return about one page (4 KiB) per read even if the buffer is bigger.
+    Therefore file is read at increasing offsets until end of the file is reached.
+    """
+
+    def __init__(self, path, buffer_size=file_read_size):
+
+        self.path = path
+        self.fd = None
+        self.buffer = bytearray(buffer_size)
+        # Number of bytes which are read since the last "readers_diagnostics_counter_add_func()". It is added to the
+        # diagnostics registry per reader group (not per file read) because some readers (such as sensor input readers) are read
+        # many times in a tick.
+        self.read_bytes = 0
+        # Counter of the diagnostics registry for the number of bytes which are read.
+        if path.startswith(sys_dir) == True:
+            self.diagnostics_counter = "/sys bytes read"
+        else:
+            self.diagnostics_counter = "/proc bytes read"
+
+
+    def read(self):
+        """
+        Read file content as bytes. "None" is returned if file could not be read.
+        """
+
+        for _ in range(2):
+            if self.fd is None:
+                try:
+                    self.fd = os.open(self.path, os.O_RDONLY)
+                except OSError:
+                    return None
+            try:
+                content_size = self.read_content_func()
+            # File descriptor may become invalid (for example, if a network card is removed). File is reopened in this situation.
+            except OSError:
+                self.close()
+                continue
+            self.read_bytes = self.read_bytes + content_size
+            return bytes(memoryview(self.buffer)[:content_size])
+
+        return None
+
+
+    def read_content_func(self):
+        """
+        Read file content into the buffer until end of the file and return size of the content.
+        Buffer size is doubled if file content does not fit into the buffer (content which is read is kept).
+        """
+
+        content_size = 0
+        while True:
+            if content_size == len(self.buffer):
+                buffer = bytearray(len(self.buffer) * 2)
+                buffer[:content_size] = self.buffer
+                self.buffer = buffer
+            read_size = os.preadv(self.fd, [memoryview(self.buffer)[content_size:]], content_size)
+            if read_size == 0:
+                return content_size
+            content_size = content_size + read_size
+
+
+    def close(self):
+        """
+        Close the file descriptor. It is reopened on the next read.
+        """
+
+        if self.fd is not None:
+            try:
+                os.close(self.fd)
+            except OSError:
+                pass
+            self.fd = None
+
+
+def readers_diagnostics_counter_add_func(reader_list):
+    """
+    Add number of bytes which are read by a group of "ProcFileReader"s to the diagnostics registry (once per counter).
+    """
+
+    read_bytes_dict = {}
+    for reader in reader_list:
+        if reader.read_bytes != 0:
+            read_bytes_dict[reader.diagnostics_counter] = read_bytes_dict.get(reader.diagnostics_counter, 0) + reader.read_bytes
+            reader.read_bytes = 0
+
+    for counter, read_bytes in read_bytes_dict.items():
+        Diagnostics.counter_add_func(counter, read_bytes)
@@ -0,0 +1,151 @@
+import os
+import io
+import sys
+import time
+import cProfile
+import pstats
+import tracemalloc
+
+
+class Profiler:
+
+    def __init__(self):
+
+        # Profiles of the running application can be captured on demand (by using keyboard shortcuts or
+        # "gapplication action io.github.hakandundar34coding.system-monitoring-center profile 20" command) without running the
+        # application under an external profiler. A cProfile profile of the collection (collector thread) and the functions which use
+        # the collected data (main thread) is captured for the next ticks. A tracemalloc snapshot difference is captured for the
+        # next ticks in the same way. Results are saved as ".prof" (for "pstats", "snakeviz", etc.) and ".txt" files.
+        self.profile_folder_path = os.environ.get("XDG_CACHE_HOME", os.environ.get("HOME", "") + "/.cache") + "/system-monitoring-center/profiles/"
+
+        self.profile = None
+        self.profile_remaining_tick_count = 0
+        self.tracemalloc_snapshot = None
+        self.tracemalloc_remaining_tick_count = 0
+
+        # Number of the lines of the text reports.
+        self.report_line_count = 40
+
+
+    def profile_start_func(self, tick_count=10):
+        """
+        Start capturing a cProfile profile for the next "tick_count" ticks.
+        """
+
+        if self.profile is not None:
+            return
+        self.profile = cProfile.Profile()
+        self.profile_remaining_tick_count = tick_count
+
+
+    def tracemalloc_start_func(self, tick_count=10):
+        """
+        Start tracing memory allocations for the next "tick_count" ticks. Allocations which are made during the ticks and
+        are not freed until the end of the last tick are compared with the first snapshot.
+        """
+
+        if self.tracemalloc_snapshot is not None:
+            return
+        # Traceback of 10 frames is kept for every allocation in order to show callers in the report.
+        tracemalloc.start(10)
+        self.tracemalloc_snapshot = tracemalloc.take_snapshot()
+        self.tracemalloc_remaining_tick_count = tick_count
+
+
+    def profiled_call_func(self, function, *args):
+        """
+        Run a function of the tick. Function is run with the profiler if a profile is being captured.
+        Functions of the tick are not run at the same time (collection and using the collected data are run in order).
+        """
+
+        profile = self.profile
+        if profile is None:
+            return function(*args)
+
+        profile.enable()
+        try:
+            return function(*args)
+        finally:
+            profile.disable()
+
+
+    def tick_end_func(self):
+        """
+        Count the ticks and save the results when capturing is finished.
+        """
+
+        if self.profile is not None:
+            self.profile_remaining_tick_count = self.profile_remaining_tick_count - 1
+            if self.profile_remaining_tick_count <= 0:
+                self.profile_save_func()
+
+        if self.tracemalloc_snapshot is not None:
+            self.tracemalloc_remaining_tick_count = self.tracemalloc_remaining_tick_count - 1
+            if self.tracemalloc_remaining_tick_count <= 0:
+                self.tracemalloc_save_func()
+
+
+    def file_path_func(self, name):
+        """
+        Get path of a result file. Date and time is added to the file name.
+        """
+
+        os.makedirs(self.profile_folder_path, exist_ok=True)
+
+        return self.profile_folder_path + time.strftime("%Y%m%d-%H%M%S") + "-" + name
+
+
+    def profile_save_func(self):
+        """
+        Save the profile as a ".prof" file and a text report (functions sorted by cumulative time).
+        """
+
+        profile = self.profile
+        self.profile = None
+
+        report = io.StringIO()
+        pstats.Stats(profile, stream=report).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.report_line_count)
+        try:
+            file_path = self.file_path_func("profile")
+            profile.dump_stats(file_path + ".prof")
+            with open(file_path + ".txt", "w") as writer:
+                writer.write(report.getvalue())
+        # Prevent errors if cache folder could not be written.
+        except OSError as e:
+            print(f'Profile could not be saved: {e}', file=sys.stderr)
+            return
+
+        print(f'Profile is saved: {file_path}.prof', file=sys.stderr)
+
+
+    def tracemalloc_save_func(self):
+        """
+        Save difference of the memory allocation snapshots as a text report (allocations which are increased most are listed first).
+        """
+
+        snapshot_filter_list = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        snapshot_first = self.tracemalloc_snapshot.filter_traces(snapshot_filter_list)
+        snapshot_last = tracemalloc.take_snapshot().filter_traces(snapshot_filter_list)
+        traced_memory_current, traced_memory_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.tracemalloc_snapshot = None
+
+        line_list = [f'Traced memory: {traced_memory_current / 1024:.1f} KiB (peak: {traced_memory_peak / 1024:.1f} KiB)', ""]
+        for statistic_difference in snapshot_last.compare_to(snapshot_first, "traceback")[:self.report_line_count]:
+            line_list.append(f'{statistic_difference.size_diff / 1024:+.1f} KiB, {statistic_difference.count_diff:+} blocks')
+            line_list.extend(statistic_difference.traceback.format(most_recent_first=True))
+            line_list.append("")
+
+        try:
+            file_path = self.file_path_func("tracemalloc")
+            with open(file_path + ".txt", "w") as writer:
+                writer.write("\n".join(line_list))
+        # Prevent errors if cache folder could not be written.
+        except OSError as e:
+            print(f'Memory allocation report could not be saved: {e}', file=sys.stderr)
+            return
+
+        print(f'Memory allocation report is saved: {file_path}.txt', file=sys.stderr)
+
+
+Profiler = Profiler()
@@ -0,0 +1,122 @@
+import array
+import collections
+
+
+class RingBuffer:
+    """
+    Fixed length history of numbers (such as CPU usage percentages of a chart). Oldest value is overwritten when
+    a value is appended (without shifting the other values). Values are stored twice in an array which has double
+    length of the history. Thus values can be get in oldest-to-newest order as a contiguous view without copying them.
+    Max value and sum of the values are tracked when values are appended for avoiding calculating them for every draw.
+    """
+
+    def __init__(self, length, value_list=None):
+
+        if value_list is None:
+            value_list = []
+        self.length = length
+        self.values_set_func([0] * (length - len(value_list)) + list(value_list[-length:]))
+
+
+    def append(self, value):
+        """
+        Append a value by overwriting the oldest value.
+        """
+
+        index = self.index
+        self.sum_value = self.sum_value + value - self.values[index]
+        self.values[index] = value
+        self.values[index + self.length] = value
+        self.index = (index + 1) % self.length
+        # Sum is calculated again once for every "length" appends in order to prevent accumulating floating point errors.
+        if self.index == 0:
+            self.sum_value = sum(self.values[:self.length])
+
+        # Remove values which can not be max value anymore (smaller than the new value) and the value which is not in the history anymore.
+        append_count = self.append_count + 1
+        self.append_count = append_count
+        max_candidates = self.max_candidates
+        while max_candidates and max_candidates[-1][1] <= value:
+            max_candidates.pop()
+        max_candidates.append((append_count, value))
+        if max_candidates[0][0] <= append_count - self.length:
+            max_candidates.popleft()
+        self.max_value = max_candidates[0][1]
+
+
+    def view(self):
+        """
+        Get values in oldest-to-newest order as a contiguous (read-only) view.
+        """
+
+        index = self.index
+        return memoryview(self.values)[index:index + self.length].toreadonly()
+
+
+    def max(self):
+        """
+        Get max value of the history.
+        """
+
+        return self.max_value
+
+
+    def sum(self):
+        """
+        Get sum of the values of the history.
+        """
+
+        return self.sum_value
+
+
+    def resize(self, length):
+        """
+        Change length of the history. Newest values are kept if history is shortened and zeroes are added
+        before the oldest value if history is lengthened.
+        """
+
+        value_list = self.view().tolist()
+        if length < self.length:
+            value_list = value_list[self.length - length:]
+        else:
+            value_list = [0] * (length - self.length) + value_list
+
+        self.length = length
+        self.values_set_func(value_list)
+
+
+    def values_set_func(self, value_list):
+        """
+        Set all values of the history (oldest-to-newest order) and generate max value candidates from them.
+        """
+
+        self.values = array.array("d", value_list + value_list)
+        # Index of the oldest value (also index which the next value is written).
+        self.index = 0
+        self.sum_value = sum(value_list)
+
+        # Values which may be max value of the history in the future ([append number, value], values are decreasing).
+        # Number of values which are appended is used for determining values which are not in the history anymore.
+        self.append_count = self.length
+        max_candidates = collections.deque()
+        for append_count, value in enumerate(value_list, 1):
+            while max_candidates and max_candidates[-1][1] <= value:
+                max_candidates.pop()
+            max_candidates.append((append_count, value))
+        self.max_candidates = max_candidates
+        self.max_value = max_candidates[0][1]
+
+
+    def __len__(self):
+
+        return self.length
+
+
+    def __getitem__(self, index):
+
+        return self.view()[index]
+
+
+    def __iter__(self):
+
+        return iter(self.view())
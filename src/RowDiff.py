@@ -0,0 +1,83 @@
+# Functions for comparing data rows of the previous and current loops of the tabs.
+# Rows are kept in dictionaries (row ID such as PID is the key) in order to get
+# new/removed/changed rows and parent rows by using dictionary lookups instead of
+# "list.index()" calls which cause high CPU usage if there are many rows.
+# Results are used for updating only the changed rows of the list models (Processes tab, "Gtk.ColumnView")
+# and tree stores (Sensors and Services tabs, "Gtk.TreeView").
+# GTK is not used in this module in order to be able to use it in benchmarks and tests.
+
+
+def rows_diff(rows_prev, rows):
+    """
+    Compare rows of the previous and current loops.
+    First element of the rows is not compared. It is row visibility data on the tabs which use "Gtk.TreeView" and it is
+    set by their search features. It is kept as a placeholder on the Processes tab (rows are shown/hidden by its filter list models).
+    Returns removed row IDs, added row IDs and changed cells of the existing rows
+    ({row ID: (column numbers, values)}).
+    """
+
+    removed_row_ids = [row_id for row_id in rows_prev if row_id not in rows]
+    added_row_ids = []
+    changed_cells = {}
+    for row_id, row in rows.items():
+        row_prev = rows_prev.get(row_id)
+        if row_prev is None:
+            added_row_ids.append(row_id)
+            continue
+        if row_prev == row:
+            continue
+        # Rows may have different lengths if shown columns are changed. All cells are set in this situation.
+        if len(row_prev) != len(row):
+            changed_cells[row_id] = (list(range(1, len(row))), row[1:])
+            continue
+        column_numbers = []
+        values = []
+        for k in range(1, len(row)):
+            if row[k] != row_prev[k]:
+                column_numbers.append(k)
+                values.append(row[k])
+        if column_numbers != []:
+            changed_cells[row_id] = (column_numbers, values)
+
+    return removed_row_ids, added_row_ids, changed_cells
+
+
+def tree_insertion_order(row_ids, parent_row_ids):
+    """
+    Order new rows for appending them into a tree structured model.
+    Parent rows are placed before their child rows if parent rows are also new rows.
+    Otherwise a child row could not be appended under its parent row (for example, if
+    PIDs are started from the beginning after reaching the maximum PID value).
+    "parent_row_ids" is a dictionary (row ID is the key, parent row ID is the value).
+    """
+
+    row_id_set = set(row_ids)
+    ordered_row_ids = []
+    ordered_row_id_set = set()
+    for row_id in row_ids:
+        # Get new parent rows of the row which are not ordered yet.
+        row_id_chain = []
+        while row_id in row_id_set and row_id not in ordered_row_id_set:
+            row_id_chain.append(row_id)
+            ordered_row_id_set.add(row_id)
+            row_id = parent_row_ids.get(row_id)
+        ordered_row_ids.extend(reversed(row_id_chain))
+
+    return ordered_row_ids
+
+
+def position_ranges(positions):
+    """
+    Group positions of the rows in a list model into ranges of consecutive positions.
+    Ranges are used for emitting "items-changed" signal of the list model only for the changed parts of the list.
+    "positions" have to be sorted. Returns a list of (first position, number of positions) tuples.
+    """
+
+    ranges = []
+    for position in positions:
+        if ranges != [] and ranges[-1][0] + ranges[-1][1] == position:
+            ranges[-1] = (ranges[-1][0], ranges[-1][1] + 1)
+        else:
+            ranges.append((position, 1))
+
+    return ranges
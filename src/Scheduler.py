@@ -0,0 +1,85 @@
+from .Config import Config
+
+
+class Scheduler:
+
+    def __init__(self):
+
+        # Collectors (functions which get data of a tab or a part of a tab) and their default update intervals (in seconds).
+        # "0" update interval means update interval of the application.
+        # Data which changes slowly is get less frequently. Update intervals of the collectors can be changed by
+        # the user ("Config.collector_update_intervals", "-1" means default update interval and values are in this order).
+        self.collector_list = ["processes", "users", "services", "sensors", "disk_file_system", "network_connection", "gpu"]
+        self.collector_dict = {"performance": {"update_interval": 0},
+                               "processes": {"update_interval": 0},
+                               "users": {"update_interval": 3.0},
+                               "services": {"update_interval": 10.0},
+                               "sensors": {"update_interval": 2.0},
+                               "disk_file_system": {"update_interval": 5.0},
+                               "network_connection": {"update_interval": 5.0},
+                               "gpu": {"update_interval": 0}}
+
+        # Collectors are run on the ticks of the main loop (ticks are repeated in update interval of the application).
+        # A collector is run on every "n"th tick (n = collector update interval / application update interval). Thus collectors
+        # which have same or multiple update intervals are run on the same ticks and there is only one wakeup for all of them.
+        self.tick_count = 0
+        self.collector_last_tick_dict = {}
+        # Collectors which are due on the current tick.
+        self.due_collector_set = set(self.collector_dict.keys())
+
+
+    def collector_update_interval_func(self, collector):
+        """
+        Get update interval (in seconds) of a collector. User defined update interval is used if there is one.
+        """
+
+        update_interval = self.collector_dict[collector]["update_interval"]
+        if collector in self.collector_list:
+            try:
+                user_update_interval = Config.collector_update_intervals[self.collector_list.index(collector)]
+            # Prevent errors if there are less values in the config file.
+            except IndexError:
+                user_update_interval = -1
+            if user_update_interval != -1:
+                update_interval = user_update_interval
+
+        if update_interval == 0:
+            update_interval = Config.update_interval
+
+        return update_interval
+
+
+    def collector_tick_interval_func(self, collector):
+        """
+        Get number of ticks between two runs of a collector.
+        """
+
+        return max(1, round(self.collector_update_interval_func(collector) / Config.update_interval))
+
+
+    def tick_func(self):
+        """
+        Start the next tick and get collectors which are due on this tick. A collector is due if the tick is a multiple
+        of its tick interval. It is also due if it is not run on its previous tick (for example, if update interval is changed).
+        """
+
+        self.tick_count = self.tick_count + 1
+        due_collector_set = set()
+        for collector in self.collector_dict:
+            tick_interval = self.collector_tick_interval_func(collector)
+            collector_last_tick = self.collector_last_tick_dict.get(collector)
+            if collector_last_tick is None or self.tick_count % tick_interval == 0 or self.tick_count - collector_last_tick > tick_interval:
+                due_collector_set.add(collector)
+                self.collector_last_tick_dict[collector] = self.tick_count
+        self.due_collector_set = due_collector_set
+
+
+    def collector_due_func(self, collector):
+        """
+        Check if a collector is due on the current tick.
+        """
+
+        return collector in self.due_collector_set
+
+
+Scheduler = Scheduler()
@@ -2,13 +2,14 @@ import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk
 
-import os
-
 from locale import gettext as _tr
 
 from .Config import Config
 from .MainWindow import MainWindow
 from . import Common
+from . import RowDiff
+from .Diagnostics import Diagnostics
+from .HwmonSensors import HwmonSensors
 
 
 class Sensors:
@@ -143,6 +144,12 @@ class Sensors:
         fan_sensor_icon_name = "system-monitoring-center-fan-symbolic"
         voltage_current_power_sensor_icon_name = "system-monitoring-center-voltage-symbolic"
 
+        # Sensor list (with sensor types and formatted high/critical values). It is updated if sensor list of the sensor files is changed.
+        # Sensor list is get again when the tab is initialized.
+        self.hwmon_sensor_list = None
+        self.sensor_list = []
+        self.piter_list = []
+
         self.filter_column = sensors_data_list[0][2] - 1                                               # Search filter is "Sensor Group". "-1" is used because "sensors_data_list" has internal column count and it has to be converted to Python index. For example, if there are 3 internal columns but index is 2 for the last internal column number for the relevant treeview column.
 
         self.initial_already_run = 1
@@ -164,108 +171,24 @@ class Sensors:
         sensors_data_column_order = Config.sensors_data_column_order
         sensors_data_column_widths = Config.sensors_data_column_widths
 
-        # Define global variables and empty lists for the current loop
-        global sensors_data_rows, sensor_type_list
+        # Define global variables for the current loop
+        global sensors_data_rows, sensors_data_rows_prev, sensor_type_list
+
+        # Sensor list (sensor groups, names, high/critical values, etc.) is get only if sensor groups are added/removed
+        # (hwmon hotplug). Only current values of the sensors are read in every loop by using file descriptors which are kept open.
+        # Sensor files are read once per loop and values are shared with the metrics exporter. Thus sensor list may be updated
+        # by the exporter and it is checked if the list is a different list.
+        hwmon_sensor_list, raw_value_list = HwmonSensors.sensor_snapshot_func()
+        sensor_list_updated = hwmon_sensor_list is not self.hwmon_sensor_list
+        if sensor_list_updated == True:
+            self.hwmon_sensor_list = hwmon_sensor_list
+            self.sensor_list_update_func()
+        sensor_type_list = [sensor[0] for sensor in self.sensor_list]                           # Sensor type information will be used for filtering sensors by type when "Show all temperature/fan/voltage and current sensors" radiobuttons are clicked.
         sensors_data_rows = []
-        sensor_type_list = []
-        supported_sensor_attributes = ["temp", "fan", "in", "curr", "power"]
-
-        # Get sensor data
-        sensor_groups = sorted(os.listdir("/sys/class/hwmon/"))                                   # Get sensor group names. In some sensor directories there are a name file and multiple label files. For example, name: "coretemp", label: "Core 0", "Core 1", ... For easier grouping and understanding name is used as "Sensor Group" name and labels are used as "Sensor" names.
-        sensor_group_names = []
-        for sensor_group in sensor_groups:
-            files_in_sensor_group = os.listdir("/sys/class/hwmon/" + sensor_group)
-            for attribute in supported_sensor_attributes:
-                sensor_number = 0
-                while True:                                                                       # Continue loop until code breaks it when next sensor data is not available in the folder.
-                    string_sensor_number = str(sensor_number)                                     # Convert integer value to string value in order to reduce CPU usage. Because this value is used multiple times.
-                    if (attribute + string_sensor_number + "_label" not in files_in_sensor_group) and (attribute + string_sensor_number + "_input" not in files_in_sensor_group):    # Some sensor groups have both label and input files. Some sensor groups have only label or only input files. Some sensor groups do not have label or input files, but they have name files. Data of sensor groups with only name files are not get because they do not have sensor values.
-                        if sensor_number == 0:                                                    # Number in sensor names may start from 0 or 1. Skipped to next loop if number is 0.
-                            sensor_number = sensor_number + 1
-                            continue
-                        if sensor_number > 0:                                                     # Number in sensor names may start from 0 or 1. Loop is broken if number is bigger than 1.
-                            break
-                    # Get device name
-                    with open("/sys/class/hwmon/" + sensor_group + "/name") as reader:
-                        sensor_group_name = reader.read().strip()
-                    if attribute == "temp":
-                        sensor_type = temperature_sensor_icon_name
-                    if attribute == "fan":
-                        sensor_type = fan_sensor_icon_name
-                    if attribute in ["in", "curr", "power"]:
-                        sensor_type = voltage_current_power_sensor_icon_name
-                    # Get device detailed name
-                    device_path = os.readlink("/sys/class/hwmon/" + sensor_group)
-                    device_detailed_name = device_path.split("/")[-2]
-                    if device_detailed_name.startswith("hwmon") == True:
-                        device_detailed_name = device_path.split("/")[-3]
-                        if device_detailed_name.startswith("hwmon") == True:
-                            device_detailed_name = "-"
-                    if device_detailed_name != "-" and device_detailed_name.startswith("0000:") == False:
-                        sensor_group_name = device_detailed_name + " ( " + sensor_group_name + " )"
-                    # Get sensor name
-                    try:
-                        with open("/sys/class/hwmon/" + sensor_group + "/" + attribute + string_sensor_number + "_label") as reader:
-                            sensor_name = reader.read().strip()
-                    except OSError:
-                        sensor_name = "-"
-                    # Get sensor current value
-                    try:
-                        with open("/sys/class/hwmon/" + sensor_group + "/" + attribute + string_sensor_number + "_input") as reader:
-                            current_value = int(reader.read().strip())                            # Units of data in this file are millidegree Celcius for temperature sensors, RM for fan sensors, millivolt for voltage sensors and milliamper for current sensors.
-                        if attribute == "temp":
-                            current_value = f'{(current_value / 1000):.0f} °C'                    # Convert millidegree Celcius to degree Celcius and show not numbers after ".".
-                        if attribute == "fan":
-                            current_value = f'{current_value} RPM'
-                        if attribute == "in":
-                            current_value = f'{(current_value / 1000):.3f} V'                     # Convert millivolt to Volt and show 3 numbers after ".".
-                        if attribute == "curr":
-                            current_value = f'{(current_value / 1000):.3f} A'                     # Convert milliamper to Amper and show 3 numbers after ".".
-                        if attribute == "power":
-                            current_value = f'{(current_value / 1000000):.3f} W'                  # Convert microwatt to Watt and show 3 numbers after ".".
-                    except OSError:
-                        current_value = "-"
-                    # Get sensor high value
-                    try:
-                        with open("/sys/class/hwmon/" + sensor_group + "/" + attribute + string_sensor_number + "_max") as reader:
-                            max_value = int(reader.read().strip())
-                        if attribute == "temp":
-                            max_value = f'{(max_value / 1000):.0f} °C'
-                        if attribute == "fan":
-                            max_value = f'{max_value} RPM'
-                        if attribute == "in":
-                            max_value = f'{(max_value / 1000):.3f} V'
-                        if attribute == "curr":
-                            max_value = f'{(max_value / 1000):.3f} A'
-                        if attribute == "power":
-                            max_value = f'{(max_value / 1000000):.3f} W'
-                    except OSError:
-                        max_value = "-"
-                    # Get sensor critical value
-                    try:
-                        with open("/sys/class/hwmon/" + sensor_group + "/" + attribute + string_sensor_number + "_crit") as reader:
-                            critical_value = int(reader.read().strip())
-                        if attribute == "temp":
-                            critical_value = f'{(critical_value / 1000):.0f} °C'
-                        if attribute == "fan":
-                            critical_value = f'{critical_value} RPM'
-                        if attribute == "in":
-                            critical_value = f'{(critical_value / 1000):.3f} V'
-                        if attribute == "curr":
-                            critical_value = f'{(critical_value / 1000):.3f} A'
-                        if attribute == "power":
-                            critical_value = f'{(critical_value / 1000000):.3f} W'
-                    except OSError:
-                        critical_value = "-"
-
-
-                    sensor_type_list.append(sensor_type)                                          # Append sensor type. This information will be used for filtering sensors by type when "Show all temperature/fan/voltage and current sensors" radiobuttons are clicked.
-                    sensors_data_row = [True, sensor_type, sensor_group_name, sensor_name, current_value, max_value, critical_value]    # Append sensor visibility data (on treeview) which is used for showing/hiding sensor when sensor data of specific sensor type (temperature or fan sensor) is preferred to be shown or sensor search feature is used from the GUI.
-
-                    # Append sensor data list into main list
-                    sensors_data_rows.append(sensors_data_row)
-
-                    sensor_number = sensor_number + 1                                             # Increase sensor number by "1" in order to use this value for getting next file names of the sensor.
+        for (sensor_type, attribute, sensor_group_name, sensor_name, max_value, critical_value), raw_value in zip(self.sensor_list, raw_value_list):
+            current_value = self.sensor_value_format_func(attribute, raw_value)                  # Units of data in this file are millidegree Celcius for temperature sensors, RM for fan sensors, millivolt for voltage sensors and milliamper for current sensors.
+            sensors_data_row = [True, sensor_type, sensor_group_name, sensor_name, current_value, max_value, critical_value]    # Append sensor visibility data (on treeview) which is used for showing/hiding sensor when sensor data of specific sensor type (temperature or fan sensor) is preferred to be shown or sensor search feature is used from the GUI.
+            sensors_data_rows.append(sensors_data_row)
 
         # Add/Remove treeview columns appropriate for user preferences
         if sensors_treeview_columns_shown != sensors_treeview_columns_shown_prev:                 # Remove all columns, redefine treestore and models, set treestore data types (str, int, etc) if column numbers are changed. Because once treestore data types (str, int, etc) are defined, they can not be changed anymore. Thus column (internal data) order and column treeview column addition/removal can not be performed.
@@ -360,14 +283,24 @@ class Sensors:
                        column_width = sensors_data_column_widths[i]
                        sensors_treeview_columns[j].set_fixed_width(column_width)                  # Set column width in pixels. Fixed width is unset if value is "-1".
 
-        # Clear piter_list and treestore because sensor data (new/removed) tracking is not performed. Because there may be same named sensors and tracking may not be successful while sensors have no unique identity (more computer examples are needed for understanding if sensors have unique information). PCI tree path could be get from sensor files but this may not be worth because code will be more complex and it may not be an exact solution for all sensors. Also CPU usage is very low (about 0.67-0.84%, tested on Core i7-2630QM 4-core notebook) even treestore is cleared and sensor data is appended from zero.
-        self.piter_list = []
-        self.treestore.clear()
-        # Append sensor data into treeview
-        for sensors_data_row in sensors_data_rows:
-            self.piter_list.append(self.treestore.append(None, sensors_data_row))                       # All sensors are appended into treeview as tree root for listing sensor data as list (there is no tree view option for sensors tab).
-        self.on_searchentry_changed(self.searchentry)                                           # Update search results.
-
+        # Treestore is cleared and all sensors are appended from zero if sensor list or treeview columns are changed. Otherwise, only
+        # changed cells (current values) are updated. Sensors are tracked by their order in the sensor list because there may be same
+        # named sensors and sensors have no unique identity (more computer examples are needed for understanding if sensors have unique information).
+        if sensor_list_updated == True or sensors_treeview_columns_shown_prev != sensors_treeview_columns_shown:
+            sensors_data_rows_prev = []
+            self.piter_list = []
+            self.treestore.clear()
+        deleted_sensors, new_sensors, updated_sensors = RowDiff.rows_diff(dict(enumerate(sensors_data_rows_prev)), dict(enumerate(sensors_data_rows)))
+        for sensor, (column_numbers, values) in updated_sensors.items():
+            self.treestore.set(self.piter_list[sensor], column_numbers, values)
+        if len(new_sensors) > 0:
+            # Append sensor data into treeview
+            for sensor in new_sensors:
+                self.piter_list.append(self.treestore.append(None, sensors_data_rows[sensor]))             # All sensors are appended into treeview as tree root for listing sensor data as list (there is no tree view option for sensors tab).
+            self.on_searchentry_changed(self.searchentry)                                       # Update search results.
+        Diagnostics.counter_add_func("Model rows changed", len(updated_sensors) + len(new_sensors))
+
+        sensors_data_rows_prev = sensors_data_rows
         sensors_treeview_columns_shown_prev = sensors_treeview_columns_shown
         sensors_data_row_sorting_column_prev = sensors_data_row_sorting_column
         sensors_data_row_sorting_order_prev = sensors_data_row_sorting_order
@@ -378,6 +311,46 @@ class Sensors:
         self.searchentry.props.placeholder_text = _tr("Search...") + "                    " + "(" + _tr("Sensors") + ": " + str(len(sensor_type_list)) + ")"
 
 
+    def sensor_value_format_func(self, attribute, value):
+        """
+        Convert sensor value (raw value which is read from the sensor file) to text with its unit.
+        """
+
+        try:
+            value = int(value)
+        # Value is "None" if file could not be read.
+        except (TypeError, ValueError):
+            return "-"
+
+        if attribute == "temp":
+            return f'{(value / 1000):.0f} °C'                                                     # Convert millidegree Celcius to degree Celcius and show not numbers after ".".
+        if attribute == "fan":
+            return f'{value} RPM'
+        if attribute == "in":
+            return f'{(value / 1000):.3f} V'                                                      # Convert millivolt to Volt and show 3 numbers after ".".
+        if attribute == "curr":
+            return f'{(value / 1000):.3f} A'                                                      # Convert milliamper to Amper and show 3 numbers after ".".
+        if attribute == "power":
+            return f'{(value / 1000000):.3f} W'                                                   # Convert microwatt to Watt and show 3 numbers after ".".
+
+
+    def sensor_list_update_func(self):
+        """
+        Get sensor list (sensor types and formatted high/critical values) from the sensor list of the sensor files.
+        """
+
+        self.sensor_list = []
+        for attribute, sensor_group_name, sensor_name, max_value, critical_value in self.hwmon_sensor_list:
+            if attribute == "temp":
+                sensor_type = temperature_sensor_icon_name
+            if attribute == "fan":
+                sensor_type = fan_sensor_icon_name
+            if attribute in ["in", "curr", "power"]:
+                sensor_type = voltage_current_power_sensor_icon_name
+            self.sensor_list.append((sensor_type, attribute, sensor_group_name, sensor_name,
+                                     self.sensor_value_format_func(attribute, max_value), self.sensor_value_format_func(attribute, critical_value)))
+
+
     def on_column_title_clicked(self, widget):
         """
         Get and save column sorting order.
@@ -15,6 +15,10 @@ from .Config import Config
 from .Performance import Performance
 from .MainWindow import MainWindow
 from . import Common
+from . import RowDiff
+from .Diagnostics import Diagnostics
+from .HostHelper import HostHelper
+from .SystemdDbus import SystemdDbus
 
 
 class Services:
@@ -323,7 +327,7 @@ class Services:
 
         service_search_text = self.searchentry.get_text().lower()
         # Set visible/hidden services
-        for piter in self.piter_list:
+        for piter in self.piter_dict.values():
             self.treestore.set_value(piter, 0, False)
             service_data_text_in_model = self.treestore.get_value(piter, self.filter_column)
             if service_search_text in str(service_data_text_in_model).lower():
@@ -434,10 +438,10 @@ class Services:
         performance_data_unit_converter_func = Performance.performance_data_unit_converter_func
 
 
-        global services_data_rows_prev, service_list_prev, services_treeview_columns_shown_prev, services_data_row_sorting_column_prev, services_data_row_sorting_order_prev, services_data_column_order_prev, services_data_column_widths_prev
-        services_data_rows_prev = []
+        global services_data_rows_dict_prev, service_list_prev, services_treeview_columns_shown_prev, services_data_row_sorting_column_prev, services_data_row_sorting_order_prev, services_data_column_order_prev, services_data_column_widths_prev
+        services_data_rows_dict_prev = {}
         service_list_prev = []
-        self.piter_list = []
+        self.piter_dict = {}
         services_treeview_columns_shown_prev = []
         services_data_row_sorting_column_prev = ""
         services_data_row_sorting_order_prev = ""
@@ -455,9 +459,30 @@ class Services:
         self.initial_already_run = 1
 
 
-    def services_loop_func(self):
+    def services_collect_func(self):
+        """
+        Get service information. GTK is not used in this function and it is run in the collector thread (see "Collector.py")
+        because systemd is called over D-Bus (or "systemctl" command is run). It is also run on the main thread if loop
+        function is run without collected data (for example, when refresh button is clicked).
+        """
+
+        services_treeview_columns_shown = list(Config.services_treeview_columns_shown)
+
+        # Get service information from systemd over D-Bus. Only services which are changed since the previous loop
+        # (by tracking signals of systemd) are processed. "systemctl" command is used if systemd could not be reached
+        # over D-Bus (for example, if D-Bus access is not allowed in Flatpak environment).
+        # Memory of the services is also get if it is served by the metrics exporter.
+        services_information_dict = SystemdDbus.services_information_func(get_memory=(6 in services_treeview_columns_shown or Config.metrics_exporter == 1))
+        if services_information_dict is None:
+            services_information_dict = self.services_information_systemctl_func(services_treeview_columns_shown)
+
+        return {"services_information_dict": services_information_dict, "services_treeview_columns_shown": services_treeview_columns_shown}
+
+
+    def services_loop_func(self, collected_data=None):
         """
         Get and show information on the GUI on every loop.
+        Service information is get on the main thread if it is not collected by the collector thread.
         """
 
         # Switch to System tab and prevent errors if systemd is not used on the system.
@@ -465,6 +490,10 @@ class Services:
             MainWindow.performance_tb.set_active(True)
             return
 
+        # Data which is collected before shown columns are changed is not used (memory of the services may not be get).
+        if collected_data is None or collected_data["services_treeview_columns_shown"] != Config.services_treeview_columns_shown:
+            collected_data = self.services_collect_func()
+
         # Get GUI obejcts one time per floop instead of getting them multiple times
         global services_treeview
 
@@ -482,122 +511,26 @@ class Services:
         services_data_column_order = Config.services_data_column_order
         services_data_column_widths = Config.services_data_column_widths
 
-        # Get service file names and define global variables and empty lists for the current loop
-        global services_data_rows, services_data_rows_prev, service_list, service_list_prev, service_loaded_not_loaded_list
+        # Define global variables and empty lists for the current loop
+        global services_data_rows, services_data_rows_dict_prev, service_list, service_list_prev, service_loaded_not_loaded_list
         services_data_rows = []
-        service_list = []
         service_loaded_not_loaded_list = []
 
-        # Service files (Unit files) are in the "/etc/systemd/system/" and "/usr/lib/systemd/system/autovt@.service" directories. But the first directory contains links to the service files in the second directory. Thus, service files get from the second directory.
-        # There is no "/usr/lib/systemd/system/" on some ARM systems (and also on older distributions) and "/lib/systemd/system/" is used in this case. On newer distributions "/usr/lib/systemd/system/" is a symlink to "/lib/systemd/system/".
-        # On ARM systems, also "/usr/lib/systemd/system/" folder may be used after installling some applications. In this situation this folder will be a real path.
-        service_unit_file_list_usr_lib_systemd = []
-        service_unit_file_list_lib_systemd = []
-        if Config.environment_type == "flatpak":
-            if os.path.isdir("/var/run/host/usr/lib/systemd/system/") == True:
-                service_unit_files_dir = "/var/run/host/usr/lib/systemd/system/"
-                service_unit_file_list_usr_lib_systemd = [filename for filename in os.listdir(service_unit_files_dir) if filename.endswith(".service")]
-            # There is no access to "/run" folder of the host OS in Flatpak environment.
-            if (subprocess.check_output(["flatpak-spawn", "--host", "realpath", "/lib/systemd/system/"], shell=False)).decode().strip() + "/" == "/lib/systemd/system/":
-                service_unit_files_dir = "/lib/systemd/system/"
-                service_unit_file_list_lib_systemd_scratch = (subprocess.check_output(["flatpak-spawn", "--host", "ls", service_unit_files_dir], shell=False)).decode().strip().split()
-                service_unit_file_list_lib_systemd = []
-                for file in service_unit_file_list_lib_systemd_scratch:
-                    if file.endswith(".service") == True:
-                        service_unit_file_list_lib_systemd.append(file)
-        else:
-            if os.path.isdir("/usr/lib/systemd/system/") == True:
-                service_unit_files_dir = "/usr/lib/systemd/system/"
-                service_unit_file_list_usr_lib_systemd = [filename for filename in os.listdir(service_unit_files_dir) if filename.endswith(".service")]
-            if os.path.realpath("/lib/systemd/system/") + "/" == "/lib/systemd/system/":
-                service_unit_files_dir = "/lib/systemd/system/"
-                service_unit_file_list_lib_systemd = [filename for filename in os.listdir(service_unit_files_dir) if filename.endswith(".service")]
-
-        # Merge service file lists from different folders.
-        service_unit_file_list = service_unit_file_list_usr_lib_systemd + service_unit_file_list_lib_systemd
-
-        try:
-            if Config.environment_type == "flatpak":
-                # There is no access to "/run" folder of the host OS in Flatpak environment.
-                service_files_from_run_systemd_list = (subprocess.check_output(["flatpak-spawn", "--host", "ls", "/run/systemd/units/"], shell=False)).decode().strip().split()
-            else:
-                service_files_from_run_systemd_list = [filename.split("invocation:", 1)[-1] for filename in os.listdir("/run/systemd/units/")]    # "/run/systemd/units/" directory contains loaded and non-dead services.
-        except FileNotFoundError:
-            service_files_from_run_systemd_list = []
-
-        if Config.environment_type == "flatpak":
-            service_unit_files_dir_scratch = service_unit_files_dir.split("/var/run/host")[-1]
-            service_unit_file_real_path_list = (subprocess.check_output(["flatpak-spawn", "--host", "ls", "-l", service_unit_files_dir_scratch], shell=False)).decode().strip().split("\n")
-            for service_file in service_unit_file_real_path_list:
-                if " -> " in service_file and "/dev/null" not in service_file:
-                    file = service_file.split(" -> ")[0].split()[-1].strip()
-                    if file in service_unit_file_list:
-                        service_unit_file_list.remove(file)
-        else:
-            for file in service_unit_file_list[:]:                                                # "[:]" is used for iterating over copy of the list because elements are removed during iteration. Otherwise incorrect operations (incorrect element removals) are performed on the list.
-                if os.path.islink(service_unit_files_dir + file) == True and os.path.realpath(service_unit_files_dir + file) != "/dev/null":    # Some service files are link to other ".service" files in the same directory. These links are removed from the list. Not all link files are removed. Link files with "/dev/null" are kept in the list.
-                    service_unit_file_list.remove(file)
-
-        # Get all service names (joining service names from "systemctl list-unit-files ..." and "systemctl list-units ..."). Some services are run multiple times. For example there is one instance of "user@.service" from ""systemctl list-unit-files ..." command but there are two loaded services (user@1000.service and user@1001.service) per logged in user. There are several examples for this situation. "user@.service" is removed from list, "user@1000.service" and "user@1001.service" appended into list for getting information for all services correctly.
-        for service_unit_file in service_unit_file_list:
-            if "@" not in service_unit_file:
-                service_list.append(service_unit_file)
-                continue
-            else:
-                service_unit_file_split = service_unit_file.split("@")[0]
-                for service_loaded in service_files_from_run_systemd_list:
-                    if "@" in service_loaded:
-                        service_loaded = service_loaded.split("invocation:")[-1]
-                        if service_unit_file_split == service_loaded.split("@")[0]:
-                            service_list.append(service_loaded)
-                            continue
-        service_list = sorted(service_list)
-
-        # Generate "unit_files_command_parameter_list". This list will be used for constructing commandline for getting service data per service file.
-        unit_files_command_parameter_list = ["LoadState"]                                         # This information is always get for filtering service, etc. Also it prevents errors if every columns other than service name are preferred not to be shown. It gives errors if no property is specified with "systemctl show [service_name] --property=" command.
-        if 1 in services_treeview_columns_shown:
-            unit_files_command_parameter_list.append("UnitFileState")
-        if 2 in services_treeview_columns_shown:
-            unit_files_command_parameter_list.append("MainPID")
-        if 3 in services_treeview_columns_shown:
-            unit_files_command_parameter_list.append("ActiveState")
-        if 5 in services_treeview_columns_shown:
-            unit_files_command_parameter_list.append("SubState")
-        if 6 in services_treeview_columns_shown:
-            unit_files_command_parameter_list.append("MemoryCurrent")
-        if 7 in services_treeview_columns_shown:
-            unit_files_command_parameter_list.append("Description")
-        unit_files_command_parameter_list = ",".join(unit_files_command_parameter_list)           # Join strings with "," between them.
-        # Construct command for getting service information for all services
-        if Config.environment_type == "flatpak":
-            unit_files_command = ["flatpak-spawn", "--host", "systemctl", "show", "--property=" + unit_files_command_parameter_list]
-        else:
-            unit_files_command = ["systemctl", "show", "--property=" + unit_files_command_parameter_list]
-        for service in service_list:
-            unit_files_command.append(service)
-
-        # Get number of online logical CPU cores (this operation is repeated in every loop because number of online CPU cores may be changed by user and this may cause wrong calculation of CPU usage percent data of the processes even if this is a very rare situation.)
-        number_of_logical_cores = Common.number_of_logical_cores()
+        services_information_dict = collected_data["services_information_dict"]
+        if services_information_dict is None:
+            return
+        service_list = sorted(services_information_dict.keys())
 
-        # Get services bu using single process (instead of multiprocessing) if the system has 1 or 2 CPU cores.
-        if number_of_logical_cores < 3:
-            # Get service data per service file in one attempt in order to obtain lower CPU usage. Because information from all service files will be get by one commandline operation and will be parsed later.
-            try:
-                systemctl_show_command_lines = (subprocess.check_output(unit_files_command, shell=False)).decode().strip().split("\n\n")
-            # Prevent errors if "systemd" is not used on the system.
-            except Exception:
-                return
-        # Get services bu using multiple processes (multiprocessing) if the system has more than 2 CPU cores.
-        else:
-            from . import ServicesGetMultProc
-            systemctl_show_command_lines = ServicesGetMultProc.start_processes_func(number_of_logical_cores, unit_files_command)
+        if Config.metrics_exporter == 1:
+            from .MetricsExporter import MetricsExporter
+            MetricsExporter.services_memory_dict = {service: service_information["MemoryCurrent"] for service, service_information in services_information_dict.items()
+                                                    if service_information.get("MemoryCurrent", -9999) != -9999}
 
         # Get services data (specific information by processing the data get previously)
-        for i, service in enumerate(service_list):
-            systemctl_show_command_lines_split = systemctl_show_command_lines[i]
+        for service in service_list:
+            service_information = services_information_dict[service]
             # Get service "loaded/not loaded" status. This data will be used for filtering (search, etc.) services.
-            service_load_state = "-"                                                              # Initial value of "service_load_state" variable. This value will be used if "service_load_state" could not be detected.
-            service_load_state = systemctl_show_command_lines_split.split("LoadState=", 1)[1].split("\n", 1)[0].capitalize()
+            service_load_state = service_information["LoadState"].capitalize()
             if service_load_state == "Loaded":
                 service_loaded_not_loaded_list.append(True)
             else:
@@ -606,35 +539,25 @@ class Services:
             services_data_row = [True, services_image, service]                                   # Service visibility data (on treeview) which is used for showing/hiding service when services in specific type (enabled/disabled) is preferred to be shown or service search feature is used from the GUI.
             # Append service unit file state
             if 1 in services_treeview_columns_shown:
-                service_state = _tr(systemctl_show_command_lines_split.split("UnitFileState=", 1)[1].split("\n", 1)[0].capitalize())    # "_tr([value])" is used for using translated string.
-                services_data_row.append(service_state)
+                services_data_row.append(_tr(service_information["UnitFileState"].capitalize()))    # "_tr([value])" is used for using translated string.
             # Append service main PID
             if 2 in services_treeview_columns_shown:
-                service_main_pid = int(systemctl_show_command_lines_split.split("MainPID=", 1)[1].split("\n", 1)[0].capitalize())
-                services_data_row.append(service_main_pid)
+                services_data_row.append(service_information["MainPID"])
             # Append service active state
             if 3 in services_treeview_columns_shown:
-                service_active_state = _tr(systemctl_show_command_lines_split.split("ActiveState=", 1)[1].split("\n", 1)[0].capitalize())
-                services_data_row.append(service_active_state)
+                services_data_row.append(_tr(service_information["ActiveState"].capitalize()))
             # Append service load state (it has been get previously)
             if 4 in services_treeview_columns_shown:
                 services_data_row.append(_tr(service_load_state))
             # Append service substate
             if 5 in services_treeview_columns_shown:
-                service_sub_state = _tr(systemctl_show_command_lines_split.split("SubState=", 1)[1].split("\n", 1)[0].capitalize())
-                services_data_row.append(service_sub_state)
-            # Append service current memory
+                services_data_row.append(_tr(service_information["SubState"].capitalize()))
+            # Append service current memory ("-9999" if memory value is not set)
             if 6 in services_treeview_columns_shown:
-                service_memory_current = systemctl_show_command_lines_split.split("MemoryCurrent=", 1)[1].split("\n", 1)[0].capitalize()
-                if service_memory_current.startswith("["):
-                    service_memory_current = -9999                                                # "-9999" value is used as "service_memory_current" value if memory value is get as "[not set]". Code will recognize this value and show "-" information in this situation. This negative integer value is used instead of string value because this data colmn of the treestore is an integer typed column.
-                else:
-                    service_memory_current = int(service_memory_current)
-                services_data_row.append(service_memory_current)
+                services_data_row.append(service_information["MemoryCurrent"])
             # Append service description
             if 7 in services_treeview_columns_shown:
-                service_description = systemctl_show_command_lines_split.split("Description=", 1)[1].split("\n", 1)[0].capitalize()
-                services_data_row.append(service_description)
+                services_data_row.append(service_information["Description"].capitalize())
             # Append all data of the services into a list which will be appended into a treestore for showing the data on a treeview.
             services_data_rows.append(services_data_row)
 
@@ -684,8 +607,9 @@ class Services:
             treemodelfilter6101.set_visible_column(0)                                             # Column "0" of the treestore will be used for column visibility information (True or False)
             treemodelsort6101 = Gtk.TreeModelSort().new_with_model(treemodelfilter6101)
             self.treeview.set_model(treemodelsort6101)
-            service_list_prev = []                                                                # Redefine (clear) "service_list_prev" list. Thus code will recognize this and data will be appended into treestore and piter_list from zero.
-            self.piter_list = []
+            service_list_prev = []                                                                # Redefine (clear) "service_list_prev" list. Thus code will recognize this and data will be appended into treestore and piter_dict from zero.
+            services_data_rows_dict_prev = {}
+            self.piter_dict = {}
 
         # Reorder columns if this is the first loop (columns are appended into treeview as unordered) or user has reset column order from customizations.
         if services_treeview_columns_shown_prev != services_treeview_columns_shown or services_data_column_order_prev != services_data_column_order:
@@ -734,35 +658,27 @@ class Services:
                        column_width = services_data_column_widths[i]
                        services_treeview_columns[j].set_fixed_width(column_width)                 # Set column width in pixels. Fixed width is unset if value is "-1".
 
-        # Get new/deleted(ended) services for updating treestore/treeview
-        service_list_prev_set = set(service_list_prev)
-        service_list_set = set(service_list)
-        deleted_services = sorted(list(service_list_prev_set - service_list_set))
-        new_services = sorted(list(service_list_set - service_list_prev_set))
-        existing_services = sorted(list(service_list_set.intersection(service_list_prev)))
-        updated_existing_services_index = [[service_list.index(i), service_list_prev.index(i)] for i in existing_services]    # "c = set(a).intersection(b)" is about 19% faster than "c = set(a).intersection(set(b))"
-        services_data_rows_row_length = len(services_data_rows[0])
+        # Get new/deleted/updated services for updating treestore/treeview. Rows and treestore iters are kept in
+        # dictionaries (service name is the key) for avoiding "list.index()" calls.
+        services_data_rows_dict = dict(zip(service_list, services_data_rows))
+        deleted_services, new_services, updated_services = RowDiff.rows_diff(services_data_rows_dict_prev, services_data_rows_dict)
 
-        # Append/Remove/Update services data into treestore
+        # Append/Remove/Update services data into treestore. Only changed cells of the rows are updated.
         global service_search_text
-        if len(self.piter_list) > 0:
-            for i, j in updated_existing_services_index:
-                if services_data_rows[i] != services_data_rows_prev[j]:
-                    for k in range(1, services_data_rows_row_length):                             # Start from "1" in order to set first element (treeview row visibility data) as "True" in every loop.
-                        if services_data_rows_prev[j][k] != services_data_rows[i][k]:
-                            self.treestore.set_value(self.piter_list[j], k, services_data_rows[i][k])
+        for service, (column_numbers, values) in updated_services.items():
+            self.treestore.set(self.piter_dict[service], column_numbers, values)
         if len(deleted_services) > 0:
-            for service in reversed(sorted(list(deleted_services))):
-                self.treestore.remove(self.piter_list[service_list_prev.index(service)])
-                self.piter_list.remove(self.piter_list[service_list_prev.index(service)])
+            for service in deleted_services:
+                self.treestore.remove(self.piter_dict.pop(service))
             self.on_searchentry_changed(self.searchentry)                                           # Update search results.
         if len(new_services) > 0:
             for service in new_services:
-                self.piter_list.insert(service_list.index(service), self.treestore.insert(None, service_list.index(service), services_data_rows[service_list.index(service)]))    # "insert" have to be used for appending element into both "self.piter_list" and "treestore" in order to avoid data index problems which are caused by sorting of ".service" file names (this sorting is performed for getting list differences).
+                self.piter_dict[service] = self.treestore.append(None, services_data_rows_dict[service])
             self.on_searchentry_changed(self.searchentry)                                           # Update search results.
+        Diagnostics.counter_add_func("Model rows changed", len(updated_services) + len(deleted_services) + len(new_services))
 
         service_list_prev = service_list                                                          # For using values in the next loop
-        services_data_rows_prev = services_data_rows
+        services_data_rows_dict_prev = services_data_rows_dict
         services_treeview_columns_shown_prev = services_treeview_columns_shown
         services_data_row_sorting_column_prev = services_data_row_sorting_column
         services_data_row_sorting_order_prev = services_data_row_sorting_order
@@ -776,6 +692,165 @@ class Services:
         self.searchentry.props.placeholder_text = _tr("Search...") + "                    " + "(" + _tr("Services") + ": " + str(len(service_loaded_not_loaded_list)) + ")"
 
 
+    def services_information_systemctl_func(self, services_treeview_columns_shown):
+        """
+        Get service information by using "systemctl show" command.
+        This function is used if systemd could not be reached over D-Bus.
+        Returns a dictionary (service name is the key) in the same format as "SystemdDbus.services_information_func" output.
+        """
+
+        service_list = []
+
+        # Service files (Unit files) are in the "/etc/systemd/system/" and "/usr/lib/systemd/system/autovt@.service" directories. But the first directory contains links to the service files in the second directory. Thus, service files get from the second directory.
+        # There is no "/usr/lib/systemd/system/" on some ARM systems (and also on older distributions) and "/lib/systemd/system/" is used in this case. On newer distributions "/usr/lib/systemd/system/" is a symlink to "/lib/systemd/system/".
+        # On ARM systems, also "/usr/lib/systemd/system/" folder may be used after installling some applications. In this situation this folder will be a real path.
+        service_unit_file_list_usr_lib_systemd = []
+        service_unit_file_list_lib_systemd = []
+        if Config.environment_type == "flatpak":
+            if os.path.isdir("/var/run/host/usr/lib/systemd/system/") == True:
+                service_unit_files_dir = "/var/run/host/usr/lib/systemd/system/"
+                service_unit_file_list_usr_lib_systemd = [filename for filename in os.listdir(service_unit_files_dir) if filename.endswith(".service")]
+            # There is no access to "/run" folder of the host OS in Flatpak environment. Helper which is run on the host OS
+            # is used for getting real paths and listing folders. Commands are run if the helper could not be used.
+            lib_systemd_real_paths = HostHelper.realpaths(["/lib/systemd/system/"])
+            if lib_systemd_real_paths is None:
+                lib_systemd_real_path = (subprocess.check_output(["flatpak-spawn", "--host", "realpath", "/lib/systemd/system/"], shell=False)).decode().strip()
+            else:
+                lib_systemd_real_path = lib_systemd_real_paths[0]
+            if lib_systemd_real_path + "/" == "/lib/systemd/system/":
+                service_unit_files_dir = "/lib/systemd/system/"
+                dir_lists = HostHelper.list_dirs([service_unit_files_dir])
+                if dir_lists is None or dir_lists[0] is None:
+                    service_unit_file_list_lib_systemd_scratch = (subprocess.check_output(["flatpak-spawn", "--host", "ls", service_unit_files_dir], shell=False)).decode().strip().split()
+                else:
+                    service_unit_file_list_lib_systemd_scratch = dir_lists[0]
+                service_unit_file_list_lib_systemd = []
+                for file in service_unit_file_list_lib_systemd_scratch:
+                    if file.endswith(".service") == True:
+                        service_unit_file_list_lib_systemd.append(file)
+        else:
+            if os.path.isdir("/usr/lib/systemd/system/") == True:
+                service_unit_files_dir = "/usr/lib/systemd/system/"
+                service_unit_file_list_usr_lib_systemd = [filename for filename in os.listdir(service_unit_files_dir) if filename.endswith(".service")]
+            if os.path.realpath("/lib/systemd/system/") + "/" == "/lib/systemd/system/":
+                service_unit_files_dir = "/lib/systemd/system/"
+                service_unit_file_list_lib_systemd = [filename for filename in os.listdir(service_unit_files_dir) if filename.endswith(".service")]
+
+        # Merge service file lists from different folders.
+        service_unit_file_list = service_unit_file_list_usr_lib_systemd + service_unit_file_list_lib_systemd
+
+        try:
+            if Config.environment_type == "flatpak":
+                # There is no access to "/run" folder of the host OS in Flatpak environment.
+                dir_lists = HostHelper.list_dirs(["/run/systemd/units/"])
+                if dir_lists is None:
+                    service_files_from_run_systemd_list = (subprocess.check_output(["flatpak-spawn", "--host", "ls", "/run/systemd/units/"], shell=False)).decode().strip().split()
+                elif dir_lists[0] is None:
+                    service_files_from_run_systemd_list = []
+                else:
+                    service_files_from_run_systemd_list = [filename.split("invocation:", 1)[-1] for filename in dir_lists[0]]
+            else:
+                service_files_from_run_systemd_list = [filename.split("invocation:", 1)[-1] for filename in os.listdir("/run/systemd/units/")]    # "/run/systemd/units/" directory contains loaded and non-dead services.
+        except FileNotFoundError:
+            service_files_from_run_systemd_list = []
+
+        if Config.environment_type == "flatpak":
+            service_unit_files_dir_scratch = service_unit_files_dir.split("/var/run/host")[-1]
+            link_targets = HostHelper.readlinks([service_unit_files_dir_scratch + file for file in service_unit_file_list])
+            if link_targets is not None:
+                for file, link_target in list(zip(service_unit_file_list, link_targets)):
+                    if link_target is not None and "/dev/null" not in link_target:
+                        service_unit_file_list.remove(file)
+            else:
+                service_unit_file_real_path_list = (subprocess.check_output(["flatpak-spawn", "--host", "ls", "-l", service_unit_files_dir_scratch], shell=False)).decode().strip().split("\n")
+                for service_file in service_unit_file_real_path_list:
+                    if " -> " in service_file and "/dev/null" not in service_file:
+                        file = service_file.split(" -> ")[0].split()[-1].strip()
+                        if file in service_unit_file_list:
+                            service_unit_file_list.remove(file)
+        else:
+            for file in service_unit_file_list[:]:                                                # "[:]" is used for iterating over copy of the list because elements are removed during iteration. Otherwise incorrect operations (incorrect element removals) are performed on the list.
+                if os.path.islink(service_unit_files_dir + file) == True and os.path.realpath(service_unit_files_dir + file) != "/dev/null":    # Some service files are link to other ".service" files in the same directory. These links are removed from the list. Not all link files are removed. Link files with "/dev/null" are kept in the list.
+                    service_unit_file_list.remove(file)
+
+        # Get all service names (joining service names from "systemctl list-unit-files ..." and "systemctl list-units ..."). Some services are run multiple times. For example there is one instance of "user@.service" from ""systemctl list-unit-files ..." command but there are two loaded services (user@1000.service and user@1001.service) per logged in user. There are several examples for this situation. "user@.service" is removed from list, "user@1000.service" and "user@1001.service" appended into list for getting information for all services correctly.
+        for service_unit_file in service_unit_file_list:
+            if "@" not in service_unit_file:
+                service_list.append(service_unit_file)
+                continue
+            else:
+                service_unit_file_split = service_unit_file.split("@")[0]
+                for service_loaded in service_files_from_run_systemd_list:
+                    if "@" in service_loaded:
+                        service_loaded = service_loaded.split("invocation:")[-1]
+                        if service_unit_file_split == service_loaded.split("@")[0]:
+                            service_list.append(service_loaded)
+                            continue
+        service_list = sorted(service_list)
+
+        # Generate "unit_files_command_parameter_list". This list will be used for constructing commandline for getting service data per service file.
+        unit_files_command_parameter_list = ["LoadState"]                                         # This information is always get for filtering service, etc. Also it prevents errors if every columns other than service name are preferred not to be shown. It gives errors if no property is specified with "systemctl show [service_name] --property=" command.
+        if 1 in services_treeview_columns_shown:
+            unit_files_command_parameter_list.append("UnitFileState")
+        if 2 in services_treeview_columns_shown:
+            unit_files_command_parameter_list.append("MainPID")
+        if 3 in services_treeview_columns_shown:
+            unit_files_command_parameter_list.append("ActiveState")
+        if 5 in services_treeview_columns_shown:
+            unit_files_command_parameter_list.append("SubState")
+        if 6 in services_treeview_columns_shown:
+            unit_files_command_parameter_list.append("MemoryCurrent")
+        if 7 in services_treeview_columns_shown:
+            unit_files_command_parameter_list.append("Description")
+        unit_files_command_parameter_list = ",".join(unit_files_command_parameter_list)           # Join strings with "," between them.
+        # Construct command for getting service information for all services
+        if Config.environment_type == "flatpak":
+            unit_files_command = ["flatpak-spawn", "--host", "systemctl", "show", "--property=" + unit_files_command_parameter_list]
+        else:
+            unit_files_command = ["systemctl", "show", "--property=" + unit_files_command_parameter_list]
+        for service in service_list:
+            unit_files_command.append(service)
+
+        # Get number of online logical CPU cores (this operation is repeated in every loop because number of online CPU cores may be changed by user and this may cause wrong calculation of CPU usage percent data of the processes even if this is a very rare situation.)
+        number_of_logical_cores = Common.number_of_logical_cores()
+
+        # Get services bu using single process (instead of multiprocessing) if the system has 1 or 2 CPU cores.
+        if number_of_logical_cores < 3:
+            # Get service data per service file in one attempt in order to obtain lower CPU usage. Because information from all service files will be get by one commandline operation and will be parsed later.
+            try:
+                systemctl_show_command_lines = (subprocess.check_output(unit_files_command, shell=False)).decode().strip().split("\n\n")
+            # Prevent errors if "systemd" is not used on the system.
+            except Exception:
+                return None
+        # Get services by running multiple commands at the same time (by using worker threads) if the system has more than 2 CPU cores.
+        else:
+            from . import ServicesGetMultProc
+            systemctl_show_command_lines = ServicesGetMultProc.start_processes_func(number_of_logical_cores, unit_files_command)
+            # Output of a command is not get if it is failed.
+            if len(systemctl_show_command_lines) != len(service_list):
+                return None
+
+        # Get property values of the services. Property values which are not get are set as empty values.
+        services_information_dict = {}
+        for i, service in enumerate(service_list):
+            service_information = {"LoadState": "", "UnitFileState": "", "MainPID": 0, "ActiveState": "", "SubState": "", "MemoryCurrent": -9999, "Description": ""}
+            for line in systemctl_show_command_lines[i].split("\n"):
+                property_name, _, value = line.partition("=")
+                if property_name not in service_information:
+                    continue
+                if property_name == "MainPID":
+                    value = int(value)
+                if property_name == "MemoryCurrent":
+                    if value.startswith("["):
+                        value = -9999                                                             # "-9999" value is used as "service_memory_current" value if memory value is get as "[not set]". Code will recognize this value and show "-" information in this situation. This negative integer value is used instead of string value because this data colmn of the treestore is an integer typed column.
+                    else:
+                        value = int(value)
+                service_information[property_name] = value
+            services_information_dict[service] = service_information
+
+        return services_information_dict
+
+
     def on_column_title_clicked(self, widget):
         """
         Get and save column sorting order.
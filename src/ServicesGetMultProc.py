@@ -1,3 +1,19 @@
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Minimum number of services per "systemctl show" command. Service list is not split for low number of
+# services because starting a "systemctl" process costs more than getting properties of a few services.
+minimum_number_of_services_per_command = 64
+
+# Worker threads are created once and they are used for all refreshes. Threads are used instead of processes
+# because workers only wait for "systemctl" processes. Forking the application (which has GTK loaded) is not needed.
+worker_pool = None
+worker_pool_number_of_workers = 0
+worker_pool_lock = threading.Lock()
+
+
 def services_number_of_cpu_cores_used_func(number_of_logical_cores):
     """
     Get number of CPU cores to be used at the same time for getting service data.
@@ -15,9 +31,9 @@ def services_number_of_cpu_cores_used_func(number_of_logical_cores):
     return number_of_cpu_cores_used
 
 
-def services_unit_files_command_split_func(number_of_cpu_cores_used, unit_files_command):
+def services_unit_files_command_split_func(number_of_commands, unit_files_command):
     """
-    Split service list into [number_of_cpu_cores_used] lists for using them to get service data by using multiprocessing.
+    Split service list into [number_of_commands] lists for using them to get service data by using worker threads.
     """
 
     # Get service list and unit file command parameters. "+1" for list slice index, "+2" for 2 elements after "systemctl" parameter to obtain index of element which starts with "--property=".
@@ -25,14 +41,14 @@ def services_unit_files_command_split_func(number_of_cpu_cores_used, unit_files_
     service_list = unit_files_command[index_to_split_list:]
     unit_files_command = unit_files_command[:index_to_split_list]
 
-    # Get number of services per process.
-    number_of_services_per_process = len(service_list) // number_of_cpu_cores_used
-    remaining_services = len(service_list) % number_of_cpu_cores_used
+    # Get number of services per command.
+    number_of_services_per_command = len(service_list) // number_of_commands
+    remaining_services = len(service_list) % number_of_commands
 
-    # Split service list per process.
+    # Split service list per command.
     service_list_split = []
-    for i in range(number_of_cpu_cores_used):
-        service_list_split.append(service_list[i*number_of_services_per_process:(i+1)*number_of_services_per_process])
+    for i in range(number_of_commands):
+        service_list_split.append(service_list[i*number_of_services_per_command:(i+1)*number_of_services_per_command])
 
     # Add the remaining services into the last list.
     if remaining_services != 0:
@@ -50,63 +66,75 @@ def services_unit_files_command_split_func(number_of_cpu_cores_used, unit_files_
     return unit_files_command_split
 
 
-def get_service_data_func(queue1, i, unit_files_command_split):
+def services_number_of_commands_func(number_of_workers, number_of_services):
+    """
+    Get number of "systemctl show" commands which are run at the same time by adapting it to number of services.
+    """
+
+    return max(1, min(number_of_workers, number_of_services // minimum_number_of_services_per_command))
+
+
+def get_service_data_func(unit_files_command_split):
     """
-    Get service data by using multiprocessing.
+    Get service data by running a "systemctl show" command. It is run in a worker thread.
     """
 
     try:
         systemctl_show_command_lines_split = (subprocess.check_output(unit_files_command_split, shell=False)).decode().strip().split("\n\n")
     # Prevent errors if "systemd" is not used on the system.
     except Exception:
-        pass
+        systemctl_show_command_lines_split = []
 
-    # Put the service data (and process number) into queue in order to get it, reorder and merge them by using the main process. It is a FIFO queue and data can be get in the same order which they are put into the queue.
-    # Nested "[}" required for putting the data as a list.
-    queue1.put([[i, systemctl_show_command_lines_split]])
+    return systemctl_show_command_lines_split
 
 
-def start_processes_func(number_of_logical_cores, unit_files_command):
+def worker_pool_get_func(number_of_workers):
     """
-    Run the reuqired functions and start processes to get the service data by using multiprocessing.
+    Get worker pool. It is created if it is not created before or number of workers is changed
+    (number of online CPU cores may be changed by user).
     """
 
-    # Import modules in this function because entire module is run separately by the all processes if multiprocessing is used.
-    global subprocess
-    import subprocess
-    import multiprocessing
+    global worker_pool, worker_pool_number_of_workers
 
-    # Get the required data.
-    number_of_cpu_cores_used = services_number_of_cpu_cores_used_func(number_of_logical_cores)
-    unit_files_command_split = services_unit_files_command_split_func(number_of_cpu_cores_used, unit_files_command)
+    with worker_pool_lock:
+        if worker_pool is not None and worker_pool_number_of_workers != number_of_workers:
+            worker_pool.shutdown(wait=False)
+            worker_pool = None
+        if worker_pool is None:
+            worker_pool = ThreadPoolExecutor(max_workers=number_of_workers, thread_name_prefix="ServicesWorker")
+            worker_pool_number_of_workers = number_of_workers
 
-    # Define a queue for getting the data from the processes.
-    queue1 = multiprocessing.Queue()
+        return worker_pool
 
-    # Generate processes and their argments (queue, process number for reordering the output, command per process).
-    process_list = [multiprocessing.Process(target=get_service_data_func, args=(queue1, i, unit_files_command_split[i]), daemon=True) for i in range(number_of_cpu_cores_used)]
 
-    # Start the processes.
-    for process in process_list:
-        process.start()
+def worker_pool_shutdown_func():
+    """
+    Stop worker threads. It is called when application is closed.
+    """
 
-    # Wait for processes to finish.
-    for process in process_list:
-        process.join()
+    global worker_pool, worker_pool_number_of_workers
 
-    # Get all the data in the queue (until it is empty).
-    queue_data_list = []
-    while queue1.empty() == False:
-        queue_data_list = queue_data_list + queue1.get()
+    with worker_pool_lock:
+        if worker_pool is not None:
+            worker_pool.shutdown(wait=True)
+            worker_pool = None
+            worker_pool_number_of_workers = 0
 
-    # Reorder the data by using the process numbers. Because processes may not be finish the works in the start order.
-    queue_data_list = sorted(queue_data_list)
 
-    # Merge the process data and obtain a single list.
+def start_processes_func(number_of_logical_cores, unit_files_command):
+    """
+    Split service list and run "systemctl show" commands at the same time by using worker threads.
+    """
+
+    # Get the required data. "+3" is used for getting number of services (after "systemctl show --property=..." parameters).
+    number_of_workers = services_number_of_cpu_cores_used_func(number_of_logical_cores)
+    number_of_services = len(unit_files_command) - (unit_files_command.index("systemctl") + 3)
+    number_of_commands = services_number_of_commands_func(number_of_workers, number_of_services)
+    unit_files_command_split = services_unit_files_command_split_func(number_of_commands, unit_files_command)
+
+    # Run the commands. Outputs are get in the same order with the commands.
     systemctl_show_command_lines = []
-    for data1 in queue_data_list:
-        for service in data1[1]:
-            systemctl_show_command_lines.append(service)
+    for systemctl_show_command_lines_split in worker_pool_get_func(number_of_workers).map(get_service_data_func, unit_files_command_split):
+        systemctl_show_command_lines.extend(systemctl_show_command_lines_split)
 
     return systemctl_show_command_lines
-
@@ -10,6 +10,7 @@ from locale import gettext as _tr
 from .Config import Config
 from .Performance import Performance
 from .MainWindow import MainWindow
+from .Scheduler import Scheduler
 from . import Common
 
 
@@ -25,7 +26,12 @@ class SettingsWindow:
                               "ru_RU.UTF-8":"Русский", "tr.UTF-8":"Türkçe", "zh_TW":"繁體中文"}
         self.gui_theme_dict = {"system":_tr("System"), "light":_tr("Light"), "dark":_tr("Dark")}
         self.update_interval_list = [0.5, 0.75, 1.0, 1.25, 1.5, 2.0, 3.0, 5.0, 10.0]
-        self.chart_data_history_list = [30, 60, 90, 120, 150, 180, 300, 600, 1200]
+        self.collector_update_interval_list = [-1, 0.5, 0.75, 1.0, 1.25, 1.5, 2.0, 3.0, 5.0, 10.0, 30.0, 60.0]
+        self.collector_name_dict = {"processes": _tr("Processes"), "users": _tr("Users"), "services": _tr("Services"),
+                                    "sensors": _tr("Sensors"), "disk_file_system": _tr("Disk") + " - " + _tr("File System"),
+                                    "network_connection": _tr("Network") + " - " + _tr("Connection"), "gpu": _tr("GPU")}
+        # Values which are longer than 1200 are drawn by using lower resolution values (10 second and 1 minute rollups) of the histories.
+        self.chart_data_history_list = [30, 60, 90, 120, 150, 180, 300, 600, 1200, 2400, 4800, 9600, 28800]
         self.default_main_tab_list = [_tr("Performance"), _tr("Processes"), _tr("Users"), _tr("Services"), _tr("System")]
         self.performance_tab_default_sub_tab_list = [_tr("Summary"), _tr("CPU"), _tr("Memory"), _tr("Disk"), _tr("Network"), _tr("GPU"), _tr("Sensors")]
 
@@ -153,20 +159,62 @@ class SettingsWindow:
         separator = Common.settings_window_separator()
         main_grid.attach(separator, 0, 14, 2, 1)
 
+        # CheckButton (Record performance history)
+        self.record_performance_history_cb = Common.checkbutton(_tr("Record performance history"), None)
+        main_grid.attach(self.record_performance_history_cb, 0, 15, 2, 1)
+
+        # CheckButton (Metrics exporter)
+        self.metrics_exporter_cb = Common.checkbutton(_tr("Serve metrics for Prometheus") + " (http://127.0.0.1:" + str(Config.metrics_exporter_port) + "/metrics)", None)
+        main_grid.attach(self.metrics_exporter_cb, 0, 16, 2, 1)
+
+        # CheckButton (Main loop watchdog)
+        self.main_loop_watchdog_cb = Common.checkbutton(_tr("Log main loop stalls"), None)
+        main_grid.attach(self.main_loop_watchdog_cb, 0, 17, 2, 1)
+
+        # Separator
+        separator = Common.settings_window_separator()
+        main_grid.attach(separator, 0, 18, 2, 1)
+
+        # Grid (Update intervals of the tabs)
+        collector_update_interval_grid = Gtk.Grid()
+        collector_update_interval_grid.set_column_spacing(3)
+        collector_update_interval_grid.set_row_spacing(3)
+        main_grid.attach(collector_update_interval_grid, 0, 19, 2, 1)
+        # Label (Update intervals of the tabs)
+        label = Common.static_information_label_no_ellipsize(_tr("Update intervals of the tabs (seconds)") + ":")
+        collector_update_interval_grid.attach(label, 0, 0, 2, 1)
+        # Label and DropDown (Update interval of a tab). First item is default update interval of the tab.
+        self.collector_update_interval_dd_list = []
+        for i, collector in enumerate(Scheduler.collector_list):
+            label = Common.static_information_label_no_ellipsize(self.collector_name_dict[collector] + ":")
+            collector_update_interval_grid.attach(label, 0, i + 1, 1, 1)
+            default_update_interval = Scheduler.collector_dict[collector]["update_interval"]
+            if default_update_interval == 0:
+                item_list = [_tr("Default") + " (" + _tr("Update interval") + ")"] + self.collector_update_interval_list[1:]
+            else:
+                item_list = [_tr("Default") + " (" + str(default_update_interval) + ")"] + self.collector_update_interval_list[1:]
+            dropdown = Common.dropdown_and_model(item_list)
+            collector_update_interval_grid.attach(dropdown, 1, i + 1, 1, 1)
+            self.collector_update_interval_dd_list.append(dropdown)
+
+        # Separator
+        separator = Common.settings_window_separator()
+        main_grid.attach(separator, 0, 20, 2, 1)
+
         # Button (Reset)
         self.reset_button = Common.reset_button()
-        main_grid.attach(self.reset_button, 0, 15, 2, 1)
+        main_grid.attach(self.reset_button, 0, 21, 2, 1)
 
         # Separator
         separator = Common.settings_window_separator()
-        main_grid.attach(separator, 0, 16, 2, 1)
+        main_grid.attach(separator, 0, 22, 2, 1)
 
         # Button (Reset all settings of the application)
         self.reset_all_settings_button = Gtk.Button()
         self.reset_all_settings_button.set_halign(Gtk.Align.CENTER)
         self.reset_all_settings_button.set_label(_tr("Reset all settings of the application"))
         self.reset_all_settings_button.add_css_class("destructive-action")
-        main_grid.attach(self.reset_all_settings_button, 0, 17, 2, 1)
+        main_grid.attach(self.reset_all_settings_button, 0, 23, 2, 1)
 
 
     def gui_signals(self):
@@ -197,6 +245,11 @@ class SettingsWindow:
         self.default_sub_tab_dd.connect("notify::selected-item", self.on_selected_item_notify)
         self.remember_last_selected_devices_cb.connect("toggled", self.on_remember_last_selected_devices_cb_toggled)
         self.remember_window_size_cb.connect("toggled", self.on_remember_window_size_cb_toggled)
+        self.record_performance_history_cb.connect("toggled", self.on_record_performance_history_cb_toggled)
+        self.metrics_exporter_cb.connect("toggled", self.on_metrics_exporter_cb_toggled)
+        self.main_loop_watchdog_cb.connect("toggled", self.on_main_loop_watchdog_cb_toggled)
+        for dropdown in self.collector_update_interval_dd_list:
+            dropdown.connect("notify::selected-item", self.on_selected_item_notify)
 
 
     def settings_disconnect_signals_func(self):
@@ -214,6 +267,11 @@ class SettingsWindow:
         self.default_sub_tab_dd.disconnect_by_func(self.on_selected_item_notify)
         self.remember_last_selected_devices_cb.disconnect_by_func(self.on_remember_last_selected_devices_cb_toggled)
         self.remember_window_size_cb.disconnect_by_func(self.on_remember_window_size_cb_toggled)
+        self.record_performance_history_cb.disconnect_by_func(self.on_record_performance_history_cb_toggled)
+        self.metrics_exporter_cb.disconnect_by_func(self.on_metrics_exporter_cb_toggled)
+        self.main_loop_watchdog_cb.disconnect_by_func(self.on_main_loop_watchdog_cb_toggled)
+        for dropdown in self.collector_update_interval_dd_list:
+            dropdown.disconnect_by_func(self.on_selected_item_notify)
 
 
     def on_settings_window_show(self, widget):
@@ -294,6 +352,12 @@ class SettingsWindow:
         if widget == self.default_sub_tab_dd:
             Config.performance_tab_default_sub_tab = widget.get_selected()
 
+        if widget in self.collector_update_interval_dd_list:
+            collector_update_intervals = list(Config.collector_update_intervals)
+            collector_update_intervals = collector_update_intervals + [-1] * (len(Scheduler.collector_list) - len(collector_update_intervals))
+            collector_update_intervals[self.collector_update_interval_dd_list.index(widget)] = self.collector_update_interval_list[widget.get_selected()]
+            Config.collector_update_intervals = collector_update_intervals
+
         Config.config_save_func()
 
         if widget == self.light_dark_theme_dd:
@@ -349,6 +413,59 @@ class SettingsWindow:
         Config.config_save_func()
 
 
+    def on_record_performance_history_cb_toggled(self, widget):
+        """
+        Enable/Disable recording performance data (CPU, memory, disk and network) to files.
+        """
+
+        if widget.get_active() == True:
+            Config.record_performance_history = 1
+        if widget.get_active() == False:
+            Config.record_performance_history = 0
+
+        Config.config_save_func()
+
+
+    def on_metrics_exporter_cb_toggled(self, widget):
+        """
+        Start/Stop serving metrics (performance, sensors, services and processes) on a local HTTP endpoint.
+        """
+
+        from .MetricsExporter import MetricsExporter
+
+        if widget.get_active() == True:
+            error_message = MetricsExporter.exporter_start_func()
+            # Setting is not enabled if server could not be started (for example, if the port is used by another application).
+            if error_message is not None:
+                widget.set_tooltip_text(error_message)
+                widget.set_active(False)
+                return
+            widget.set_tooltip_text(None)
+            Config.metrics_exporter = 1
+        if widget.get_active() == False:
+            MetricsExporter.exporter_stop_func()
+            Config.metrics_exporter = 0
+
+        Config.config_save_func()
+
+
+    def on_main_loop_watchdog_cb_toggled(self, widget):
+        """
+        Enable/Disable detecting main loop stalls and writing them into a log file.
+        """
+
+        from .Watchdog import Watchdog
+
+        if widget.get_active() == True:
+            Watchdog.watchdog_start_func()
+            Config.main_loop_watchdog = 1
+        if widget.get_active() == False:
+            Watchdog.watchdog_stop_func()
+            Config.main_loop_watchdog = 0
+
+        Config.config_save_func()
+
+
     def on_reset_button_clicked(self, widget):
         """
         Reset settings on the "Settings" window.
@@ -448,6 +565,12 @@ class SettingsWindow:
         self.light_dark_theme_dd.set_selected(list(self.gui_theme_dict.keys()).index(Config.light_dark_theme))
         self.update_interval_dd.set_selected(self.update_interval_list.index(Config.update_interval))
         self.graph_data_history_dd.set_selected(self.chart_data_history_list.index(Config.chart_data_history))
+        for i, dropdown in enumerate(self.collector_update_interval_dd_list):
+            try:
+                dropdown.set_selected(self.collector_update_interval_list.index(Config.collector_update_intervals[i]))
+            # Default update interval is selected if there is no value or value is not in the list (it may be changed in the config file).
+            except (IndexError, ValueError):
+                dropdown.set_selected(0)
 
         # Set GUI preferences for "show performance summary on the headerbar" setting
         if Config.performance_summary_on_the_headerbar == 1:
@@ -487,97 +610,71 @@ class SettingsWindow:
         if Config.remember_window_size[0] == 0:
             self.remember_window_size_cb.set_active(False)
 
+        # Set GUI preferences for "record performance history" setting
+        if Config.record_performance_history == 1:
+            self.record_performance_history_cb.set_active(True)
+        if Config.record_performance_history == 0:
+            self.record_performance_history_cb.set_active(False)
+
+        # Set GUI preferences for "metrics exporter" setting
+        if Config.metrics_exporter == 1:
+            self.metrics_exporter_cb.set_active(True)
+        if Config.metrics_exporter == 0:
+            self.metrics_exporter_cb.set_active(False)
+
+        # Set GUI preferences for "main loop watchdog" setting
+        if Config.main_loop_watchdog == 1:
+            self.main_loop_watchdog_cb.set_active(True)
+        if Config.main_loop_watchdog == 0:
+            self.main_loop_watchdog_cb.set_active(False)
+
 
     def settings_gui_set_chart_data_history_func(self):
         """
-        Trim/Add performance data lists (cpu_usage_percent_ave, ram_usage_percent, ...)
-        when "chart_data_history" preference is changed.
+        Resize performance data histories (cpu_usage_percent_ave, ram_usage_percent, ...)
+        when "chart_data_history" preference is changed. Newest values are kept.
+        Raw values of the histories are not longer than "MultiResolutionHistory.raw_length_max".
         """
 
-        # Get current chart_data_history length which is same for all performance data lists (cpu_usage_percent_ave, ram_usage_percent, ...).
-        chart_data_history_current = len(Performance.cpu_usage_percent_ave)
         chart_data_history_new = Config.chart_data_history
 
-        # Trim beginning part of the lists if new "chart_data_history" value is smaller than the old value.
-        if chart_data_history_current > chart_data_history_new:
-
-            length_difference = chart_data_history_current - chart_data_history_new
-
-            # "cpu_usage_percent_ave" list
-            Performance.cpu_usage_percent_ave = Performance.cpu_usage_percent_ave[length_difference:]
-
-            # "cpu_usage_percent_per_core" list
-            for device in Performance.logical_core_list:
-                Performance.cpu_usage_percent_per_core[device] = Performance.cpu_usage_percent_per_core[device][length_difference:]
-
-            # "ram_usage_percent" and "swap_usage_percent" lists
-            Performance.ram_usage_percent = Performance.ram_usage_percent[length_difference:]
-            Performance.swap_usage_percent = Performance.swap_usage_percent[length_difference:]
-
-            # "disk_read_speed" and "disk_write_speed" lists
-            for device in Performance.disk_list:
-                Performance.disk_read_speed[device] = Performance.disk_read_speed[device][length_difference:]
-                Performance.disk_write_speed[device] = Performance.disk_write_speed[device][length_difference:]
-
-            # "network_receive_speed" and "network_send_speed" lists
-            for device in Performance.network_card_list:
-                Performance.network_receive_speed[device] = Performance.network_receive_speed[device][length_difference:]
-                Performance.network_send_speed[device] = Performance.network_send_speed[device][length_difference:]
-
-            # "gpu_load_list" list
-            if MainWindow.gpu_tb.get_active() == True:
-                from .Gpu import Gpu
-                Gpu.gpu_load_list = Gpu.gpu_load_list[length_difference:]
-
-            # Process Details window CPU, memory (RSS), disk read speed and disk write speed lists
-            if MainWindow.processes_tab_main_grid.get_child_at(0,0) != None:
-                from . import ProcessesDetails
-                for process_details_object in ProcessesDetails.processes_details_object_list:
-                    process_details_object.process_cpu_usage_list = process_details_object.process_cpu_usage_list[length_difference:]
-                    process_details_object.process_ram_usage_list = process_details_object.process_ram_usage_list[length_difference:]
-                    process_details_object.process_disk_read_speed_list = process_details_object.process_disk_read_speed_list[length_difference:]
-                    process_details_object.process_disk_write_speed_list = process_details_object.process_disk_write_speed_list[length_difference:]
-
-        # Add list of zeroes to the beginning part of the lists if new "chart_data_history" value is bigger than the old value.
-        if chart_data_history_current < chart_data_history_new:
-
-            # Generate list of zeroes for adding to the beginning of te lists.
-            list_to_add = [0] * (chart_data_history_new - chart_data_history_current)
-
-            # "cpu_usage_percent_ave" list
-            Performance.cpu_usage_percent_ave = list_to_add + Performance.cpu_usage_percent_ave
-
-            # "cpu_usage_percent_per_core" list
-            for device in Performance.logical_core_list:
-                Performance.cpu_usage_percent_per_core[device] = list_to_add + Performance.cpu_usage_percent_per_core[device]
-
-            # "ram_usage_percent" and "swap_usage_percent" lists
-            Performance.ram_usage_percent = list_to_add + Performance.ram_usage_percent
-            Performance.swap_usage_percent = list_to_add + Performance.swap_usage_percent
-
-            # "disk_read_speed" and "disk_write_speed" lists
-            for device in Performance.disk_list:
-                Performance.disk_read_speed[device] = list_to_add + Performance.disk_read_speed[device]
-                Performance.disk_write_speed[device] = list_to_add + Performance.disk_write_speed[device]
-
-            # "network_receive_speed" and "network_send_speed" lists
-            for device in Performance.network_card_list:
-                Performance.network_receive_speed[device] = list_to_add + Performance.network_receive_speed[device]
-                Performance.network_send_speed[device] = list_to_add + Performance.network_send_speed[device]
-
-            # "gpu_load_list" list
-            if MainWindow.gpu_tb.get_active() == True:
-                from .Gpu import Gpu
-                Gpu.gpu_load_list = list_to_add + Gpu.gpu_load_list
-
-            # Process Details window CPU, memory (RSS), disk read speed and disk write speed lists
-            if MainWindow.processes_tab_main_grid.get_child_at(0,0) != None:
-                from . import ProcessesDetails
-                for process_details_object in ProcessesDetails.processes_details_object_list:
-                    process_details_object.process_cpu_usage_list = list_to_add + process_details_object.process_cpu_usage_list
-                    process_details_object.process_ram_usage_list = list_to_add + process_details_object.process_ram_usage_list
-                    process_details_object.process_disk_read_speed_list = list_to_add + process_details_object.process_disk_read_speed_list
-                    process_details_object.process_disk_write_speed_list = list_to_add + process_details_object.process_disk_write_speed_list
+        # Histories of the devices which are added after this change are generated by using new length.
+        Performance.chart_data_history = chart_data_history_new
+
+        # "cpu_usage_percent_ave" history
+        Performance.cpu_usage_percent_ave.resize(chart_data_history_new)
+
+        # "cpu_usage_percent_per_core" histories
+        for device in Performance.cpu_usage_percent_per_core:
+            Performance.cpu_usage_percent_per_core[device].resize(chart_data_history_new)
+
+        # "ram_usage_percent" and "swap_usage_percent" histories
+        Performance.ram_usage_percent.resize(chart_data_history_new)
+        Performance.swap_usage_percent.resize(chart_data_history_new)
+
+        # "disk_read_speed" and "disk_write_speed" histories
+        for device in Performance.disk_read_speed:
+            Performance.disk_read_speed[device].resize(chart_data_history_new)
+            Performance.disk_write_speed[device].resize(chart_data_history_new)
+
+        # "network_receive_speed" and "network_send_speed" histories
+        for device in Performance.network_receive_speed:
+            Performance.network_receive_speed[device].resize(chart_data_history_new)
+            Performance.network_send_speed[device].resize(chart_data_history_new)
+
+        # "gpu_load_list" history
+        if MainWindow.gpu_tb.get_active() == True:
+            from .Gpu import Gpu
+            Gpu.gpu_load_list.resize(chart_data_history_new)
+
+        # Process Details window CPU, memory (RSS), disk read speed and disk write speed histories
+        if MainWindow.processes_tab_main_grid.get_child_at(0,0) != None:
+            from . import ProcessesDetails
+            for process_details_object in ProcessesDetails.processes_details_object_list:
+                process_details_object.process_cpu_usage_list.resize(chart_data_history_new)
+                process_details_object.process_ram_usage_list.resize(chart_data_history_new)
+                process_details_object.process_disk_read_speed_list.resize(chart_data_history_new)
+                process_details_object.process_disk_write_speed_list.resize(chart_data_history_new)
 
 
     def settings_gui_apply_settings_immediately_func(self):
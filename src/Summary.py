@@ -2,8 +2,6 @@ import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk
 
-import os
-
 import cairo
 from math import sin, cos
 
@@ -12,6 +10,7 @@ from locale import gettext as _tr
 from .Config import Config
 from .Performance import Performance
 from . import Common
+from . import Procfs
 
 
 class Summary:
@@ -56,6 +55,15 @@ class Summary:
 
 
     def performance_summary_graph_draw(self, widget, ctx, width, height):
+        """
+        Draw performance summary data. Histories are not changed by the collector thread while they are drawn.
+        """
+
+        with Performance.history_lock:
+            self.performance_summary_graph_draw_func(widget, ctx, width, height)
+
+
+    def performance_summary_graph_draw_func(self, widget, ctx, width, height):
         """
         Draw performance summary data.
         """
@@ -71,12 +79,8 @@ class Summary:
         cpu_usage_text = f'{Performance.cpu_usage_percent_ave[-1]:.{performance_cpu_usage_percent_precision}f}'
         performance_memory_data_precision = 0
         ram_usage_text = f'{Performance.ram_usage_percent[-1]:.{performance_memory_data_precision}f}'
-        if Config.environment_type == "flatpak":
-            import subprocess
-            ls_proc_list = (subprocess.run(["flatpak-spawn", "--host", "ls", "/proc/"], shell=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)).stdout.decode().strip().split()
-            processes_number_text = f'{len([filename for filename in ls_proc_list if filename.isdigit()])}'
-        else:
-            processes_number_text = f'{len([filename for filename in os.listdir("/proc/") if filename.isdigit()])}'
+        # Number of processes is get from the process snapshot of the current loop instead of listing "/proc" folder in every draw.
+        processes_number_text = f'{len(Procfs.snapshot_pid_list())}'
         swap_usage_text = f'{Performance.swap_usage_percent[-1]:.0f}%'
         performance_disk_data_precision = 1
         performance_disk_data_unit = Config.performance_disk_data_unit
@@ -14,6 +14,7 @@ from locale import gettext as _tr
 from .Config import Config
 from .MainWindow import MainWindow
 from . import Common
+from . import Procfs
 
 
 class System:
@@ -709,18 +710,15 @@ class System:
         # Try to detect windowing system, window manager, current desktop 
         # environment and current display manager by reading process names and
         # other details.
-        command_list = ["ps", "--no-headers", "-eo", "comm,user"]
-        if Config.environment_type == "flatpak":
-            command_list = ["flatpak-spawn", "--host"] + command_list
-        ps_output_lines = (subprocess.run(command_list, shell=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)).stdout.decode().strip().split("\n")
+        # Process names and usernames are get from the process snapshot which is shared with other tabs and windows.
+        processes_information_dict, global_cpu_time_all = Procfs.processes_snapshot()
 
         process_name_list = []
         username_list = []
 
-        for line in ps_output_lines:
-            line_split = line.split()
-            process_name_list.append(line_split[0])
-            username_list.append(line_split[1])
+        for process_information in processes_information_dict.values():
+            process_name_list.append(process_information["name"])
+            username_list.append(process_information["username"])
 
         # Get current desktop environment information
         # "current_desktop_environment == "GNOME"" check is performed in order to
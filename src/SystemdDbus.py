@@ -0,0 +1,362 @@
+import gi
+gi.require_version('GLib', '2.0')
+gi.require_version('Gio', '2.0')
+from gi.repository import GLib, Gio
+
+import threading
+
+
+systemd_bus_name = "org.freedesktop.systemd1"
+systemd_object_path = "/org/freedesktop/systemd1"
+systemd_manager_interface = "org.freedesktop.systemd1.Manager"
+systemd_unit_interface = "org.freedesktop.systemd1.Unit"
+systemd_service_interface = "org.freedesktop.systemd1.Service"
+dbus_properties_interface = "org.freedesktop.DBus.Properties"
+
+# Properties of the "org.freedesktop.systemd1.Unit" interface which are shown on the Services tab.
+unit_property_list = ["LoadState", "ActiveState", "SubState", "UnitFileState", "Description"]
+
+# Properties which are updated by using "PropertiesChanged" signals (interface name is the key). systemd sends the signal
+# for every interface of a unit (for example, "org.freedesktop.systemd1.Service" and "org.freedesktop.systemd1.Socket")
+# and properties which have the same name in other interfaces are not used.
+tracked_interface_property_dict = {systemd_unit_interface: unit_property_list, systemd_service_interface: ["MainPID"]}
+
+# "MemoryCurrent" property value is "UINT64_MAX" if memory accounting is not enabled or service is not running.
+memory_current_not_set_value = 18446744073709551615
+
+
+class SystemdDbus:
+
+    def __init__(self):
+
+        # D-Bus address which is used instead of the system bus if it is set (for example, address of a
+        # "python-dbusmock" bus which provides a stand-in "org.freedesktop.systemd1" service for testing).
+        # "DBUS_SYSTEM_BUS_ADDRESS" environment variable can also be used for this purpose.
+        self.bus_address = None
+
+        self.connection = None
+        # "1" means that systemd could not be reached over D-Bus. "systemctl" command is used in this situation.
+        self.dbus_unavailable = 0
+        self.signal_subscription_id_list = []
+        # Signals are dispatched in a separate main context when service information is get. Thus service information
+        # is changed only by the thread which gets it (collector thread of the main window or the main thread).
+        # Lock prevents getting it in these threads at the same time.
+        self.signal_main_context = GLib.MainContext.new()
+        self.lock = threading.Lock()
+
+        # Service information (service name is the key). Values are updated by using the signals.
+        self.services_information_dict = {}
+        self.object_path_service_dict = {}
+        # Service list is get from zero if services are added/removed or unit files are changed.
+        self.service_list_changed = 1
+        # Properties of these services are get again on the next refresh.
+        self.services_changed_set = set()
+
+
+    def connect_func(self):
+        """
+        Connect to the bus, subscribe to systemd signals.
+        """
+
+        try:
+            if self.bus_address is None:
+                self.connection = Gio.bus_get_sync(Gio.BusType.SYSTEM, None)
+            else:
+                self.connection = Gio.DBusConnection.new_for_address_sync(self.bus_address,
+                                                                          Gio.DBusConnectionFlags.AUTHENTICATION_CLIENT | Gio.DBusConnectionFlags.MESSAGE_BUS_CONNECTION,
+                                                                          None, None)
+            # systemd sends "UnitNew", "UnitRemoved", etc. signals only to the subscribed clients.
+            self.connection.call_sync(systemd_bus_name, systemd_object_path, systemd_manager_interface, "Subscribe",
+                                      None, None, Gio.DBusCallFlags.NONE, -1, None)
+        except GLib.Error:
+            self.connection = None
+            self.dbus_unavailable = 1
+            return
+
+        self.signal_main_context.push_thread_default()
+        try:
+            self.signals_subscribe_func()
+        finally:
+            self.signal_main_context.pop_thread_default()
+
+
+    def signals_subscribe_func(self):
+        """
+        Subscribe to systemd signals. Signals are dispatched in the thread default main context.
+        """
+
+        self.signal_subscription_id_list = [
+            self.connection.signal_subscribe(systemd_bus_name, dbus_properties_interface, "PropertiesChanged", None, None,
+                                             Gio.DBusSignalFlags.NONE, self.on_properties_changed),
+            self.connection.signal_subscribe(systemd_bus_name, systemd_manager_interface, "UnitNew", systemd_object_path, None,
+                                             Gio.DBusSignalFlags.NONE, self.on_unit_new_removed),
+            self.connection.signal_subscribe(systemd_bus_name, systemd_manager_interface, "UnitRemoved", systemd_object_path, None,
+                                             Gio.DBusSignalFlags.NONE, self.on_unit_new_removed),
+            self.connection.signal_subscribe(systemd_bus_name, systemd_manager_interface, "UnitFilesChanged", systemd_object_path, None,
+                                             Gio.DBusSignalFlags.NONE, self.on_unit_files_changed),
+            self.connection.signal_subscribe(systemd_bus_name, systemd_manager_interface, "Reloading", systemd_object_path, None,
+                                             Gio.DBusSignalFlags.NONE, self.on_unit_files_changed)]
+
+
+    def disconnect_func(self):
+        """
+        Unsubscribe from the signals and forget service information.
+        Connection is established again on the next refresh.
+        """
+
+        if self.connection is not None:
+            for subscription_id in self.signal_subscription_id_list:
+                self.connection.signal_unsubscribe(subscription_id)
+        self.signal_subscription_id_list = []
+        self.connection = None
+        self.services_information_dict = {}
+        self.object_path_service_dict = {}
+        self.service_list_changed = 1
+        self.services_changed_set = set()
+
+
+    def on_properties_changed(self, connection, sender_name, object_path, interface_name, signal_name, parameters):
+        """
+        Update property values of a service by using the values in the signal.
+        Values of the properties which are invalidated (values are not sent) are get on the next refresh.
+        """
+
+        service = self.object_path_service_dict.get(object_path)
+        if service is None:
+            return
+
+        # Signal is subscribed for "org.freedesktop.DBus.Properties" interface ("interface_name"). Name of the interface
+        # of which properties are changed is in the signal parameters.
+        changed_interface_name, changed_properties, invalidated_properties = parameters.unpack()
+        tracked_property_list = tracked_interface_property_dict.get(changed_interface_name)
+        if tracked_property_list is None:
+            return
+
+        service_information = self.services_information_dict[service]
+        for property_name, value in changed_properties.items():
+            if property_name in tracked_property_list:
+                service_information[property_name] = value
+        for property_name in invalidated_properties:
+            if property_name in tracked_property_list:
+                self.services_changed_set.add(service)
+                break
+
+
+    def on_unit_new_removed(self, connection, sender_name, object_path, interface_name, signal_name, parameters):
+        """
+        Services which are instances of template services (such as "user@1000.service") are shown only if
+        they are loaded. Service list is get again if one of them is loaded/unloaded.
+        Other services are always shown (they are loaded/unloaded also when their properties are get) and
+        their changes are tracked by using "PropertiesChanged" signal.
+        """
+
+        unit_name, unit_object_path = parameters.unpack()
+        if unit_name.endswith(".service") == True and "@" in unit_name:
+            self.service_list_changed = 1
+
+
+    def on_unit_files_changed(self, connection, sender_name, object_path, interface_name, signal_name, parameters):
+        """
+        Get service list again if unit files are changed or systemd configuration is reloaded.
+        """
+
+        self.service_list_changed = 1
+
+
+    def calls_func(self, call_list):
+        """
+        Send method calls in a batch without waiting for replies of the previous calls and wait for all replies.
+        "call_list" contains (object path, interface name, method name, parameters) tuples.
+        Returns a list of unpacked replies ("None" for calls which are failed).
+        """
+
+        results = [None] * len(call_list)
+        number_of_pending_calls = len(call_list)
+
+        def on_call_finished(connection, result, index):
+            nonlocal number_of_pending_calls
+            try:
+                results[index] = connection.call_finish(result).unpack()
+            except GLib.Error:
+                pass
+            number_of_pending_calls = number_of_pending_calls - 1
+
+        # A separate main context is used for getting the replies. Otherwise, replies are
+        # dispatched by the main loop of the application after the current function is finished.
+        main_context = GLib.MainContext.new()
+        main_context.push_thread_default()
+        try:
+            for index, (object_path, interface_name, method_name, parameters) in enumerate(call_list):
+                self.connection.call(systemd_bus_name, object_path, interface_name, method_name, parameters, None,
+                                     Gio.DBusCallFlags.NONE, -1, None, on_call_finished, index)
+            while number_of_pending_calls > 0:
+                main_context.iteration(True)
+        finally:
+            main_context.pop_thread_default()
+
+        return results
+
+
+    def manager_call_func(self, method_name, parameters):
+        """
+        Call a method of systemd manager and get the unpacked reply.
+        """
+
+        return self.connection.call_sync(systemd_bus_name, systemd_object_path, systemd_manager_interface, method_name,
+                                         parameters, None, Gio.DBusCallFlags.NONE, -1, None).unpack()
+
+
+    def service_list_get_func(self):
+        """
+        Get service list and properties of all services.
+        Services from unit files and loaded instances of template services are listed.
+        """
+
+        # Get service unit files. "ListUnitFiles" is used on older systemd versions which do not have "ListUnitFilesByPatterns".
+        try:
+            unit_file_list = self.manager_call_func("ListUnitFilesByPatterns", GLib.Variant("(asas)", ([], ["*.service"])))[0]
+        except GLib.Error:
+            unit_file_list = [unit_file for unit_file in self.manager_call_func("ListUnitFiles", None)[0] if unit_file[0].endswith(".service")]
+
+        # Aliases (links to other service files) are not shown.
+        template_service_prefix_set = set()
+        service_list = []
+        for unit_file_path, unit_file_state in unit_file_list:
+            service = unit_file_path.split("/")[-1]
+            if unit_file_state == "alias":
+                continue
+            if "@" in service:
+                template_service_prefix_set.add(service.split("@")[0])
+                continue
+            service_list.append(service)
+
+        # Get loaded units. Their properties are get in the same reply.
+        # Reply fields: name, description, load state, active state, sub state, followed unit, object path, job ID, job type, job object path.
+        loaded_unit_dict = {}
+        for unit in self.manager_call_func("ListUnits", None)[0]:
+            if unit[0].endswith(".service"):
+                loaded_unit_dict[unit[0]] = unit
+                if "@" in unit[0] and unit[0].split("@")[0] in template_service_prefix_set:
+                    service_list.append(unit[0])
+        service_list = sorted(set(service_list))
+
+        self.services_information_dict = {}
+        self.object_path_service_dict = {}
+        not_loaded_service_list = []
+        for service in service_list:
+            unit = loaded_unit_dict.get(service)
+            if unit is None:
+                not_loaded_service_list.append(service)
+                continue
+            self.services_information_dict[service] = {"LoadState": unit[2], "ActiveState": unit[3], "SubState": unit[4],
+                                                       "UnitFileState": "", "Description": unit[1], "MainPID": 0,
+                                                       "MemoryCurrent": memory_current_not_set_value}
+            self.object_path_service_dict[unit[6]] = service
+
+        # Get object paths of the services which are not loaded. systemd loads them temporarily (as "systemctl show" command does).
+        for service, reply in zip(not_loaded_service_list, self.calls_func([(systemd_object_path, systemd_manager_interface, "LoadUnit", GLib.Variant("(s)", (service,)))
+                                                                           for service in not_loaded_service_list])):
+            if reply is None:
+                continue
+            self.services_information_dict[service] = {"LoadState": "", "ActiveState": "", "SubState": "", "UnitFileState": "",
+                                                       "Description": "", "MainPID": 0, "MemoryCurrent": memory_current_not_set_value}
+            self.object_path_service_dict[reply[0]] = service
+
+        # Get all unit properties (including unit file state which is not in "ListUnits" reply) of all services.
+        self.services_changed_set = set(self.services_information_dict.keys())
+        self.service_list_changed = 0
+
+
+    def services_properties_get_func(self, service_list, get_memory):
+        """
+        Get properties of the services in a batch.
+        Values of the "org.freedesktop.systemd1.Service" interface properties are get only for
+        active services because they do not have main PID and memory values if they are not active.
+        """
+
+        service_object_path_dict = {service: object_path for object_path, service in self.object_path_service_dict.items()}
+
+        call_list = []
+        for service in service_list:
+            call_list.append((service_object_path_dict[service], dbus_properties_interface, "GetAll", GLib.Variant("(s)", (systemd_unit_interface,))))
+        for service, reply in zip(service_list, self.calls_func(call_list)):
+            if reply is None:
+                continue
+            service_information = self.services_information_dict[service]
+            for property_name in unit_property_list:
+                if property_name in reply[0]:
+                    service_information[property_name] = reply[0][property_name]
+
+        # Main PID is updated by using the signals. Memory values are not sent by systemd in the signals and they are get on every refresh.
+        active_service_list = [service for service in self.services_information_dict if self.services_information_dict[service]["ActiveState"] in ["active", "reloading", "activating", "deactivating"]]
+        call_list = []
+        call_service_list = []
+        for service in active_service_list:
+            if service in service_list:
+                call_list.append((service_object_path_dict[service], dbus_properties_interface, "Get", GLib.Variant("(ss)", (systemd_service_interface, "MainPID"))))
+                call_service_list.append((service, "MainPID"))
+            if get_memory == True:
+                call_list.append((service_object_path_dict[service], dbus_properties_interface, "Get", GLib.Variant("(ss)", (systemd_service_interface, "MemoryCurrent"))))
+                call_service_list.append((service, "MemoryCurrent"))
+        for (service, property_name), reply in zip(call_service_list, self.calls_func(call_list)):
+            if reply is not None:
+                self.services_information_dict[service][property_name] = reply[0]
+
+        # Services which are not active do not have main PID and memory values.
+        for service, service_information in self.services_information_dict.items():
+            if service_information["ActiveState"] not in ["active", "reloading", "activating", "deactivating"]:
+                service_information["MainPID"] = 0
+                service_information["MemoryCurrent"] = memory_current_not_set_value
+
+
+    def services_information_func(self, get_memory=True):
+        """
+        Get information of all services. Only changed services are processed after the first call.
+        Returns a dictionary (service name is the key) or "None" if systemd could not be reached over D-Bus.
+        "MemoryCurrent" value is "-9999" if memory value is not set (as it is used by the Services tab).
+        """
+
+        with self.lock:
+            services_information_dict = self.services_information_get_func(get_memory)
+
+        return services_information_dict
+
+
+    def services_information_get_func(self, get_memory):
+        """
+        Update service information by using the received signals and by getting information of the changed services.
+        """
+
+        if self.connection is None:
+            if self.dbus_unavailable == 1:
+                return None
+            self.connect_func()
+            if self.connection is None:
+                return None
+
+        # Dispatch signals which are received since the previous call.
+        while self.signal_main_context.iteration(False) == True:
+            pass
+
+        try:
+            if self.service_list_changed == 1:
+                self.service_list_get_func()
+            services_changed_list = sorted(self.services_changed_set)
+            self.services_changed_set = set()
+            self.services_properties_get_func(services_changed_list, get_memory)
+        except GLib.Error:
+            # Connection may be closed (for example, if systemd is restarted). It is connected again on the next refresh.
+            self.disconnect_func()
+            return None
+
+        services_information_dict = {}
+        for service, service_information in self.services_information_dict.items():
+            service_information = dict(service_information)
+            if service_information["MemoryCurrent"] == memory_current_not_set_value:
+                service_information["MemoryCurrent"] = -9999
+            services_information_dict[service] = service_information
+
+        return services_information_dict
+
+
+SystemdDbus = SystemdDbus()
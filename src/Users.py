@@ -8,8 +8,6 @@ gi.require_version('Pango', '1.0')
 from gi.repository import Gtk, Gdk, GLib, GObject, Gio, Pango
 
 import os
-import time
-import subprocess
 from datetime import datetime
 
 from locale import gettext as _tr
@@ -17,6 +15,8 @@ from locale import gettext as _tr
 from .Config import Config
 from .MainWindow import MainWindow
 from . import Common
+from . import Procfs
+from .Diagnostics import Diagnostics
 
 
 class Users:
@@ -254,10 +254,11 @@ class Users:
                           ]
 
         global users_data_rows_prev, users_treeview_columns_shown_prev, users_data_row_sorting_column_prev, users_data_row_sorting_order_prev, users_data_column_order_prev, users_data_column_widths_prev
-        global pid_list_prev, global_process_cpu_times_prev, uid_username_list_prev
+        global pid_list_prev, global_process_cpu_times_prev, snapshot_global_cpu_time_all_prev, uid_username_list_prev
         users_data_rows_prev = []
         pid_list_prev = []
-        global_process_cpu_times_prev = []
+        global_process_cpu_times_prev = {}
+        snapshot_global_cpu_time_all_prev = 0
         uid_username_list_prev = []                                                               # For tracking new/removed (from treeview) user data rows
         users_treeview_columns_shown_prev = []
         users_data_row_sorting_column_prev = ""
@@ -307,9 +308,9 @@ class Users:
         users_data_column_widths = Config.users_data_column_widths
 
         # Define global variables and empty lists for the current loop
-        global users_data_rows, users_data_rows_prev, global_process_cpu_times_prev, pid_list, pid_list_prev, uid_username_list_prev, uid_username_list
+        global users_data_rows, users_data_rows_prev, global_process_cpu_times_prev, snapshot_global_cpu_time_all_prev, pid_list, pid_list_prev, uid_username_list_prev, uid_username_list
         users_data_rows = []
-        global_process_cpu_times = []
+        global_process_cpu_times = {}
         uid_username_list = []                                                                    # For tracking new/removed user data rows. User UID and username information is appended per user. Because tracking only user UID and username may cause confusions. User UID may be given another user after a time if a user is deleted.
 
         # Get number of online logical CPU cores (this operation is repeated in every loop because number of online CPU cores may be changed by user and this may cause wrong calculation of CPU usage percent data of the processes even if this is a very rare situation.)
@@ -318,54 +319,32 @@ class Users:
         # Get all users and user groups.
         etc_passwd_lines, user_group_names, user_group_ids = self.users_groups_func()
 
-        # Get all user process PIDs and elapsed times (seconds) since they are started.
-        command_list = ["ps", "--no-headers", "-eo", "pid,etimes,user"]
-        if Config.environment_type == "flatpak":
-            command_list = ["flatpak-spawn", "--host"] + command_list
-        ps_output_lines = (subprocess.check_output(command_list, shell=False)).decode().strip().split("\n")
+        # Get all user process PIDs, usernames and start times from the process snapshot which is shared with other tabs and windows.
+        processes_information_dict, global_cpu_time_all = Procfs.processes_snapshot()
 
-        # Get user process PIDs, logged in users and user start times.
+        # Get user process PIDs, logged in users and user process start times (in seconds since epoch).
         pid_list = []
         user_processes_start_times = []
         logged_in_users_list = []
-        for line in ps_output_lines:
-            line_split = line.split()
-            pid_list.append(line_split[0])
-            user_processes_start_times.append(int(line_split[1]))
-            logged_in_users_list.append(line_split[-1])
+        for pid, process_information in processes_information_dict.items():
+            pid_list.append(pid)
+            user_processes_start_times.append(system_boot_time + process_information["start_time"] / number_of_clock_ticks)
+            logged_in_users_list.append(process_information["username"])
 
         # Get CPU usage percent of all processes
         if 10 in users_treeview_columns_shown:
-            command_list = ["cat"]
-            if Config.environment_type == "flatpak":
-                command_list = ["flatpak-spawn", "--host"] + command_list
-            for pid in pid_list:
-                command_list.append("/proc/" + pid + "/stat")
-            cat_output_lines = (subprocess.run(command_list, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=False)).stdout.decode().strip().split("\n")
-            global_cpu_time_all = time.time() * number_of_clock_ticks                             # global_cpu_time_all value is get just after "/proc/[PID]/stat file is get in order to measure global an process specific CPU times at the same time (nearly) for ensuring accurate process CPU usage percent.
             all_process_cpu_usages = []
-            pid_list_from_stat = []
-            for line in cat_output_lines:
-                line_split = line.split()
-                process_pid = line_split[0]
-                pid_list_from_stat.append(process_pid)
-                process_cpu_time = int(line_split[-39]) + int(line_split[-38])                    # Get process cpu time in user mode (utime + stime)
-                global_process_cpu_times.append((global_cpu_time_all, process_cpu_time))          # While appending multiple elements into a list "append((value1, value2))" is faster than "append([value1, value2])".
-                try:                                                                              # It gives various errors (ValueError, IndexError, UnboundLocalError) if a new process is started, a new column is shown on the treeview, etc because previous CPU time values are not present in these situations. Following CPU time values are use in these situations.
-                    global_cpu_time_all_prev, process_cpu_time_prev = global_process_cpu_times_prev[pid_list_prev.index(process_pid)]
-                except (ValueError, IndexError, UnboundLocalError) as me:
+            for pid in pid_list:
+                process_cpu_time = processes_information_dict[pid]["cpu_time"]
+                global_process_cpu_times[pid] = (global_cpu_time_all, process_cpu_time)
+                try:                                                                              # It gives "KeyError" if a new process is started, a new column is shown on the treeview, etc because previous CPU time values are not present in these situations. Following CPU time values are use in these situations.
+                    global_cpu_time_all_prev, process_cpu_time_prev = global_process_cpu_times_prev[pid]
+                except KeyError:
                     process_cpu_time_prev = process_cpu_time                                      # There is no "process_cpu_time_prev" value and get it from "process_cpu_time"  if this is first loop of the process
-                    global_cpu_time_all_prev = global_process_cpu_times[-1][0] - 1                # Subtract "1" CPU time (a negligible value) if this is first loop of the process
+                    global_cpu_time_all_prev = global_cpu_time_all - 1                            # Subtract "1" CPU time (a negligible value) if this is first loop of the process
                 process_cpu_time_difference = process_cpu_time - process_cpu_time_prev
                 global_cpu_time_difference = global_cpu_time_all - global_cpu_time_all_prev
                 all_process_cpu_usages.append(process_cpu_time_difference / global_cpu_time_difference * 100 / number_of_logical_cores)
-            for pid in pid_list[:]:
-                index_to_remove = pid_list.index(pid)
-                if pid not in pid_list_from_stat:
-                    del pid_list[index_to_remove]
-                    del user_processes_start_times[index_to_remove]
-                    del logged_in_users_list[index_to_remove]
-                continue
 
         # Get only logged in human user list.
         user_logged_in_list = []
@@ -430,7 +409,7 @@ class Users:
                     if curent_user_process_start_time_list == []:
                         user_process_start_time = 0
                     else:
-                        user_process_start_time = time.time() - max(curent_user_process_start_time_list)
+                        user_process_start_time = min(curent_user_process_start_time_list)
                     users_data_row.append(user_process_start_time)
                 # Get user processes CPU usage percentages
                 if 10 in users_treeview_columns_shown:
@@ -442,7 +421,10 @@ class Users:
                 # Append all data of the users into a list which will be appended into a treestore for showing the data on a treeview.
                 users_data_rows.append(users_data_row)
         pid_list_prev = pid_list                                                                  # For using values in the next loop
-        global_process_cpu_times_prev = global_process_cpu_times                                  # For using values in the next loop
+        # Previous CPU times are not changed if the process snapshot is not refreshed since the previous loop. Otherwise CPU usage values could not be calculated.
+        if global_cpu_time_all != snapshot_global_cpu_time_all_prev:
+            global_process_cpu_times_prev = global_process_cpu_times
+            snapshot_global_cpu_time_all_prev = global_cpu_time_all
 
         # Add/Remove treeview columns appropriate for user preferences
         if users_treeview_columns_shown != users_treeview_columns_shown_prev:                     # Remove all columns, redefine treestore and models, set treestore data types (str, int, etc) if column numbers are changed. Because once treestore data types (str, int, etc) are defined, they can not be changed anymore. Thus column (internal data) order and column treeview column addition/removal can not be performed.
@@ -557,9 +539,11 @@ class Users:
             return
         # Append/Remove/Update users data into treestore
         global user_search_text
+        updated_user_count = 0
         if len(self.piter_list) > 0:
             for i, j in updated_existing_user_index:
                 if users_data_rows[i] != users_data_rows_prev[j]:
+                    updated_user_count = updated_user_count + 1
                     for k in range(1, users_data_rows_row_length):                                 # Start from "1" in order to set first element (treeview row visibility data) as "True" in every loop.
                         if users_data_rows_prev[j][k] != users_data_rows[i][k]:
                             self.treestore.set_value(self.piter_list[j], k, users_data_rows[i][k])
@@ -572,6 +556,7 @@ class Users:
             for i, user in enumerate(new_users):
                 self.piter_list.append(self.treestore.append(None, users_data_rows[uid_username_list.index(list(user))]))
             self.on_searchentry_changed(self.searchentry)                                          # Update search results.
+        Diagnostics.counter_add_func("Model rows changed", updated_user_count + len(deleted_users) + len(new_users))
 
         uid_username_list_prev = uid_username_list
         users_data_rows_prev = users_data_rows
@@ -4,8 +4,6 @@ gi.require_version('GLib', '2.0')
 from gi.repository import Gtk, GLib
 
 import os
-import time
-import subprocess
 from datetime import datetime
 
 from locale import gettext as _tr
@@ -15,6 +13,7 @@ from .Users import Users
 from .Performance import Performance
 from .MainWindow import MainWindow
 from . import Common
+from . import Procfs
 
 
 class UsersDetails:
@@ -214,8 +213,8 @@ class UsersDetails:
         Initial code which which is not wanted to be run in every loop.
         """
 
-        self.pid_list_prev = []
-        self.global_process_cpu_times_prev = []
+        self.global_process_cpu_times_prev = {}
+        self.snapshot_global_cpu_time_all_prev = 0
 
         self.system_boot_time = Users.system_boot_time
         self.number_of_clock_ticks = Users.number_of_clock_ticks
@@ -237,58 +236,37 @@ class UsersDetails:
         self.user_details_window.set_title(_tr("User") + ": " + selected_username)
 
         # Define empty lists for the current loop
-        global_process_cpu_times = []
+        global_process_cpu_times = {}
 
         # Get all users and user groups.
         etc_passwd_lines, user_group_names, user_group_ids = Users.users_groups_func()
 
-        # Get all user process PIDs and elapsed times (seconds) since they are started.
-        command_list = ["ps", "--no-headers", "-eo", "pid,etimes,user"]
-        if Config.environment_type == "flatpak":
-            command_list = ["flatpak-spawn", "--host"] + command_list
-        ps_output_lines = (subprocess.run(command_list, shell=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)).stdout.decode().strip().split("\n")
+        # Get all user process PIDs, usernames and start times from the process snapshot which is shared with other tabs and windows.
+        processes_information_dict, global_cpu_time_all = Procfs.processes_snapshot()
 
-        # Get user process PIDs, logged in users and user start times.
+        # Get user process PIDs, logged in users and user process start times (in seconds since epoch).
         pid_list = []
         user_processes_start_times = []
         logged_in_users_list = []
-        for line in ps_output_lines:
-            line_split = line.split()
-            pid_list.append(line_split[0])
-            user_processes_start_times.append(int(line_split[1]))
-            logged_in_users_list.append(line_split[-1])
+        for pid, process_information in processes_information_dict.items():
+            pid_list.append(pid)
+            user_processes_start_times.append(self.system_boot_time + process_information["start_time"] / self.number_of_clock_ticks)
+            logged_in_users_list.append(process_information["username"])
 
         # Get CPU usage percent of all processes
-        command_list = ["cat"]
-        if Config.environment_type == "flatpak":
-            command_list = ["flatpak-spawn", "--host"] + command_list
-        for pid in pid_list:
-            command_list.append("/proc/" + pid + "/stat")
-        cat_output_lines = (subprocess.run(command_list, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=False)).stdout.decode().strip().split("\n")
-        global_cpu_time_all = time.time() * self.number_of_clock_ticks                             # global_cpu_time_all value is get just after "/proc/[PID]/stat file is get in order to measure global an process specific CPU times at the same time (nearly) for ensuring accurate process CPU usage percent.
         all_process_cpu_usages = []
-        pid_list_from_stat = []
-        for line in cat_output_lines:
-            line_split = line.split()
-            process_pid = line_split[0]
-            pid_list_from_stat.append(process_pid)
-            process_cpu_time = int(line_split[-39]) + int(line_split[-38])                    # Get process cpu time in user mode (utime + stime)
-            global_process_cpu_times.append((global_cpu_time_all, process_cpu_time))          # While appending multiple elements into a list "append((value1, value2))" is faster than "append([value1, value2])".
-            try:                                                                              # It gives various errors (ValueError, IndexError, UnboundLocalError) if a new process is started, a new column is shown on the treeview, etc because previous CPU time values are not present in these situations. Following CPU time values are use in these situations.
-                global_cpu_time_all_prev, process_cpu_time_prev = self.global_process_cpu_times_prev[self.pid_list_prev.index(process_pid)]
-            except (ValueError, IndexError, UnboundLocalError) as me:
-                process_cpu_time_prev = process_cpu_time                                      # There is no "process_cpu_time_prev" value and get it from "process_cpu_time"  if this is first loop of the process
-                global_cpu_time_all_prev = global_process_cpu_times[-1][0] - 1                # Subtract "1" CPU time (a negligible value) if this is first loop of the process
+        number_of_logical_cores = Common.number_of_logical_cores()
+        for pid in pid_list:
+            process_cpu_time = processes_information_dict[pid]["cpu_time"]
+            global_process_cpu_times[pid] = (global_cpu_time_all, process_cpu_time)
+            try:                                                                                  # It gives "KeyError" if a new process is started because previous CPU time values are not present in this situation. Following CPU time values are use in this situation.
+                global_cpu_time_all_prev, process_cpu_time_prev = self.global_process_cpu_times_prev[pid]
+            except KeyError:
+                process_cpu_time_prev = process_cpu_time                                          # There is no "process_cpu_time_prev" value and get it from "process_cpu_time"  if this is first loop of the process
+                global_cpu_time_all_prev = global_cpu_time_all - 1                                # Subtract "1" CPU time (a negligible value) if this is first loop of the process
             process_cpu_time_difference = process_cpu_time - process_cpu_time_prev
             global_cpu_time_difference = global_cpu_time_all - global_cpu_time_all_prev
-            all_process_cpu_usages.append(process_cpu_time_difference / global_cpu_time_difference * 100 / Common.number_of_logical_cores())
-        for pid in pid_list[:]:
-            index_to_remove = pid_list.index(pid)
-            if pid not in pid_list_from_stat:
-                del pid_list[index_to_remove]
-                del user_processes_start_times[index_to_remove]
-                del logged_in_users_list[index_to_remove]
-            continue
+            all_process_cpu_usages.append(process_cpu_time_difference / global_cpu_time_difference * 100 / number_of_logical_cores)
 
         # Get only logged in human user list.
         user_logged_in_list = []
@@ -348,7 +326,7 @@ class UsersDetails:
                 if curent_user_process_start_time_list == []:
                     selected_user_process_start_time = 0
                 else:
-                    selected_user_process_start_time = time.time() - max(curent_user_process_start_time_list)
+                    selected_user_process_start_time = min(curent_user_process_start_time_list)
 
                 # Get user processes CPU usage percentages
                 selected_user_cpu_percent = 0
@@ -357,8 +335,10 @@ class UsersDetails:
                         selected_user_cpu_percent = selected_user_cpu_percent + all_process_cpu_usages[pid_list.index(pid)]
 
         # For using values in the next loop
-        self.pid_list_prev = pid_list
-        self.global_process_cpu_times_prev = global_process_cpu_times
+        # Previous CPU times are not changed if the process snapshot is not refreshed since the previous loop. Otherwise CPU usage values could not be calculated.
+        if global_cpu_time_all != self.snapshot_global_cpu_time_all_prev:
+            self.global_process_cpu_times_prev = global_process_cpu_times
+            self.snapshot_global_cpu_time_all_prev = global_cpu_time_all
 
         # It gives "UnboundLocalError" error if "User Details" window is closed. The value is checked and window is closed in order to avoid errors.
         try:
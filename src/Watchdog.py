@@ -0,0 +1,153 @@
+import gi
+gi.require_version('GLib', '2.0')
+from gi.repository import GLib
+
+import os
+import sys
+import time
+import threading
+import traceback
+import collections
+
+from .Diagnostics import Diagnostics
+from .Collector import Collector
+
+
+class Watchdog:
+
+    def __init__(self):
+
+        # Main loop (GTK) is blocked if a function which is run on the main thread takes a long time (for example, a slow command
+        # or rebuilding a treestore which has thousands of rows). GUI does not respond during this time. A heartbeat function is
+        # run on the main loop in short intervals and its time is checked by the watchdog thread. If there is no heartbeat for
+        # longer than the threshold, stack of the main thread and the collector/loop function which is being run are captured.
+        # Stalls are written into a log file (old log is kept as ".1" file when size limit is reached) and kept in memory.
+        self.heartbeat_interval = 0.2
+        self.stall_threshold = 0.5
+        self.heartbeat_time = None
+        self.heartbeat_source_id = None
+        self.watchdog_thread = None
+        self.stop_event = threading.Event()
+        self.main_thread_id = threading.main_thread().ident
+
+        self.stall_list = collections.deque(maxlen=50)
+        self.stall_log_path = os.environ.get("XDG_STATE_HOME", os.environ.get("HOME", "") + "/.local/state") + "/system-monitoring-center/stalls.log"
+        self.stall_log_size_max = 1048576
+
+
+    def watchdog_start_func(self):
+        """
+        Start the heartbeat function on the main loop and the watchdog thread.
+        """
+
+        if self.watchdog_thread is not None:
+            return
+
+        self.heartbeat_time = time.monotonic()
+        self.heartbeat_source_id = GLib.timeout_add(int(self.heartbeat_interval * 1000), self.heartbeat_func)
+        self.stop_event.clear()
+        self.watchdog_thread = threading.Thread(target=self.watchdog_thread_func, name="main-loop-watchdog", daemon=True)
+        self.watchdog_thread.start()
+
+
+    def watchdog_stop_func(self):
+        """
+        Stop the heartbeat function and the watchdog thread.
+        """
+
+        if self.watchdog_thread is None:
+            return
+
+        GLib.source_remove(self.heartbeat_source_id)
+        self.heartbeat_source_id = None
+        self.stop_event.set()
+        self.watchdog_thread.join()
+        self.watchdog_thread = None
+
+
+    def heartbeat_func(self):
+        """
+        Save time of the heartbeat. This function is run on the main loop.
+        """
+
+        self.heartbeat_time = time.monotonic()
+
+        return True
+
+
+    def watchdog_thread_func(self):
+        """
+        Check heartbeats of the main loop. Thread waits until the time which a stall is detected if there is no heartbeat
+        (it does not wake up in short intervals). Stall information is captured during the stall and it is logged with its duration
+        when the main loop runs again.
+        """
+
+        stall = None
+        while True:
+            heartbeat_time = self.heartbeat_time
+            if stall is None:
+                wait_time = heartbeat_time + self.heartbeat_interval + self.stall_threshold - time.monotonic()
+            else:
+                wait_time = self.heartbeat_interval
+            if self.stop_event.wait(max(wait_time, 0.01)) == True:
+                break
+
+            if stall is not None:
+                # Stall is ended when there is a new heartbeat.
+                if self.heartbeat_time != stall["heartbeat_time"]:
+                    stall["duration"] = self.heartbeat_time - stall["heartbeat_time"] - self.heartbeat_interval
+                    self.stall_log_func(stall)
+                    stall = None
+                continue
+
+            if self.heartbeat_time == heartbeat_time and time.monotonic() - heartbeat_time - self.heartbeat_interval > self.stall_threshold:
+                stall = self.stall_capture_func(heartbeat_time)
+
+
+    def stall_capture_func(self, heartbeat_time):
+        """
+        Get stack of the main thread and names of the collector/loop functions which are being run by the main thread and the collector thread.
+        """
+
+        main_thread_frame = sys._current_frames().get(self.main_thread_id)
+        if main_thread_frame is not None:
+            stack_line_list = traceback.format_stack(main_thread_frame)
+        else:
+            stack_line_list = []
+        collector_thread_name = None
+        if Collector.worker_thread is not None:
+            collector_thread_name = Diagnostics.running_name_dict.get(Collector.worker_thread.ident)
+
+        return {"time": time.time() - (time.monotonic() - heartbeat_time - self.heartbeat_interval),
+                "heartbeat_time": heartbeat_time,
+                "main_thread_name": Diagnostics.running_name_dict.get(self.main_thread_id),
+                "collector_thread_name": collector_thread_name,
+                "collection_running": Collector.collection_running,
+                "stack": "".join(stack_line_list)}
+
+
+    def stall_log_func(self, stall):
+        """
+        Keep the stall in the stall list and write it into the log file.
+        """
+
+        self.stall_list.append(stall)
+        Diagnostics.counter_add_func("Main loop stalls")
+
+        log_text = f'{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(stall["time"]))} Main loop stall: {stall["duration"] * 1000:.0f} ms\n' + \
+                   f'Main thread: {stall["main_thread_name"] or "-"}, collector thread: {stall["collector_thread_name"] or "-"} ' + \
+                   f'(collection running: {stall["collection_running"]})\n' + \
+                   f'Stack of the main thread:\n{stall["stack"]}\n'
+
+        try:
+            os.makedirs(os.path.dirname(self.stall_log_path), exist_ok=True)
+            if os.path.isfile(self.stall_log_path) == True and os.path.getsize(self.stall_log_path) > self.stall_log_size_max:
+                os.replace(self.stall_log_path, self.stall_log_path + ".1")
+            with open(self.stall_log_path, "a") as writer:
+                writer.write(log_text)
+        # Prevent errors if log file could not be written. Stall is kept in the stall list.
+        except OSError:
+            pass
+
+
+Watchdog = Watchdog()
@@ -8,6 +8,14 @@ parent_dir = '/'.join(current_path[:-1])
 current_folder = current_path[-1]
 sys.path.append(parent_dir)
 
+# Headless mode does not import GTK.
+if "--headless" in sys.argv[1:]:
+    if current_folder == "src":
+        from src import Headless
+    if current_folder == "systemmonitoringcenter":
+        from systemmonitoringcenter import Headless
+    sys.exit(Headless.main(sys.argv[1:]))
+
 if current_folder == "src":
     from src import Main
 if current_folder == "systemmonitoringcenter":
@@ -0,0 +1,105 @@
+import time
+import tempfile
+import unittest
+
+from src.MetricStore import MetricStore
+
+
+class MetricStoreTestCase(unittest.TestCase):
+
+    def setUp(self):
+
+        # A separate store which uses a temporary folder and small ring files is used for every test.
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.metric_store = type(MetricStore)()
+        self.metric_store.store_folder_path = self.temporary_directory.name + "/metrics/"
+        self.metric_store.capacity = 10
+
+
+    def tearDown(self):
+
+        for family_data in self.metric_store.family_dict.values():
+            family_data["records"].release()
+            family_data["mmap"].close()
+        self.temporary_directory.cleanup()
+
+
+    def series_value_list_func(self, family, series_name):
+        """
+        Get all recorded values of a series in oldest-to-newest order.
+        """
+
+        value_list = []
+        for times, values in self.metric_store.series_values_func(family, series_name):
+            value_list = value_list + values.tolist()
+
+        return value_list
+
+
+    def test_slot_reuse(self):
+
+        # "cpu" family has no minimum slot count. 3 slots are used for 2 series (half of the series count is added as free slots).
+        self.metric_store.record_func("cpu", {"a": 1, "b": 2}, 1)
+        self.assertEqual(self.metric_store.family_dict["cpu"]["slot_count"], 3)
+        self.metric_store.record_func("cpu", {"a": 3, "b": 4, "c": 5}, 2)
+        self.metric_store.record_func("cpu", {"a": 6, "c": 7}, 3)
+
+        # There is no free slot. Slot of "b" is reused because it is not recorded for the longest time.
+        self.metric_store.record_func("cpu", {"a": 8, "d": 9}, 4)
+        family_data = self.metric_store.family_dict["cpu"]
+        self.assertEqual(family_data["slot_count"], 3)
+        self.assertEqual(family_data["series_slot_dict"], {"a": 0, "d": 1, "c": 2})
+        self.assertEqual(self.metric_store.series_values_func("cpu", "b"), [])
+        # Values of the previous series of the slot are cleared.
+        self.assertEqual(self.series_value_list_func("cpu", "d"), [0, 0, 0, 9])
+        self.assertEqual(self.series_value_list_func("cpu", "c"), [0, 5, 7, 0])
+        self.assertEqual(self.series_value_list_func("cpu", "a"), [1, 3, 6, 8])
+
+
+    def test_grow_keeps_recorded_values(self):
+
+        self.metric_store.record_func("cpu", {"a": 1, "b": 2}, 1)
+        self.metric_store.record_func("cpu", {"a": 3, "b": 4, "c": 5}, 2)
+
+        # All slots are used by the series of the record. File is generated again with more slots.
+        self.metric_store.record_func("cpu", {"a": 6, "b": 7, "c": 8, "d": 9}, 3)
+        family_data = self.metric_store.family_dict["cpu"]
+        self.assertEqual(family_data["slot_count"], 6)
+        self.assertEqual(self.series_value_list_func("cpu", "a"), [1, 3, 6])
+        self.assertEqual(self.series_value_list_func("cpu", "b"), [2, 4, 7])
+        self.assertEqual(self.series_value_list_func("cpu", "c"), [0, 5, 8])
+        self.assertEqual(self.series_value_list_func("cpu", "d"), [0, 0, 9])
+        self.assertEqual(self.metric_store.series_values_func("cpu", "a")[0][0].tolist(), [1, 2, 3])
+
+        # Grown file is used when it is opened again.
+        self.metric_store.flush_func()
+        metric_store = type(MetricStore)()
+        metric_store.store_folder_path = self.metric_store.store_folder_path
+        metric_store.capacity = self.metric_store.capacity
+        try:
+            self.assertEqual(metric_store.series_values_func("cpu", "d")[0][1].tolist(), [0, 0, 9])
+        finally:
+            metric_store.family_dict["cpu"]["records"].release()
+            metric_store.family_dict["cpu"]["mmap"].close()
+
+
+    def test_recent_values_after_wraparound(self):
+
+        # 25 records are written into a file which has 10 records (file is wrapped). Records are written in the middle of the seconds.
+        current_time = time.time()
+        for i in range(25):
+            self.metric_store.record_func("memory", {"ram": i}, current_time - 25 + i + 0.5)
+
+        series_values_list = self.metric_store.series_values_func("memory", "ram")
+        self.assertEqual(len(series_values_list), 2)
+        self.assertEqual(self.series_value_list_func("memory", "ram"), list(range(15, 25)))
+
+        # Values are placed by their record times.
+        self.assertEqual(self.metric_store.series_recent_values_func("memory", "ram", 5, 1), [20, 21, 22, 23, 24])
+        self.assertEqual(self.metric_store.series_recent_values_func("memory", "ram", 5, 2), [16, 18, 20, 22, 24])
+        # "0" is used for the periods which have no recorded values.
+        self.assertEqual(self.metric_store.series_recent_values_func("memory", "ram", 12, 1), [0, 0, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24])
+
+
+if __name__ == "__main__":
+    unittest.main()
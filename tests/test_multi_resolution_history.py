@@ -0,0 +1,100 @@
+import unittest
+
+from src.MultiResolutionHistory import MultiResolutionHistory
+
+
+class MultiResolutionHistoryTestCase(unittest.TestCase):
+
+    def history_generate(self, length, value_count, sample_interval=1):
+        """
+        Generate a history and append "value_count" values (0, 1, 2, ...) in every "sample_interval" seconds.
+        """
+
+        history = MultiResolutionHistory(length)
+        for value in range(value_count):
+            history.append(value, value * sample_interval)
+
+        return history
+
+
+    def test_raw_values_are_used_for_short_time_span(self):
+
+        history = self.history_generate(100, 250)
+
+        self.assertEqual(history.chart_values_func(100, 1, 1000), list(range(150, 250)))
+        self.assertEqual(history.chart_values_func(20, 1, 1000), list(range(230, 250)))
+
+
+    def test_rollup_is_used_for_long_time_span(self):
+
+        # Raw history is shorter than the time span. 10 second rollup is used for 1 hour.
+        history = self.history_generate(3600, 1205)
+        self.assertEqual(len(history), MultiResolutionHistory.raw_length_max)
+        value_list = history.chart_values_func(3600, 1, 1000)
+        self.assertEqual(len(value_list), 360)
+        # Averages of the finished periods and average of the values of the period which is not finished yet (1200-1204).
+        self.assertEqual(value_list[-3:], [1184.5, 1194.5, 1202])
+        self.assertEqual(value_list[0], 0)
+
+        # 1 minute rollup is used for 2 hours.
+        value_list = history.chart_values_func(7200, 1, 1000)
+        self.assertEqual(len(value_list), 120)
+        # Average of the values of the current minute (1200-1204) is the newest value.
+        # Period of the previous minute (1140-1199) is not finished in the 1 minute rollup because no values of the current minute are added to it yet.
+        self.assertEqual(value_list[-3:], [1109.5, 1169.5, 1202])
+
+
+    def test_values_are_averaged_to_chart_width(self):
+
+        history = self.history_generate(100, 100)
+
+        self.assertEqual(history.chart_values_func(100, 1, 10), [i * 10 + 4.5 for i in range(10)])
+        # Values are not averaged if there are not more values than pixels.
+        self.assertEqual(len(history.chart_values_func(100, 1, 100)), 100)
+        # Values which are drawn on the same pixel are averaged if number of values is not a multiple of width.
+        value_list = history.chart_values_func(100, 1, 30)
+        self.assertEqual(len(value_list), 30)
+        self.assertAlmostEqual(sum(value_list) / len(value_list), 49.5, delta=1)
+
+
+    def test_rollup_wraparound(self):
+
+        # 10 second rollup is written more than its length (360 periods).
+        history = self.history_generate(3600, 5000)
+        value_list = history.chart_values_func(3600, 1, 1000)
+        self.assertEqual(len(value_list), 360)
+        self.assertEqual(value_list[0], 1404.5)
+        self.assertEqual(value_list[-2], 4984.5)
+        # Average of the values of the period which is not finished yet (4990-4999).
+        self.assertEqual(value_list[-1], 4994.5)
+        self.assertEqual(value_list, sorted(value_list))
+
+
+    def test_periods_without_values_are_zero(self):
+
+        history = MultiResolutionHistory(3600)
+        for sample_time in range(100):
+            history.append(1, sample_time)
+        # Application is suspended for 100 seconds.
+        for sample_time in range(200, 215):
+            history.append(2, sample_time)
+
+        value_list = history.chart_values_func(3600, 1, 1000)
+        self.assertEqual(value_list[-22:], [1] * 10 + [0] * 10 + [2, 2])
+
+
+    def test_chart_max(self):
+
+        history = self.history_generate(100, 150)
+        history.append(1000, 150)
+        history.append(0, 151)
+
+        # Tracked max value of the raw values is used if all raw values are shown.
+        self.assertEqual(history.chart_max_func(100, 1, history.chart_values_func(100, 1, 10)), 1000)
+        # Max value of the chart values is used if a part of the raw values is shown.
+        value_list = history.chart_values_func(50, 1, 1000)
+        self.assertEqual(history.chart_max_func(50, 1, value_list), max(value_list))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import unittest
+
+from src.Procfs import ProcFileReader
+
+
+# Files in "/proc/" are seq_files. A read of a seq_file returns about one page even if the buffer is bigger.
+# Files which are bigger than a page are used in order to check that file content is not truncated.
+page_size = os.sysconf("SC_PAGE_SIZE")
+
+
+def read_file_bytes_full(path):
+    """
+    Read full content of a file by using a Python file object.
+    """
+
+    try:
+        with open(path, "rb") as reader:
+            return reader.read()
+    except OSError:
+        return None
+
+
+class ProcFileReaderTestCase(unittest.TestCase):
+
+    def assert_reader_reads_full_content(self, path, buffer_size):
+
+        content = read_file_bytes_full(path)
+        if content is None or len(content) <= page_size:
+            self.skipTest(path + " is not readable or it is not bigger than a page.")
+        reader = ProcFileReader(path, buffer_size)
+        try:
+            # File is read twice in order to check reading by using the same file descriptor and the grown buffer.
+            for _ in range(2):
+                self.assertEqual(reader.read(), read_file_bytes_full(path))
+        finally:
+            reader.close()
+
+
+    def test_seq_file_bigger_than_buffer(self):
+
+        # "/proc/kallsyms" is a seq_file which is bigger than a page and its content does not change.
+        self.assert_reader_reads_full_content("/proc/kallsyms", 4096)
+
+
+    def test_seq_file_bigger_than_page_with_big_buffer(self):
+
+        # Buffer is bigger than the file. A single read returns only about one page.
+        self.assert_reader_reads_full_content("/proc/kallsyms", 16 * 1024 * 1024)
+
+
+    def test_mountinfo(self):
+
+        # "/proc/self/mountinfo" is read by "FileSystemUsage" and it may be bigger than a page if there are many mounts.
+        # It is read by using a buffer which is smaller than the file in order to check growing the buffer.
+        content = read_file_bytes_full("/proc/self/mountinfo")
+        if content is None:
+            self.skipTest("/proc/self/mountinfo is not readable.")
+        reader = ProcFileReader("/proc/self/mountinfo", 64)
+        try:
+            self.assertEqual(reader.read(), content)
+        finally:
+            reader.close()
+
+
+    def test_missing_file(self):
+
+        reader = ProcFileReader("/proc/system-monitoring-center-missing-file")
+        self.assertIsNone(reader.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+
+from src.RingBuffer import RingBuffer
+
+
+class RingBufferTestCase(unittest.TestCase):
+
+    def test_initial_values(self):
+
+        # Zeroes are added before the values if there are less values than length of the history.
+        ring_buffer = RingBuffer(5, [1, 2, 3])
+        self.assertEqual(list(ring_buffer), [0, 0, 1, 2, 3])
+        self.assertEqual(len(ring_buffer), 5)
+
+        # Newest values are used if there are more values.
+        ring_buffer = RingBuffer(3, [1, 2, 3, 4, 5])
+        self.assertEqual(list(ring_buffer), [3, 4, 5])
+
+
+    def test_append_wraparound(self):
+
+        ring_buffer = RingBuffer(4)
+        for value in range(1, 11):
+            ring_buffer.append(value)
+            value_list = [max(0, i) for i in range(value - 3, value + 1)]
+            self.assertEqual(list(ring_buffer), value_list)
+            self.assertEqual(ring_buffer[-1], value)
+            self.assertEqual(ring_buffer[0], value_list[0])
+
+
+    def test_view_is_contiguous_and_read_only(self):
+
+        ring_buffer = RingBuffer(4, [1, 2, 3, 4])
+        ring_buffer.append(5)
+        ring_buffer.append(6)
+
+        view = ring_buffer.view()
+        self.assertTrue(view.contiguous)
+        self.assertTrue(view.readonly)
+        self.assertEqual(view.tolist(), [3, 4, 5, 6])
+        self.assertEqual(view[1:].tolist(), [4, 5, 6])
+        with self.assertRaises(TypeError):
+            view[0] = 0
+
+
+    def test_max_and_sum(self):
+
+        ring_buffer = RingBuffer(3)
+        value_list = [5, 1, 2, 7, 3, 3, 1, 0, 0, 4]
+        for i, value in enumerate(value_list):
+            ring_buffer.append(value)
+            history = ([0, 0] + value_list)[i:i + 3]
+            self.assertEqual(ring_buffer.max(), max(history))
+            self.assertEqual(ring_buffer.sum(), sum(history))
+
+
+    def test_sum_does_not_accumulate_floating_point_errors(self):
+
+        ring_buffer = RingBuffer(10)
+        for _ in range(1000):
+            ring_buffer.append(0.1)
+            ring_buffer.append(1e16)
+        for _ in range(10):
+            ring_buffer.append(0.1)
+
+        self.assertAlmostEqual(ring_buffer.sum(), 1.0)
+
+
+    def test_resize_keeps_newest_values(self):
+
+        ring_buffer = RingBuffer(5)
+        for value in range(1, 8):
+            ring_buffer.append(value)
+
+        # Oldest values are removed if history is shortened.
+        ring_buffer.resize(3)
+        self.assertEqual(list(ring_buffer), [5, 6, 7])
+        self.assertEqual(ring_buffer.max(), 7)
+        self.assertEqual(ring_buffer.sum(), 18)
+
+        # Zeroes are added before the oldest value if history is lengthened.
+        ring_buffer.resize(6)
+        self.assertEqual(list(ring_buffer), [0, 0, 0, 5, 6, 7])
+        self.assertEqual(ring_buffer.sum(), 18)
+
+        # Values are appended in the same way after resizing.
+        ring_buffer.append(8)
+        self.assertEqual(list(ring_buffer), [0, 0, 5, 6, 7, 8])
+        self.assertEqual(ring_buffer.max(), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
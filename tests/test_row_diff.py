@@ -0,0 +1,69 @@
+import unittest
+
+from src import RowDiff
+
+
+class RowsDiffTestCase(unittest.TestCase):
+
+    def test_removed_added_and_changed_rows(self):
+
+        rows_prev = {1: [True, "a", 1.0, 10], 2: [True, "b", 2.0, 20], 3: [True, "c", 3.0, 30]}
+        rows = {1: [True, "a", 1.0, 10], 3: [True, "c", 3.5, 31], 4: [True, "d", 4.0, 40]}
+
+        removed_row_ids, added_row_ids, changed_cells = RowDiff.rows_diff(rows_prev, rows)
+
+        self.assertEqual(removed_row_ids, [2])
+        self.assertEqual(added_row_ids, [4])
+        self.assertEqual(changed_cells, {3: ([2, 3], [3.5, 31])})
+
+
+    def test_first_element_is_not_compared(self):
+
+        # First element is row visibility data which is set by the search feature.
+        removed_row_ids, added_row_ids, changed_cells = RowDiff.rows_diff({1: [True, "a"]}, {1: [False, "a"]})
+
+        self.assertEqual((removed_row_ids, added_row_ids, changed_cells), ([], [], {}))
+
+
+    def test_rows_with_different_lengths(self):
+
+        # All cells are set if shown columns are changed.
+        removed_row_ids, added_row_ids, changed_cells = RowDiff.rows_diff({1: [True, "a", 1]}, {1: [True, "a", 1, "x"]})
+
+        self.assertEqual(changed_cells, {1: ([1, 2, 3], ["a", 1, "x"])})
+
+
+class TreeInsertionOrderTestCase(unittest.TestCase):
+
+    def test_parent_rows_are_placed_before_child_rows(self):
+
+        # PIDs are started from the beginning after reaching the maximum PID value. Child rows have lower IDs than their parents.
+        parent_row_ids = {5: 1, 3: 7, 2: 3, 7: 1, 9: 2}
+        ordered_row_ids = RowDiff.tree_insertion_order([2, 3, 5, 7, 9], parent_row_ids)
+
+        self.assertEqual(sorted(ordered_row_ids), [2, 3, 5, 7, 9])
+        for row_id in ordered_row_ids:
+            parent_row_id = parent_row_ids[row_id]
+            if parent_row_id in ordered_row_ids:
+                self.assertLess(ordered_row_ids.index(parent_row_id), ordered_row_ids.index(row_id))
+
+
+    def test_order_is_kept_if_parents_are_not_new(self):
+
+        self.assertEqual(RowDiff.tree_insertion_order([4, 2, 8], {4: 1, 2: 1, 8: 1}), [4, 2, 8])
+
+
+class PositionRangesTestCase(unittest.TestCase):
+
+    def test_consecutive_positions_are_merged(self):
+
+        self.assertEqual(RowDiff.position_ranges([0, 1, 2, 5, 7, 8]), [(0, 3), (5, 1), (7, 2)])
+
+
+    def test_no_positions(self):
+
+        self.assertEqual(RowDiff.position_ranges([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+import os
+import time
+import threading
+import subprocess
+import unittest
+
+# A stand-in "org.freedesktop.systemd1" service is run on a private system bus by using "python-dbusmock".
+# Tests are skipped if "python-dbusmock", "dbus-python" or PyGObject is not installed.
+try:
+    import dbus
+    import dbusmock
+    import gi
+    gi.require_version('GLib', '2.0')
+    from gi.repository import GLib
+except (ImportError, ValueError):
+    raise unittest.SkipTest("python-dbusmock, dbus-python and PyGObject are required.")
+
+from src import SystemdDbus as SystemdDbusModule
+from src.SystemdDbus import SystemdDbus
+
+
+unit_object_path = "/org/freedesktop/systemd1/unit/test_2eservice"
+
+
+class SystemdDbusSignalTestCase(dbusmock.DBusTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.start_system_bus()
+        cls.dbus_con = cls.get_dbus(system_bus=True)
+
+
+    def setUp(self):
+
+        self.p_mock = self.spawn_server(SystemdDbusModule.systemd_bus_name, SystemdDbusModule.systemd_object_path,
+                                        SystemdDbusModule.systemd_manager_interface, system_bus=True, stdout=subprocess.PIPE)
+        systemd_mock = dbus.Interface(self.dbus_con.get_object(SystemdDbusModule.systemd_bus_name, SystemdDbusModule.systemd_object_path),
+                                      dbusmock.MOCK_IFACE)
+        systemd_mock.AddMethod("", "Subscribe", "", "", "")
+        systemd_mock.AddMethod("", "ListUnitFilesByPatterns", "asas", "a(ss)",
+                               'ret = [("/usr/lib/systemd/system/test.service", "enabled")]')
+        systemd_mock.AddMethod("", "ListUnits", "", "a(ssssssouso)",
+                               f'ret = [("test.service", "Test service", "loaded", "inactive", "dead", "", "{unit_object_path}", '
+                               'dbus.UInt32(0), "", "/")]')
+        systemd_mock.AddObject(unit_object_path, SystemdDbusModule.systemd_unit_interface,
+                               {"LoadState": "loaded", "ActiveState": "inactive", "SubState": "dead",
+                                "UnitFileState": "enabled", "Description": "Test service"}, [])
+        self.unit_mock = dbus.Interface(self.dbus_con.get_object(SystemdDbusModule.systemd_bus_name, unit_object_path), dbusmock.MOCK_IFACE)
+        self.unit_mock.AddProperties(SystemdDbusModule.systemd_service_interface,
+                                     {"MainPID": dbus.UInt32(0), "MemoryCurrent": dbus.UInt64(SystemdDbusModule.memory_current_not_set_value)})
+
+        SystemdDbus.disconnect_func()
+        SystemdDbus.dbus_unavailable = 0
+        SystemdDbus.bus_address = os.environ["DBUS_SYSTEM_BUS_ADDRESS"]
+
+
+    def tearDown(self):
+
+        SystemdDbus.disconnect_func()
+        SystemdDbus.bus_address = None
+        self.p_mock.stdout.close()
+        self.p_mock.terminate()
+        self.p_mock.wait()
+
+
+    def properties_changed_emit_func(self, interface_name, changed_properties):
+        """
+        Emit "PropertiesChanged" signal of the unit object.
+        """
+
+        self.unit_mock.EmitSignal(SystemdDbusModule.dbus_properties_interface, "PropertiesChanged", "sa{sv}as",
+                                  [interface_name, changed_properties, dbus.Array([], signature="s")])
+
+
+    def signals_dispatch_func(self, condition_function):
+        """
+        Dispatch received signals (they are dispatched by the signal main context of "SystemdDbus") until "condition_function" returns "True".
+        """
+
+        main_context = SystemdDbus.signal_main_context
+        end_time = time.monotonic() + 5
+        while condition_function() == False and time.monotonic() < end_time:
+            while main_context.iteration(False) == True:
+                pass
+            time.sleep(0.01)
+
+
+    def test_properties_changed_signal_updates_service(self):
+
+        services_information_dict = SystemdDbus.services_information_func(get_memory=False)
+        self.assertEqual(services_information_dict["test.service"]["ActiveState"], "inactive")
+
+        self.properties_changed_emit_func(SystemdDbusModule.systemd_unit_interface, {"ActiveState": "active", "SubState": "running"})
+        self.signals_dispatch_func(lambda: SystemdDbus.services_information_dict["test.service"]["ActiveState"] == "active")
+
+        self.assertEqual(SystemdDbus.services_information_dict["test.service"]["ActiveState"], "active")
+        self.assertEqual(SystemdDbus.services_information_dict["test.service"]["SubState"], "running")
+
+
+    def test_properties_changed_signal_of_other_interface_is_ignored(self):
+
+        SystemdDbus.services_information_func(get_memory=False)
+
+        # Signals are received in the order they are sent. Signal of the Unit interface is sent after the
+        # signal of another interface in order to know that both signals are dispatched.
+        self.properties_changed_emit_func("org.freedesktop.systemd1.Socket", {"ActiveState": "failed", "Description": "Socket"})
+        self.properties_changed_emit_func(SystemdDbusModule.systemd_unit_interface, {"SubState": "running"})
+        self.signals_dispatch_func(lambda: SystemdDbus.services_information_dict["test.service"]["SubState"] == "running")
+
+        self.assertEqual(SystemdDbus.services_information_dict["test.service"]["SubState"], "running")
+        self.assertEqual(SystemdDbus.services_information_dict["test.service"]["ActiveState"], "inactive")
+        self.assertEqual(SystemdDbus.services_information_dict["test.service"]["Description"], "Test service")
+
+
+    def test_signals_are_dispatched_by_services_information_func_in_another_thread(self):
+
+        SystemdDbus.services_information_func(get_memory=False)
+        self.properties_changed_emit_func(SystemdDbusModule.systemd_unit_interface, {"ActiveState": "active"})
+
+        # Service information is get in the collector thread of the main window. Signals are not dispatched by the default main context.
+        results = []
+        def collect_func():
+            end_time = time.monotonic() + 5
+            while time.monotonic() < end_time:
+                services_information_dict = SystemdDbus.services_information_func(get_memory=False)
+                if services_information_dict["test.service"]["ActiveState"] == "active":
+                    break
+                time.sleep(0.01)
+            results.append(services_information_dict["test.service"]["ActiveState"])
+        thread = threading.Thread(target=collect_func)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(results, ["active"])
+        self.assertEqual(GLib.MainContext.default().pending(), False)
+
+
+    def test_calls_func_with_failing_call(self):
+
+        SystemdDbus.services_information_func(get_memory=False)
+
+        # Second call fails because the object does not exist. Results of the other calls are not affected.
+        results = SystemdDbus.calls_func([
+            (unit_object_path, SystemdDbusModule.dbus_properties_interface, "Get",
+             GLib.Variant("(ss)", (SystemdDbusModule.systemd_unit_interface, "ActiveState"))),
+            ("/org/freedesktop/systemd1/unit/missing_2eservice", SystemdDbusModule.dbus_properties_interface, "GetAll",
+             GLib.Variant("(s)", (SystemdDbusModule.systemd_unit_interface,))),
+            (unit_object_path, SystemdDbusModule.dbus_properties_interface, "Get",
+             GLib.Variant("(ss)", (SystemdDbusModule.systemd_unit_interface, "SubState")))])
+
+        self.assertEqual(results, [("inactive",), None, ("dead",)])
+
+
+    def test_services_information_with_failing_properties_call(self):
+
+        # Object of "missing.service" does not exist. Its properties could not be get and values of "ListUnits" reply are kept.
+        systemd_mock = dbus.Interface(self.dbus_con.get_object(SystemdDbusModule.systemd_bus_name, SystemdDbusModule.systemd_object_path),
+                                      dbusmock.MOCK_IFACE)
+        systemd_mock.AddMethod("", "ListUnitFilesByPatterns", "asas", "a(ss)",
+                               'ret = [("/usr/lib/systemd/system/test.service", "enabled"), ("/usr/lib/systemd/system/missing.service", "enabled")]')
+        systemd_mock.AddMethod("", "ListUnits", "", "a(ssssssouso)",
+                               f'ret = [("test.service", "Test service", "loaded", "inactive", "dead", "", "{unit_object_path}", dbus.UInt32(0), "", "/"), '
+                               '("missing.service", "Missing service", "loaded", "active", "running", "", "/org/freedesktop/systemd1/unit/missing_2eservice", '
+                               'dbus.UInt32(0), "", "/")]')
+
+        services_information_dict = SystemdDbus.services_information_func(get_memory=True)
+
+        self.assertEqual(services_information_dict["test.service"]["UnitFileState"], "enabled")
+        self.assertEqual(services_information_dict["missing.service"]["Description"], "Missing service")
+        self.assertEqual(services_information_dict["missing.service"]["MainPID"], 0)
+        self.assertEqual(services_information_dict["missing.service"]["MemoryCurrent"], -9999)
+
+
+if __name__ == "__main__":
+    unittest.main()